@@ -1,124 +1,256 @@
 # __init__.py
+"""
+ggplotly: a grammar of graphics for Python built on Plotly.
 
-from .aes import aes, after_stat
-from .coords import Coord, coord_cartesian, coord_fixed, coord_flip, coord_polar, coord_sf
-from .datasets import data
-from .facets import Facet, facet_grid, facet_wrap, label_both, label_value
-from .geoms import (
-    geom_abline,
-    geom_acf,
-    geom_area,
-    geom_bar,
-    geom_boxplot,
-    geom_candlestick,
-    geom_col,
-    geom_contour,
-    geom_contour_filled,
-    geom_density,
-    geom_edgebundle,
-    geom_errorbar,
-    geom_fanchart,
-    geom_histogram,
-    geom_hline,
-    geom_jitter,
-    geom_label,
-    geom_line,
-    geom_lines,
-    geom_map,
-    geom_norm,
-    geom_ohlc,
-    geom_pacf,
-    geom_path,
-    geom_point,
-    geom_point_3d,
-    geom_qq,
-    geom_qq_line,
-    geom_range,
-    geom_rect,
-    geom_ribbon,
-    geom_rug,
-    geom_sankey,
-    geom_searoute,
-    geom_segment,
-    geom_sf,
-    geom_smooth,
-    geom_step,
-    geom_stl,
-    geom_surface,
-    geom_text,
-    geom_tile,
-    geom_violin,
-    geom_vline,
-    geom_waterfall,
-    geom_wireframe,
-)
-from .ggplot import ggplot
-from .ggtitle import ggtitle
-from .guides import annotate, guide_colorbar, guide_legend, guides, labs
-from .layer import Layer, layer
-from .limits import lims, xlim, ylim
-from .map_data import map_data
-from .positions import (
-    position_dodge,
-    position_dodge2,
-    position_fill,
-    position_identity,
-    position_jitter,
-    position_nudge,
-    position_stack,
-)
-from .scales import (
-    scale_color_brewer,
-    scale_color_gradient,
-    scale_color_manual,
-    scale_fill_brewer,
-    scale_fill_gradient,
-    scale_fill_manual,
-    scale_fill_viridis_c,
-    scale_shape_manual,
-    scale_size,
-    scale_x_continuous,
-    scale_x_date,
-    scale_x_datetime,
-    scale_x_log10,
-    scale_x_rangeselector,
-    scale_x_rangeslider,
-    scale_x_reverse,
-    scale_y_continuous,
-    scale_y_log10,
-    scale_y_reverse,
-)
-from .stats import (
-    stat_bin,
-    stat_contour,
-    stat_count,
-    stat_density,
-    stat_ecdf,
-    stat_fanchart,
-    stat_function,
-    stat_identity,
-    stat_qq,
-    stat_qq_line,
-    stat_smooth,
-    stat_stl,
-    stat_summary,
-)
-from .themes import (
-    element_line,
-    element_rect,
-    element_text,
-    theme,
-    theme_bbc,
-    theme_classic,
-    theme_custom,
-    # theme_bw,
-    theme_dark,
-    theme_default,
-    theme_ggplot2,
-    theme_minimal,
-    theme_nytimes,
+Public names are loaded lazily (PEP 562). ``import ggplotly`` only builds the
+table below; the submodule defining a name is imported the first time that
+name is used, so a script that only draws a bar chart never imports the
+modules behind contours, smoothers or maps.
+"""
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING
+
+# Submodule -> public names it provides
+_EXPORTS = {
+    ".aes": ("aes", "after_stat"),
+    ".async_render": ("RenderQueue",),
+    ".chunked": ("ChunkedData",),
+    ".coords": (
+        "Coord", "coord_cartesian", "coord_fixed", "coord_flip", "coord_polar",
+        "coord_sf",
+    ),
+    ".datasets": ("data",),
+    ".export": ("export_html", "ggsave_many"),
+    ".facets": ("Facet", "facet_grid", "facet_wrap", "label_both", "label_value"),
+    ".geoms": (
+        "geom_abline", "geom_acf", "geom_area", "geom_bar", "geom_bin2d", "geom_boxplot",
+        "geom_candlestick", "geom_col", "geom_contour", "geom_contour_filled",
+        "geom_density", "geom_edgebundle", "geom_errorbar", "geom_fanchart", "geom_hex",
+        "geom_histogram", "geom_hline", "geom_jitter", "geom_label", "geom_line",
+        "geom_lines", "geom_map", "geom_norm", "geom_ohlc", "geom_pacf", "geom_path",
+        "geom_point", "geom_point_3d", "geom_qq", "geom_qq_line", "geom_range",
+        "geom_raster_points", "geom_rect", "geom_ribbon", "geom_rug", "geom_sankey",
+        "geom_searoute", "geom_segment", "geom_sf", "geom_smooth", "geom_step", "geom_stl",
+        "geom_surface", "geom_text", "geom_tile", "geom_violin", "geom_vline",
+        "geom_waterfall", "geom_wireframe",
+    ),
+    ".ggplot": ("ggplot",),
+    ".ggtitle": ("ggtitle",),
+    ".guides": ("annotate", "guide_colorbar", "guide_legend", "guides", "labs"),
+    ".layer": ("Layer", "layer"),
+    ".limits": ("lims", "xlim", "ylim"),
+    ".map_data": ("map_data",),
+    ".positions": (
+        "position_dodge", "position_dodge2", "position_fill", "position_identity",
+        "position_jitter", "position_nudge", "position_stack",
+    ),
+    ".scales": (
+        "scale_color_brewer", "scale_color_gradient", "scale_color_manual",
+        "scale_fill_brewer", "scale_fill_gradient", "scale_fill_manual",
+        "scale_fill_viridis_c", "scale_shape_manual", "scale_size",
+        "scale_x_continuous", "scale_x_date", "scale_x_datetime", "scale_x_log10",
+        "scale_x_rangeselector", "scale_x_rangeslider", "scale_x_reverse",
+        "scale_y_continuous", "scale_y_log10", "scale_y_reverse",
+    ),
+    ".stats": (
+        "stat_acf", "stat_bin", "stat_bin_2d", "stat_binhex", "stat_boxplot",
+        "stat_contour", "stat_count", "stat_density", "stat_ecdf", "stat_fanchart",
+        "stat_function", "stat_identity", "stat_pacf", "stat_qq", "stat_qq_line",
+        "stat_smooth", "stat_stl", "stat_summary", "stat_ydensity",
+    ),
+    ".themes": (
+        "element_line", "element_rect", "element_text", "theme", "theme_bbc",
+        "theme_classic", "theme_custom", "theme_dark", "theme_default", "theme_ggplot2",
+        "theme_minimal", "theme_nytimes",
+    ),
+    ".utils": ("ggsave", "ggsize"),
+}
+
+_LAZY_IMPORTS = {name: module for module, names in _EXPORTS.items() for name in names}
+
+# Submodules that may be reached as attributes, e.g. ``ggplotly.geoms``
+_SUBMODULES = (
+    "aesthetic_mapper", "async_render", "chunked", "colormap", "constants", "coords", "data_utils", "datasets",
+    "exceptions", "export", "facets", "figure_builder", "geo_utils", "geoms", "guides", "limits",
+    "positions", "rasterize", "render_cache", "render_context", "render_diff", "scales",
+    "serialize", "stats", "streaming", "themes", "trace_builders", "utils",
 )
-from .utils import ggsave, ggsize
+
+
+def __getattr__(name):
+    """Import the submodule behind a public name on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module, __name__), name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _LazyModule(types.ModuleType):
+    """
+    Package module that keeps public names from being shadowed.
+
+    Importing a submodule binds it as an attribute of its package, so
+    importing ``ggplotly.ggplot`` would otherwise replace the ``ggplot``
+    class with the module of the same name.
+    """
+
+    def __setattr__(self, name, value):
+        if isinstance(value, types.ModuleType) and _LAZY_IMPORTS.get(name) == f".{name}":
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
+
+if TYPE_CHECKING:
+    from .aes import aes, after_stat
+    from .async_render import RenderQueue
+    from .chunked import ChunkedData
+    from .coords import (
+        Coord,
+        coord_cartesian,
+        coord_fixed,
+        coord_flip,
+        coord_polar,
+        coord_sf,
+    )
+    from .datasets import data
+    from .export import export_html, ggsave_many
+    from .facets import Facet, facet_grid, facet_wrap, label_both, label_value
+    from .geoms import (
+        geom_abline,
+        geom_acf,
+        geom_area,
+        geom_bar,
+        geom_bin2d,
+        geom_boxplot,
+        geom_candlestick,
+        geom_col,
+        geom_contour,
+        geom_contour_filled,
+        geom_density,
+        geom_edgebundle,
+        geom_errorbar,
+        geom_fanchart,
+        geom_hex,
+        geom_histogram,
+        geom_hline,
+        geom_jitter,
+        geom_label,
+        geom_line,
+        geom_lines,
+        geom_map,
+        geom_norm,
+        geom_ohlc,
+        geom_pacf,
+        geom_path,
+        geom_point,
+        geom_point_3d,
+        geom_qq,
+        geom_qq_line,
+        geom_range,
+        geom_raster_points,
+        geom_rect,
+        geom_ribbon,
+        geom_rug,
+        geom_sankey,
+        geom_searoute,
+        geom_segment,
+        geom_sf,
+        geom_smooth,
+        geom_step,
+        geom_stl,
+        geom_surface,
+        geom_text,
+        geom_tile,
+        geom_violin,
+        geom_vline,
+        geom_waterfall,
+        geom_wireframe,
+    )
+    from .ggplot import ggplot
+    from .ggtitle import ggtitle
+    from .guides import annotate, guide_colorbar, guide_legend, guides, labs
+    from .layer import Layer, layer
+    from .limits import lims, xlim, ylim
+    from .map_data import map_data
+    from .positions import (
+        position_dodge,
+        position_dodge2,
+        position_fill,
+        position_identity,
+        position_jitter,
+        position_nudge,
+        position_stack,
+    )
+    from .scales import (
+        scale_color_brewer,
+        scale_color_gradient,
+        scale_color_manual,
+        scale_fill_brewer,
+        scale_fill_gradient,
+        scale_fill_manual,
+        scale_fill_viridis_c,
+        scale_shape_manual,
+        scale_size,
+        scale_x_continuous,
+        scale_x_date,
+        scale_x_datetime,
+        scale_x_log10,
+        scale_x_rangeselector,
+        scale_x_rangeslider,
+        scale_x_reverse,
+        scale_y_continuous,
+        scale_y_log10,
+        scale_y_reverse,
+    )
+    from .stats import (
+        stat_acf,
+        stat_bin,
+        stat_bin_2d,
+        stat_binhex,
+        stat_boxplot,
+        stat_contour,
+        stat_count,
+        stat_density,
+        stat_ecdf,
+        stat_fanchart,
+        stat_function,
+        stat_identity,
+        stat_pacf,
+        stat_qq,
+        stat_qq_line,
+        stat_smooth,
+        stat_stl,
+        stat_summary,
+        stat_ydensity,
+    )
+    from .themes import (
+        element_line,
+        element_rect,
+        element_text,
+        theme,
+        theme_bbc,
+        theme_classic,
+        theme_custom,
+        # theme_bw,
+        theme_dark,
+        theme_default,
+        theme_ggplot2,
+        theme_minimal,
+        theme_nytimes,
+    )
+    from .utils import ggsave, ggsize
 
 __all__ = [
     "ggplot",
@@ -212,6 +344,9 @@ __all__ = [
     "geom_qq_line",
     "geom_sankey",
     "geom_waterfall",
+    "geom_bin2d",
+    "geom_hex",
+    "geom_raster_points",
     "scale_x_continuous",
     "scale_y_continuous",
     "scale_color_manual",
@@ -244,8 +379,18 @@ __all__ = [
     "stat_qq",
     "stat_qq_line",
     "stat_stl",
+    "stat_acf",
+    "stat_pacf",
+    "stat_boxplot",
+    "stat_ydensity",
+    "stat_bin_2d",
+    "stat_binhex",
     "data",
     "map_data",
+    "ChunkedData",
+    "RenderQueue",
+    "export_html",
+    "ggsave_many",
     "Layer",
     "layer",
 ]
@@ -10,6 +10,7 @@ from __future__ import annotations
 from functools import lru_cache
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from .constants import SHAPE_PALETTE
@@ -242,7 +243,9 @@ class AestheticMapper:
             return True
         if pd.api.types.is_float_dtype(series):
             # Check if values are actually floats (not integers stored as float)
-            if not series.dropna().apply(lambda x: float(x).is_integer()).all():
+            values = series.to_numpy(dtype=float, na_value=np.nan)
+            values = values[np.isfinite(values)]
+            if np.mod(values, 1).any():
                 return True
 
         return False
@@ -0,0 +1,190 @@
+# async_render.py
+"""
+Drawing and saving plots without blocking an asyncio event loop.
+
+``ggplot.draw()`` and ``ggplot.save()`` compute stats, build traces and
+export images synchronously, so calling them from a web server handler
+(e.g. FastAPI) stalls every other request. ``await plot.draw_async()`` and
+``await plot.save_async(path)`` run them in an executor instead: the event
+loop's default thread pool, the executor set as
+``async_render.default_executor``, or one given per call. A
+``ProcessPoolExecutor`` also runs them outside the GIL; the plot is sent to
+a worker and its figure sent back, with its arrays as Plotly's base64
+typed arrays like any pickled figure.
+
+Both accept a timeout and can be cancelled. Cancelling stops a draw that has
+not started yet; a draw already running in a thread finishes in the
+background and leaves its figure on the plot, as a plain ``draw()`` would.
+
+``RenderQueue`` bounds how many plots render at once, so a request drawing
+many figures does not take every worker from the other requests.
+
+Examples:
+    >>> fig = await p.draw_async(timeout=10)
+    >>> await p.save_async('plot.png')
+    >>> async_render.default_executor = ProcessPoolExecutor(4)  # for every call
+    >>> queue = RenderQueue(max_concurrency=2)
+    >>> figures = await queue.draw_all([p1, p2, p3])
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+from .workers import call_packed, pack
+
+# Executor used when a call does not give one; None uses the event loop's
+# default thread pool
+default_executor = None
+
+# One draw at a time per plot, since drawing replaces plot.fig
+_locks = weakref.WeakKeyDictionary()
+_locks_guard = threading.Lock()
+
+
+def _lock(plot):
+    with _locks_guard:
+        lock = _locks.get(plot)
+        if lock is None:
+            lock = _locks[plot] = threading.Lock()
+        return lock
+
+
+def _draw(plot):
+    with _lock(plot):
+        return plot.draw()
+
+
+def _save(plot, filepath, kwargs):
+    with _lock(plot):
+        plot.draw()
+        plot.save(filepath, **kwargs)
+    return filepath
+
+
+def _draw_in_worker(plot):
+    """Draw a plot sent to a worker process; returns what the caller keeps."""
+    fig = plot.draw()
+    return fig, plot._render_key
+
+
+async def _run(func, args, pool, timeout):
+    loop = asyncio.get_running_loop()
+    return await asyncio.wait_for(loop.run_in_executor(pool, func, *args), timeout)
+
+
+async def draw(plot, timeout=None, executor=None):
+    """
+    Draw a plot in an executor.
+
+    Parameters:
+        plot (ggplot): Plot to draw.
+        timeout (float, optional): Seconds to wait for the figure.
+        executor (Executor, optional): Executor to draw in. Default is
+            ``async_render.default_executor``, or the event loop's thread pool.
+
+    Returns:
+        go.Figure: The figure, also kept as ``plot.fig``.
+
+    Raises:
+        asyncio.TimeoutError: If the draw takes longer than timeout (the
+            builtin TimeoutError from Python 3.11).
+    """
+    pool = executor if executor is not None else default_executor
+    if isinstance(pool, ProcessPoolExecutor):
+        payload = pack((plot,))
+        if payload is not None:
+            fig, key = await _run(call_packed, (_draw_in_worker, payload), pool, timeout)
+            plot.fig, plot._render_key = fig, key
+            return fig
+        # A plot that cannot be sent to a worker is drawn in a thread
+        pool = None
+    return await _run(_draw, (plot,), pool, timeout)
+
+
+async def save(plot, filepath, timeout=None, executor=None, **kwargs):
+    """
+    Draw a plot and save it in an executor.
+
+    Parameters:
+        plot (ggplot): Plot to save.
+        filepath (str): File to write; see ``ggplot.save``.
+        timeout (float, optional): Seconds to wait for the file.
+        executor (Executor, optional): Executor to draw and save in. Default
+            is ``async_render.default_executor``, or the event loop's thread
+            pool. Plots saved in worker processes keep their own figure out
+            of date.
+        **kwargs: Options of ``ggplot.save`` (format, precision,
+            include_plotlyjs).
+
+    Returns:
+        str: filepath.
+
+    Raises:
+        asyncio.TimeoutError: If drawing and saving take longer than timeout
+            (the builtin TimeoutError from Python 3.11).
+    """
+    pool = executor if executor is not None else default_executor
+    if isinstance(pool, ProcessPoolExecutor):
+        payload = pack((plot, filepath, kwargs))
+        if payload is not None:
+            return await _run(call_packed, (_save, payload), pool, timeout)
+        pool = None
+    return await _run(_save, (plot, filepath, kwargs), pool, timeout)
+
+
+class RenderQueue:
+    """
+    Draw and save plots with at most max_concurrency renders at a time.
+
+    Parameters:
+        max_concurrency (int, optional): Renders running at once. Default is
+            the number of CPUs.
+        timeout (float, optional): Seconds each render may take.
+        executor (Executor, optional): Executor to render in; see ``draw``.
+
+    Examples:
+        >>> queue = RenderQueue(max_concurrency=2, timeout=30)
+        >>> figures = await queue.draw_all(plots)
+        >>> await asyncio.gather(*(queue.save(p, f'{i}.png') for i, p in enumerate(plots)))
+    """
+
+    def __init__(self, max_concurrency=None, timeout=None, executor=None):
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self.timeout = timeout
+        self.executor = executor
+        self._semaphore = None
+
+    def _slot(self):
+        # Created on first use, inside the event loop that renders
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def draw(self, plot):
+        """Draw a plot once a slot is free; returns its figure."""
+        async with self._slot():
+            return await draw(plot, timeout=self.timeout, executor=self.executor)
+
+    async def save(self, plot, filepath, **kwargs):
+        """Draw and save a plot once a slot is free; returns filepath."""
+        async with self._slot():
+            return await save(plot, filepath, timeout=self.timeout, executor=self.executor, **kwargs)
+
+    async def draw_all(self, plots):
+        """
+        Draw many plots.
+
+        Returns:
+            list: Figures in the order of plots. If one render fails, the
+                others are cancelled and its error is raised.
+        """
+        tasks = [asyncio.ensure_future(self.draw(plot)) for plot in plots]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
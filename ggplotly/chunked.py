@@ -0,0 +1,263 @@
+# chunked.py
+"""
+Chunked data sources for out-of-core stats.
+
+Stats such as stat_bin and stat_count only need running totals, so they can
+work through data that does not fit in memory one chunk at a time. A
+``ChunkedData`` wraps such a source and hands out pandas DataFrames of at
+most ``chunk_size`` rows, so peak memory is bounded by the chunk size rather
+than by the size of the data.
+
+Supported sources:
+    - an iterable of DataFrames (a list, or a generator; generators can only
+      be read once)
+    - a callable returning a fresh iterable of DataFrames on every call
+    - a pyarrow Dataset or Table (read batch by batch)
+    - a NumPy array or ``np.memmap`` (1-D, 2-D or structured)
+    - a DataFrame (sliced into chunks)
+
+Examples:
+    >>> import pyarrow.dataset as ds
+    >>> events = ChunkedData(ds.dataset('events/', format='parquet'), n_jobs=4)
+    >>> ggplot(mapping=aes(x='latency')) + geom_histogram(data=events, binwidth=5)
+
+    >>> values = np.memmap('latency.f8', dtype='float64', mode='r')
+    >>> stat_bin(mapping={'x': 'value'}).compute_chunks(values)
+"""
+from __future__ import annotations
+
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+def is_chunked_source(obj):
+    """
+    Return True if ``obj`` should be read in chunks rather than as a DataFrame.
+
+    DataFrames, Series, dicts and strings are ordinary layer data; arrays,
+    pyarrow datasets, callables and other iterables are chunked sources.
+    """
+    if isinstance(obj, ChunkedData):
+        return True
+    if obj is None or isinstance(obj, (pd.DataFrame, pd.Series, dict, str, bytes)):
+        return False
+    if isinstance(obj, np.ndarray) or hasattr(obj, "to_batches"):
+        return True
+    if callable(obj):
+        return True
+    return hasattr(obj, "__iter__")
+
+
+def as_chunked(source, **kwargs):
+    """Wrap ``source`` in a ChunkedData unless it already is one."""
+    if isinstance(source, ChunkedData):
+        return source
+    return ChunkedData(source, **kwargs)
+
+
+class ChunkedData:
+    """
+    A data source read as a sequence of DataFrame chunks.
+
+    Parameters:
+        source: Iterable of DataFrames, callable returning one, pyarrow
+            Dataset or Table, NumPy array / memmap, or DataFrame.
+        chunk_size (int): Rows per chunk for sources that are sliced here
+            (arrays, DataFrames and pyarrow sources). Default is 1,000,000.
+        columns (list of str, optional): Column names for plain 2-D or 1-D
+            arrays. A 1-D array becomes a single column named 'value'.
+        n_jobs (int, optional): Number of threads used to process chunks.
+            Default is None (process chunks in the calling thread).
+
+    Examples:
+        >>> ChunkedData(lambda: pd.read_csv('big.csv', chunksize=500_000))
+        >>> ChunkedData(np.memmap('x.f4', dtype='float32', mode='r'), columns=['x'])
+    """
+
+    def __init__(self, source, chunk_size=DEFAULT_CHUNK_SIZE, columns=None, n_jobs=None):
+        if isinstance(source, ChunkedData):
+            source = source.source
+        self.source = source
+        self.chunk_size = int(chunk_size)
+        self.n_jobs = n_jobs
+        self._columns = list(columns) if columns is not None else None
+        # Chunk read ahead of time from a one-shot iterator to learn its schema
+        self._peeked = None
+        self._consumed = False
+
+    def __deepcopy__(self, memo):
+        # Sources are read-only views of external data; never copy them
+        return self
+
+    def __repr__(self):
+        return f"ChunkedData({type(self.source).__name__}, chunk_size={self.chunk_size})"
+
+    @property
+    def one_shot(self):
+        """True if the source can only be read once (a plain iterator)."""
+        source = self.source
+        return (
+            not isinstance(source, (np.ndarray, pd.DataFrame))
+            and not hasattr(source, "to_batches")
+            and not callable(source)
+            and iter(source) is source
+        )
+
+    @property
+    def columns(self):
+        """Column names of the source."""
+        if self._columns is not None:
+            return self._columns
+        source = self.source
+        if isinstance(source, np.ndarray):
+            if source.dtype.names:
+                return list(source.dtype.names)
+            if source.ndim == 1:
+                return ["value"]
+            return [str(i) for i in range(source.shape[1])]
+        if isinstance(source, pd.DataFrame):
+            return list(source.columns)
+        if hasattr(source, "schema"):
+            return list(source.schema.names)
+        first = self._first_chunk()
+        return [] if first is None else list(first.columns)
+
+    def empty(self):
+        """A zero-row DataFrame with the source's columns, used as layer data."""
+        first = None
+        if not isinstance(self.source, np.ndarray) and not hasattr(self.source, "schema"):
+            first = self._first_chunk()
+        if first is not None:
+            return first.iloc[:0].copy()
+        return pd.DataFrame(columns=self.columns)
+
+    def _first_chunk(self):
+        if self.one_shot:
+            if self._peeked is None and not self._consumed:
+                self._peeked = next(self.source, None)
+            return None if self._peeked is None else self._to_frame(self._peeked)
+        return next(self.chunks(), None)
+
+    def _to_frame(self, chunk):
+        if isinstance(chunk, pd.DataFrame):
+            return chunk
+        if hasattr(chunk, "to_pandas"):
+            return chunk.to_pandas()
+        return pd.DataFrame(chunk)
+
+    def _array_frame(self, block):
+        if block.dtype.names:
+            return pd.DataFrame({name: block[name] for name in block.dtype.names})
+        if block.ndim == 1:
+            return pd.DataFrame({self.columns[0]: block})
+        return pd.DataFrame(block, columns=self.columns)
+
+    def _raw_chunks(self, columns):
+        source = self.source
+        size = self.chunk_size
+        if isinstance(source, np.ndarray):
+            for start in range(0, len(source), size):
+                # Slicing a memmap reads only this block from disk
+                frame = self._array_frame(np.asarray(source[start:start + size]))
+                yield frame if columns is None else frame[columns]
+        elif isinstance(source, pd.DataFrame):
+            frame = source if columns is None else source[columns]
+            for start in range(0, len(frame), size):
+                yield frame.iloc[start:start + size]
+        elif hasattr(source, "scanner"):
+            # pyarrow Dataset: only the needed columns are read
+            yield from source.to_batches(columns=columns, batch_size=size)
+        elif hasattr(source, "to_batches"):
+            # pyarrow Table
+            table = source if columns is None else source.select(columns)
+            yield from table.to_batches(max_chunksize=size)
+        elif callable(source):
+            yield from source()
+        elif self.one_shot:
+            if self._consumed:
+                raise ValueError(
+                    "This chunked source is an iterator and has already been read. "
+                    "Pass a list of chunks or a callable returning a fresh iterator "
+                    "to read it more than once."
+                )
+            self._consumed = True
+            head = [] if self._peeked is None else [self._peeked]
+            self._peeked = None
+            yield from itertools.chain(head, source)
+        else:
+            yield from source
+
+    def chunks(self, columns=None):
+        """
+        Iterate over the source as DataFrames.
+
+        Parameters:
+            columns (list of str, optional): Only keep these columns.
+
+        Yields:
+            DataFrame: One chunk at a time.
+        """
+        for chunk in self._raw_chunks(columns):
+            frame = self._to_frame(chunk)
+            if columns is not None and list(frame.columns) != list(columns):
+                frame = frame[columns]
+            yield frame
+
+    def map(self, func, columns=None):
+        """
+        Apply ``func`` to every chunk, yielding results in chunk order.
+
+        With ``n_jobs`` greater than one the chunks are processed in a thread
+        pool. At most ``2 * n_jobs`` chunks are in flight at any time, so
+        memory stays bounded by the chunk size. NumPy releases the GIL in
+        the binning and counting kernels, so the threads run in parallel.
+
+        Parameters:
+            func (callable): Called with each chunk DataFrame.
+            columns (list of str, optional): Only read these columns.
+
+        Yields:
+            Results of ``func``, in chunk order.
+        """
+        chunks = self.chunks(columns)
+        if not self.n_jobs or self.n_jobs <= 1:
+            for chunk in chunks:
+                yield func(chunk)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(func, chunk))
+                if len(pending) >= 2 * self.n_jobs:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def value_range(self, column):
+        """
+        Finite minimum and maximum of a column, in one pass over the chunks.
+
+        Returns:
+            tuple: (min, max), or None if the column has no finite values.
+        """
+        def chunk_range(chunk):
+            values = chunk[column].to_numpy(dtype=float)
+            values = values[np.isfinite(values)]
+            if len(values) == 0:
+                return None
+            return values.min(), values.max()
+
+        lo, hi = np.inf, -np.inf
+        for bounds in self.map(chunk_range, [column]):
+            if bounds is not None:
+                lo, hi = min(lo, bounds[0]), max(hi, bounds[1])
+        if lo > hi:
+            return None
+        return float(lo), float(hi)
@@ -0,0 +1,188 @@
+# colormap.py
+"""
+Colormap lookup tables.
+
+Continuous colors used to be computed one value at a time: the colorscale
+endpoints were parsed on every call and each value interpolated in Python.
+A colorscale is now expanded once into a table of ``lut_size`` RGBA entries,
+cached per colorscale, and whole arrays of values are mapped to colors with
+index arithmetic and a single gather from that table.
+
+Examples:
+    >>> from ggplotly import colormap
+    >>> colormap.lut('Viridis').shape
+    (256, 4)
+    >>> colormap.map_values(df['temp'], 'Viridis')  # (n, 4) uint8 RGBA array
+    >>> colormap.map_colors([0, 0.5, 1], [[0, 'white'], [1, 'red']], 0, 1)
+    array(['rgb(255, 255, 255)', 'rgb(255, 127, 127)', 'rgb(255, 0, 0)'], dtype=object)
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from .aesthetic_mapper import _cached_color_to_rgba
+
+# Number of entries of the lookup tables (256 or 1024 are typical)
+lut_size = 256
+
+
+@lru_cache(maxsize=512)
+def to_rgba(color):
+    """
+    (r, g, b, a) of a hex, rgb(), rgba() or named color.
+
+    Channels are floats, from 0 to 255 for r, g and b and from 0 to 1 for a.
+    """
+    rgba = _cached_color_to_rgba(color, 1.0)
+    r, g, b = (float(part) for part in rgba[5:-1].split(",")[:3])
+    alpha = 1.0
+    if color.startswith("rgba("):
+        parts = color[5:-1].split(",")
+        if len(parts) == 4:
+            alpha = float(parts[3])
+    return r, g, b, alpha
+
+
+def to_rgba_array(colors):
+    """
+    RGBA of an array of colors, parsing each distinct color once.
+
+    Parameters:
+        colors (array-like): Color strings.
+
+    Returns:
+        ndarray: (n, 4) float array of (r, g, b, a) rows.
+    """
+    codes, uniques = pd.factorize(pd.Series(colors, dtype=object))
+    table = np.array([to_rgba(color) for color in uniques], dtype=float).reshape(-1, 4)
+    if (codes < 0).any():
+        # Missing colors are transparent
+        table = np.vstack([table, np.zeros(4)])
+    return table[codes]
+
+
+def _key(colorscale):
+    """Hashable form of a colorscale: a name or ((position, color), ...) pairs."""
+    if isinstance(colorscale, str):
+        return colorscale
+    if all(isinstance(entry, str) for entry in colorscale):
+        # Plain color list, evenly spaced
+        colorscale = zip(np.linspace(0, 1, len(colorscale)), colorscale)
+    return tuple((float(position), color) for position, color in colorscale)
+
+
+def _stops(key):
+    """Positions and (k, 4) RGBA colors of the stops of a colorscale key."""
+    import plotly.colors as pc
+
+    if isinstance(key, str):
+        key = _key(pc.get_colorscale(key))
+    positions = np.array([position for position, _ in key])
+    colors = np.array([to_rgba(color) for _, color in key])
+    colors[:, 3] *= 255
+    return positions, colors
+
+
+@lru_cache(maxsize=128)
+def _lut(key, n):
+    positions, colors = _stops(key)
+    t = np.linspace(0, 1, n)
+    table = np.column_stack([np.interp(t, positions, channel) for channel in colors.T])
+    table = np.rint(table).astype(np.uint8)
+    table.flags.writeable = False
+    return table
+
+
+@lru_cache(maxsize=128)
+def _css(key, n):
+    table = _lut(key, n)
+    css = np.array([
+        f"rgb({r}, {g}, {b})" if a == 255 else f"rgba({r}, {g}, {b}, {a / 255:.3g})"
+        for r, g, b, a in table.tolist()
+    ], dtype=object)
+    css.flags.writeable = False
+    return css
+
+
+def lut(colorscale, n=None):
+    """
+    RGBA lookup table of a colorscale.
+
+    Parameters:
+        colorscale (str or list): Plotly colorscale name (e.g. 'Viridis'),
+            list of colors, or list of [position, color] pairs.
+        n (int, optional): Number of entries. Default is ``lut_size``.
+
+    Returns:
+        ndarray: Read-only (n, 4) uint8 array; entry i is the color at
+            position i / (n - 1) of the colorscale.
+    """
+    return _lut(_key(colorscale), n or lut_size)
+
+
+def indices(values, n=None, vmin=None, vmax=None):
+    """
+    Lookup table entries of values.
+
+    Parameters:
+        values (array-like): Numeric values.
+        n (int, optional): Number of entries. Default is ``lut_size``.
+        vmin, vmax (float, optional): Values mapped to the first and last
+            entries. Default is the range of the values. Values outside are
+            clamped.
+
+    Returns:
+        ndarray: int array of entries, with n for missing values.
+    """
+    n = n or lut_size
+    values = np.asarray(values).ravel()
+    if values.dtype.kind in "iufb":
+        values = values.astype(float, copy=False)
+    else:
+        values = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=float)
+    finite = np.isfinite(values)
+    if vmin is None:
+        vmin = values[finite].min() if finite.any() else 0.0
+    if vmax is None:
+        vmax = values[finite].max() if finite.any() else 0.0
+    scale = (n - 1) / (vmax - vmin) if vmax != vmin else 0.0
+    position = np.clip((np.where(finite, values, vmin) - vmin) * scale, 0, n - 1)
+    index = np.rint(position).astype(np.intp)
+    index[~finite] = n
+    return index
+
+
+def map_values(values, colorscale, vmin=None, vmax=None, n=None, na_color=(0, 0, 0, 0)):
+    """
+    RGBA colors of numeric values on a colorscale.
+
+    Parameters:
+        values (array-like): Numeric values.
+        colorscale (str or list): Colorscale, as for ``lut``.
+        vmin, vmax (float, optional): Range of the colorscale. Default is the
+            range of the values.
+        n (int, optional): Number of lookup table entries.
+        na_color (tuple): RGBA of missing values. Default is transparent.
+
+    Returns:
+        ndarray: (len(values), 4) uint8 array.
+    """
+    table = lut(colorscale, n)
+    table = np.vstack([table, np.asarray(na_color, dtype=np.uint8)])
+    return table[indices(values, len(table) - 1, vmin, vmax)]
+
+
+def map_colors(values, colorscale, vmin=None, vmax=None, n=None, na_color="rgba(0, 0, 0, 0)"):
+    """
+    Color strings of numeric values on a colorscale.
+
+    Same as ``map_values``, returning 'rgb(r, g, b)' strings for Plotly.
+
+    Returns:
+        ndarray: Object array of color strings.
+    """
+    css = _css(_key(colorscale), n or lut_size)
+    css = np.append(css, np.array([na_color], dtype=object))
+    return css[indices(values, len(css) - 1, vmin, vmax)]
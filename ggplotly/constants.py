@@ -5,7 +5,7 @@ This module contains palettes, defaults, and other constants used across
 the library to avoid duplication and ensure consistency.
 """
 
-import plotly.express as px
+import plotly.colors as pc
 
 # Default shape palette matching ggplot2's defaults
 # Maps to Plotly marker symbols
@@ -29,7 +29,7 @@ SHAPE_PALETTE = [
 ]
 
 # Default color palette (Plotly's qualitative palette)
-DEFAULT_COLOR_PALETTE = px.colors.qualitative.Plotly
+DEFAULT_COLOR_PALETTE = pc.qualitative.Plotly
 
 
 def get_color_palette(theme=None):
@@ -16,13 +16,24 @@ class Coord:
     like polar coordinates.
 
     All coordinate systems must implement the apply() method which
-    takes a Plotly figure and modifies it in place.
+    takes a Plotly figure and modifies it in place. Coordinate systems that
+    move trace data implement map(), which works on the plain trace dicts
+    before the figure is built.
 
     Examples:
         >>> ggplot(df, aes(x='x', y='y')) + geom_point() + coord_cartesian(xlim=(0, 10))
         >>> ggplot(df, aes(x='x', y='y')) + geom_bar() + coord_flip()
     """
 
+    def map(self, traces):
+        """
+        Transform trace data in place, after the scales are mapped.
+
+        Parameters:
+            traces (list): Plain trace dicts (see ``figure_builder``).
+        """
+        pass
+
     def apply(self, fig):
         """
         Apply the coordinate transformation to the figure.
@@ -1,5 +1,27 @@
+import numpy as np
+
+from .. import figure_builder
 from .coord_base import Coord
 
+# Trace types holding a grid indexed [y][x] in z
+_GRID_TRACE_TYPES = frozenset({"heatmap", "contour", "surface"})
+
+
+def _swap(trace, a, b):
+    """Swap two properties of a plain trace dict, leaving unset ones unset."""
+    value_a, value_b = trace.pop(a, None), trace.pop(b, None)
+    if value_b is not None:
+        trace[a] = value_b
+    if value_a is not None:
+        trace[b] = value_a
+
+
+def _transpose(trace, key):
+    """Transpose a 2-D property of a plain trace dict, such as a heatmap's z."""
+    value = trace.get(key)
+    if value is not None and np.ndim(value) == 2:
+        trace[key] = np.asarray(value).T
+
 
 class coord_flip(Coord):
     """
@@ -35,12 +57,41 @@ class coord_flip(Coord):
         self.expand = expand
         self.clip = clip
 
+    def map(self, traces):
+        """
+        Swap the x and y data of every trace.
+
+        This rotates the plot 90 degrees; apply() then swaps the axis titles
+        and settings.
+
+        Parameters:
+            traces (list): Plain trace dicts of every layer.
+        """
+        for trace in traces:
+            # Swap x and y data
+            _swap(trace, 'x', 'y')
+
+            # Box and violin traces may be positioned by x0/y0 instead
+            _swap(trace, 'x0', 'y0')
+
+            # For bar traces, swap orientation
+            if figure_builder.has_property(trace, 'orientation'):
+                trace['orientation'] = 'v' if trace.get('orientation') == 'h' else 'h'
+
+            # Swap the error bars; error_x and error_y hold the same settings
+            _swap(trace, 'error_x', 'error_y')
+
+            # Grids such as heatmap z are indexed [y][x], so rows become columns
+            if trace.get('type') in _GRID_TRACE_TYPES:
+                for key in ('z', 'text', 'hovertext', 'customdata'):
+                    _transpose(trace, key)
+
     def apply(self, fig):
         """
-        Apply coordinate flip to the figure by swapping x and y data.
+        Apply coordinate flip to the figure.
 
-        This swaps the x and y values in all traces, effectively rotating
-        the plot 90 degrees. Also swaps axis titles and settings.
+        Swaps the trace data (see map(); already done when the figure is
+        drawn with this coord), the axis titles and settings.
 
         Parameters:
             fig (Figure): The Plotly figure to modify.
@@ -48,34 +99,7 @@ class coord_flip(Coord):
         Returns:
             None: Modifies the figure in place.
         """
-        # Swap x and y data in all traces
-        for trace in fig.data:
-            # Get current x and y values
-            x_data = trace.x
-            y_data = trace.y
-
-            # Swap them
-            trace.x = y_data
-            trace.y = x_data
-
-            # For bar traces, swap orientation
-            if hasattr(trace, 'orientation'):
-                if trace.orientation == 'v' or trace.orientation is None:
-                    trace.orientation = 'h'
-                elif trace.orientation == 'h':
-                    trace.orientation = 'v'
-
-            # Handle error bars if present - swap the error bar data
-            # Note: error_x and error_y are different types in Plotly, so we need
-            # to convert the properties rather than swapping the objects directly
-            if hasattr(trace, 'error_x') and hasattr(trace, 'error_y'):
-                error_x_dict = trace.error_x.to_plotly_json() if trace.error_x else {}
-                error_y_dict = trace.error_y.to_plotly_json() if trace.error_y else {}
-                # Only swap if there's actual error bar data
-                if error_x_dict or error_y_dict:
-                    # Convert error_x data to error_y format and vice versa
-                    trace.error_x = error_y_dict if error_y_dict else None
-                    trace.error_y = error_x_dict if error_x_dict else None
+        figure_builder.map_figure(fig, self)
 
         # Swap axis titles
         layout = fig.layout
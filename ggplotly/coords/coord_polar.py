@@ -73,9 +73,14 @@ class coord_polar(Coord):
         angular_direction = 'clockwise' if self.direction == 1 else 'counterclockwise'
 
         # Check if we have Bar traces - convert to Pie or Barpolar
-        bar_traces = [t for t in fig.data if t.type == 'bar']
-        scatter_traces = [t for t in fig.data if t.type == 'scatter']
-        other_traces = [t for t in fig.data if t.type not in ('bar', 'scatter')]
+        bar_traces, scatter_traces, other_traces = [], [], []
+        for t in fig.data:
+            if t.type == 'bar':
+                bar_traces.append(t)
+            elif t.type == 'scatter':
+                scatter_traces.append(t)
+            else:
+                other_traces.append(t)
 
         new_traces = []
 
@@ -154,11 +159,10 @@ class coord_polar(Coord):
 
         # Replace all traces
         fig.data = []
-        for trace in new_traces:
-            fig.add_trace(trace)
+        fig.add_traces(new_traces)
 
         # Set up polar layout (for non-pie traces) or hide legend for pie
-        has_pie = any(t.type == 'pie' for t in fig.data)
+        has_pie = bool(bar_traces) or any(t.type == 'pie' for t in other_traces)
         if has_pie:
             # Hide legend for pie charts (categories shown in pie itself)
             fig.update_layout(showlegend=False)
@@ -1,5 +1,6 @@
 # coords/coord_sf.py
 
+from ..render_context import RenderContext
 from .coord_base import Coord
 
 
@@ -131,26 +132,11 @@ class coord_sf(Coord):
 
     def _has_geo_traces(self, fig):
         """Check if figure has geographic traces."""
-        geo_types = (
-            'scattergeo', 'choropleth',
-            'scattermapbox', 'choroplethmapbox',
-            'scattermap', 'choroplethmap'
-        )
-        return any(
-            hasattr(trace, 'type') and trace.type in geo_types
-            for trace in fig.data
-        )
+        return RenderContext.of(fig).is_geo
 
     def _has_mapbox_traces(self, fig):
         """Check if figure uses mapbox-style traces."""
-        mapbox_types = (
-            'scattermapbox', 'choroplethmapbox',
-            'scattermap', 'choroplethmap'
-        )
-        return any(
-            hasattr(trace, 'type') and trace.type in mapbox_types
-            for trace in fig.data
-        )
+        return RenderContext.of(fig).is_map
 
     def apply(self, fig):
         """
@@ -1,21 +1,180 @@
 # datasets.py
 """
 Built-in datasets for ggplotly, mirroring those available in ggplot2.
+
+The bundled CSV files are parsed once and converted into a columnar binary
+cache (one ``.npy`` file per column plus a small JSON header) in the user
+cache directory. Later loads memory-map the numeric columns instead of
+re-parsing text, and loaded frames are kept in an in-process LRU so repeated
+``data(name)`` calls are nearly free.
+
+The cache directory is ``$GGPLOTLY_CACHE_DIR`` if set, otherwise
+``$XDG_CACHE_HOME/ggplotly`` (``~/.cache/ggplotly`` by default). If it cannot
+be written, datasets are read straight from the CSV files.
 """
 from __future__ import annotations
 
+import json
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 _DATA_DIR = Path(__file__).parent / "data"
 
+# Bump when the on-disk cache layout changes
+_CACHE_FORMAT = 1
+
+# Number of parsed datasets kept in memory
+DATA_CACHE_SIZE = 16
+
+_frame_cache: OrderedDict = OrderedDict()
+
 
 def _list_datasets() -> list[str]:
     """Return sorted list of available dataset names."""
     return sorted([f.stem for f in _DATA_DIR.glob("*.csv")])
 
 
+def _cache_dir() -> Path:
+    """Return the directory holding the binary dataset cache."""
+    env = os.environ.get("GGPLOTLY_CACHE_DIR")
+    if env:
+        return Path(env) / "datasets"
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "ggplotly" / "datasets"
+
+
+def _copy_on_write_enabled() -> bool:
+    """Return True if pandas copy-on-write protects shallow copies."""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except (KeyError, pd.errors.OptionError):
+        return False
+
+
+def _source_stamp(csv_path: Path) -> dict:
+    """Return the fields that decide whether a cache entry is stale."""
+    stat = csv_path.stat()
+    return {"format": _CACHE_FORMAT, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _write_binary_cache(df: pd.DataFrame, target: Path, stamp: dict):
+    """
+    Write a DataFrame as one .npy file per column plus a JSON header.
+
+    Numeric and boolean columns are stored as-is so they can be memory-mapped.
+    Other columns are stored as integer codes with their unique values in
+    the header. The directory is written under a temporary name and renamed
+    into place, so concurrent readers never see a partial cache.
+
+    Parameters:
+        df (DataFrame): Parsed dataset.
+        target (Path): Cache directory for this dataset.
+        stamp (dict): Source stamp from _source_stamp().
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix=f".{target.name}-", dir=target.parent))
+    try:
+        columns = []
+        for i, name in enumerate(df.columns):
+            col = df[name]
+            entry = {"name": name, "dtype": str(col.dtype)}
+            if col.dtype.kind in "biuf":
+                np.save(tmp / f"{i}.npy", col.to_numpy())
+                entry["kind"] = "array"
+            else:
+                codes, uniques = pd.factorize(col)
+                np.save(tmp / f"{i}.npy", codes.astype(np.int32))
+                entry["kind"] = "codes"
+                entry["uniques"] = list(uniques)
+            columns.append(entry)
+
+        header = {**stamp, "n_rows": len(df), "columns": columns}
+        (tmp / "header.json").write_text(json.dumps(header))
+
+        if target.exists():
+            shutil.rmtree(target, ignore_errors=True)
+        os.replace(tmp, target)
+    finally:
+        if tmp.exists():
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _read_binary_cache(target: Path, stamp: dict) -> pd.DataFrame | None:
+    """
+    Load a dataset from its binary cache, or None if missing or stale.
+
+    Numeric columns are memory-mapped read-only; pandas copies them only if
+    a caller writes to them.
+    """
+    try:
+        header = json.loads((target / "header.json").read_text())
+    except (OSError, ValueError):
+        return None
+    if any(header.get(key) != value for key, value in stamp.items()):
+        return None
+
+    columns = {}
+    for i, entry in enumerate(header["columns"]):
+        values = np.load(target / f"{i}.npy", mmap_mode="r").view(np.ndarray)
+        if entry["kind"] == "codes":
+            uniques = pd.array(entry["uniques"], dtype=entry["dtype"])
+            values = uniques.take(np.asarray(values, dtype=np.intp), allow_fill=True)
+        columns[entry["name"]] = values
+    return pd.DataFrame(columns, copy=False)
+
+
+def _load_frame(name: str) -> pd.DataFrame:
+    """
+    Return the shared, cached DataFrame for a bundled dataset.
+
+    Looks in the in-process LRU first, then the binary cache, and finally
+    parses the CSV and writes the binary cache for next time.
+    """
+    cached = _frame_cache.get(name)
+    if cached is not None:
+        _frame_cache.move_to_end(name)
+        return cached
+
+    csv_path = _DATA_DIR / f"{name}.csv"
+    stamp = _source_stamp(csv_path)
+    target = _cache_dir() / name
+
+    df = _read_binary_cache(target, stamp)
+    if df is None:
+        df = pd.read_csv(csv_path)
+        try:
+            _write_binary_cache(df, target, stamp)
+        except (OSError, TypeError, ValueError):
+            # Read-only home, full disk or unserializable values: keep the CSV frame
+            pass
+
+    _frame_cache[name] = df
+    if len(_frame_cache) > DATA_CACHE_SIZE:
+        _frame_cache.popitem(last=False)
+    return df
+
+
+def clear_cache(disk: bool = False):
+    """
+    Clear the in-memory dataset cache.
+
+    Parameters:
+        disk: If True, also delete the binary cache files on disk.
+    """
+    _frame_cache.clear()
+    if disk:
+        shutil.rmtree(_cache_dir(), ignore_errors=True)
+
+
 def _load_us_flights():
     """Load US flights as an igraph Graph object."""
     try:
@@ -26,30 +185,23 @@ def _load_us_flights():
             "Install it with: pip install igraph"
         )
 
-    nodes = pd.read_csv(_DATA_DIR / "us_flights_nodes.csv")
-    edges = pd.read_csv(_DATA_DIR / "us_flights_edges.csv")
-
-    g = ig.Graph.TupleList(
-        edges.itertuples(index=False),
-        directed=False,
-    )
+    nodes = _load_frame("us_flights_nodes")
+    edges = _load_frame("us_flights_edges").to_numpy()
 
-    # Add node attributes - vertex names are integer IDs from edge list
-    # Map from integer ID to node attributes using the 'id' column
-    id_to_row = {row['id']: row for _, row in nodes.iterrows()}
+    # Vertices are numbered in order of first appearance in the edge list,
+    # matching Graph.TupleList
+    vertex_ids = pd.unique(edges.ravel())
+    edge_index = pd.Index(vertex_ids).get_indexer(edges.ravel()).reshape(-1, 2)
 
-    # First, collect the vertex IDs before we overwrite 'name'
-    vertex_ids = [v["name"] for v in g.vs]
+    g = ig.Graph(n=len(vertex_ids), edges=edge_index, directed=False)
 
-    # Now add all attributes
+    # Align node attributes to vertex order; ids missing from nodes get None
+    attrs = nodes.set_index("id", drop=False).reindex(vertex_ids).astype(object)
+    missing = ~np.isin(vertex_ids, nodes["id"].to_numpy())
     for col in nodes.columns:
-        attr_values = []
-        for node_id in vertex_ids:
-            if node_id in id_to_row:
-                attr_values.append(id_to_row[node_id][col])
-            else:
-                attr_values.append(None)
-        g.vs[col] = attr_values
+        values = attrs[col].to_numpy(copy=True)
+        values[missing] = None
+        g.vs[col] = values.tolist()
 
     return g
 
@@ -66,7 +218,8 @@ def data(name: str | None = None):
     Returns:
         If name is None: list of available dataset names.
         If name is 'us_flights': igraph.Graph object.
-        Otherwise: pandas.DataFrame containing the dataset.
+        Otherwise: pandas.DataFrame containing the dataset. The frame is
+        independent of the cache, so it can be modified freely.
 
     Raises:
         ValueError: If the dataset name is not found.
@@ -91,4 +244,6 @@ def data(name: str | None = None):
             f"Unknown dataset '{name}'. "
             f"Use data() to see available datasets."
         )
-    return pd.read_csv(_DATA_DIR / f"{name}.csv")
+
+    # With copy-on-write a shallow copy is enough: writes copy the touched column
+    return _load_frame(name).copy(deep=not _copy_on_write_enabled())
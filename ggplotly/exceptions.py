@@ -8,9 +8,21 @@ when they make common mistakes with aesthetic mappings, data, or parameters.
 from difflib import get_close_matches
 
 
+def _restore(cls, args, state):
+    """Unpickle an error without calling its __init__."""
+    error = cls.__new__(cls)
+    Exception.__init__(error, *args)
+    error.__dict__.update(state)
+    return error
+
+
 class GgplotlyError(Exception):
     """Base exception for all ggplotly errors."""
-    pass
+
+    def __reduce__(self):
+        # Subclasses take other __init__ arguments than their message; errors
+        # raised in worker processes (see export) are sent back as they are
+        return _restore, (type(self), self.args, self.__dict__)
 
 
 class AestheticMappingError(GgplotlyError):
@@ -0,0 +1,317 @@
+# export.py
+"""
+Exporting many plots: offline HTML and bulk image export.
+
+``ggplot.save('plot.html')`` references plotly.js and MathJax on a CDN, which
+does not work without internet access, while inlining plotly.js adds about
+3.5 MB to every file. ``export_html`` writes a batch of plots that all load
+one local copy of plotly.js, either as one HTML file per plot in a directory
+or as a single page holding every plot. MathJax is only referenced by plots
+that render LaTeX (``parse=True``), and figures are drawn and serialized in a
+pool of worker processes.
+
+``ggsave_many`` saves many plots to files of any format ``ggplot.save``
+knows, plus SVG, PDF, JPEG and WebP images. Saving images one at a time
+with ``fig.write_image`` starts Kaleido's browser for every figure, so the
+plots are split into batches: a pool of worker processes, kept for the whole
+export, draws each batch and writes its images with one Kaleido call. Files
+are written as batches finish and the report lists per-file timings.
+
+Examples:
+    >>> report = export_html({'sales': p1, 'costs': p2}, 'reports/')
+    >>> report.total_bytes
+    >>> export_html([p1, p2, p3], 'reports/summary.html', mathjax='static/tex-svg.js')
+    >>> report = ggsave_many(plots, [f'out/{i}.png' for i in range(len(plots))], workers=4)
+    >>> max(report.files, key=lambda f: f.draw_seconds + f.write_seconds)
+"""
+
+import importlib.util
+import math
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+from plotly.offline.offline import get_plotlyjs_version
+
+from . import serialize
+from .workers import call_packed, pack
+
+ExportReport = namedtuple("ExportReport", ["files", "plotlyjs", "total_bytes", "seconds"])
+SaveReport = namedtuple("SaveReport", ["files", "total_bytes", "seconds"])
+
+# A file written by ggsave_many. Images written by one Kaleido call share its
+# time evenly
+SavedFile = namedtuple("SavedFile", ["path", "format", "bytes", "draw_seconds", "write_seconds"])
+
+# Formats written by Kaleido, and by ggplot.save
+_IMAGE_FORMATS = ("png", "jpg", "jpeg", "webp", "svg", "pdf")
+_FILE_FORMATS = ("html", "json")
+
+# Largest batch by default, so workers hold few figures and files are
+# written as the export goes
+_MAX_BATCH = 100
+
+_PAGE = """<!doctype html>
+<html>
+<head>
+    <meta charset="utf-8" />
+    <title>{title}</title>
+    <script src="{plotlyjs}"></script>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+def plotlyjs_filename():
+    """File name of the plotly.js bundle shipped with the installed plotly."""
+    return f"plotly-{get_plotlyjs_version()}.min.js"
+
+
+def write_plotlyjs(directory):
+    """
+    Write the plotly.js bundle shipped with plotly into a directory.
+
+    The file name includes the plotly.js version, so exports made with
+    different plotly versions do not overwrite each other's bundle. An
+    existing copy is reused.
+
+    Parameters:
+        directory (str): Target directory. Created if needed.
+
+    Returns:
+        str: Path of the bundle.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, plotlyjs_filename())
+    if not os.path.exists(path):
+        # Write then rename, so concurrent exports never see a partial file
+        partial = f"{path}.{os.getpid()}.tmp"
+        with open(partial, "w", encoding="utf-8") as f:
+            f.write(get_plotlyjs())
+        os.replace(partial, path)
+    return path
+
+
+def _check_name(name):
+    """A plot name, if it is a plain file name inside the export directory."""
+    name = str(name)
+    if name in ("", ".", "..") or any(sep in name for sep in ("/", "\\", "\0")):
+        raise ValueError(f"Plot name {name!r} is not a plain file name")
+    return name
+
+
+def _named(plots, names):
+    """(name, plot) pairs from a dict or a sequence of plots."""
+    if isinstance(plots, dict):
+        return [(_check_name(name), plot) for name, plot in plots.items()]
+    plots = list(plots)
+    if names is None:
+        width = max(len(str(len(plots) - 1)), 3)
+        names = [f"plot_{i:0{width}d}" for i in range(len(plots))]
+    elif len(names) != len(plots):
+        raise ValueError(f"Got {len(names)} names for {len(plots)} plots")
+    return [(_check_name(name), plot) for name, plot in zip(names, plots)]
+
+
+def _render_file(name, plot, directory, plotlyjs_src, mathjax, precision):
+    """Draw one plot and write it as an HTML file; returns (path, bytes)."""
+    target = os.path.join(directory, f"{name}.html")
+    html = serialize.to_html(
+        plot.draw(), precision=precision, include_plotlyjs=plotlyjs_src,
+        include_mathjax=mathjax if plot._needs_mathjax() else False,
+    )
+    with open(target, "w", encoding="utf-8") as f:
+        f.write(html)
+    return target, os.path.getsize(target)
+
+
+def _render_div(name, plot, mathjax, precision):
+    """Draw one plot as an HTML div without plotly.js."""
+    return serialize.to_html(
+        plot.draw(), precision=precision, full_html=False, include_plotlyjs=False,
+        include_mathjax=mathjax, div_id=name,
+    )
+
+
+def _map(func, calls, n_jobs):
+    """
+    Results of func(*args) for each args in calls, in order.
+
+    Drawing and serializing hold the GIL, so the calls run in a pool of
+    processes. A plot that cannot be sent to a worker (e.g. one holding a
+    lambda) is rendered in the calling process instead. Errors raised while
+    rendering propagate.
+    """
+    if n_jobs is None:
+        n_jobs = min(len(calls), os.cpu_count() or 1)
+    if n_jobs <= 1:
+        return [func(*args) for args in calls]
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        futures = []
+        for args in calls:
+            payload = pack(args)
+            futures.append(None if payload is None else pool.submit(call_packed, func, payload))
+        return [func(*args) if future is None else future.result()
+                for future, args in zip(futures, calls)]
+
+
+def export_html(plots, path, names=None, mathjax="cdn", precision="float64", n_jobs=None,
+                title="ggplotly"):
+    """
+    Export plots as offline HTML sharing one local copy of plotly.js.
+
+    Parameters:
+        plots (dict or list): ggplot objects, keyed by name in a dict.
+        path (str): Directory to write one ``<name>.html`` per plot into, or a
+            file name ending in ``.html`` to write every plot into one page.
+            plotly.js is written next to the HTML.
+        names (list, optional): File names (without extension) for a list of
+            plots. Default is ``plot_000``, ``plot_001``, ...
+        mathjax (str): MathJax for plots that render LaTeX: 'cdn' or the path
+            or URL of a local ``tex-svg.js``. Plots without LaTeX never load it.
+        precision (str): Precision of float arrays: 'float64' (default) or
+            'float32'. See ``ggplotly.serialize``.
+        n_jobs (int, optional): Worker processes drawing and serializing the
+            plots. Default is one per CPU; 1 exports in the calling process.
+            Plots drawn by workers keep their own figure out of date.
+        title (str): Page title of a single-page export.
+
+    Returns:
+        ExportReport: Named tuple (files, plotlyjs, total_bytes, seconds), where
+            files lists (path, bytes) per HTML file and total_bytes includes the
+            plotly.js bundle.
+    """
+    start = time.perf_counter()
+    named = _named(plots, names)
+    single_page = str(path).lower().endswith(".html")
+    directory = os.path.dirname(os.path.abspath(path)) if single_page else str(path)
+    plotlyjs = write_plotlyjs(directory)
+    plotlyjs_src = os.path.basename(plotlyjs)
+
+    if single_page:
+        # MathJax is loaded once, by the first plot that needs it
+        needs_mathjax = [plot._needs_mathjax() for _, plot in named]
+        first = needs_mathjax.index(True) if any(needs_mathjax) else None
+        calls = [(name, plot, mathjax if i == first else False, precision)
+                 for i, (name, plot) in enumerate(named)]
+        divs = _map(_render_div, calls, n_jobs)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_PAGE.format(title=title, plotlyjs=plotlyjs_src, body="\n".join(divs)))
+        files = [(str(path), os.path.getsize(path))]
+    else:
+        calls = [(name, plot, directory, plotlyjs_src, mathjax, precision) for name, plot in named]
+        files = _map(_render_file, calls, n_jobs)
+
+    total = sum(size for _, size in files) + os.path.getsize(plotlyjs)
+    return ExportReport(files, plotlyjs, total, time.perf_counter() - start)
+
+
+def _save_batch(batch, width, height, scale, precision, include_plotlyjs):
+    """Draw a batch of (plot, path, format) and write its files; returns SavedFiles."""
+    timings, images = [], []
+    for plot, path, fmt in batch:
+        start = time.perf_counter()
+        fig = plot.draw()
+        drawn = time.perf_counter()
+        if fmt in _IMAGE_FORMATS:
+            images.append((len(timings), fig, path, fmt))
+            timings.append([drawn - start, 0.0])
+        else:
+            plot.save(path, format=fmt, precision=precision, include_plotlyjs=include_plotlyjs)
+            timings.append([drawn - start, time.perf_counter() - drawn])
+
+    if images:
+        start = time.perf_counter()
+        pio.write_images(
+            [fig for _, fig, _, _ in images], [path for _, _, path, _ in images],
+            format=[fmt for *_, fmt in images], width=width, height=height, scale=scale,
+        )
+        share = (time.perf_counter() - start) / len(images)
+        for index, *_ in images:
+            timings[index][1] = share
+
+    return [SavedFile(path, fmt, os.path.getsize(path), *timing)
+            for (_, path, fmt), timing in zip(batch, timings)]
+
+
+def ggsave_many(plots, paths, workers=None, batch_size=None, width=None, height=None, scale=1.0,
+                precision="float64", include_plotlyjs="cdn"):
+    """
+    Save many plots, drawing and exporting them in a pool of worker processes.
+
+    Parameters:
+        plots (list): ggplot objects.
+        paths (list): File path per plot. The extension gives the format:
+            png, jpg, jpeg, webp, svg or pdf (written by Kaleido), html or json.
+        workers (int, optional): Worker processes. Default is one per CPU;
+            1 exports in the calling process. Plots drawn by workers keep
+            their own figure out of date.
+        batch_size (int, optional): Plots per batch. Each batch is drawn by
+            one worker and its images written by one Kaleido call. Default
+            spreads the plots evenly over the workers, with at most 100 per
+            batch.
+        width (int, optional): Image width in pixels. Default is the figure
+            width.
+        height (int, optional): Image height in pixels. Default is the
+            figure height.
+        scale (float): Scale factor of images.
+        precision (str): Precision of float arrays in HTML and JSON files:
+            'float64' (default) or 'float32'.
+        include_plotlyjs (str or bool): How HTML files load Plotly.js; see
+            ``ggplot.save``.
+
+    Returns:
+        SaveReport: Named tuple (files, total_bytes, seconds), where files
+            lists a SavedFile (path, format, bytes, draw_seconds,
+            write_seconds) per plot, in order.
+
+    Raises:
+        ValueError: If paths do not match plots, or a format is unsupported.
+        ImportError: If images are requested and kaleido is not installed, or
+            plotly is too old to export them in batches.
+
+    Examples:
+        >>> report = ggsave_many(plots, [f'out/{i}.png' for i in range(len(plots))], workers=4)
+        >>> report.seconds, sum(f.write_seconds for f in report.files)
+    """
+    start = time.perf_counter()
+    plots, paths = list(plots), [str(path) for path in paths]
+    if len(paths) != len(plots):
+        raise ValueError(f"Got {len(paths)} paths for {len(plots)} plots")
+    formats = [path.rsplit(".", 1)[-1].lower() for path in paths]
+    unsupported = sorted(set(formats) - set(_IMAGE_FORMATS) - set(_FILE_FORMATS))
+    if unsupported:
+        raise ValueError(
+            f"Unsupported file format(s): {', '.join(unsupported)}. "
+            f"Use {', '.join(_IMAGE_FORMATS + _FILE_FORMATS)}."
+        )
+    if any(fmt in _IMAGE_FORMATS for fmt in formats):
+        if importlib.util.find_spec("kaleido") is None:
+            raise ImportError(
+                "The kaleido package is required to export images. "
+                "Install it with: pip install kaleido"
+            )
+        if getattr(pio, "write_images", None) is None:
+            raise ImportError(
+                "Exporting images in batches requires plotly 6.1 or later and kaleido 1.0 "
+                "or later. Install them with: pip install -U plotly kaleido"
+            )
+    if not plots:
+        return SaveReport([], 0, time.perf_counter() - start)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if batch_size is None:
+        batch_size = min(math.ceil(len(plots) / max(workers, 1)), _MAX_BATCH)
+    items = list(zip(plots, paths, formats))
+    calls = [(items[i:i + batch_size], width, height, scale, precision, include_plotlyjs)
+             for i in range(0, len(items), batch_size)]
+    files = [saved for batch in _map(_save_batch, calls, min(workers, len(calls))) for saved in batch]
+    return SaveReport(files, sum(saved.bytes for saved in files), time.perf_counter() - start)
@@ -63,12 +63,14 @@ class Facet:
         geom._global_color_map = global_color_map
         geom._global_shape_map = global_shape_map
 
-    def apply(self, plot) -> Optional[Figure]:
+    def apply(self, plot, context=None) -> Optional[Figure]:
         """
         Apply faceting to the plot.
 
         Parameters:
             plot (ggplot): The ggplot object.
+            context (RenderContext, optional): State shared by every geom
+                drawn on the facets.
 
         Returns:
             Figure: A Plotly figure with facets applied.
@@ -146,12 +148,14 @@ class facet_grid(Facet):
         """Check if value means 'no faceting on this dimension'."""
         return value is None or value == '.'
 
-    def apply(self, plot):
+    def apply(self, plot, context=None):
         """
         Apply facet grid to the plot.
 
         Parameters:
             plot (ggplot): The ggplot object.
+            context (RenderContext, optional): State shared by every geom
+                drawn on the facets.
 
         Returns:
             Figure: A Plotly figure with facets applied in a grid.
@@ -323,7 +327,7 @@ class facet_grid(Facet):
                     if scene_key:
                         geom.params['_scene_key'] = scene_key
 
-                    geom.draw(fig, row=row, col=col)
+                    geom.draw(fig, row=row, col=col, context=context)
 
         return fig
 
@@ -428,12 +432,14 @@ class facet_wrap(Facet):
                 return getattr(geom, 'map_type', 'state')
         return 'state'
 
-    def apply(self, plot):
+    def apply(self, plot, context=None):
         """
         Apply facet wrapping to the plot.
 
         Parameters:
             plot (ggplot): The ggplot object.
+            context (RenderContext, optional): State shared by every geom
+                drawn on the facets.
 
         Returns:
             Figure: A Plotly figure with facets applied.
@@ -524,7 +530,7 @@ class facet_wrap(Facet):
 
                     # Pass scene key for 3D geoms
                     geom.params['_scene_key'] = scene_key
-                    geom.draw(fig, row=row, col=col)
+                    geom.draw(fig, row=row, col=col, context=context)
 
         elif is_geo:
             # For geo subplots, we need to manually position each geo
@@ -596,7 +602,7 @@ class facet_wrap(Facet):
                     if global_zmin is not None:
                         geom.params['_global_zmin'] = global_zmin
                         geom.params['_global_zmax'] = global_zmax
-                    geom.draw(fig, row=row+1, col=col+1)
+                    geom.draw(fig, row=row+1, col=col+1, context=context)
 
                 # Set up geo layout for this subplot with domain positioning
                 if map_type in ('state', 'usa'):
@@ -679,6 +685,6 @@ class facet_wrap(Facet):
                         geom.setup_data(geom_facet_data, plot.mapping)
                     else:
                         geom.setup_data(facet_data, plot.mapping)
-                    geom.draw(fig, row=row, col=col)
+                    geom.draw(fig, row=row, col=col, context=context)
 
         return fig
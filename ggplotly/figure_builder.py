@@ -0,0 +1,359 @@
+# figure_builder.py
+"""
+Validation-free trace assembly.
+
+Adding a trace with ``fig.add_trace(go.Scatter(...), row=, col=)`` runs
+Plotly's property validators twice (once for the trace, once when the figure
+copies it) and resolves the subplot axes on every call. For faceted plots
+with many categories this dominates ``ggplot.draw()``. While a figure is
+drawn, the trace builders instead record each trace as a plain dict with its
+``xaxis``/``yaxis`` references read once from the facet grid. ``build``
+then constructs the final figure in one step with validation skipped.
+
+Traces still pass through Plotly's validators when they are added outside a
+draw, or when ``figure_builder.strict_validation = True`` (useful to debug a
+geom that produces an invalid property).
+
+Examples:
+    >>> from ggplotly import figure_builder
+    >>> figure_builder.strict_validation = True
+    >>> fig = p.draw()  # every trace validated, as in fig.add_trace
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from _plotly_utils.basevalidators import (
+    ColorscaleValidator,
+    copy_to_readonly_numpy_array,
+)
+from plotly.basedatatypes import BaseTraceType
+from plotly.validator_cache import ValidatorCache
+
+from .render_context import RenderContext
+
+# Set to True to validate every trace property while drawing
+strict_validation = False
+
+_PENDING_ATTR = "_ggplotly_pending"
+_MAPPED_ATTR = "_ggplotly_mapped"
+
+# Properties holding arbitrary user data, copied without expanding their keys
+_FREEFORM = frozenset({"meta", "customdata"})
+
+# Expands named colorscales ('Viridis') to the color lists Plotly stores
+_COLORSCALE = ColorscaleValidator("colorscale", "figure_builder")
+
+# Layout properties holding one dict per annotation, shape or image
+_LAYOUT_ARRAYS = ("annotations", "shapes", "images")
+
+# (trace type, property path) -> whether the trace type supports it
+_SUPPORTED = {}
+
+# Whether traces added through add_trace are deferred in this context
+_deferring = ContextVar("ggplotly_deferring", default=False)
+
+
+@contextmanager
+def deferred():
+    """Defer traces added with ``add_trace`` until ``build`` is called."""
+    token = _deferring.set(not strict_validation)
+    try:
+        yield
+    finally:
+        _deferring.reset(token)
+
+
+def is_deferring():
+    """Whether traces added with ``add_trace`` are currently deferred."""
+    return _deferring.get()
+
+
+def _plain(value):
+    """Trace value as Plotly stores it after validation."""
+    if isinstance(value, np.ndarray) or (
+        isinstance(value, (pd.Series, pd.Index))
+        and isinstance(value.dtype, np.dtype) and value.dtype.kind in "iufb"
+    ):
+        # Plain NumPy data: the read-only copy Plotly makes, without the
+        # dataframe-agnostic conversion it runs first
+        array = np.ascontiguousarray(np.array(value))
+        array.flags.writeable = False
+        return array
+    if isinstance(value, (pd.Series, pd.Index)):
+        return copy_to_readonly_numpy_array(value)
+    if isinstance(value, dict):
+        nested = {}
+        for key, item in value.items():
+            if item is not None:
+                _set_path(nested, key.split("_"), _plain(item))
+        return nested
+    return value
+
+
+def _set_path(target, path, value):
+    """Set a nested property the way Plotly's validators store it."""
+    if isinstance(value, dict) and not value:
+        # Empty compound properties are dropped
+        return
+    if path[-1] == "title" and isinstance(value, str):
+        value = {"text": value}
+    elif path[-1] == "colorscale" and isinstance(value, str):
+        value = _COLORSCALE.validate_coerce(value)
+    for part in path[:-1]:
+        target = target.setdefault(part, {})
+    last = path[-1]
+    if isinstance(value, dict) and isinstance(target.get(last), dict):
+        target[last].update(value)
+    else:
+        target[last] = value
+
+
+def trace_dict(plot, props):
+    """
+    Plain Plotly dict of a trace, expanding magic underscore names.
+
+    Parameters:
+        plot: Plotly trace class (e.g. go.Scatter).
+        props (dict): Constructor arguments, e.g. {'marker_color': 'red'}.
+
+    Returns:
+        dict: Trace dict with a ``type`` key, e.g.
+            {'type': 'scatter', 'marker': {'color': 'red'}}.
+    """
+    trace = {"type": plot._path_str}
+    valid = plot._valid_props
+    for key, value in props.items():
+        if value is None:
+            continue
+        if key in valid:
+            path = [key]
+        else:
+            head, _, rest = key.partition("_")
+            if head not in valid or not rest:
+                raise ValueError(f"Invalid property {key!r} for {plot.__name__}")
+            path = [head, *rest.split("_")]
+        _set_path(trace, path, value if key in _FREEFORM else _plain(value))
+    return trace
+
+
+def add_trace(fig, plot, row=None, col=None, **props):
+    """
+    Add a trace to a subplot of a figure.
+
+    During a draw the trace is recorded as a plain dict and added by
+    ``build``; otherwise this is ``fig.add_trace(plot(**props), row, col)``.
+
+    Parameters:
+        fig (Figure): Figure to add the trace to.
+        plot: Plotly trace class (e.g. go.Scatter).
+        row, col (int, optional): Subplot position.
+        **props: Trace properties.
+    """
+    # Only Plotly trace classes are deferred, not factories returning traces
+    if _deferring.get() and isinstance(plot, type) and issubclass(plot, BaseTraceType):
+        context = RenderContext.of(fig)
+        refs = context.axis_refs(row, col)
+        if refs is not None and refs.keys() <= plot._valid_props:
+            trace = trace_dict(plot, props)
+            trace.update(refs)
+            context.record(trace["type"])
+            # Remember the position among validated traces to keep the z-order
+            pending_traces(fig).append((len(fig.data), trace))
+            return
+    fig.add_trace(plot(**props), row=row, col=col)
+
+
+def add_trace_dict(fig, trace):
+    """
+    Add a plain trace dict to a figure drawn inside ``deferred()``.
+
+    The trace is added by ``build`` like the traces of ``add_trace``, e.g.
+    to reuse a trace drawn by an earlier draw (see render_diff).
+
+    Parameters:
+        fig (Figure): Figure being drawn.
+        trace (dict): Plain trace dict with a ``type`` key and its axis
+            references.
+    """
+    RenderContext.of(fig).record(trace.get("type", "scatter"))
+    pending_traces(fig).append((len(fig.data), trace))
+
+
+def pending_traces(fig):
+    """Deferred (position, trace dict) pairs of a figure, in drawing order."""
+    return fig.__dict__.setdefault(_PENDING_ATTR, [])
+
+
+def add_annotations(fig, annotations):
+    """
+    Append annotations to the layout of a figure in one assignment.
+
+    ``fig.add_annotation`` validates each annotation and copies the whole
+    annotation tuple on every call, which is quadratic in the number of
+    labels. The annotations are given as plain Plotly dicts (nested, without
+    magic underscores) and are not validated unless
+    ``figure_builder.strict_validation`` is set.
+
+    Parameters:
+        fig (Figure): Figure to add the annotations to.
+        annotations (list): Annotation dicts, e.g.
+            [{'x': 1, 'y': 2, 'text': 'a', 'showarrow': False}].
+    """
+    extend_layout(fig, "annotations", annotations)
+
+
+def extend_layout(fig, key, items):
+    """
+    Append plain dicts to a layout array of a figure in one assignment.
+
+    Like ``add_annotations`` for any of the layout arrays.
+
+    Parameters:
+        fig (Figure): Figure to add the items to.
+        key (str): 'annotations', 'shapes' or 'images'.
+        items (list): Plain Plotly dicts.
+    """
+    if not items:
+        return
+    layout = fig.layout
+    validate = layout._validate
+    layout._validate = validate and strict_validation
+    try:
+        layout[key] = (*layout[key], *items)
+    finally:
+        layout._validate = validate
+
+
+def update_trace(trace, **props):
+    """
+    Set properties of a plain trace dict, e.g. ``update_trace(t, marker_size=4)``.
+
+    Values are stored the way ``trace_dict`` stores them; dicts are merged
+    into existing compound properties.
+    """
+    for key, value in props.items():
+        if value is not None:
+            _set_path(trace, key.split("_"), _plain(value))
+
+
+def has_property(trace, path):
+    """
+    Whether the type of a plain trace dict supports a property.
+
+    Parameters:
+        trace (dict): Plain trace dict.
+        path (str): Dotted property path, e.g. 'marker.size'.
+
+    Returns:
+        bool
+    """
+    key = (trace.get("type", "scatter"), path)
+    if key not in _SUPPORTED:
+        # Walk an empty trace of that type; compound properties are objects
+        obj = _trace_class(key[0])()
+        supported = True
+        for part in path.split("."):
+            if obj is None or part not in obj:
+                supported = False
+                break
+            obj = obj[part]
+        _SUPPORTED[key] = supported
+    return _SUPPORTED[key]
+
+
+def _trace_class(trace_type):
+    return ValidatorCache.get_validator("", "data").get_trace_class(trace_type)
+
+
+def map_figure(fig, component):
+    """
+    Train and map a scale or coord onto the traces of a finished figure.
+
+    ``ggplot.draw()`` maps scales and coords onto plain trace dicts before
+    the figure is built and records them on the figure; those are skipped.
+    This keeps ``scale.apply(fig)`` working on any other figure.
+
+    Parameters:
+        fig (Figure): Plotly figure, modified in place.
+        component: Scale or Coord with ``map`` (and optionally ``train``).
+    """
+    if any(done is component for done in fig.__dict__.get(_MAPPED_ATTR, ())):
+        return
+    traces = [trace.to_plotly_json() for trace in fig.data]
+    if hasattr(component, "train"):
+        component.train(traces)
+    component.map(traces)
+    fig.data = []
+    fig.add_traces(traces)
+
+
+def mark_mapped(fig, components):
+    """Record scales and coords already mapped onto the traces of fig."""
+    setattr(fig, _MAPPED_ATTR, tuple(components))
+
+
+def collect(fig):
+    """
+    Every trace of a figure drawn inside ``deferred()`` as a plain dict.
+
+    Deferred traces and traces added directly to the figure are returned in
+    drawing order. The dicts of direct traces are the figure's own, so fig
+    must be replaced by ``build(fig, traces)`` afterwards.
+
+    Parameters:
+        fig (Figure): Drawn figure.
+
+    Returns:
+        list: Plain trace dicts.
+    """
+    pending = fig.__dict__.pop(_PENDING_ATTR, [])
+    existing = [trace._props for trace in fig.data]
+    data = []
+    start = 0
+    for position, trace in pending:
+        data.extend(existing[start:position])
+        start = max(start, position)
+        data.append(trace)
+    data.extend(existing[start:])
+    return data
+
+
+def build(fig, data=None):
+    """
+    Figure holding the deferred traces of fig.
+
+    Parameters:
+        fig (Figure): Figure drawn inside ``deferred()``.
+        data (list, optional): Plain trace dicts from ``collect(fig)``,
+            possibly changed since. Default collects them.
+
+    Returns:
+        Figure: fig itself when nothing was deferred or collected, otherwise a
+            new figure with the same layout, subplot grid and traces in
+            drawing order.
+    """
+    if data is None:
+        if not fig.__dict__.get(_PENDING_ATTR):
+            return fig
+        data = collect(fig)
+
+    # Layout arrays (annotations, shapes) are rebuilt and validated element
+    # by element when a figure is constructed; carry them over unchanged
+    layout = dict(fig.layout._props)
+    arrays = {key: layout.pop(key) for key in _LAYOUT_ARRAYS if key in layout}
+    built = go.Figure(data=data, layout=layout, _validate=strict_validation)
+    built.layout._validate = strict_validation
+    built.layout.update(arrays)
+    # Later changes (scales, themes, user code) are validated again
+    built._validate = True
+    built.layout._validate = True
+    for trace in built.data:
+        trace._validate = True
+    for attr, value in vars(fig).items():
+        if attr in ("_grid_ref", "_grid_str") or attr.startswith("_ggplotly_"):
+            setattr(built, attr, value)
+    return built
@@ -0,0 +1,462 @@
+"""
+GeoJSON geometry utilities for ggplotly.
+
+This module flattens GeoJSON geometries into ragged NumPy arrays (one
+coordinate array plus offset indices, in the spirit of shapely/GeoArrow
+ragged arrays) so bounds and trace coordinates can be computed without
+walking every coordinate in Python. It also provides Douglas-Peucker and
+Visvalingam-Whyatt simplification with a per-geometry cache.
+
+Examples:
+    >>> arrays = GeometryArrays.from_geojson(geojson)
+    >>> arrays.bounds()
+    (-124.4, 32.5, -114.1, 42.0)
+
+    >>> small = simplify_geojson(geojson, tolerance=0.01)
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+from collections import OrderedDict
+
+import numpy as np
+
+# Part kinds stored per ragged part
+POINT, LINE, RING = 0, 1, 2
+
+# Maximum number of simplified geometries kept in the module-level cache
+SIMPLIFY_CACHE_SIZE = 4096
+
+_simplify_cache: OrderedDict = OrderedDict()
+
+
+def _geometry_parts(geometry):
+    """
+    Yield (kind, coordinates) for each part of a GeoJSON geometry.
+
+    Parameters:
+        geometry (dict): A GeoJSON geometry object.
+
+    Yields:
+        tuple: (POINT, LINE or RING, nested coordinate list)
+    """
+    if not geometry:
+        return
+    geom_type = geometry.get('type', '')
+    coordinates = geometry.get('coordinates', [])
+
+    if geom_type == 'Point':
+        yield POINT, [coordinates]
+    elif geom_type == 'MultiPoint':
+        yield POINT, coordinates
+    elif geom_type == 'LineString':
+        yield LINE, coordinates
+    elif geom_type == 'MultiLineString':
+        for line in coordinates:
+            yield LINE, line
+    elif geom_type == 'Polygon':
+        for ring in coordinates:
+            yield RING, ring
+    elif geom_type == 'MultiPolygon':
+        for polygon in coordinates:
+            for ring in polygon:
+                yield RING, ring
+    elif geom_type == 'GeometryCollection':
+        for sub in geometry.get('geometries', []):
+            yield from _geometry_parts(sub)
+
+
+def _as_xy(part):
+    """Convert a nested coordinate list to an (n, 2) float array."""
+    arr = np.asarray(part, dtype=float)
+    if arr.size == 0:
+        return np.empty((0, 2))
+    return arr.reshape(len(arr), -1)[:, :2]
+
+
+class GeometryArrays:
+    """
+    Ragged-array representation of the geometries in a GeoJSON object.
+
+    All coordinates live in a single (n, 2) array. ``part_offsets`` marks
+    where each point group, line or ring starts, and ``feature_offsets``
+    marks which parts belong to each feature.
+
+    Attributes:
+        coords (ndarray): (n_coords, 2) array of lon/lat pairs.
+        part_offsets (ndarray): (n_parts + 1,) offsets into coords.
+        part_kinds (ndarray): (n_parts,) POINT, LINE or RING per part.
+        feature_offsets (ndarray): (n_features + 1,) offsets into parts.
+        geom_types (list): GeoJSON geometry type of each feature.
+    """
+
+    def __init__(self, coords, part_offsets, part_kinds, feature_offsets, geom_types):
+        self.coords = coords
+        self.part_offsets = part_offsets
+        self.part_kinds = part_kinds
+        self.feature_offsets = feature_offsets
+        self.geom_types = geom_types
+
+    @classmethod
+    def from_geojson(cls, geojson):
+        """
+        Flatten a GeoJSON FeatureCollection, Feature or geometry.
+
+        Each part is converted with a single ``np.asarray`` call, so the
+        cost is one conversion per ring/line instead of one Python step
+        per coordinate.
+
+        Parameters:
+            geojson (dict): GeoJSON object.
+
+        Returns:
+            GeometryArrays: The flattened geometries.
+        """
+        if geojson is None:
+            geometries = []
+        elif geojson.get('type') == 'FeatureCollection':
+            geometries = [f.get('geometry') or {} for f in geojson.get('features', [])]
+        elif geojson.get('type') == 'Feature':
+            geometries = [geojson.get('geometry') or {}]
+        else:
+            geometries = [geojson]
+
+        arrays, kinds, parts_per_feature, geom_types = [], [], [], []
+        for geometry in geometries:
+            geom_types.append(geometry.get('type', ''))
+            n_parts = 0
+            for kind, part in _geometry_parts(geometry):
+                arrays.append(_as_xy(part))
+                kinds.append(kind)
+                n_parts += 1
+            parts_per_feature.append(n_parts)
+
+        lengths = np.fromiter((len(a) for a in arrays), dtype=np.int64, count=len(arrays))
+        coords = np.concatenate(arrays) if arrays else np.empty((0, 2))
+        part_offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        feature_offsets = np.concatenate([[0], np.cumsum(parts_per_feature)]).astype(np.int64)
+
+        return cls(coords, part_offsets, np.asarray(kinds, dtype=np.int8),
+                   feature_offsets, geom_types)
+
+    @property
+    def coord_kinds(self):
+        """Return the part kind of every coordinate."""
+        return np.repeat(self.part_kinds, np.diff(self.part_offsets))
+
+    def bounds(self):
+        """
+        Return the overall (minx, miny, maxx, maxy), or None if empty.
+        """
+        if len(self.coords) == 0:
+            return None
+        lo = np.nanmin(self.coords, axis=0)
+        hi = np.nanmax(self.coords, axis=0)
+        return float(lo[0]), float(lo[1]), float(hi[0]), float(hi[1])
+
+    def feature_bounds(self):
+        """
+        Return per-feature bounds as an (n_features, 4) array.
+
+        Features without coordinates get NaN bounds.
+        """
+        n_features = len(self.geom_types)
+        result = np.full((n_features, 4), np.nan)
+        coord_starts = self.part_offsets[self.feature_offsets]
+        counts = np.diff(coord_starts)
+        nonempty = counts > 0
+        if nonempty.any():
+            starts = coord_starts[:-1][nonempty]
+            result[nonempty, :2] = np.minimum.reduceat(self.coords, starts, axis=0)
+            result[nonempty, 2:] = np.maximum.reduceat(self.coords, starts, axis=0)
+        return result
+
+    def line_coords(self):
+        """
+        Return (lons, lats) of all line parts with NaN breaks between lines.
+
+        NaN values serialize to null, which Plotly treats as a gap.
+        """
+        mask = self.coord_kinds == LINE
+        if not mask.any():
+            return np.array([]), np.array([])
+        line_parts = self.part_kinds == LINE
+        # Position of each line's end within the filtered coordinate array
+        ends = np.cumsum(np.diff(self.part_offsets)[line_parts])
+        xy = np.insert(self.coords[mask], ends, np.nan, axis=0)
+        return xy[:, 0], xy[:, 1]
+
+    def point_coords(self):
+        """Return (lons, lats) of all point parts."""
+        xy = self.coords[self.coord_kinds == POINT]
+        return xy[:, 0], xy[:, 1]
+
+
+def zoom_for_extent(max_range):
+    """
+    Estimate a web-map zoom level that fits an extent in degrees.
+
+    Parameters:
+        max_range (float): Largest of the lon/lat ranges.
+
+    Returns:
+        int: Zoom level.
+    """
+    if max_range > 100:
+        return 2
+    elif max_range > 50:
+        return 3
+    elif max_range > 20:
+        return 4
+    elif max_range > 10:
+        return 5
+    elif max_range > 5:
+        return 6
+    return 7
+
+
+def zoom_tolerance(zoom):
+    """
+    Return the size of one screen pixel in degrees at a web-map zoom level.
+
+    Detail finer than this cannot be seen, so it is a natural default
+    simplification tolerance.
+
+    Parameters:
+        zoom (float): Web-map zoom level.
+
+    Returns:
+        float: Tolerance in degrees.
+    """
+    return 360.0 / (256 * 2 ** zoom)
+
+
+def _segment_distances(points, start, end):
+    """Distances from points to the segment start-end."""
+    seg = end - start
+    seg_len2 = seg @ seg
+    if seg_len2 == 0:
+        return np.hypot(*(points - start).T)
+    t = np.clip(((points - start) @ seg) / seg_len2, 0, 1)
+    proj = start + t[:, None] * seg
+    return np.hypot(*(points - proj).T)
+
+
+def douglas_peucker(points, tolerance):
+    """
+    Simplify a polyline with the Douglas-Peucker algorithm.
+
+    The recursion is run level by level: every open segment is measured and
+    split in the same vectorized step, so a ring costs a handful of NumPy
+    calls per level rather than several per segment.
+
+    Parameters:
+        points (ndarray): (n, 2) coordinates.
+        tolerance (float): Maximum allowed deviation.
+
+    Returns:
+        ndarray: Simplified (m, 2) coordinates, m <= n.
+    """
+    n = len(points)
+    if n < 3:
+        return points
+    x, y = points[:, 0], points[:, 1]
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    active = ~keep
+
+    while active.any():
+        anchors = np.flatnonzero(keep)
+        cand = np.flatnonzero(active)
+        seg = np.searchsorted(anchors, cand, side='right') - 1
+        a, b = anchors[seg], anchors[seg + 1]
+
+        # Distance from each candidate to the segment between its anchors
+        dx, dy = x[b] - x[a], y[b] - y[a]
+        px, py = x[cand] - x[a], y[cand] - y[a]
+        len2 = dx * dx + dy * dy
+        t = np.clip((px * dx + py * dy) / np.where(len2 > 0, len2, 1), 0, 1)
+        dists = np.hypot(px - t * dx, py - t * dy)
+
+        # Farthest candidate of each segment (first one on ties)
+        starts = np.flatnonzero(np.r_[True, seg[1:] != seg[:-1]])
+        counts = np.diff(np.r_[starts, len(cand)])
+        seg_max = np.maximum.reduceat(dists, starts)
+        at_max = np.flatnonzero(dists == np.repeat(seg_max, counts))
+        _, first = np.unique(seg[at_max], return_index=True)
+        split = at_max[first]
+        split = split[dists[split] > tolerance]
+        if not len(split):
+            break
+
+        keep[cand[split]] = True
+        active[cand[split]] = False
+        active[cand[np.repeat(seg_max <= tolerance, counts)]] = False
+    return points[keep]
+
+
+def visvalingam_whyatt(points, tolerance):
+    """
+    Simplify a polyline with the Visvalingam-Whyatt algorithm.
+
+    Points whose triangle with their neighbours has an area below
+    ``tolerance ** 2`` are removed. All non-adjacent local minima are
+    dropped in the same vectorized pass, and passes repeat until nothing
+    more can be removed.
+
+    Parameters:
+        points (ndarray): (n, 2) coordinates.
+        tolerance (float): Distance tolerance; the area threshold is its square.
+
+    Returns:
+        ndarray: Simplified (m, 2) coordinates, m <= n.
+    """
+    threshold = tolerance ** 2
+    idx = np.arange(len(points))
+    while len(idx) > 2:
+        p = points[idx]
+        a, b, c = p[:-2], p[1:-1], p[2:]
+        areas = 0.5 * np.abs((b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1])
+                             - (c[:, 0] - a[:, 0]) * (b[:, 1] - a[:, 1]))
+        left = np.concatenate([[np.inf], areas[:-1]])
+        right = np.concatenate([areas[1:], [np.inf]])
+        remove = (areas < threshold) & (areas <= left) & (areas < right)
+        if not remove.any():
+            break
+        idx = np.concatenate([idx[:1], idx[1:-1][~remove], idx[-1:]])
+    return points[idx]
+
+
+_SIMPLIFIERS = {
+    'dp': douglas_peucker,
+    'douglas-peucker': douglas_peucker,
+    'vw': visvalingam_whyatt,
+    'visvalingam': visvalingam_whyatt,
+}
+
+
+def _minimal_ring(points):
+    """
+    Reduce a closed ring to a triangle that keeps its extent.
+
+    Used when a ring is smaller than the tolerance: the ring keeps its
+    start point, the point farthest from it and the point farthest from
+    that chord, so small islands and counties stay visible.
+    """
+    far = int(np.argmax(np.hypot(*(points - points[0]).T)))
+    dists = _segment_distances(points, points[0], points[far])
+    dists[[0, far, len(points) - 1]] = -1
+    third = int(np.argmax(dists))
+    return points[sorted({0, far, third, len(points) - 1})]
+
+
+def _simplify_part(kind, part, simplifier, tolerance):
+    """Simplify one part, keeping rings closed and valid."""
+    if kind == POINT:
+        return part
+    simplified = simplifier(part, tolerance)
+    if kind == RING and len(simplified) < 4:
+        simplified = _minimal_ring(part) if len(part) >= 4 else part
+    return simplified
+
+
+def _rebuild_geometry(geometry, parts):
+    """Rebuild a GeoJSON geometry dict from simplified parts, in order."""
+    geom_type = geometry.get('type', '')
+    it = iter(parts)
+
+    def take():
+        return next(it).tolist()
+
+    if geom_type == 'LineString':
+        coordinates = take()
+    elif geom_type == 'MultiLineString':
+        coordinates = [take() for _ in geometry['coordinates']]
+    elif geom_type == 'Polygon':
+        coordinates = [take() for _ in geometry['coordinates']]
+    elif geom_type == 'MultiPolygon':
+        coordinates = [[take() for _ in polygon] for polygon in geometry['coordinates']]
+    else:
+        return geometry
+    return {**geometry, 'coordinates': coordinates}
+
+
+def simplify_geometry(geometry, tolerance, method='dp'):
+    """
+    Simplify a single GeoJSON geometry, using the per-geometry cache.
+
+    The cache key is a digest of the geometry's coordinates together with
+    the tolerance and method, so repeated draws of the same map (or the same
+    feature across facets) reuse earlier results.
+
+    Parameters:
+        geometry (dict): GeoJSON geometry.
+        tolerance (float): Simplification tolerance in coordinate units.
+        method (str): 'dp' (Douglas-Peucker, default) or 'vw'
+            (Visvalingam-Whyatt).
+
+    Returns:
+        dict: Simplified geometry (the input itself if nothing changed).
+    """
+    if method not in _SIMPLIFIERS:
+        raise ValueError(
+            f"Unknown simplify method '{method}'. "
+            f"Options: {sorted(_SIMPLIFIERS)}"
+        )
+    if not geometry or geometry.get('type') in ('Point', 'MultiPoint', 'GeometryCollection'):
+        return geometry
+
+    parts = [(kind, _as_xy(part)) for kind, part in _geometry_parts(geometry)]
+    if not parts:
+        return geometry
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(geometry.get('type', '').encode())
+    for _, arr in parts:
+        digest.update(np.int64(len(arr)).tobytes())
+        digest.update(np.ascontiguousarray(arr).tobytes())
+    key = (digest.hexdigest(), float(tolerance), method)
+
+    cached = _simplify_cache.get(key)
+    if cached is not None:
+        _simplify_cache.move_to_end(key)
+        return cached
+
+    simplifier = _SIMPLIFIERS[method]
+    new_parts = [_simplify_part(kind, arr, simplifier, tolerance) for kind, arr in parts]
+    result = _rebuild_geometry(geometry, new_parts)
+
+    _simplify_cache[key] = result
+    if len(_simplify_cache) > SIMPLIFY_CACHE_SIZE:
+        _simplify_cache.popitem(last=False)
+    return result
+
+
+def simplify_geojson(geojson, tolerance, method='dp'):
+    """
+    Return a copy of a GeoJSON object with every geometry simplified.
+
+    Feature properties and ids are kept; only coordinates change.
+
+    Parameters:
+        geojson (dict): FeatureCollection, Feature or geometry.
+        tolerance (float): Simplification tolerance in coordinate units.
+        method (str): 'dp' (Douglas-Peucker, default) or 'vw'.
+
+    Returns:
+        dict: Simplified GeoJSON.
+    """
+    if tolerance is None or tolerance <= 0 or not math.isfinite(tolerance):
+        return geojson
+
+    geojson_type = geojson.get('type')
+    if geojson_type == 'FeatureCollection':
+        features = [
+            {**f, 'geometry': simplify_geometry(f.get('geometry'), tolerance, method)}
+            for f in geojson.get('features', [])
+        ]
+        return {**geojson, 'features': features}
+    if geojson_type == 'Feature':
+        return {**geojson, 'geometry': simplify_geometry(geojson.get('geometry'), tolerance, method)}
+    return simplify_geometry(geojson, tolerance, method)
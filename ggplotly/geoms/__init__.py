@@ -5,6 +5,7 @@ from .geom_acf import geom_acf
 from .geom_area import geom_area
 from .geom_bar import geom_bar
 from .geom_base import Geom
+from .geom_bin2d import geom_bin2d
 from .geom_boxplot import geom_boxplot
 from .geom_candlestick import geom_candlestick, geom_ohlc
 from .geom_col import geom_col
@@ -14,6 +15,7 @@ from .geom_density import geom_density
 from .geom_edgebundle import geom_edgebundle
 from .geom_errorbar import geom_errorbar
 from .geom_fanchart import geom_fanchart
+from .geom_hex import geom_hex
 from .geom_histogram import geom_histogram
 from .geom_hline import geom_hline
 from .geom_jitter import geom_jitter
@@ -29,6 +31,7 @@ from .geom_point_3d import geom_point_3d
 from .geom_qq import geom_qq
 from .geom_qq_line import geom_qq_line
 from .geom_range import geom_range
+from .geom_raster_points import geom_raster_points
 from .geom_rect import geom_rect
 from .geom_ribbon import geom_ribbon
 from .geom_rug import geom_rug
@@ -93,4 +96,7 @@ __all__ = [
     "geom_qq_line",
     "geom_sankey",
     "geom_waterfall",
+    "geom_bin2d",
+    "geom_hex",
+    "geom_raster_points",
 ]
@@ -3,6 +3,8 @@
 import numpy as np
 import plotly.graph_objects as go
 
+from ..constants import get_color_palette
+from ..stats.stat_acf import stat_acf
 from .geom_base import Geom
 
 
@@ -11,7 +13,9 @@ class geom_acf(Geom):
     Geom for displaying Autocorrelation Function (ACF) plots.
 
     Computes and displays the autocorrelation at each lag as vertical bars
-    with horizontal confidence interval bands.
+    with horizontal confidence interval bands. Uses stat_acf internally, so
+    mapping ``group`` (or ``color``) computes many series in one batched FFT
+    and draws one set of bars per series.
 
     Parameters
     ----------
@@ -42,6 +46,9 @@ class geom_acf(Geom):
 
     >>> # Styled ACF
     >>> ggplot(df, aes(y='value')) + geom_acf(color='coral', nlags=30)
+
+    >>> # One ACF per sensor, computed in a single batch
+    >>> ggplot(df, aes(y='value', group='sensor')) + geom_acf()
     """
 
     required_aes = ['y']
@@ -55,12 +62,20 @@ class geom_acf(Geom):
         "bar_width": 0.3,
     }
 
-    def _draw_impl(self, fig, data, row, col):
-        from statsmodels.tsa.stattools import acf
+    # Stat used to compute the correlations and the y-axis label
+    stat_class = stat_acf
+    value_name = 'ACF'
+
+    def _stat_params(self):
+        """Return the parameters forwarded to the stat."""
+        return dict(
+            nlags=self.params.get("nlags", 40),
+            alpha=self.params.get("alpha", 0.05),
+        )
 
+    def _draw_impl(self, fig, data, row, col):
         # Get parameters
         nlags = self.params.get("nlags", 40)
-        alpha = self.params.get("alpha", 0.05)
         color = self.params.get("color", "steelblue")
         ci_alpha = self.params.get("ci_alpha", 0.3)
         bar_width = self.params.get("bar_width", 0.3)
@@ -68,37 +83,44 @@ class geom_acf(Geom):
         # Get y values
         y_col = self.mapping.get('y') if self.mapping else None
         if y_col is None:
-            raise ValueError("geom_acf requires y aesthetic")
-
-        y_values = data[y_col].dropna().values
-
-        # Compute ACF with confidence intervals
-        acf_values, confint = acf(y_values, nlags=nlags, alpha=alpha)
-
-        # Skip lag 0 (always 1.0, not informative)
-        acf_values = acf_values[1:]
-        confint = confint[1:]
-        lags = np.arange(1, len(acf_values) + 1)
-
-        # Confidence interval (symmetric around 0 for lags > 0)
-        # confint is relative to the acf values, we want the bounds
-        ci_lower = confint[:, 0] - acf_values
-        ci_upper = confint[:, 1] - acf_values
-
-        # Add confidence band (shaded region)
-        fig.add_trace(
-            go.Scatter(
-                x=list(lags) + list(lags[::-1]),
-                y=list(ci_upper) + list(ci_lower[::-1]),
-                fill='toself',
-                fillcolor=f'rgba(173, 216, 230, {ci_alpha})',
-                line=dict(width=0),
-                showlegend=False,
-                hoverinfo='skip',
-                name='95% CI',
-            ),
-            row=row, col=col,
-        )
+            raise ValueError(f"geom_{self.value_name.lower()} requires y aesthetic")
+
+        # Compute correlations for every series in one batch
+        stat = self.stat_class(mapping=self.mapping, **self._stat_params())
+        result, _ = stat.compute(data)
+        group_col = stat._group_col(data)
+
+        if group_col is None:
+            groups = [(None, result, color)]
+        else:
+            palette = get_color_palette(self.theme)
+            groups = [
+                (key, subset, palette[i % len(palette)])
+                for i, (key, subset) in enumerate(
+                    result.groupby(group_col, sort=False, observed=True)
+                )
+            ]
+
+        for key, subset, group_color in groups:
+            lags = subset['lag'].values
+            legend_name = None if key is None else str(key)
+
+            # Add confidence band (shaded region)
+            fig.add_trace(
+                go.Scatter(
+                    x=np.concatenate([lags, lags[::-1]]),
+                    y=np.concatenate([subset['ci_upper'].values,
+                                      subset['ci_lower'].values[::-1]]),
+                    fill='toself',
+                    fillcolor=f'rgba(173, 216, 230, {ci_alpha})',
+                    line=dict(width=0),
+                    showlegend=False,
+                    hoverinfo='skip',
+                    name='95% CI',
+                    legendgroup=legend_name,
+                ),
+                row=row, col=col,
+            )
 
         # Add horizontal line at y=0
         fig.add_trace(
@@ -113,20 +135,23 @@ class geom_acf(Geom):
             row=row, col=col,
         )
 
-        # Add bars for ACF values
-        fig.add_trace(
-            go.Bar(
-                x=lags,
-                y=acf_values,
-                marker_color=color,
-                width=bar_width,
-                name='ACF',
-                showlegend=False,
-                hovertemplate='Lag %{x}: %{y:.3f}<extra></extra>',
-            ),
-            row=row, col=col,
-        )
+        # Add bars for the correlation values
+        for key, subset, group_color in groups:
+            legend_name = None if key is None else str(key)
+            fig.add_trace(
+                go.Bar(
+                    x=subset['lag'].values,
+                    y=subset[stat.value_name].values,
+                    marker_color=group_color,
+                    width=bar_width,
+                    name=legend_name or self.value_name,
+                    showlegend=key is not None,
+                    legendgroup=legend_name,
+                    hovertemplate='Lag %{x}: %{y:.3f}<extra></extra>',
+                ),
+                row=row, col=col,
+            )
 
         # Update axes
         fig.update_xaxes(title_text='Lag', row=row, col=col)
-        fig.update_yaxes(title_text='ACF', row=row, col=col)
+        fig.update_yaxes(title_text=self.value_name, row=row, col=col)
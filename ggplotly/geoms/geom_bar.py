@@ -3,6 +3,8 @@
 import pandas as pd
 import plotly.graph_objects as go
 
+from ..aes import aes
+from ..chunked import as_chunked, is_chunked_source
 from ..stats.stat_count import stat_count
 from .geom_base import Geom
 
@@ -29,20 +31,52 @@ class geom_bar(Geom):
             'dodge', 'fill', or 'identity'.
         na_rm (bool, optional): If True, silently remove missing values. Default is False.
 
+    Data that does not fit in memory can be passed as ``data``: an iterable of
+    DataFrame chunks, a callable returning one, a pyarrow Dataset or a memmap
+    (see ChunkedData). Counts are then accumulated chunk by chunk. Facets are
+    not applied to such layers.
+
     Examples:
         >>> ggplot(df, aes(x='category')) + geom_bar()
         >>> ggplot(df, aes(x='category', fill='group')) + geom_bar(position='dodge')
         >>> ggplot(df, aes(x='category')) + geom_bar(width=0.5)  # narrower bars
+        >>> ggplot(mapping=aes(x='region')) + geom_bar(data=ChunkedData(dataset))
     """
 
     required_aes = ['x']  # y is computed by stat_count
 
+    def __init__(self, data=None, mapping=None, **params):
+        """
+        Initialize the bar geom.
+
+        Parameters:
+            data (DataFrame or chunked source, optional): Data for this geom.
+            mapping (aes, optional): Aesthetic mappings.
+            **params: Additional parameters.
+        """
+        # Chunked sources are counted when drawn; the layer itself only
+        # carries an empty frame with their columns
+        self.source = None
+        if not isinstance(data, aes) and is_chunked_source(data):
+            self.source = as_chunked(data)
+            data = self.source.empty()
+        super().__init__(data, mapping, **params)
+
     def _apply_stats(self, data):
         """Add default stat_count if no stats and stat='count'."""
         if self.stats == []:
             stat = self.params.get("stat", "count")
             if stat == "count":
                 self.stats.append(stat_count(mapping=self.mapping))
+        if self.source is not None:
+            # The first stat counts the chunks; any others see the counts
+            first, *rest = self.stats or [None]
+            if not isinstance(first, stat_count):
+                raise ValueError("geom_bar counts chunked data with stat_count only")
+            data, self.mapping = first.compute_chunks(self.source)
+            for stat in rest:
+                data, self.mapping = stat.compute(data)
+            return data
         return super()._apply_stats(data)
 
     def _draw_impl(self, fig, data, row, col):
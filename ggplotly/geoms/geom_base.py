@@ -3,6 +3,7 @@ import copy
 from ..aes import aes
 from ..aesthetic_mapper import AestheticMapper
 from ..exceptions import ColumnNotFoundError, RequiredAestheticError
+from ..render_context import RenderContext
 from ..trace_builders import get_trace_builder
 
 
@@ -97,6 +98,11 @@ class Geom:
     # Optional aesthetics that can be mapped to columns
     optional_aes: list = ['color', 'fill', 'size', 'alpha', 'shape', 'group']
 
+    # Whether rows appended to the plot can be drawn on their own and added
+    # to the end of this geom's traces (see ggplotly.streaming). The name of
+    # an aesthetic means the rows must arrive sorted by it.
+    streamable = False
+
     def __init__(self, data=None, mapping=None, **params):
         """
         Initialize the geom.
@@ -237,7 +243,7 @@ class Geom:
                                 if similar:
                                     raise ColumnNotFoundError(value, list(data.columns), aes_name)
 
-    def draw(self, fig, data=None, row=1, col=1):
+    def draw(self, fig, data=None, row=1, col=1, context=None):
         """
         Draw the geometry on the figure.
 
@@ -249,6 +255,8 @@ class Geom:
             data (DataFrame, optional): Data subset for faceting.
             row (int): Row position in subplot (for faceting). Default is 1.
             col (int): Column position in subplot (for faceting). Default is 1.
+            context (RenderContext, optional): State shared by the layers and
+                panels of the plot. Default is the one attached to fig.
 
         Returns:
             None: Modifies the figure in place.
@@ -258,6 +266,8 @@ class Geom:
             ColumnNotFoundError: If mapped columns don't exist in data
         """
         data = data if data is not None else self.data
+        # Geoms, trace builders and coords find the context on the figure
+        RenderContext.of(fig, context)
 
         # Handle na_rm: remove rows with missing values in mapped columns
         if self.params.get("na_rm", False):
@@ -334,8 +344,8 @@ class Geom:
                 return self.theme.color_map[0]
             # Try Plotly's default palette
             try:
-                import plotly.express as px
-                return px.colors.qualitative.Plotly[0]
+                import plotly.colors as pc
+                return pc.qualitative.Plotly[0]
             except (ImportError, IndexError):
                 pass
 
@@ -453,7 +463,7 @@ class Geom:
         return result
 
     def _transform_fig(
-        self, plot, fig, data, payload, color_targets, row, col, **layout
+        self, plot, fig, data, payload, color_targets, row, col, color_map=None, **layout
     ):
         """
         Transform data into Plotly traces using the appropriate builder strategy.
@@ -469,12 +479,14 @@ class Geom:
             color_targets: Dict mapping aesthetics to trace property names
             row: Row position in subplot
             col: Column position in subplot
+            color_map: Optional color map to use instead of the facet one,
+                e.g. when a panel is drawn in several calls
             **layout: Additional layout parameters
         """
         # Create aesthetic mapper for this geom, passing global maps for faceting
         mapper = AestheticMapper(
             data, self.mapping, self.params, self.theme,
-            global_color_map=self._global_color_map,
+            global_color_map=self._global_color_map if color_map is None else color_map,
             global_shape_map=self._global_shape_map
         )
         style_props = mapper.get_style_properties()
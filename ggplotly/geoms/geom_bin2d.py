@@ -0,0 +1,141 @@
+# geoms/geom_bin2d.py
+
+import numpy as np
+import plotly.graph_objects as go
+
+from ..render_context import RenderContext
+from ..stats.stat_bin_2d import stat_bin_2d
+from .geom_base import Geom
+
+
+class geom_bin2d(Geom):
+    """
+    Geom for drawing a heatmap of 2D bin counts.
+
+    Points are counted in rectangular bins by stat_bin_2d and drawn as a
+    single heatmap, so the figure holds one value per bin instead of one
+    marker per point. Useful for scatter plots with heavy overplotting.
+
+    Parameters:
+        bins (int or tuple): Number of bins in each direction. Default is 30.
+        binwidth (float or tuple, optional): Bin width in each direction. Overrides bins.
+        fun (str or callable, optional): Summary of the z aesthetic per bin
+            ('count', 'sum', 'mean', 'min', 'max', 'median' or a callable).
+        alpha (float, optional): Transparency level for the fill color. Default is 1.
+        palette (str, optional): Color scale for the fill. Default is 'Viridis'.
+        name (str, optional): Colorbar title. Default is the summarised variable.
+        na_rm (bool, optional): If True, silently remove missing values. Default is False.
+
+    Examples:
+        >>> ggplot(df, aes(x='x', y='y')) + geom_bin2d()
+        >>> ggplot(df, aes(x='x', y='y')) + geom_bin2d(bins=(60, 40))
+        >>> ggplot(df, aes(x='x', y='y', z='price')) + geom_bin2d(fun='median')
+    """
+
+    required_aes = ['x', 'y']
+
+    stat_class = stat_bin_2d
+
+    def __init__(self, data=None, mapping=None, bins=30, binwidth=None, fun=None, **params):
+        """
+        Initialize the 2D bin geom.
+
+        Parameters:
+            data (DataFrame, optional): Data for this geom.
+            mapping (aes, optional): Aesthetic mappings.
+            bins (int or tuple): Number of bins per direction. Default is 30.
+            binwidth (float or tuple, optional): Bin width per direction.
+            fun (str or callable, optional): Summary of z per bin.
+            **params: Additional parameters.
+        """
+        super().__init__(data, mapping, **params)
+        self.stat = self.stat_class(bins=bins, binwidth=binwidth, fun=fun)
+
+    def _make_stat(self, fig):
+        """
+        The stat binning one panel, with this layer's mapping.
+
+        Every facet panel is binned over the range of the whole layer, so
+        bins line up across panels.
+        """
+        stat = self.stat.copy()
+        stat.mapping = {**self.mapping, **stat.mapping}
+        if stat.limits is None:
+            stat.limits = self._layer_limits(RenderContext.of(fig).layer_data.get(self))
+        return stat
+
+    def _layer_limits(self, data):
+        """((xmin, xmax), (ymin, ymax)) of the finite x and y values, or None."""
+        if data is None:
+            return None
+        limits = []
+        for aes_name in ('x', 'y'):
+            column = self.mapping.get(aes_name)
+            if not isinstance(column, str) or column not in data.columns:
+                return None
+            values = data[column].to_numpy(dtype=float)
+            values = values[np.isfinite(values)]
+            if values.size == 0:
+                return None
+            limits.append((values.min(), values.max()))
+        return tuple(limits)
+
+    def _apply_stats(self, data):
+        """
+        Apply attached stats, leaving binning to _draw_impl.
+
+        An attached stat of this geom's binning class replaces the geom's
+        binning settings.
+        """
+        for stat in self.stats:
+            if isinstance(stat, self.stat_class):
+                self.stat = stat
+            else:
+                data, self.mapping = stat.compute(data)
+        return data
+
+    def _colorbar_title(self):
+        if "name" in self.params:
+            return self.params["name"]
+        z_col = self.mapping.get('z')
+        return z_col if isinstance(z_col, str) else "count"
+
+    def _draw_impl(self, fig, data, row, col):
+        """
+        Bin one panel and draw it as one heatmap.
+
+        Parameters:
+            fig (Figure): Plotly figure object.
+            data (DataFrame): Points of the panel.
+            row (int): Row position in subplot.
+            col (int): Column position in subplot.
+        """
+        data, _ = self._make_stat(fig).compute(data)
+        if data.empty:
+            return
+
+        width, height = data['width'].iloc[0], data['height'].iloc[0]
+        x_first, y_first = data['x'].min(), data['y'].min()
+        ix = np.rint((data['x'].to_numpy() - x_first) / width).astype(np.int64)
+        iy = np.rint((data['y'].to_numpy() - y_first) / height).astype(np.int64)
+
+        # Dense grid so Plotly does not infer cell sizes from gaps
+        z = np.full((iy.max() + 1, ix.max() + 1), np.nan)
+        z[iy, ix] = data['value'].to_numpy()
+
+        fig.add_trace(
+            go.Heatmap(
+                x=x_first + np.arange(z.shape[1]) * width,
+                y=y_first + np.arange(z.shape[0]) * height,
+                z=z,
+                colorscale=self.params.get("palette", "Viridis"),
+                opacity=self.params.get("alpha", 1),
+                colorbar=dict(title=self._colorbar_title()),
+                name=self.params.get("name", "Bin2d"),
+                hoverongaps=False,
+            ),
+            row=row,
+            col=col,
+        )
+        # One color range across facet panels
+        RenderContext.of(fig).share_range(self, fig.data[-1], ('zmin', 'zmax'), z)
@@ -1,12 +1,20 @@
 # geoms/geom_boxplot.py
 
+import numpy as np
 import plotly.graph_objects as go
 
+from ..stats.stat_boxplot import stat_boxplot
 from .geom_base import Geom
 
 
 class geom_boxplot(Geom):
-    """Geom for drawing boxplots."""
+    """
+    Geom for drawing boxplots.
+
+    Box statistics are computed with stat_boxplot before the figure is
+    built, so each trace carries quartiles, whisker ends and outliers
+    rather than every observation.
+    """
 
     required_aes = ['x', 'y']
 
@@ -111,6 +119,43 @@ class geom_boxplot(Geom):
         }
         return shape_map.get(shape, 'circle')
 
+    def _apply_stats(self, data):
+        """
+        Apply attached stats, leaving stat_boxplot to the trace builder.
+
+        Box summaries are computed per trace so that colour, fill and facet
+        splits still apply. An attached stat_boxplot only sets the whisker
+        coefficient.
+        """
+        for stat in self.stats:
+            if isinstance(stat, stat_boxplot):
+                self.coef = stat.coef
+            else:
+                data, self.mapping = stat.compute(data)
+        return data
+
+    def _box_trace(self, x, y, **kwargs):
+        """
+        Build a go.Box from precomputed statistics.
+
+        Plotly draws the quartiles, whiskers and notches from the summary
+        fields and only receives the outliers as sample points.
+        """
+        box = stat_boxplot(coef=self.coef).compute_array(x, y)
+        box = box[box["n"] > 0]
+        if self.notch:
+            kwargs["notchspan"] = (box["notchupper"] - box["middle"]).to_numpy()
+        return go.Box(
+            x=box["x"].to_numpy(),
+            q1=box["lower"].to_numpy(),
+            median=box["middle"].to_numpy(),
+            q3=box["upper"].to_numpy(),
+            lowerfence=box["ymin"].to_numpy(),
+            upperfence=box["ymax"].to_numpy(),
+            y=[np.asarray(values) for values in box["outliers"]],
+            **kwargs,
+        )
+
     def _draw_impl(self, fig, data, row, col):
         """
         Draw boxplot(s) on the figure.
@@ -127,7 +172,7 @@ class geom_boxplot(Geom):
             Column position in subplot.
         """
 
-        plot = go.Box
+        plot = self._box_trace
 
         payload = dict(
             name=self.params.get("name", "Boxplot"),
@@ -153,14 +198,6 @@ class geom_boxplot(Geom):
         if self.notch:
             payload['notched'] = True
 
-        # Configure whisker length (coef * IQR)
-        # Plotly doesn't have direct coef parameter, but we can approximate
-        # by not using suspectedoutliers when coef != 1.5
-        if self.coef != 1.5:
-            # Plotly's default is 1.5 IQR, which matches ggplot2 default
-            # For other values, we'd need custom calculation
-            pass  # Note: Plotly doesn't support custom coef directly
-
         color_targets = dict(
             fill="fillcolor",
             color="line_color",
@@ -11,6 +11,7 @@ Supports igraph Graph objects for convenient graph visualization.
 import pandas as pd
 import plotly.graph_objects as go
 
+from ..render_context import RenderContext
 from ..stats.stat_edgebundle import stat_edgebundle
 from .geom_base import Geom
 
@@ -260,17 +261,10 @@ class geom_edgebundle(Geom):
         """
         Check if figure has geo context (map traces present).
 
-        Returns True if any Scattergeo or Choropleth traces exist,
+        Returns True if any geographic (geo or mapbox) traces were drawn,
         indicating we should render edges as Scattergeo too.
         """
-        if not fig.data:
-            return False
-
-        geo_types = ('scattergeo', 'choropleth', 'scattermapbox', 'choroplethmapbox')
-        return any(
-            hasattr(trace, 'type') and trace.type in geo_types
-            for trace in fig.data
-        )
+        return RenderContext.of(fig).is_geo
 
     def _draw_impl(self, fig, data, row, col):
         """
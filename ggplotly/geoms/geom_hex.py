@@ -0,0 +1,104 @@
+# geoms/geom_hex.py
+
+import numpy as np
+import plotly.graph_objects as go
+
+from ..rasterize import panel_pixels
+from ..render_context import RenderContext
+from ..stats.stat_binhex import SQRT3, stat_binhex
+from .geom_bin2d import geom_bin2d
+
+
+class geom_hex(geom_bin2d):
+    """
+    Geom for drawing a hexagonal heatmap of 2D bin counts.
+
+    Points are counted in hexagons by stat_binhex and drawn as a single
+    scatter trace of hexagon markers colored by count, so the figure holds
+    one marker per occupied hexagon instead of one per point.
+
+    Marker sizes are in pixels, so hexagons are sized to tile the panel at
+    the figure size set with ggsize (or Plotly's default size). Use
+    geom_bin2d when the figure will be resized or zoomed a lot.
+
+    Parameters:
+        bins (int or tuple): Number of hexagons across the x range. Default is 30.
+        binwidth (float or tuple, optional): Distance between hexagon centers in a row
+            (and between rows). Overrides bins.
+        fun (str or callable, optional): Summary of the z aesthetic per hexagon
+            ('count', 'sum', 'mean', 'min', 'max', 'median' or a callable).
+        alpha (float, optional): Transparency level for the fill color. Default is 1.
+        palette (str, optional): Color scale for the fill. Default is 'Viridis'.
+        name (str, optional): Colorbar title. Default is the summarised variable.
+        na_rm (bool, optional): If True, silently remove missing values. Default is False.
+
+    Examples:
+        >>> ggplot(df, aes(x='x', y='y')) + geom_hex()
+        >>> ggplot(df, aes(x='x', y='y')) + geom_hex(bins=50)
+        >>> ggplot(df, aes(x='x', y='y', weight='w')) + geom_hex()
+    """
+
+    stat_class = stat_binhex
+
+    def _draw_impl(self, fig, data, row, col):
+        """
+        Bin one panel into hexagons and draw them as one trace of markers.
+
+        Hexagons are regular on the panel, and sized to tile it, at the
+        panel's size in pixels.
+
+        Parameters:
+            fig (Figure): Plotly figure object.
+            data (DataFrame): Points of the panel.
+            row (int): Row position in subplot.
+            col (int): Column position in subplot.
+        """
+        context = RenderContext.of(fig)
+        panel_width, panel_height = panel_pixels(fig, row, col, context.figure_size)
+        stat = self._make_stat(fig)
+        stat.aspect = panel_height / panel_width
+        data, _ = stat.compute(data)
+        if data.empty:
+            return
+
+        x = data['x'].to_numpy()
+        y = data['y'].to_numpy()
+        width, height = data['width'].iloc[0], data['height'].iloc[0]
+
+        # Pixel width of one hexagon, with the axis range padded by a hexagon.
+        # Facet panels share the range of the whole layer
+        x_span, y_span = np.ptp(x), np.ptp(y)
+        if stat.limits is not None:
+            (x_lo, x_hi), (y_lo, y_hi) = stat.limits
+            x_span, y_span = max(x_span, x_hi - x_lo), max(y_span, y_hi - y_lo)
+        x_pixels = panel_width / (x_span + width)
+        y_pixels = panel_height / (y_span + 2 * height)
+        hex_width = min(width * x_pixels, height * y_pixels * 2 / SQRT3)
+        # Plotly draws a hexagon of size s as sqrt(3) / 2 * s wide
+        size = hex_width * 2 / SQRT3 * 1.02
+
+        value = data['value'].to_numpy()
+        fig.add_trace(
+            go.Scatter(
+                x=x,
+                y=y,
+                mode='markers',
+                marker=dict(
+                    symbol='hexagon',
+                    size=size,
+                    color=value,
+                    colorscale=self.params.get("palette", "Viridis"),
+                    colorbar=dict(title=self._colorbar_title()),
+                    line=dict(width=0),
+                    opacity=self.params.get("alpha", 1),
+                ),
+                customdata=value,
+                hovertemplate="x=%{x}<br>y=%{y}<br>value=%{customdata}<extra></extra>",
+                name=self.params.get("name", "Hex"),
+                showlegend=False,
+            ),
+            row=row,
+            col=col,
+        )
+        # One color range across facet panels
+        context.share_range(self, fig.data[-1].marker, ('cmin', 'cmax'), value)
@@ -1,8 +1,10 @@
 # geoms/geom_histogram.py
 
-import pandas as pd
 import plotly.graph_objects as go
 
+from ..aes import aes
+from ..chunked import as_chunked, is_chunked_source
+from ..render_context import RenderContext
 from ..stats.stat_bin import stat_bin
 from .geom_base import Geom
 
@@ -22,6 +24,7 @@ class geom_histogram(Geom):
         boundary (float, optional): A boundary between bins. Shifts bin edges to align with
             this value. For example, boundary=0 ensures a bin edge at 0.
         center (float, optional): The center of one of the bins. Alternative to boundary.
+        breaks (array-like, optional): Explicit bin edges. Overrides bins and binwidth.
         color (str, optional): Color of the histogram bars. If a categorical variable is
             mapped to color, different colors will be assigned.
         group (str, optional): Grouping variable for the histogram bars.
@@ -31,22 +34,28 @@ class geom_histogram(Geom):
         position (str, optional): Position adjustment: 'stack' (default), 'dodge', 'identity'.
         na_rm (bool, optional): If True, silently remove missing values. Default is False.
 
+    Data that does not fit in memory can be passed as ``data``: an iterable of
+    DataFrame chunks, a callable returning one, a pyarrow Dataset or a memmap
+    (see ChunkedData). Counts are then accumulated chunk by chunk. Facets are
+    not applied to such layers.
+
     Examples:
         >>> ggplot(df, aes(x='value')) + geom_histogram()
         >>> ggplot(df, aes(x='value')) + geom_histogram(bins=20)
         >>> ggplot(df, aes(x='value')) + geom_histogram(binwidth=5)
         >>> ggplot(df, aes(x='value', fill='category')) + geom_histogram(alpha=0.5)
+        >>> ggplot(mapping=aes(x='latency')) + geom_histogram(data=ChunkedData(dataset), binwidth=5)
     """
 
     required_aes = ['x']  # y is computed by stat_bin
 
     def __init__(self, data=None, mapping=None, bins=30, binwidth=None, boundary=None,
-                 center=None, barmode="stack", bin=None, **params):
+                 center=None, barmode="stack", bin=None, breaks=None, **params):
         """
         Initialize the histogram geom.
 
         Parameters:
-            data (DataFrame, optional): Data for this geom.
+            data (DataFrame or chunked source, optional): Data for this geom.
             mapping (aes, optional): Aesthetic mappings.
             bins (int): Number of bins. Default is 30. Overridden by binwidth if specified.
             binwidth (float, optional): Width of each bin. Overrides bins if specified.
@@ -54,8 +63,15 @@ class geom_histogram(Geom):
             center (float, optional): The center of one of the bins.
             barmode (str): Bar mode ('stack', 'overlay', 'group'). Default is 'stack'.
             bin (int, optional): Deprecated alias for bins. Use bins instead.
+            breaks (array-like, optional): Explicit bin edges.
             **params: Additional parameters.
         """
+        # Chunked sources are binned when drawn; the layer itself only
+        # carries an empty frame with their columns
+        self.source = None
+        if not isinstance(data, aes) and is_chunked_source(data):
+            self.source = as_chunked(data)
+            data = self.source.empty()
         super().__init__(data, mapping, **params)
         # Support deprecated 'bin' parameter for backward compatibility
         if bin is not None:
@@ -65,6 +81,7 @@ class geom_histogram(Geom):
         self.binwidth = binwidth
         self.boundary = boundary
         self.center = center
+        self.breaks = breaks
         self.barmode = barmode
 
     def _apply_stats(self, data):
@@ -89,61 +106,26 @@ class geom_histogram(Geom):
                     break
 
         # Create stat_bin with our parameters
+        stat_mapping = {'x': x_col}
+        if isinstance(self.mapping.get('weight'), str):
+            stat_mapping['weight'] = self.mapping['weight']
         bin_stat = stat_bin(
-            mapping={'x': x_col},
+            mapping=stat_mapping,
             bins=self.bins,
             binwidth=self.binwidth,
             boundary=self.boundary,
             center=self.center,
+            breaks=self.breaks,
             na_rm=na_rm
         )
 
         # Compute bins - either grouped or ungrouped
-        if group_col is not None:
-            # Grouped histogram: compute bins using SAME edges for all groups
-            # First, compute bin edges from ALL data so groups align for stacking
-            import numpy as np
-            all_x = data[x_col].dropna().values
-            x_min, x_max = np.nanmin(all_x), np.nanmax(all_x)
-            x_range = x_max - x_min
-
-            # Determine bin width
-            if self.binwidth is not None:
-                width = self.binwidth
-            else:
-                width = x_range / self.bins
-
-            # Compute shared bin edges
-            if self.boundary is not None:
-                shift = (x_min - self.boundary) % width
-                bin_min = x_min - shift
-            elif self.center is not None:
-                shift = (x_min - self.center + width / 2) % width
-                bin_min = x_min - shift
-            else:
-                bin_min = x_min
-
-            n_bins = int(np.ceil((x_max - bin_min) / width)) + 1
-            shared_breaks = bin_min + np.arange(n_bins + 1) * width
-
-            # Now compute bins for each group using the shared breaks
-            binned_frames = []
-            for group_value in data[group_col].unique():
-                group_data = data[data[group_col] == group_value].copy()
-                # Create a new stat_bin with the shared breaks
-                group_bin_stat = stat_bin(
-                    mapping={'x': x_col},
-                    breaks=shared_breaks,
-                    na_rm=na_rm
-                )
-                binned_data = group_bin_stat.compute(group_data)
-                binned_data[group_col] = group_value
-                binned_frames.append(binned_data)
-
-            if binned_frames:
-                data = pd.concat(binned_frames, ignore_index=True)
-            else:
-                data = pd.DataFrame({'x': [], 'count': [], 'width': [], group_col: []})
+        if self.source is not None:
+            data = bin_stat.compute_chunks(self.source, group_col)
+        elif group_col is not None:
+            # Grouped histogram: one pass over the rows with edges shared
+            # by all groups so they align for stacking
+            data = bin_stat.compute_grouped(data, group_col)
         else:
             # Ungrouped histogram
             data = bin_stat.compute(data)
@@ -224,18 +206,17 @@ class geom_histogram(Geom):
         x_col = self.mapping.get("x", "x")
         y_col = self.mapping.get("y", "count")
 
-        # Initialize legend tracking on figure if not present
-        if not hasattr(fig, '_ggplotly_shown_legendgroups'):
-            fig._ggplotly_shown_legendgroups = set()
+        # Legend entries already shown by other panels and layers
+        context = RenderContext.of(fig)
 
         if group_col is not None:
             # Grouped histogram - one trace per group with proper width
             cat_map = style_props.get('color_map') or style_props.get('fill_map', {})
             if not cat_map:
                 # Build a color map from unique values
-                import plotly.express as px
+                import plotly.colors as pc
                 unique_vals = data[group_col].unique()
-                colors = px.colors.qualitative.Plotly
+                colors = pc.qualitative.Plotly
                 cat_map = {val: colors[i % len(colors)] for i, val in enumerate(unique_vals)}
 
             for cat_value in cat_map.keys():
@@ -247,9 +228,7 @@ class geom_histogram(Geom):
                 legend_name = str(cat_value)
 
                 # Check if we should show this legend entry
-                show_legend = legend_name not in fig._ggplotly_shown_legendgroups
-                if show_legend:
-                    fig._ggplotly_shown_legendgroups.add(legend_name)
+                show_legend = context.show_legend(legend_name)
 
                 fig.add_trace(
                     go.Bar(
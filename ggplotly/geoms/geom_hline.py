@@ -67,4 +67,7 @@ class geom_hline(Geom):
                 row=row,
                 col=col,
                 name=name,
+                # Traces are added after all geoms are drawn, so the panel
+                # may not hold any yet (see figure_builder)
+                exclude_empty_subplots=False,
             )
@@ -1,8 +1,12 @@
 # geoms/geom_label.py
 
+import pandas as pd
 import plotly.graph_objects as go
 
+from .. import figure_builder
 from ..aesthetic_mapper import AestheticMapper
+from ..label_layout import label_mask
+from ..render_context import RenderContext
 from .geom_base import Geom
 
 
@@ -32,6 +36,11 @@ class geom_label(Geom):
         label_size (float, optional): Border line width. Default is 0.5.
         parse (bool, optional): If True, parse text labels as LaTeX math expressions.
             Default is False.
+        check_overlap (bool, optional): If True, labels whose box overlaps a label
+            drawn before are not drawn. Default is False.
+        priority (str, optional): Column deciding which labels are drawn first
+            (highest values first) with check_overlap or max_labels.
+        max_labels (int, optional): Maximum number of labels to draw.
         na_rm (bool, optional): If True, silently remove missing values. Default is False.
 
     Aesthetics:
@@ -56,6 +65,11 @@ class geom_label(Geom):
         ...  + geom_point()
         ...  + geom_label(nudge_y=0.5))
 
+        >>> # Readable labels for a dense scatter plot, largest cities first
+        >>> ggplot(df, aes(x='x', y='y', label='name')) + geom_label(
+        ...     check_overlap=True, priority='population', max_labels=100
+        ... )
+
         >>> # Labels colored by category
         >>> ggplot(df, aes(x='x', y='y', label='name', fill='category')) + geom_label()
 
@@ -116,6 +130,12 @@ class geom_label(Geom):
             return {"weight": "bold", "style": "italic"}
         return {}  # plain
 
+    @staticmethod
+    def _lookup_colors(values, color_map, default):
+        """Color of each value from a category -> color map, else default."""
+        colors = pd.Series(values).astype(object).map(color_map)
+        return colors.where(colors.notna(), default).tolist()
+
     def _draw_impl(self, fig, data, row, col):
         """
         Draw text labels with background boxes on the figure.
@@ -172,7 +192,6 @@ class geom_label(Geom):
 
         # Get label box styling
         label_padding = self.params.get("label_padding", 4)
-        label_r = self.params.get("label_r", 2)
         label_size = self.params.get("label_size", 0.5)
         alpha = style_props["alpha"]
 
@@ -180,16 +199,10 @@ class geom_label(Geom):
         default_text_color = self.params.get("color", "black")
         default_fill_color = self.params.get("fill", "white")
 
-        # Determine axis references for subplots
-        # For faceted plots, we need the correct axis reference
-        xref = f"x{col}" if col > 1 else "x"
-        yref = f"y{row}" if row > 1 else "y"
-        # Adjust for subplot layout
-        if row > 1 or col > 1:
-            subplot_idx = (row - 1) * fig._grid_ref[0].__len__() + col if hasattr(fig, '_grid_ref') else 1
-            if subplot_idx > 1:
-                xref = f"x{subplot_idx}"
-                yref = f"y{subplot_idx}"
+        # Axis references of the subplot the labels belong to
+        refs = RenderContext.of(fig).axis_refs(row, col) or {}
+        xref = refs.get("xaxis", "x")
+        yref = refs.get("yaxis", "y")
 
         # Handle fill mapping for background colors
         fill_series = style_props.get("fill_series")
@@ -201,45 +214,48 @@ class geom_label(Geom):
         color_map = style_props.get("color_map", {})
         color_col = style_props.get("color")
 
-        # Add annotations for each label
-        for idx in data.index:
-            # Determine fill color for this label
-            if fill_series is not None and fill_col in data.columns:
-                cat_value = data.loc[idx, fill_col]
-                fill_color = fill_map.get(cat_value, default_fill_color)
-            else:
-                fill_color = default_fill_color
-
-            # Determine text color for this label
-            if color_series is not None and color_col in data.columns:
-                cat_value = data.loc[idx, color_col]
-                text_color = color_map.get(cat_value, default_text_color)
-            else:
-                text_color = default_text_color
-
-            # Build font dict
-            font_dict = {"size": font_size, "color": text_color}
-            if font_family:
-                font_dict["family"] = font_family
-            font_dict.update(font_props)
-
-            # Add annotation with background
-            fig.add_annotation(
-                x=x[idx],
-                y=y[idx],
-                text=str(label[idx]),
-                showarrow=False,
-                font=font_dict,
-                xanchor=xanchor,
-                yanchor=yanchor,
-                bgcolor=fill_color,
-                opacity=alpha,
-                bordercolor=text_color,
-                borderwidth=label_size,
-                borderpad=label_padding,
-                xref=xref,
-                yref=yref,
-            )
+        # Thin out overlapping labels (check_overlap, priority, max_labels)
+        keep = label_mask(self, fig, data, x, y, label, row, col,
+                          padding=label_padding + label_size, hjust=hjust, vjust=vjust)
+        if keep is not None:
+            data, x, y, label = data[keep], x[keep], y[keep], label[keep]
+
+        # Colors of every label at once
+        if fill_series is not None and fill_col in data.columns:
+            fill_colors = self._lookup_colors(data[fill_col], fill_map, default_fill_color)
+        else:
+            fill_colors = [default_fill_color] * len(data)
+        if color_series is not None and color_col in data.columns:
+            text_colors = self._lookup_colors(data[color_col], color_map, default_text_color)
+        else:
+            text_colors = [default_text_color] * len(data)
+
+        font_base = {"size": font_size}
+        if font_family:
+            font_base["family"] = font_family
+
+        # Build every annotation, then add them to the layout in one step
+        annotations = []
+        for x_value, y_value, text, fill_color, text_color in zip(
+            x.tolist(), y.tolist(), label.astype(str).tolist(), fill_colors, text_colors
+        ):
+            annotations.append({
+                "x": x_value,
+                "y": y_value,
+                "text": text,
+                "showarrow": False,
+                "font": {**font_base, "color": text_color, **font_props},
+                "xanchor": xanchor,
+                "yanchor": yanchor,
+                "bgcolor": fill_color,
+                "opacity": alpha,
+                "bordercolor": text_color,
+                "borderwidth": label_size,
+                "borderpad": label_padding,
+                "xref": xref,
+                "yref": yref,
+            })
+        figure_builder.add_annotations(fig, annotations)
 
         # Add invisible scatter trace for legend if fill is mapped
         if fill_series is not None:
@@ -31,6 +31,7 @@ class geom_line(Geom):
     """
 
     required_aes = ['x', 'y']
+    streamable = 'x'
     default_params = {"size": 2}
 
     def _draw_impl(self, fig, data, row, col):
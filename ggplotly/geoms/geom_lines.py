@@ -55,7 +55,7 @@ class geom_lines(Geom):
 
     def _get_color_palette(self, n_colors):
         """Get a list of colors for multicolor mode."""
-        import plotly.express as px
+        import plotly.colors as pc
 
         palette_name = self.params.get("palette", "Plotly")
 
@@ -63,15 +63,15 @@ class geom_lines(Geom):
         if isinstance(palette_name, list):
             colors = palette_name
         # Check qualitative palettes first
-        elif hasattr(px.colors.qualitative, palette_name):
-            colors = getattr(px.colors.qualitative, palette_name)
+        elif hasattr(pc.qualitative, palette_name):
+            colors = getattr(pc.qualitative, palette_name)
         # Check sequential palettes (need to sample from continuous scale)
-        elif hasattr(px.colors.sequential, palette_name):
-            colorscale = getattr(px.colors.sequential, palette_name)
-            colors = px.colors.sample_colorscale(colorscale, n_colors)
+        elif hasattr(pc.sequential, palette_name):
+            colorscale = getattr(pc.sequential, palette_name)
+            colors = pc.sample_colorscale(colorscale, n_colors)
         # Default to Plotly palette
         else:
-            colors = px.colors.qualitative.Plotly
+            colors = pc.qualitative.Plotly
 
         return colors
 
@@ -125,8 +125,8 @@ class geom_lines(Geom):
             # Single color mode: use None separators for performance
             color = self.params.get("color")
             if color is None and hasattr(self, 'theme') and self.theme:
-                import plotly.express as px
-                palette = getattr(self.theme, 'color_map', None) or px.colors.qualitative.Plotly
+                import plotly.colors as pc
+                palette = getattr(self.theme, 'color_map', None) or pc.qualitative.Plotly
                 color = palette[0]
             elif color is None:
                 color = '#636EFA'  # Plotly default blue
@@ -3,10 +3,16 @@
 import json
 
 import pandas as pd
-import plotly.express as px
+import plotly.colors as pc
 import plotly.graph_objects as go
 
 from ..aesthetic_mapper import AestheticMapper
+from ..geo_utils import (
+    GeometryArrays,
+    simplify_geojson,
+    zoom_for_extent,
+    zoom_tolerance,
+)
 from .geom_base import Geom
 
 
@@ -99,6 +105,14 @@ class geom_map(Geom):
             Background color.
         fitbounds : str, optional
             How to fit bounds: 'locations', 'geojson', False.
+        simplify : bool or float, default=False
+            Simplify GeoJSON geometries before they are written into the figure.
+            True picks a tolerance of one screen pixel at the map's zoom level;
+            a float is used as the tolerance in degrees. Simplified geometries
+            are cached per geometry, so redraws and facets reuse them.
+        simplify_method : str, default='dp'
+            Simplification algorithm: 'dp' (Douglas-Peucker) or 'vw'
+            (Visvalingam-Whyatt).
 
         Examples
         --------
@@ -107,6 +121,9 @@ class geom_map(Geom):
 
         >>> # Choropleth
         >>> ggplot(data, aes(map_id='state', fill='pop')) + geom_map(map=map_data('state'))
+
+        >>> # County-level GeoJSON simplified to the display resolution
+        >>> ggplot(counties, aes(map_id='fips', fill='rate')) + geom_map(geojson=geo, simplify=True)
         """
         super().__init__(data, mapping, **params)
         self.map_df = params.pop('map', None)  # The map dataframe (like ggplot2)
@@ -257,9 +274,9 @@ class geom_map(Geom):
 
                 # Create discrete colorscale
                 n_cats = len(categories)
-                colors = px.colors.qualitative.Plotly[:n_cats]
+                colors = pc.qualitative.Plotly[:n_cats]
                 if n_cats > len(colors):
-                    colors = px.colors.qualitative.Alphabet[:n_cats]
+                    colors = pc.qualitative.Alphabet[:n_cats]
 
                 # Build discrete colorscale
                 colorscale = []
@@ -358,11 +375,16 @@ class geom_map(Geom):
         else:
             fill_values = None
 
+        # Flatten all coordinates once; bounds and trace coordinates come from these arrays
+        arrays = GeometryArrays.from_geojson(geojson)
+        simplify = self.params.get('simplify', False)
+        if simplify is not None and simplify is not False:
+            tolerance = self._simplify_tolerance(arrays, simplify)
+            geojson = simplify_geojson(geojson, tolerance, self.params.get('simplify_method', 'dp'))
+            arrays = GeometryArrays.from_geojson(geojson)
+
         # Determine geometry types in GeoJSON
-        geom_types = set()
-        for feature in geojson.get('features', []):
-            geom_type = feature.get('geometry', {}).get('type', '')
-            geom_types.add(geom_type)
+        geom_types = set(arrays.geom_types)
 
         # Check if primarily polygons, lines, or points
         has_polygons = 'Polygon' in geom_types or 'MultiPolygon' in geom_types
@@ -409,9 +431,9 @@ class geom_map(Geom):
                     z_values = fill_values.map(cat_to_num)
 
                     n_cats = len(categories)
-                    colors = px.colors.qualitative.Plotly[:n_cats]
+                    colors = pc.qualitative.Plotly[:n_cats]
                     if n_cats > len(colors):
-                        colors = px.colors.qualitative.Alphabet[:n_cats]
+                        colors = pc.qualitative.Alphabet[:n_cats]
 
                     colorscale = []
                     for i, color in enumerate(colors[:n_cats]):
@@ -457,24 +479,7 @@ class geom_map(Geom):
 
         # Handle lines with Scattermap
         if has_lines and not has_polygons:
-            # Extract line coordinates from GeoJSON
-            lats, lons = [], []
-            for feature in geojson.get('features', []):
-                geom = feature.get('geometry', {})
-                if geom.get('type') == 'LineString':
-                    coords = geom.get('coordinates', [])
-                    for lon, lat in coords:
-                        lons.append(lon)
-                        lats.append(lat)
-                    lons.append(None)  # Break between lines
-                    lats.append(None)
-                elif geom.get('type') == 'MultiLineString':
-                    for line in geom.get('coordinates', []):
-                        for lon, lat in line:
-                            lons.append(lon)
-                            lats.append(lat)
-                        lons.append(None)
-                        lats.append(None)
+            lons, lats = arrays.line_coords()
 
             line_color = self.params.get('color', 'steelblue')
             trace = ScatterMapTrace(
@@ -489,17 +494,7 @@ class geom_map(Geom):
 
         # Handle points with Scattermap
         if has_points and not has_polygons and not has_lines:
-            lats, lons = [], []
-            for feature in geojson.get('features', []):
-                geom = feature.get('geometry', {})
-                if geom.get('type') == 'Point':
-                    lon, lat = geom.get('coordinates', [0, 0])
-                    lons.append(lon)
-                    lats.append(lat)
-                elif geom.get('type') == 'MultiPoint':
-                    for lon, lat in geom.get('coordinates', []):
-                        lons.append(lon)
-                        lats.append(lat)
+            lons, lats = arrays.point_coords()
 
             point_color = self.params.get('color', 'steelblue')
             point_size = self.params.get('size', 8)
@@ -516,50 +511,49 @@ class geom_map(Geom):
         self._map_layout_key = map_layout_key
 
         # Set up mapbox layout for GeoJSON mode
-        self._setup_mapbox_layout(fig, geojson, fitbounds)
+        self._setup_mapbox_layout(fig, geojson, fitbounds, arrays=arrays)
+
+    def _simplify_tolerance(self, arrays, simplify):
+        """Resolve the simplify param to a tolerance in degrees.
 
-    def _setup_mapbox_layout(self, fig, geojson, fitbounds='locations'):
+        Args:
+            arrays: GeometryArrays of the unsimplified GeoJSON
+            simplify: True for a zoom-appropriate tolerance, or a float tolerance
+        """
+        if simplify is True:
+            zoom = self.params.get('zoom')
+            if zoom is None:
+                bounds = arrays.bounds()
+                if bounds is None:
+                    return None
+                zoom = zoom_for_extent(max(bounds[2] - bounds[0], bounds[3] - bounds[1]))
+            return zoom_tolerance(zoom)
+        return float(simplify)
+
+    def _setup_mapbox_layout(self, fig, geojson, fitbounds='locations', arrays=None):
         """Set up map layout for GeoJSON rendering.
 
         Args:
             fig: The plotly figure
             geojson: GeoJSON dict for bounds calculation
             fitbounds: How to fit bounds ('locations', 'geojson', or False)
+            arrays: Pre-flattened GeometryArrays for geojson (computed if None)
         """
         mapbox_style = self.params.get('mapbox_style', 'carto-positron')
         map_layout_key = getattr(self, '_map_layout_key', 'map')
 
         # Calculate center from GeoJSON bounds
-        if geojson and 'features' in geojson:
-            all_lons, all_lats = [], []
-            for feature in geojson['features']:
-                coords = self._extract_coords(feature.get('geometry', {}))
-                for lon, lat in coords:
-                    all_lons.append(lon)
-                    all_lats.append(lat)
-
-            if all_lons and all_lats:
-                center_lat = (min(all_lats) + max(all_lats)) / 2
-                center_lon = (min(all_lons) + max(all_lons)) / 2
-
-                # Estimate zoom based on bounds
-                lat_range = max(all_lats) - min(all_lats)
-                lon_range = max(all_lons) - min(all_lons)
-                max_range = max(lat_range, lon_range)
-                if max_range > 100:
-                    zoom = 2
-                elif max_range > 50:
-                    zoom = 3
-                elif max_range > 20:
-                    zoom = 4
-                elif max_range > 10:
-                    zoom = 5
-                elif max_range > 5:
-                    zoom = 6
-                else:
-                    zoom = 7
-            else:
-                center_lat, center_lon, zoom = 0, 0, 1
+        if arrays is None and geojson:
+            arrays = GeometryArrays.from_geojson(geojson)
+        bounds = arrays.bounds() if arrays is not None else None
+
+        if bounds is not None:
+            min_lon, min_lat, max_lon, max_lat = bounds
+            center_lat = (min_lat + max_lat) / 2
+            center_lon = (min_lon + max_lon) / 2
+
+            # Estimate zoom based on bounds
+            zoom = zoom_for_extent(max(max_lat - min_lat, max_lon - min_lon))
         else:
             center_lat, center_lon, zoom = 0, 0, 1
 
@@ -577,36 +571,6 @@ class geom_map(Geom):
         # Use the appropriate layout key (map or mapbox)
         fig.update_layout(**{map_layout_key: map_config})
 
-    def _extract_coords(self, geometry):
-        """Extract all coordinates from a GeoJSON geometry."""
-        coords = []
-        geom_type = geometry.get('type', '')
-        coordinates = geometry.get('coordinates', [])
-
-        if geom_type == 'Point':
-            coords.append(tuple(coordinates[:2]))
-        elif geom_type == 'MultiPoint':
-            for c in coordinates:
-                coords.append(tuple(c[:2]))
-        elif geom_type == 'LineString':
-            for c in coordinates:
-                coords.append(tuple(c[:2]))
-        elif geom_type == 'MultiLineString':
-            for line in coordinates:
-                for c in line:
-                    coords.append(tuple(c[:2]))
-        elif geom_type == 'Polygon':
-            for ring in coordinates:
-                for c in ring:
-                    coords.append(tuple(c[:2]))
-        elif geom_type == 'MultiPolygon':
-            for polygon in coordinates:
-                for ring in polygon:
-                    for c in ring:
-                        coords.append(tuple(c[:2]))
-
-        return coords
-
     def _setup_geo_layout(self, fig, scope=None, projection=None, add_marker_trace=True):
         """Set up the geographic layout for the map.
 
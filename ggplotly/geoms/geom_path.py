@@ -47,6 +47,7 @@ class geom_path(Geom):
     """
 
     required_aes = ['x', 'y']
+    streamable = True
     default_params = {"size": 2}
 
     def _draw_impl(self, fig, data, row, col):
@@ -4,6 +4,8 @@ import pandas as pd
 import plotly.graph_objects as go
 
 from ..aesthetic_mapper import AestheticMapper
+from ..rasterize import draw_raster_points
+from ..render_context import RenderContext
 from .geom_base import Geom
 
 
@@ -25,25 +27,42 @@ class geom_point(Geom):
         stroke (float, optional): Width of the point border/outline. Default is 0.
             In ggplot2, this applies to shapes 21-25 (filled shapes with borders).
         group (str, optional): Grouping variable for the points.
+        raster (bool, optional): If True, aggregate the points into a pixel grid
+            sized from ggsize and draw it as one heatmap (or, with a categorical
+            color, one image of blended category colors) instead of one marker
+            per point. See geom_raster_points. Default is False.
+        legend (int or str, optional): Draw a categorical color as a single trace with one
+            color per point, with legend entries for this many of the most frequent
+            categories, or none with 'none'. Colors with more than
+            ``trace_builders.max_category_traces`` categories are drawn this way
+            anyway, with ``trace_builders.legend_categories`` legend entries.
+            Default is None (one trace and legend entry per category).
 
     Required Aesthetics:
         x, y
 
     Optional Aesthetics:
         color, fill, size, shape, alpha, group
+
+    Examples:
+        >>> ggplot(df, aes(x='x', y='y', color='species')) + geom_point()
+        >>> # Thousands of users: one trace, legend for the 10 most frequent
+        >>> ggplot(df, aes(x='x', y='y', color='user_id')) + geom_point(legend=10)
     """
 
     required_aes = ['x', 'y']
+    streamable = True
     default_params = {"size": 8, "stroke": 0}
 
     def _draw_impl(self, fig, data, row, col):
 
+        if self.params.get("raster", False):
+            draw_raster_points(self, fig, data, row, col)
+            return
+
         # Check if this figure has geographic traces (from geom_map)
         # If so, use Scattergeo instead of Scatter
-        has_geo = any(
-            hasattr(trace, 'type') and trace.type in ('choropleth', 'scattergeo')
-            for trace in fig.data
-        )
+        has_geo = RenderContext.of(fig).has_trace_type('choropleth', 'scattergeo')
 
         if has_geo:
             self._draw_geo(fig, data)
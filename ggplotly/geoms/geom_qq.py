@@ -2,6 +2,7 @@
 
 import plotly.graph_objects as go
 
+from ..render_context import RenderContext
 from ..stats.stat_qq import stat_qq
 from .geom_base import Geom
 
@@ -82,13 +83,14 @@ class geom_qq(Geom):
         self.distribution = distribution
         self.dparams = dparams if dparams is not None else {}
 
-    def draw(self, fig, data=None, row=1, col=1):
+    def draw(self, fig, data=None, row=1, col=1, context=None):
         """
         Draw the Q-Q plot on the figure.
 
         Overrides base draw to create stat with current mapping (after merge).
         """
         data = data if data is not None else self.data
+        RenderContext.of(fig, context)
 
         # Create stat with current mapping (now includes global mapping)
         qq_stat = stat_qq(
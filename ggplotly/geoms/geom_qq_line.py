@@ -2,6 +2,7 @@
 
 import plotly.graph_objects as go
 
+from ..render_context import RenderContext
 from ..stats.stat_qq_line import stat_qq_line
 from .geom_base import Geom
 
@@ -81,13 +82,14 @@ class geom_qq_line(Geom):
         self.dparams = dparams if dparams is not None else {}
         self.line_p = line_p
 
-    def draw(self, fig, data=None, row=1, col=1):
+    def draw(self, fig, data=None, row=1, col=1, context=None):
         """
         Draw the Q-Q reference line on the figure.
 
         Overrides base draw to create stat with current mapping (after merge).
         """
         data = data if data is not None else self.data
+        RenderContext.of(fig, context)
 
         # Create stat with current mapping (now includes global mapping)
         qq_line_stat = stat_qq_line(
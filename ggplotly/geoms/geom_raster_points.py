@@ -0,0 +1,45 @@
+# geoms/geom_raster_points.py
+
+from .geom_point import geom_point
+
+
+class geom_raster_points(geom_point):
+    """
+    Geom for drawing very large point clouds as a pixel grid.
+
+    Points are aggregated into one cell per screen pixel of the panel (sized
+    from ggsize, or Plotly's default figure size) and drawn as a single
+    heatmap, so the figure holds one value per pixel instead of one marker
+    per point. With a categorical color mapping, the category colors are
+    blended per pixel and drawn as a single image, with opacity growing with
+    the number of points. Axis ranges follow the extent of the data.
+
+    Equivalent to ``geom_point(raster=True)``.
+
+    Parameters:
+        reduce (str, optional): Reduction per pixel: 'count', 'sum', 'mean',
+            'min', 'max' or 'any'. The sum, mean, min and max reduce a numeric
+            color aesthetic. Default is 'mean' with a numeric color and
+            'count' otherwise.
+        pixels (tuple, optional): (width, height) of the grid. Default is the
+            panel size in pixels.
+        engine (str, optional): 'numpy' (default) or 'numba' for a single
+            compiled pass over the points.
+        palette (str, optional): Color scale of the heatmap. Default is 'Viridis'.
+        min_alpha (float, optional): Opacity of single-point pixels when blending
+            categories. Default is 0.25.
+        alpha (float, optional): Transparency level of the layer. Default is 1.
+
+    Required Aesthetics:
+        x, y
+
+    Optional Aesthetics:
+        color
+
+    Examples:
+        >>> ggplot(df, aes(x='x', y='y')) + geom_raster_points()
+        >>> ggplot(df, aes(x='x', y='y', color='value')) + geom_raster_points(reduce='max')
+        >>> ggplot(df, aes(x='x', y='y', color='species')) + geom_raster_points() + ggsize(1200, 800)
+    """
+
+    default_params = {**geom_point.default_params, "raster": True}
@@ -10,6 +10,7 @@ Automatically detects geo context and uses Scattergeo when a map is present.
 import numpy as np
 import plotly.graph_objects as go
 
+from ..render_context import RenderContext
 from .geom_base import Geom
 
 
@@ -163,17 +164,10 @@ class geom_searoute(Geom):
         """
         Check if figure has geo context (map traces present).
 
-        Returns True if any Scattergeo or Choropleth traces exist,
+        Returns True if any geographic (geo or mapbox) traces were drawn,
         indicating we should render routes as Scattergeo too.
         """
-        if not fig.data:
-            return False
-
-        geo_types = ('scattergeo', 'choropleth', 'scattermapbox', 'choroplethmapbox')
-        return any(
-            hasattr(trace, 'type') and trace.type in geo_types
-            for trace in fig.data
-        )
+        return RenderContext.of(fig).is_geo
 
     def _compute_route(self, origin, destination):
         """
@@ -2,6 +2,8 @@
 
 import plotly.graph_objects as go
 
+from ..aes import aes
+from ..chunked import as_chunked, is_chunked_source
 from ..stats.stat_ecdf import stat_ecdf
 from .geom_base import Geom
 
@@ -23,23 +25,72 @@ class geom_step(Geom):
         group (str, optional): Grouping variable for the steps.
         stat (str, optional): The statistical transformation to use. Default is 'identity'.
             Use 'ecdf' for empirical cumulative distribution function.
+        n (int, optional): With stat='ecdf', the largest number of breakpoints per ECDF.
+        spacing (str, optional): With stat='ecdf' and n, 'probability' (default) or 'x'.
+        pad (bool, optional): With stat='ecdf', pad each ECDF to 0 and 1. Default is False.
         na_rm (bool, optional): If True, remove missing values. Default is False.
         show_legend (bool, optional): Whether to show in legend. Default is True.
 
+    With stat='ecdf', data that does not fit in memory can be passed as
+    ``data``: an iterable of DataFrame chunks, a callable returning one, a
+    pyarrow Dataset or a memmap (see ChunkedData). Each ECDF is then
+    accumulated chunk by chunk in an EcdfSketch, grouped by one column at
+    most. Facets are not applied to such layers.
+
     Examples:
         >>> ggplot(df, aes(x='x', y='y')) + geom_step()
         >>> ggplot(df, aes(x='x')) + geom_step(stat='ecdf')
+        >>> ggplot(df, aes(x='x', color='g')) + geom_step(stat='ecdf', n=500)
+        >>> ggplot(mapping=aes(x='ms')) + geom_step(data=ChunkedData(dataset), stat='ecdf')
     """
 
     required_aes = ['x']  # y is optional when stat='ecdf'
     default_params = {"size": 2}
 
+    def __init__(self, data=None, mapping=None, **params):
+        """
+        Initialize the step geom.
+
+        Parameters:
+            data (DataFrame or chunked source, optional): Data for this geom.
+            mapping (aes, optional): Aesthetic mappings.
+            **params: Additional parameters.
+        """
+        # Chunked sources are summarised when drawn; the layer itself only
+        # carries an empty frame with their columns
+        self.source = None
+        if not isinstance(data, aes) and is_chunked_source(data):
+            self.source = as_chunked(data)
+            data = self.source.empty()
+        super().__init__(data, mapping, **params)
+
     def _apply_stats(self, data):
         """Add stat_ecdf if stat='ecdf'."""
         if self.stats == []:
             stat = self.params.get("stat", "identity")
             if stat == "ecdf":
-                self.stats.append(stat_ecdf(mapping=self.mapping))
+                self.stats.append(stat_ecdf(
+                    mapping=self.mapping,
+                    n=self.params.get("n"),
+                    spacing=self.params.get("spacing", "probability"),
+                    pad=self.params.get("pad", False),
+                ))
+        if self.source is not None:
+            # The first stat sketches the chunks; any others see the curves
+            first, *rest = self.stats or [None]
+            if not isinstance(first, stat_ecdf):
+                raise ValueError("geom_step draws chunked data with stat='ecdf' only")
+            group_col = None
+            for aesthetic in ['group', 'fill', 'color', 'colour']:
+                column = self.mapping.get(aesthetic)
+                if isinstance(column, str) and column in self.source.columns:
+                    group_col = column
+                    break
+            data = first.compute_chunks(self.source, group_col)
+            self.mapping = first._new_mapping()
+            for stat in rest:
+                data, self.mapping = stat.compute(data)
+            return data
         return super()._apply_stats(data)
 
     def _draw_impl(self, fig, data, row, col):
@@ -3,6 +3,7 @@
 import plotly.graph_objects as go
 
 from ..aesthetic_mapper import AestheticMapper
+from ..label_layout import label_mask
 from .geom_base import Geom
 
 
@@ -22,7 +23,11 @@ class geom_text(Geom):
         nudge_x (float, optional): Horizontal offset to apply to text position. Default is 0.
         nudge_y (float, optional): Vertical offset to apply to text position. Default is 0.
         check_overlap (bool, optional): If True, text that overlaps previous text will not
-            be plotted. Default is False. Note: Limited support in Plotly.
+            be plotted. Default is False. Text extents are estimated from the number
+            of characters and the font size.
+        priority (str, optional): Column deciding which labels are drawn first
+            (highest values first) with check_overlap or max_labels.
+        max_labels (int, optional): Maximum number of labels to draw.
         size (float, optional): Text size in points. Default is 11.
         family (str, optional): Font family. Default is None (use Plotly default).
         fontface (str, optional): Font face ('plain', 'bold', 'italic', 'bold.italic').
@@ -41,6 +46,7 @@ class geom_text(Geom):
         >>> ggplot(df, aes(x='x', y='y', label='name')) + geom_text(hjust=0, vjust=1)  # top-left
         >>> ggplot(df, aes(x='x', y='y', label='name')) + geom_text(angle=45)
         >>> ggplot(df, aes(x='x', y='y', label='name')) + geom_text(nudge_y=0.5)
+        >>> ggplot(df, aes(x='x', y='y', label='name')) + geom_text(check_overlap=True)
     """
 
     required_aes = ['x', 'y', 'label']
@@ -149,6 +155,19 @@ class geom_text(Geom):
         alpha = style_props['alpha']
         group_values = style_props['group_series']
 
+        # Thin out overlapping labels (check_overlap, priority, max_labels).
+        # Plotly places 'left' text to the left of its point, and so on.
+        v_pos, _, h_pos = textposition.partition(" ")
+        keep = label_mask(
+            self, fig, data, x, y, label, row, col,
+            hjust={"left": 1, "right": 0}.get(h_pos, 0.5),
+            vjust={"bottom": 1, "top": 0}.get(v_pos, 0.5),
+        )
+        if keep is not None:
+            data, x, y, label = data[keep], x[keep], y[keep], label[keep]
+            if group_values is not None:
+                group_values = group_values[keep]
+
         color_targets = dict(color="textfont_color")
 
         # Draw text traces
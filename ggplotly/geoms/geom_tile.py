@@ -1,7 +1,7 @@
 # geoms/geom_tile.py
 
 import pandas as pd
-import plotly.express as px
+import plotly.colors as pc
 import plotly.graph_objects as go
 
 from .geom_base import Geom
@@ -53,8 +53,8 @@ class geom_tile(Geom):
 
                 unique_colors = z.unique()
                 color_map = {
-                    val: px.colors.qualitative.Plotly[
-                        i % len(px.colors.qualitative.Plotly)
+                    val: pc.qualitative.Plotly[
+                        i % len(pc.qualitative.Plotly)
                     ]
                     for i, val in enumerate(unique_colors)
                 }
@@ -1,7 +1,11 @@
 # geoms/geom_violin.py
 
+import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
 
+from ..constants import get_color_palette
+from ..stats.stat_ydensity import density_quantiles, stat_ydensity
 from .geom_base import Geom
 
 
@@ -12,25 +16,200 @@ class geom_violin(Geom):
     Automatically handles categorical variables for color and fill.
     Automatically converts 'group' and 'fill' columns to categorical if necessary.
 
+    Densities are estimated server-side with stat_ydensity. Each violin is
+    sent to Plotly as ``max_points`` points that carry the same binned
+    density, so figure size does not grow with the number of rows. The
+    violins of a colour group share one trace and are drawn with the
+    smallest of their bandwidths; the points of the others are fitted so
+    that they still draw their own profile.
+
     Parameters:
         fill (str, optional): Fill color for the violins.
         alpha (float, optional): Transparency level for the fill color. Default is 0.5.
         color (str, optional): Outline color of the violin plots.
         linewidth (float, optional): Line width of the violin outline.
         group (str, optional): Grouping variable for the violin plots.
+        bw (str or float, optional): Bandwidth method or value. Default is 'nrd0'.
+        adjust (float, optional): Bandwidth adjustment multiplier. Default is 1.
+        n (int, optional): Number of density grid points per violin. Default is 512.
+        trim (bool, optional): Trim violins to the range of the data. Default is True.
+        scale (str, optional): 'area' (default) gives every violin the same area,
+            'count' makes areas proportional to the number of observations and
+            'width' gives every violin the same maximum width.
+        draw_quantiles (list of float, optional): Draw horizontal lines at these
+            quantiles of the density instead of the inner box.
+        max_points (int, optional): Number of points sent per violin. Default
+            is 1024. With scale='count' this is the number for the largest
+            violin and the others get proportionally fewer.
+        width (float, optional): Largest violin width, as a fraction of the
+            spacing between x positions. Default is 0.9.
+
+    Examples:
+        >>> ggplot(mpg, aes(x='class', y='hwy')) + geom_violin()
+        >>> ggplot(mpg, aes(x='class', y='hwy')) + geom_violin(scale='count')
+        >>> ggplot(mpg, aes(x='class', y='hwy')) + geom_violin(draw_quantiles=[0.25, 0.5, 0.75])
     """
 
     required_aes = ['x', 'y']
 
+    def __init__(self, data=None, mapping=None, bw='nrd0', adjust=1, kernel='gaussian',
+                 n=512, trim=True, scale='area', draw_quantiles=None, max_points=1024,
+                 width=0.9, **params):
+        super().__init__(data, mapping, **params)
+        self.stat = stat_ydensity(bw=bw, adjust=adjust, kernel=kernel, n=n, trim=trim,
+                                  scale=scale, draw_quantiles=draw_quantiles)
+        self.max_points = max_points
+        self.width = width
+
+    def _apply_stats(self, data):
+        """
+        Apply attached stats, leaving stat_ydensity to the trace builder.
+
+        Densities are estimated per violin so that colour, fill and facet
+        splits still apply. An attached stat_ydensity replaces this geom's
+        density settings.
+        """
+        for stat in self.stats:
+            if isinstance(stat, stat_ydensity):
+                self.stat = stat
+            else:
+                data, self.mapping = stat.compute(data)
+        return data
+
+    def _group_columns(self, data):
+        """Columns that split violins at the same x position."""
+        columns = []
+        for aes_name in ('group', 'fill', 'color'):
+            column = self.mapping.get(aes_name)
+            if isinstance(column, str) and column in data.columns and column not in columns:
+                columns.append(column)
+        return columns
+
+    @staticmethod
+    def _resolution(x):
+        """Smallest gap between x positions in axis units, or 1 for categories."""
+        if pd.api.types.is_datetime64_any_dtype(x):
+            # Date axes are measured in milliseconds
+            x = (x - x.min()) / pd.Timedelta(milliseconds=1)
+        elif pd.api.types.is_bool_dtype(x) or not pd.api.types.is_numeric_dtype(x):
+            return 1.0
+        gaps = np.diff(np.unique(x.dropna().to_numpy(dtype=float)))
+        return float(gaps.min()) if len(gaps) else 1.0
+
+    @staticmethod
+    def _violins(x, y):
+        """Positions and finite observations of the violins with at least two."""
+        frame = pd.DataFrame({'x': np.asarray(x), 'y': np.asarray(y, dtype=float)})
+        positions, groups = [], []
+        for position, values in frame.groupby('x', sort=False)['y']:
+            values = values.to_numpy()
+            values = values[np.isfinite(values)]
+            if len(values) >= 2:
+                positions.append(position)
+                groups.append(values)
+        return positions, groups
+
+    def _layer_color_map(self, data):
+        """Colour map over the whole panel, so split traces keep their colours."""
+        column = self.mapping.get('color') or self.mapping.get('fill')
+        if not isinstance(column, str) or column not in data.columns:
+            return None
+        palette = get_color_palette(self.theme)
+        values = data[column].dropna().unique()
+        return {value: palette[i % len(palette)] for i, value in enumerate(values)}
+
+    def _violin_trace(self, x, y, scalegroup, n_max, width, **kwargs):
+        """
+        Build one go.Violin holding every violin of a single group.
+
+        Plotly smooths all violins of a trace with one bandwidth, the
+        smallest of theirs, and spans each one over its points; the
+        sketches are fitted to that bandwidth.
+        """
+        stat = self.stat
+        positions, groups = self._violins(x, y)
+        if not groups:
+            return go.Violin(x=[], y=[], **kwargs)
+
+        bw = min(stat.bandwidth(values) for values in groups)
+        sketches = []
+        for values in groups:
+            if stat.scale == 'count':
+                # Plotly scales 'count' violins by their number of points
+                size = len(values) * self.max_points / n_max
+            else:
+                size = self.max_points
+            sketches.append(stat.sketch(values, size, bw).astype(np.float32))
+
+        if stat.scale == 'width':
+            scalegroup = f"{scalegroup}-{positions[0]}-{kwargs.get('name')}"
+
+        return go.Violin(
+            x=np.repeat(np.asarray(positions), [len(points) for points in sketches]),
+            y=np.concatenate(sketches),
+            bandwidth=bw,
+            spanmode='hard',
+            scalegroup=scalegroup,
+            scalemode='count' if stat.scale == 'count' else 'width',
+            width=width,
+            points=False,
+            **kwargs,
+        )
+
+    def _quantile_lines(self, x, y, n_max, width, peak, line_width, **kwargs):
+        """
+        Build the ``draw_quantiles`` lines of a single group as one go.Bar.
+
+        Plotly violins have no quantile lines, and scatter points cannot be
+        offset on a categorical axis. Bars can: each line is a bar of zero
+        height at the quantile, as wide as Plotly draws the violin there.
+        """
+        stat = self.stat
+        positions, groups = self._violins(x, y)
+        lines, base, half = [], [], []
+        for position, values in zip(positions, groups):
+            grid, density, _ = stat.profile(values)
+            quantiles = density_quantiles(grid, density, stat.draw_quantiles)
+            # Plotly scales densities by the largest one in the scale group
+            scale = width / 2 / (density.max() if peak is None else peak)
+            if stat.scale == 'count':
+                scale *= len(values) / n_max
+            lines += [position] * len(quantiles)
+            base.extend(quantiles)
+            half.extend(np.interp(quantiles, grid, density) * scale)
+
+        half = np.asarray(half)
+        return go.Bar(
+            x=lines,
+            y=np.zeros(len(half)),
+            base=base,
+            width=2 * half,
+            offset=-half,
+            marker_color='rgba(0,0,0,0)',
+            marker_line_width=line_width,
+            hoverinfo='skip',
+            **kwargs,
+        )
+
     def _draw_impl(self, fig, data, row, col):
         if "linewidth" not in self.params:
             self.params["linewidth"] = 1
 
-        plot = go.Violin
+        x_col = self.mapping['x']
+        keys = [x_col, *self._group_columns(data)]
+        groups = data.groupby(keys, sort=False, observed=True)[self.mapping['y']]
+        violins = [values[np.isfinite(values)] for values in
+                   (np.asarray(group, dtype=float) for _, group in groups)]
+        violins = [values for values in violins if len(values) >= 2]
+        n_max = max(map(len, violins), default=0)
+        width = self.width * self._resolution(data[x_col])
 
         payload = dict(
             name=self.params.get("name", "Violin"),
-            box_visible=True,
+            box_visible=self.stat.draw_quantiles is None,
+            scalegroup=f"violin-{row}-{col}",
+            n_max=n_max,
+            width=width,
         )
 
         # Note: opacity/alpha is handled by _transform_fig via AestheticMapper
@@ -44,4 +223,32 @@ class geom_violin(Geom):
             color="line_color",
         )
 
-        self._transform_fig(plot, fig, data, payload, color_targets, row, col)
+        # Plotly scales the widths of a trace together, so violins of equal
+        # width take a trace each, coloured by the map of the whole panel
+        color_map = self._global_color_map
+        subsets = [data]
+        if self.stat.scale == 'width':
+            if color_map is None:
+                color_map = self._layer_color_map(data)
+            subsets = [subset for _, subset in data.groupby(x_col, sort=False, observed=True)]
+
+        for subset in subsets:
+            self._transform_fig(
+                self._violin_trace, fig, subset, payload, color_targets, row, col,
+                color_map=color_map,
+            )
+
+        if self.stat.draw_quantiles is not None:
+            lines = dict(
+                name=payload["name"],
+                n_max=n_max,
+                width=width,
+                peak=None if self.stat.scale == 'width' else
+                max(self.stat.profile(values)[1].max() for values in violins),
+                line_width=self.params["linewidth"],
+            )
+            for subset in subsets:
+                self._transform_fig(
+                    self._quantile_lines, fig, subset, lines, dict(color="marker_line_color"),
+                    row, col, color_map=color_map,
+                )
@@ -1,16 +1,28 @@
 # ggplot.py
 
 import copy
+import os
 
 import plotly.graph_objects as go
+import plotly.io as pio
 import plotly.subplots as sp
 
+from . import (
+    async_render,
+    export,
+    figure_builder,
+    render_cache,
+    render_diff,
+    serialize,
+    streaming,
+)
 from .aes import aes
 from .coords.coord_base import Coord
 from .data_utils import INDEX_COLUMN, normalize_data
 from .facets import Facet
 from .geoms.geom_base import Geom
 from .guides import Annotate, Guides, Labs
+from .render_context import RenderContext
 from .scales.scale_base import Scale, ScaleRegistry
 from .stats.stat_base import Stat
 from .themes import Theme
@@ -76,6 +88,7 @@ class ggplot:
         self.guides_obj = None  # Initialize guides
         self.fig = go.Figure()
         self.auto_draw = True  # Automatically draw after adding components by default
+        self._render_key = None  # Fingerprint of the plot when self.fig was drawn
 
     def copy(self):
         """
@@ -93,6 +106,9 @@ class ggplot:
         Parameters:
             component: The component to add.
         """
+        # Any new component invalidates the cached figure
+        self._render_key = None
+
         if isinstance(component, Geom):
             self.add_geom(component)
         elif isinstance(component, Scale):
@@ -132,27 +148,37 @@ class ggplot:
     def _repr_html_(self):
         """Return HTML representation for Jupyter/IPython display."""
         if self.auto_draw:
-            fig = self.draw()
-            # Only include MathJax CDN if parse=True is used (for LaTeX rendering)
-            if self._needs_mathjax():
-                return fig.to_html(full_html=False, include_plotlyjs='cdn', include_mathjax='cdn')
-            return fig._repr_html_()
+            return self._notebook_bundle()['text/html']
         return ""
 
-    def _repr_mimebundle_(self, **kwargs):
+    def _repr_mimebundle_(self, include=None, exclude=None, **kwargs):
         """Return MIME bundle for Jupyter display (preferred by VS Code, JupyterLab)."""
         if self.auto_draw:
-            fig = self.draw()
-            # Only include MathJax CDN if parse=True is used (for LaTeX rendering)
-            if self._needs_mathjax():
-                html = fig.to_html(full_html=False, include_plotlyjs='cdn', include_mathjax='cdn')
-                return {'text/html': html}
-            bundle = fig._repr_mimebundle_(**kwargs)
-            if 'text/html' not in bundle:
-                bundle['text/html'] = fig._repr_html_()
-            return bundle
+            return self._notebook_bundle(**kwargs)
         return {}
 
+    def _notebook_bundle(self, **kwargs):
+        """
+        MIME bundle of the figure from the configured Plotly renderers.
+
+        Figures are shown from their compact dict (see ``serialize``), so
+        notebooks hold numeric arrays as small typed arrays, and go through
+        ``plotly.io.renderers`` like any Plotly figure (e.g. 'notebook'
+        inlines Plotly.js for offline kernels). The Plotly MIME renderer
+        cannot load MathJax, so plots rendering LaTeX (parse=True) are shown
+        as HTML only.
+        """
+        fig_dict = serialize.figure_dict(self.draw())
+        if self._needs_mathjax():
+            html = pio.to_html(fig_dict, validate=False, full_html=False,
+                               include_plotlyjs='cdn', include_mathjax='cdn')
+            return {'text/html': html}
+        bundle = pio.renderers._build_mime_bundle(fig_dict, **kwargs)
+        if 'text/html' not in bundle:
+            bundle['text/html'] = pio.to_html(fig_dict, validate=False, full_html=False,
+                                              include_plotlyjs='cdn')
+        return bundle
+
     def add_stat(self, stat):
         """
         Add stat as a new layer with its own geom.
@@ -202,6 +228,8 @@ class ggplot:
         new_geom.stats = [stat_copy]
 
         self.add_geom(new_geom)
+        # The layer draws the plot data (e.g. rows added with append())
+        new_geom._has_explicit_data = False
 
     def add_geom(self, geom):
         """
@@ -298,24 +326,133 @@ class ggplot:
         """
         self.coords.append(coords)
 
-    def draw(self):
+    def draw(self, incremental=False):
         """
         Render the plot.
 
+        If nothing has changed since the last draw (same layers, params,
+        scales, theme, facets and data), the previously built figure is
+        returned instead of rebuilding every trace. See ``render_cache``.
+
+        Parameters:
+            incremental (bool): Reuse the traces of the layers that have not
+                changed since the last incremental draw, and remember the
+                traces of every layer for the next one. See ``render_diff``.
+                Default is False.
+
         Returns:
             go.Figure: The Plotly figure object.
         """
-        # Initialize the figure with subplots
-        if self.facets:
-            # Faceting is applied; the facet's apply method will handle subplot creation
-            self.fig = self.facets.apply(self)
-        else:
-            # No faceting; create a single-subplot figure
-            self.fig = sp.make_subplots(rows=1, cols=1)
+        return self._draw(self.fig if incremental else None)
+
+    async def draw_async(self, timeout=None, executor=None):
+        """
+        Render the plot in an executor without blocking the event loop.
+
+        Parameters:
+            timeout (float, optional): Seconds to wait for the figure.
+            executor (Executor, optional): Executor to draw in, e.g. a
+                ``ProcessPoolExecutor``. Default is the event loop's thread
+                pool. See ``ggplotly.async_render``.
+
+        Returns:
+            go.Figure: The Plotly figure object.
+
+        Examples:
+            >>> fig = await p.draw_async(timeout=10)
+        """
+        return await async_render.draw(self, timeout=timeout, executor=executor)
+
+    def diff(self, previous_figure):
+        """
+        Render the plot and list what changed since an earlier figure.
+
+        Layers that have not changed since previous_figure was drawn with
+        ``draw(incremental=True)`` (or by ``diff``) reuse its traces. The
+        result lists the changes as Plotly.js ``restyle``,
+        ``extendTraces``, ``addTraces``, ``deleteTraces`` and ``relayout``
+        updates, so an app can send them instead of the whole figure.
+
+        Parameters:
+            previous_figure (Figure or dict): Figure shown so far, or its
+                figure dict (e.g. the ``figure`` of a Dash graph).
+
+        Returns:
+            FigurePatch: The changes, and the new figure as ``figure``.
+
+        Examples:
+            >>> fig = p.draw(incremental=True)
+            >>> patch = (ggplot(filtered, aes('x', 'y')) + geom_point()).diff(fig)
+            >>> patch.restyle
+            [({'x': [array([...])], 'y': [array([...])]}, [0])]
+        """
+        return render_diff.diff(previous_figure, self._draw(previous_figure))
+
+    def _figure_size(self):
+        """(width, height) set by ggsize, or None."""
+        return (self.size.width, self.size.height) if self.size else None
+
+    def _draw(self, previous=None):
+        """
+        Render the plot, reusing the layers of a previous figure if given.
+
+        Parameters:
+            previous (Figure or dict, optional): Figure whose layer cache is
+                reused (see ``render_diff``). None draws every layer and
+                keeps no layer cache.
+
+        Returns:
+            go.Figure: The Plotly figure object.
+        """
+        use_cache = render_cache.enabled
+        if use_cache and self._render_key is not None:
+            hit = render_cache.fingerprint(self) == self._render_key
+            render_cache.record(hit)
+            if hit:
+                return self.fig
+        elif use_cache:
+            render_cache.record(False)
 
-            # Draw all geoms on the main figure
-            for geom in self.layers:
-                geom.draw(self.fig, row=1, col=1)
+        # Initialize the figure with subplots
+        # Trace builders record plain trace dicts; the figure is built once
+        # they are all drawn (see figure_builder)
+        # One render context records what the layers have drawn (trace types,
+        # shown legend entries, panel axes) for the geoms, facets and coords.
+        # Geoms that size their output in pixels (geom_hex, rasterized points)
+        # read the final figure size from it, and geoms binning every facet
+        # panel alike (geom_bin2d) the data of their whole layer
+        context = RenderContext(self.coords, self.scales, self._figure_size(), {
+            geom: geom.data if getattr(geom, '_has_explicit_data', False) else self.data
+            for geom in self.layers
+        })
+        layers = None
+        if previous is not None:
+            layers = render_diff.LayerCache(render_diff.layer_cache(previous))
+        with figure_builder.deferred():
+            if self.facets:
+                # Faceting is applied; the facet's apply method will handle subplot creation
+                self.fig = self.facets.apply(self, context)
+            else:
+                # No faceting; create a single-subplot figure
+                self.fig = sp.make_subplots(rows=1, cols=1)
+
+                # Draw all geoms on the main figure
+                for geom in self.layers:
+                    if layers is not None:
+                        # Reuse the traces of unchanged layers
+                        layers.draw(geom, self.fig, context)
+                    else:
+                        geom.draw(self.fig, row=1, col=1, context=context)
+
+        # Train the scales on every layer's traces, then map sizes, colors and
+        # positions onto the plain trace data before the figure is built
+        traces = figure_builder.collect(self.fig)
+        self._scale_registry.train(traces)
+        self._scale_registry.map(traces)
+        for coord in self.coords:
+            coord.map(traces)
+        self.fig = figure_builder.build(self.fig, traces)
+        figure_builder.mark_mapped(self.fig, [*self.scales, *self.coords])
 
         # Apply scales after plotting the geoms
         for scale in self.scales:
@@ -350,9 +487,42 @@ class ggplot:
         if self.size:
             self.size.apply(self)
 
+        if layers is not None:
+            layers.attach(self.fig)
+
+        # Fingerprint after drawing, so state recorded by geoms during the draw
+        # is part of the key and the next draw of an unchanged plot is a hit
+        self._render_key = render_cache.fingerprint(self) if use_cache else None
+
         # Show the plot
         return self.fig
 
+    def append(self, rows, max_points=None):
+        """
+        Append rows to the plot data and update the figure.
+
+        Layers drawing one mark per row (points, paths and lines arriving in
+        x order) draw only the new rows and extend their traces; other layers
+        are drawn again from the kept rows. See ``ggplotly.streaming``.
+
+        Parameters:
+            rows (DataFrame, Series or dict): New rows, with the columns of
+                the plot data.
+            max_points (int, optional): Number of latest rows to keep; older
+                rows leave the plot. Default keeps every row.
+
+        Returns:
+            FigurePatch: Changes from the figure drawn so far to the new one,
+                e.g. ``patch.extend`` as Plotly.js ``extendTraces`` calls, or
+                ``render_diff.apply_patch(widget, patch)`` for a FigureWidget.
+
+        Examples:
+            >>> p = ggplot(df, aes('time', 'value')) + geom_line()
+            >>> fig = p.draw(incremental=True)
+            >>> patch = p.append(new_rows, max_points=10_000)
+        """
+        return streaming.append(self, rows, max_points=max_points)
+
     def show(self):
         """
         Show the current plot in the default viewer.
@@ -362,24 +532,86 @@ class ggplot:
         """
         self.draw().show()
 
-    def save(self, filepath):
+    def to_json(self, precision="float64"):
         """
-        Save the current plot to a file (e.g., HTML, PNG).
+        Serialize the plot to Plotly JSON with compact numeric arrays.
+
+        Numeric trace arrays are written as base64 typed arrays in the
+        smallest type that holds them exactly. See ``ggplotly.serialize``.
+
+        Parameters:
+            precision (str): 'float64' (default) keeps every value exact;
+                'float32' downcasts float arrays to single precision for
+                about half the size.
+
+        Returns:
+            str: Plotly JSON, readable with ``plotly.io.from_json``.
+        """
+        return serialize.to_json(self.draw(), precision=precision)
+
+    def save(self, filepath, format=None, precision="float64", include_plotlyjs="cdn"):
+        """
+        Save the current plot to a file (e.g., HTML, PNG, JSON).
 
         Parameters:
             filepath (str): The file path where the plot should be saved.
+            format (str, optional): 'html', 'json', or an image format written
+                by Kaleido ('png', 'svg', 'pdf', 'jpg', 'webp'). Default is
+                taken from the file extension.
+            precision (str): Precision of float arrays in HTML and JSON output:
+                'float64' (default, exact) or 'float32'.
+            include_plotlyjs (str or bool): How HTML files load Plotly.js: 'cdn'
+                (default), 'directory' to reference a shared copy written next
+                to the file (works offline), or True to inline it (~3.5 MB).
 
         Note:
-            HTML files use CDN references for Plotly.js and MathJax, resulting
+            By default HTML files use CDN references for Plotly.js, resulting
             in small file sizes (~8KB) but requiring internet for viewing.
-            MathJax CDN enables LaTeX rendering (e.g., geom_text with parse=True).
+            MathJax is loaded from its CDN only when LaTeX is rendered (e.g.,
+            geom_text with parse=True). HTML and JSON files hold numeric trace
+            arrays as compact base64 typed arrays. Use ``export_html`` to save
+            many plots for offline viewing.
         """
         if not hasattr(self, "fig"):
             raise AttributeError("No figure to save. Call draw() before saving.")
 
-        if filepath.endswith(".html"):
-            self.fig.write_html(filepath, include_plotlyjs='cdn', include_mathjax='cdn')
-        elif filepath.endswith(".png"):
-            self.fig.write_image(filepath)
+        if format is None:
+            format = str(filepath).rsplit(".", 1)[-1].lower()
+
+        if format == "html":
+            if include_plotlyjs == "directory":
+                directory = os.path.dirname(os.path.abspath(filepath))
+                include_plotlyjs = os.path.basename(export.write_plotlyjs(directory))
+            html = serialize.to_html(
+                self.fig, precision=precision, include_plotlyjs=include_plotlyjs,
+                include_mathjax='cdn' if self._needs_mathjax() else False,
+            )
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.write(html)
+        elif format == "json":
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.write(serialize.to_json(self.fig, precision=precision))
+        elif format in export._IMAGE_FORMATS:
+            self.fig.write_image(filepath, format=format)
         else:
-            raise ValueError("Unsupported file format. Use .html or .png.")
+            raise ValueError("Unsupported file format. Use .html, .json, .png, .svg or .pdf.")
+
+    async def save_async(self, filepath, timeout=None, executor=None, **kwargs):
+        """
+        Render the plot and save it in an executor without blocking the event loop.
+
+        Parameters:
+            filepath (str): The file path where the plot should be saved.
+            timeout (float, optional): Seconds to wait for the file.
+            executor (Executor, optional): Executor to draw and save in.
+                Default is the event loop's thread pool. See
+                ``ggplotly.async_render``.
+            **kwargs: Options of ``save`` (format, precision, include_plotlyjs).
+
+        Returns:
+            str: filepath.
+
+        Examples:
+            >>> await p.save_async('plot.png', timeout=30)
+        """
+        return await async_render.save(self, filepath, timeout=timeout, executor=executor, **kwargs)
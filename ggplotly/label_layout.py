@@ -0,0 +1,193 @@
+# label_layout.py
+"""
+Choose which text labels to draw in dense plots.
+
+Labeling every point of a dense scatter plot draws thousands of overlapping
+labels that nobody can read. ``select_labels`` keeps a label only if its box
+does not overlap a label already kept, in order of priority, optionally up
+to a budget of labels. Boxes are estimated from the number of characters and
+the font size, placed in pixels using the panel size, and bucketed in a grid
+of cells as large as the largest box, so each label is only compared with
+the labels kept in the 3 x 3 neighbouring cells.
+
+Examples:
+    >>> ggplot(df, aes(x='x', y='y', label='name')) + geom_text(check_overlap=True)
+    >>> ggplot(df, aes(x='x', y='y', label='name')) + geom_label(
+    ...     check_overlap=True, priority='population', max_labels=50)
+"""
+
+import numpy as np
+import pandas as pd
+
+from .rasterize import _coordinates, _extent, panel_pixels
+from .render_context import RenderContext
+
+# Average glyph width and line height of sans-serif fonts, in font sizes
+CHAR_WIDTH = 0.6
+LINE_HEIGHT = 1.2
+
+# Share of the data range Plotly's autorange adds on each side
+_AUTORANGE_PAD = 0.05
+
+_LINE_BREAK = r"<br>|\n"
+
+
+def text_extents(labels, size, padding=0):
+    """
+    Estimated width and height of text labels in pixels.
+
+    Parameters:
+        labels (Series): Label text. Lines break at ``<br>`` or newlines.
+        size (float): Font size in pixels.
+        padding (float): Space added around the text on each side.
+
+    Returns:
+        tuple: (widths, heights) float arrays.
+    """
+    text = pd.Series(labels).astype(str)
+    breaks = text.str.count(_LINE_BREAK)
+    if breaks.any():
+        chars = text.str.split(_LINE_BREAK, regex=True).map(lambda lines: max(map(len, lines)))
+    else:
+        chars = text.str.len()
+    widths = chars.to_numpy(dtype=float) * size * CHAR_WIDTH + 2 * padding
+    heights = (breaks.to_numpy(dtype=float) + 1) * size * LINE_HEIGHT + 2 * padding
+    return widths, heights
+
+
+def axis_positions(values):
+    """
+    Positions of label coordinates along an axis, as floats.
+
+    Numbers and datetimes keep their values; categories are placed at 0, 1,
+    2, ... in order of appearance, as on a Plotly category axis.
+    """
+    positions, _ = _coordinates(values)
+    if np.isnan(positions).all() and pd.notna(values).any():
+        codes, _ = pd.factorize(values)
+        positions = np.where(codes < 0, np.nan, codes.astype(float))
+    return positions
+
+
+def to_pixels(positions, pixels):
+    """Pixel coordinates of positions on a panel spanning their padded range."""
+    finite = np.isfinite(positions)
+    if not finite.any():
+        return positions
+    lo, hi = _extent(positions[finite])
+    pad = (hi - lo) * _AUTORANGE_PAD
+    return (positions - lo + pad) / (hi - lo + 2 * pad) * pixels
+
+
+def select_labels(left, bottom, widths, heights, priority=None, max_labels=None,
+                  check_overlap=True):
+    """
+    Labels to draw, as a boolean mask.
+
+    Labels are visited by decreasing priority (in data order for ties) and
+    kept when their box does not overlap a box kept before, until
+    max_labels are kept. Labels with missing positions are never kept.
+
+    Parameters:
+        left, bottom (ndarray): Lower left corner of each label box in pixels.
+        widths, heights (ndarray): Size of each label box in pixels.
+        priority (array-like, optional): Higher values are placed first.
+            Missing values come last.
+        max_labels (int, optional): Maximum number of labels to keep.
+        check_overlap (bool): Drop labels overlapping a label kept before.
+            With False, only the max_labels labels of highest priority are kept.
+
+    Returns:
+        ndarray: Boolean mask of the labels to draw.
+    """
+    left = np.asarray(left, dtype=float)
+    bottom = np.asarray(bottom, dtype=float)
+    n = len(left)
+    keep = np.zeros(n, dtype=bool)
+    if max_labels is not None and max_labels <= 0:
+        return keep
+
+    valid = np.isfinite(left) & np.isfinite(bottom)
+    if priority is None:
+        order = np.flatnonzero(valid)
+    else:
+        rank = pd.to_numeric(pd.Series(priority), errors="coerce").to_numpy(dtype=float)
+        order = np.argsort(-np.nan_to_num(rank, nan=-np.inf), kind="stable")
+        order = order[valid[order]]
+
+    if not check_overlap:
+        keep[order[:max_labels]] = True
+        return keep
+    if not len(order):
+        return keep
+
+    widths = np.broadcast_to(np.asarray(widths, dtype=float), n)
+    heights = np.broadcast_to(np.asarray(heights, dtype=float), n)
+    right, top = left + widths, bottom + heights
+    # Overlapping boxes lie at most one cell apart in each direction
+    cell_x = max(widths[order].max(), 1e-9)
+    cell_y = max(heights[order].max(), 1e-9)
+    cells_x = np.floor(left[order] / cell_x).astype(np.int64).tolist()
+    cells_y = np.floor(bottom[order] / cell_y).astype(np.int64).tolist()
+
+    grid = {}
+    budget = n if max_labels is None else max_labels
+    for i, cx, cy in zip(order.tolist(), cells_x, cells_y):
+        l, b, r, t = left[i], bottom[i], right[i], top[i]
+        free = True
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for j in grid.get((cx + dx, cy + dy), ()):
+                    if l < right[j] and left[j] < r and b < top[j] and bottom[j] < t:
+                        free = False
+                        break
+                if not free:
+                    break
+            if not free:
+                break
+        if free:
+            keep[i] = True
+            grid.setdefault((cx, cy), []).append(i)
+            budget -= 1
+            if not budget:
+                break
+    return keep
+
+
+def label_mask(geom, fig, data, x, y, labels, row, col, padding=0, hjust=0.5, vjust=0.5):
+    """
+    Labels of a text geom to draw, from its check_overlap, priority and
+    max_labels parameters.
+
+    Parameters:
+        geom (Geom): geom_text or geom_label.
+        fig (Figure): Figure the labels are drawn on.
+        data (DataFrame): Layer data.
+        x, y (Series): Label positions, after nudging.
+        labels (Series): Label text.
+        row, col (int): Subplot position.
+        padding (float): Space around the text of each label box in pixels.
+        hjust, vjust (float): Justification of the text around its position.
+
+    Returns:
+        ndarray or None: Boolean mask of the rows to label, or None to label
+            every row.
+    """
+    params = geom.params
+    check_overlap = params.get("check_overlap", False)
+    max_labels = params.get("max_labels")
+    priority = params.get("priority")
+    if not check_overlap and max_labels is None:
+        return None
+    if priority is not None:
+        priority = data[priority] if isinstance(priority, str) else priority
+
+    positions_x, positions_y = axis_positions(x), axis_positions(y)
+    if check_overlap:
+        width, height = panel_pixels(fig, row, col, RenderContext.of(fig).figure_size)
+        widths, heights = text_extents(labels, params.get("size", 11), padding)
+        left = to_pixels(positions_x, width) - hjust * widths
+        bottom = to_pixels(positions_y, height) - vjust * heights
+    else:
+        left, bottom, widths, heights = positions_x, positions_y, 0, 0
+    return select_labels(left, bottom, widths, heights, priority, max_labels, check_overlap)
@@ -0,0 +1,404 @@
+# rasterize.py
+"""
+Aggregate points into a pixel grid.
+
+Drawing tens of millions of points as markers means serializing every
+coordinate into the figure. Rasterized layers instead count (or otherwise
+reduce) the points falling in each screen pixel of the panel and embed the
+grid as one heatmap or image, so the figure size depends on the panel size
+only.
+
+Pixels are found with integer arithmetic and reduced with np.bincount. With
+``engine='numba'`` the reduction is a single compiled pass over the points,
+which avoids the temporary arrays of the NumPy path for very large inputs.
+"""
+
+import base64
+import struct
+import zlib
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from . import colormap
+from .aesthetic_mapper import AestheticMapper
+from .render_context import RenderContext
+from .stats.stat_bin_2d import summarise_bins
+
+REDUCTIONS = ("count", "sum", "mean", "min", "max", "any")
+
+ENGINES = ("numpy", "numba")
+
+# Plotly's defaults when the layout does not set them
+_DEFAULT_SIZE = (700, 450)
+_DEFAULT_MARGIN = dict(l=80, r=80, t=100, b=80)
+
+# Most color categories blended per pixel; the blend holds a count grid per
+# category
+max_categories = 256
+
+_numba_kernel = None
+
+
+def panel_pixels(fig, row, col, size=None):
+    """
+    Approximate plotting area of one subplot in pixels.
+
+    Uses the given figure size (from ggsize), else the figure's width and
+    height, else Plotly's defaults, together with the margins and the
+    subplot's axis domains.
+
+    Parameters:
+        fig (Figure): Plotly figure object.
+        row (int): Row position in subplot.
+        col (int): Column position in subplot.
+        size (tuple, optional): (width, height) of the whole figure in pixels.
+
+    Returns:
+        tuple: (width, height)
+    """
+    layout = fig.layout
+    width, height = size if size is not None else (layout.width, layout.height)
+    width = width or _DEFAULT_SIZE[0]
+    height = height or _DEFAULT_SIZE[1]
+    margin = {side: getattr(layout.margin, side) for side in _DEFAULT_MARGIN}
+    margin = {side: _DEFAULT_MARGIN[side] if value is None else value
+              for side, value in margin.items()}
+
+    x_domain, y_domain = (0, 1), (0, 1)
+    try:
+        subplot = fig.get_subplot(row, col)
+        x_domain, y_domain = subplot.xaxis.domain, subplot.yaxis.domain
+    except Exception:
+        pass
+    return (
+        max(width - margin['l'] - margin['r'], 1) * (x_domain[1] - x_domain[0]),
+        max(height - margin['t'] - margin['b'], 1) * (y_domain[1] - y_domain[0]),
+    )
+
+
+def _coordinates(series):
+    """Float values of a coordinate column, and whether it holds datetimes."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        values = series.to_numpy(dtype='datetime64[ns]')
+        return np.where(pd.isna(values), np.nan, values.astype(np.int64).astype(float)), True
+    return pd.to_numeric(series, errors='coerce').to_numpy(dtype=float), False
+
+
+def _extent(values):
+    """(low, high) of finite values, widened when all values are equal."""
+    lo, hi = float(values.min()), float(values.max())
+    if hi == lo:
+        pad = abs(lo) * 0.05 or 0.5
+        return lo - pad, hi + pad
+    return lo, hi
+
+
+def pixel_codes(x, y, extent, shape):
+    """
+    Flat pixel index of each point in a row-major grid.
+
+    Row 0 is the bottom of the panel (lowest y). Points on the upper edges
+    fall in the last pixel.
+
+    Parameters:
+        x, y (ndarray): Point coordinates, all inside the extent.
+        extent (tuple): (x_low, x_high, y_low, y_high).
+        shape (tuple): (n_columns, n_rows) of the grid.
+
+    Returns:
+        ndarray: int64 pixel index of each point.
+    """
+    x_lo, x_hi, y_lo, y_hi = extent
+    nx, ny = shape
+    ix = ((x - x_lo) * (nx / (x_hi - x_lo))).astype(np.int64)
+    iy = ((y - y_lo) * (ny / (y_hi - y_lo))).astype(np.int64)
+    np.minimum(ix, nx - 1, out=ix)
+    np.minimum(iy, ny - 1, out=iy)
+    iy *= nx
+    iy += ix
+    return iy
+
+
+def _get_numba_kernel():
+    """Compile (once) the single-pass reduction used by engine='numba'."""
+    global _numba_kernel
+    if _numba_kernel is None:
+        try:
+            import numba
+        except ImportError:
+            raise ImportError(
+                "The numba package is required for engine='numba'. "
+                "Install it with: pip install numba"
+            )
+
+        @numba.njit(nogil=True)
+        def accumulate(x, y, values, x_lo, x_scale, y_lo, y_scale, nx, ny,
+                       count, total, low, high):
+            for i in range(x.shape[0]):
+                ix = min(int((x[i] - x_lo) * x_scale), nx - 1)
+                iy = min(int((y[i] - y_lo) * y_scale), ny - 1)
+                c = iy * nx + ix
+                v = values[i]
+                count[c] += 1
+                total[c] += v
+                if v < low[c]:
+                    low[c] = v
+                if v > high[c]:
+                    high[c] = v
+
+        _numba_kernel = accumulate
+    return _numba_kernel
+
+
+def aggregate(x, y, extent, shape, values=None, how="count", engine="numpy"):
+    """
+    Reduce the points falling in each pixel.
+
+    Parameters:
+        x, y (ndarray): Finite point coordinates inside the extent.
+        extent (tuple): (x_low, x_high, y_low, y_high).
+        shape (tuple): (n_columns, n_rows) of the grid.
+        values (ndarray, optional): Values reduced by 'sum', 'mean', 'min'
+            and 'max'.
+        how (str): One of 'count', 'sum', 'mean', 'min', 'max', 'any'.
+        engine (str): 'numpy' (default) or 'numba'.
+
+    Returns:
+        ndarray: (n_rows, n_columns) float grid, NaN where no point fell.
+    """
+    if how not in REDUCTIONS:
+        raise ValueError(f"reduce must be one of {REDUCTIONS}, got {how!r}")
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}, got {engine!r}")
+    if how in ("sum", "mean", "min", "max") and values is None:
+        raise ValueError(f"reduce={how!r} needs a numeric color aesthetic to reduce")
+
+    nx, ny = shape
+    n_pixels = nx * ny
+    grid = np.full(n_pixels, np.nan)
+
+    if engine == "numba":
+        kernel = _get_numba_kernel()
+        count = np.zeros(n_pixels, dtype=np.int64)
+        total = np.zeros(n_pixels)
+        low = np.full(n_pixels, np.inf)
+        high = np.full(n_pixels, -np.inf)
+        reduced = np.zeros(len(x)) if values is None else np.asarray(values, dtype=float)
+        x_lo, x_hi, y_lo, y_hi = extent
+        kernel(x, y, reduced, x_lo, nx / (x_hi - x_lo), y_lo, ny / (y_hi - y_lo), nx, ny,
+               count, total, low, high)
+        occupied = np.flatnonzero(count)
+        result = {
+            "count": count, "any": count, "sum": total, "min": low, "max": high,
+            "mean": total / np.maximum(count, 1),
+        }[how][occupied]
+    else:
+        codes = pixel_codes(x, y, extent, shape)
+        fun = "count" if how == "any" else how
+        occupied, _, result = summarise_bins(codes, n_pixels, values, None, fun)
+
+    grid[occupied] = 1.0 if how == "any" else result
+    return grid.reshape(ny, nx)
+
+
+def blend_categories(x, y, categories, colors, extent, shape, min_alpha=0.25):
+    """
+    Blend category colors per pixel, weighted by the points of each category.
+
+    Opacity grows with the logarithm of the pixel's point count, from
+    ``min_alpha`` for a single point to 1 for the densest pixel.
+
+    Parameters:
+        x, y (ndarray): Finite point coordinates inside the extent.
+        categories (ndarray): Integer category code of each point (0..k-1).
+        colors (ndarray): (k, 3) RGB color of each category.
+        extent (tuple): (x_low, x_high, y_low, y_high).
+        shape (tuple): (n_columns, n_rows) of the grid.
+        min_alpha (float): Opacity of pixels holding a single point.
+
+    Returns:
+        ndarray: (n_rows, n_columns, 4) uint8 RGBA image, row 0 at the bottom
+            of the panel.
+    """
+    nx, ny = shape
+    n_pixels = nx * ny
+    n_categories = len(colors)
+    codes = pixel_codes(x, y, extent, shape)
+    codes += categories.astype(np.int64) * n_pixels
+    counts = np.bincount(codes, minlength=n_categories * n_pixels)
+    counts = counts.reshape(n_categories, n_pixels).astype(float)
+
+    total = counts.sum(axis=0)
+    occupied = total > 0
+    rgb = np.zeros((n_pixels, 3))
+    rgb[occupied] = (counts[:, occupied].T @ np.asarray(colors, dtype=float)) / total[occupied, None]
+
+    alpha = np.zeros(n_pixels)
+    densest = np.log1p(total.max()) if total.size else 0.0
+    if densest > np.log1p(1):
+        scaled = (np.log1p(total[occupied]) - np.log1p(1)) / (densest - np.log1p(1))
+        alpha[occupied] = min_alpha + (1 - min_alpha) * scaled
+    else:
+        alpha[occupied] = 1.0
+
+    image = np.empty((n_pixels, 4), dtype=np.uint8)
+    image[:, :3] = np.clip(np.rint(rgb), 0, 255)
+    image[:, 3] = np.rint(alpha * 255)
+    return image.reshape(ny, nx, 4)
+
+
+def png_data_uri(image):
+    """
+    Encode an RGBA image as a PNG data URI.
+
+    Uses only the standard library (zlib), so no imaging package is needed.
+    Row 0 of the array is the first row of the PNG; Plotly places it at the
+    trace's y0, which is the bottom of a non-reversed axis.
+
+    Parameters:
+        image (ndarray): (height, width, 4) uint8 array.
+
+    Returns:
+        str: ``data:image/png;base64,...``
+    """
+    height, width = image.shape[:2]
+
+    def chunk(tag, body):
+        return (struct.pack(">I", len(body)) + tag + body
+                + struct.pack(">I", zlib.crc32(tag + body) & 0xFFFFFFFF))
+
+    # Each scanline starts with filter type 0 (none)
+    raw = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    raw[:, 1:] = image.reshape(height, width * 4)
+    png = (b"\x89PNG\r\n\x1a\n"
+           + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+           + chunk(b"IDAT", zlib.compress(raw.tobytes(), 6))
+           + chunk(b"IEND", b""))
+    return "data:image/png;base64," + base64.b64encode(png).decode("ascii")
+
+
+def _axis_values(lo, step, n, is_datetime):
+    """Pixel centers along one axis, as datetimes for datetime axes."""
+    centers = lo + (np.arange(n) + 0.5) * step
+    return pd.to_datetime(centers.astype(np.int64)) if is_datetime else centers
+
+
+def draw_raster_points(geom, fig, data, row, col):
+    """
+    Draw a point layer as a rasterized heatmap or image.
+
+    Without a color mapping, or with a continuous one, the reduced grid is
+    drawn as a heatmap using the geom's palette. With a categorical color
+    mapping, category colors are blended per pixel and drawn as an image,
+    with a legend entry per category.
+
+    Parameters:
+        geom (Geom): The point geom being drawn.
+        fig (Figure): Plotly figure object.
+        data (DataFrame): Layer data.
+        row (int): Row position in subplot.
+        col (int): Column position in subplot.
+    """
+    params = geom.params
+    x, x_is_datetime = _coordinates(data[geom.mapping['x']])
+    y, y_is_datetime = _coordinates(data[geom.mapping['y']])
+    keep = np.isfinite(x) & np.isfinite(y)
+
+    style_props = geom._get_style_props(data)
+    color_series = style_props['color_series']
+    color_map = style_props['color_map']
+    # Facets give every layer a color map, continuous columns included
+    if color_series is not None and AestheticMapper(
+            data, geom.mapping, params, geom.theme, validate=False)._is_continuous(color_series):
+        color_map = None
+    elif color_map is not None and len(color_map) > max_categories:
+        raise ValueError(
+            f"Rasterized points blend at most {max_categories} color categories, "
+            f"got {len(color_map)}. Map color to a numeric column or to fewer categories."
+        )
+    values = None
+    if color_series is not None and color_map is None:
+        values = pd.to_numeric(color_series, errors='coerce').to_numpy(dtype=float)
+        keep &= np.isfinite(values)
+        values = values[keep]
+    x, y = x[keep], y[keep]
+    if len(x) == 0:
+        return
+
+    x_lo, x_hi = _extent(x)
+    y_lo, y_hi = _extent(y)
+    extent = (x_lo, x_hi, y_lo, y_hi)
+    pixels = params.get("pixels")
+    if pixels is None:
+        pixels = panel_pixels(fig, row, col, RenderContext.of(fig).figure_size)
+    shape = (max(int(round(pixels[0])), 1), max(int(round(pixels[1])), 1))
+    dx, dy = (x_hi - x_lo) / shape[0], (y_hi - y_lo) / shape[1]
+
+    name = params.get("name", "Point")
+    if color_map is not None:
+        codes = pd.Categorical(color_series[keep], categories=list(color_map)).codes
+        known = codes >= 0
+        colors = colormap.to_rgba_array(list(color_map.values()))[:, :3]
+        image = blend_categories(x[known], y[known], codes[known], colors, extent, shape,
+                                 params.get("min_alpha", 0.25))
+        fig.add_trace(
+            go.Image(
+                source=png_data_uri(image),
+                x0=_axis_values(x_lo, dx, 1, x_is_datetime)[0],
+                dx=dx / 1e6 if x_is_datetime else dx,
+                y0=_axis_values(y_lo, dy, 1, y_is_datetime)[0],
+                dy=dy / 1e6 if y_is_datetime else dy,
+                opacity=params.get("alpha", 1),
+                name=name,
+                hoverinfo='skip',
+            ),
+            row=row,
+            col=col,
+        )
+        # Images would otherwise flip the y axis and lock the aspect ratio
+        fig.update_yaxes(autorange=True, scaleanchor=False, row=row, col=col)
+
+        context = RenderContext.of(fig)
+        present = np.bincount(codes[known], minlength=len(color_map)) > 0
+        for (value, color), shown in zip(color_map.items(), present):
+            if not shown:
+                continue
+            legend_name = str(value)
+            show_legend = params.get("showlegend", True) and context.show_legend(legend_name)
+            fig.add_trace(
+                go.Scatter(
+                    x=[None], y=[None], mode='markers',
+                    marker=dict(color=color, size=params.get("size", 8)),
+                    name=legend_name, legendgroup=legend_name, showlegend=show_legend,
+                ),
+                row=row,
+                col=col,
+            )
+        return
+
+    how = params.get("reduce") or ("count" if values is None else "mean")
+    grid = aggregate(x, y, extent, shape, values, how, params.get("engine", "numpy"))
+    if how == "any":
+        color = style_props['default_color']
+        colorscale = [[0, color], [1, color]]
+    else:
+        colorscale = params.get("palette", "Viridis")
+    colorbar_title = how if values is None else f"{geom.mapping.get('color')} ({how})"
+
+    fig.add_trace(
+        go.Heatmap(
+            x=_axis_values(x_lo, dx, shape[0], x_is_datetime),
+            y=_axis_values(y_lo, dy, shape[1], y_is_datetime),
+            z=grid,
+            colorscale=colorscale,
+            showscale=how != "any",
+            colorbar=dict(title=colorbar_title),
+            opacity=params.get("alpha", 1),
+            name=name,
+            hoverongaps=False,
+        ),
+        row=row,
+        col=col,
+    )
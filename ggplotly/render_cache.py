@@ -0,0 +1,207 @@
+# render_cache.py
+"""
+Memoization of drawn figures.
+
+``ggplot.draw()`` is called several times for the same plot: Jupyter asks
+for both ``_repr_html_`` and ``_repr_mimebundle_``, and scripts often call
+``draw()`` followed by ``ggsave``. Each plot remembers a fingerprint of
+everything that affects its figure (layers, params, stats, scales, theme,
+facets, coords, labels and data). When the fingerprint has not changed since
+the last draw, the previously built figure is returned.
+
+Chunked data sources (see ``ggplotly.chunked``) are not hashed; they are
+identified by object, so wrap changed data in a new ``ChunkedData`` to
+redraw it. Adding any component with ``+`` clears the cached figure. Set
+``render_cache.enabled = False`` to always rebuild.
+
+Examples:
+    >>> from ggplotly import render_cache
+    >>> p = ggplot(df, aes('x', 'y')) + geom_point()
+    >>> fig = p.draw()
+    >>> p.draw() is fig
+    True
+    >>> render_cache.cache_info()
+    CacheInfo(hits=1, misses=1, enabled=True)
+"""
+from __future__ import annotations
+
+import hashlib
+import types
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from plotly.basedatatypes import BaseFigure
+
+from .chunked import ChunkedData
+
+# Set to False to rebuild the figure on every draw()
+enabled = True
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "enabled"])
+
+_hits = 0
+_misses = 0
+
+# Attributes that hold draw output or cache bookkeeping rather than plot spec.
+# Facets and streaming set the color and shape maps of every layer from its
+# data on each draw; the data is hashed already, and a continuous color map
+# holds one entry per point
+_SKIP_ATTRS = frozenset({"fig", "_render_key", "_global_color_map", "_global_shape_map"})
+
+_CALLABLE_TYPES = (type, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+def cache_info():
+    """
+    Return hit and miss counts for draw() since the last reset.
+
+    Returns:
+        CacheInfo: Named tuple (hits, misses, enabled).
+    """
+    return CacheInfo(_hits, _misses, enabled)
+
+
+def reset_counters():
+    """Reset the hit and miss counters."""
+    global _hits, _misses
+    _hits = _misses = 0
+
+
+def record(hit):
+    """Count one cache lookup."""
+    global _hits, _misses
+    if hit:
+        _hits += 1
+    else:
+        _misses += 1
+
+
+def _new_hasher():
+    """Return xxhash's 128-bit hasher if installed, else blake2b."""
+    try:
+        import xxhash
+    except ImportError:
+        return hashlib.blake2b(digest_size=16)
+    return xxhash.xxh3_128()
+
+
+def _update_array(h, values):
+    """Feed an array's dtype, shape and contents into the hasher."""
+    values = np.asarray(values)
+    h.update(f"{values.dtype.str}{values.shape}".encode())
+    if values.dtype.kind == "O":
+        _update_objects(h, pd.Series(values.ravel()))
+    else:
+        h.update(np.ascontiguousarray(values).view(np.uint8).data)
+
+
+def _update_objects(h, values):
+    """Hash object values with pandas' vectorized hashing."""
+    try:
+        hashed = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    except TypeError:
+        # Unhashable cells such as lists
+        h.update(repr(values.tolist()).encode())
+    else:
+        h.update(hashed.data)
+
+
+def _update_frame(h, frame):
+    """Feed a DataFrame or Series into the hasher, one column buffer at a time."""
+    if isinstance(frame, pd.Series):
+        frame = frame.to_frame()
+    h.update(f"frame{frame.shape}".encode())
+    _update(h, list(frame.columns), set())
+    h.update(str(list(frame.dtypes)).encode())
+    _update_index(h, frame.index)
+    for _, col in frame.items():
+        _update_column(h, col)
+
+
+def _update_index(h, index):
+    """Feed an index into the hasher; RangeIndex is hashed by its bounds."""
+    if isinstance(index, pd.RangeIndex):
+        h.update(f"range{index.start},{index.stop},{index.step}".encode())
+    else:
+        h.update(pd.util.hash_pandas_object(index).to_numpy().data)
+
+
+def _update_column(h, col):
+    """Feed one column into the hasher."""
+    if col.dtype.kind in "biufcmM":
+        _update_array(h, col.to_numpy())
+    else:
+        _update_objects(h, col)
+
+
+def _update(h, obj, seen):
+    """Recursively feed a plot component into the hasher."""
+    if obj is None or isinstance(obj, (bool, int, float, complex, str, bytes)):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+        return
+    if isinstance(obj, BaseFigure):
+        return
+
+    obj_id = id(obj)
+    if obj_id in seen:
+        # Shared component (e.g. the theme referenced by every layer)
+        h.update(f"ref{obj_id};".encode())
+        return
+    seen.add(obj_id)
+
+    if isinstance(obj, ChunkedData):
+        # Out-of-core sources are too large to hash; identify them by object
+        h.update(f"chunked{obj_id};".encode())
+    elif isinstance(obj, (pd.DataFrame, pd.Series)):
+        _update_frame(h, obj)
+    elif isinstance(obj, pd.Index):
+        _update_index(h, obj)
+    elif isinstance(obj, np.ndarray):
+        _update_array(h, obj)
+    elif isinstance(obj, dict):
+        h.update(b"{")
+        for key, value in obj.items():
+            _update(h, key, seen)
+            _update(h, value, seen)
+        h.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}[".encode())
+        for item in obj:
+            _update(h, item, seen)
+        h.update(b"]")
+    elif isinstance(obj, (set, frozenset)):
+        h.update(repr(sorted(map(repr, obj))).encode())
+    elif isinstance(obj, _CALLABLE_TYPES):
+        # Functions are identified by object: two lambdas must not collide
+        h.update(f"{getattr(obj, '__qualname__', repr(obj))}@{obj_id};".encode())
+    elif hasattr(obj, "__dict__"):
+        cls = type(obj)
+        h.update(f"{cls.__module__}.{cls.__qualname__}(".encode())
+        for key, value in vars(obj).items():
+            if key in _SKIP_ATTRS:
+                continue
+            h.update(key.encode())
+            _update(h, value, seen)
+        h.update(b")")
+    else:
+        h.update(f"{type(obj).__qualname__}:{obj!r};".encode())
+
+
+def fingerprint(obj):
+    """
+    Return a stable digest of a plot and everything it draws from.
+
+    Data frames are hashed column by column from their buffers; other
+    components are hashed from their attributes. Figures built by a previous
+    draw are ignored.
+
+    Parameters:
+        obj: A ggplot object (or any component of one).
+
+    Returns:
+        str: Hex digest.
+    """
+    h = _new_hasher()
+    _update(h, obj, set())
+    return h.hexdigest()
@@ -0,0 +1,232 @@
+# render_context.py
+"""
+State of a figure while a plot is drawn.
+
+Geoms and coords used to find out what a figure holds by scanning
+``fig.data`` (is there a map? are there bar traces?) on every layer, and
+trace builders kept the legend entries already shown in an attribute of
+the figure. ``ggplot.draw()`` now creates one ``RenderContext``, passes it to
+the facets and to every ``Geom.draw``, and attaches it to the figure. It reads
+each trace once, the first time it is queried after the trace was added, so
+queries cost O(1) instead of O(traces).
+
+Examples:
+    >>> from ggplotly.render_context import RenderContext
+    >>> context = RenderContext.of(fig)
+    >>> context.is_geo
+    >>> context.show_legend('setosa')  # True the first time only
+"""
+
+import numpy as np
+
+# Trace types drawn on a geographic layout
+GEO_TRACE_TYPES = frozenset({
+    "scattergeo", "choropleth",
+    "scattermapbox", "choroplethmapbox",
+    "scattermap", "choroplethmap",
+})
+
+# Trace types drawn on a tile map (mapbox or MapLibre) layout
+MAP_TRACE_TYPES = frozenset({
+    "scattermapbox", "choroplethmapbox",
+    "scattermap", "choroplethmap",
+})
+
+_ATTR = "_ggplotly_context"
+
+
+class RenderContext:
+    """
+    What has been drawn on a figure so far.
+
+    Parameters:
+        coords (list, optional): Coordinate systems of the plot.
+        scales (list, optional): Scales of the plot.
+        figure_size (tuple, optional): (width, height) of the figure in pixels
+            set by ggsize.
+        layer_data (dict, optional): Layer -> its data across all facet panels.
+
+    Attributes:
+        coords (list): Coordinate systems of the plot.
+        scales (list): Scales of the plot.
+        figure_size (tuple or None): Figure size for layers sized in pixels
+            (geom_hex, rasterized points, label overlap).
+        layer_data (dict): Layer -> its data across all facet panels, for
+            layers binning every panel alike (geom_bin2d, geom_hex).
+        legend_groups (set): Legend groups whose entry is already shown.
+        legend_queries (dict or None): When set to a dict, records the answer
+            of ``show_legend`` for each legend group asked about.
+    """
+
+    def __init__(self, coords=None, scales=None, figure_size=None, layer_data=None):
+        self.coords = list(coords or [])
+        self.scales = list(scales or [])
+        self.figure_size = figure_size
+        self.layer_data = dict(layer_data or {})
+        self.legend_groups = set()
+        self.legend_queries = None
+        self._fig = None
+        # Types of traces in fig.data, read up to position _seen
+        self._types = set()
+        self._seen = 0
+        # Types of traces recorded before they are added to fig.data
+        self._recorded = set()
+        # (row, col) -> subplot references of that panel
+        self._panels = {}
+        # key -> [low, high, [(target, names)]] of share_range
+        self._ranges = {}
+
+    @classmethod
+    def of(cls, fig, context=None):
+        """
+        The context attached to a figure.
+
+        Parameters:
+            fig (Figure): Plotly figure.
+            context (RenderContext, optional): Context to attach to fig.
+                Default is the one already attached, or a new one.
+
+        Returns:
+            RenderContext
+        """
+        attached = fig.__dict__.get(_ATTR)
+        if context is None:
+            context = attached if attached is not None else cls()
+        if context is not attached:
+            setattr(fig, _ATTR, context)
+        if context._fig is not fig:
+            # New figure (e.g. the one built from the deferred traces)
+            context._fig = fig
+            context._types = set()
+            context._seen = 0
+            context._panels = {}
+        return context
+
+    def record(self, trace_type):
+        """Record a trace that is added to the figure later (see figure_builder)."""
+        self._recorded.add(trace_type)
+
+    @property
+    def trace_types(self):
+        """set: Types of all traces drawn so far, e.g. {'scatter', 'bar'}."""
+        data = self._fig.data if self._fig is not None else ()
+        if len(data) < self._seen:
+            # Traces were replaced; read them again
+            self._types = set()
+            self._seen = 0
+        for trace in data[self._seen:]:
+            self._types.add(trace.type)
+        self._seen = len(data)
+        return self._types | self._recorded
+
+    def has_trace_type(self, *types):
+        """Whether any trace of one of the given types has been drawn."""
+        return not self.trace_types.isdisjoint(types)
+
+    @property
+    def is_geo(self):
+        """bool: Whether the figure holds geographic traces."""
+        return self.has_trace_type(*GEO_TRACE_TYPES)
+
+    @property
+    def is_map(self):
+        """bool: Whether the figure holds tile map (mapbox) traces."""
+        return self.has_trace_type(*MAP_TRACE_TYPES)
+
+    def has_coord(self, coord_type):
+        """Whether the plot uses a coordinate system of the given class."""
+        return any(isinstance(coord, coord_type) for coord in self.coords)
+
+    def manual_colors(self, aesthetic, color_map):
+        """
+        Colors of categories under a manual scale (e.g. scale_color_manual).
+
+        Scales recolor traces by name after the layers are drawn; layers
+        coloring each point themselves need the scale's colors up front.
+
+        Parameters:
+            aesthetic (str): 'color' or 'fill'.
+            color_map (dict): Category -> default color, in category order.
+
+        Returns:
+            dict: color_map with the colors the scale gives its categories.
+        """
+        for scale in self.scales:
+            values = getattr(scale, "values", None)
+            if scale.aesthetic != aesthetic or values is None:
+                continue
+            if not isinstance(values, dict):
+                # Colors are given in category order
+                values = dict(zip(map(str, color_map), values))
+            return {category: values.get(category, values.get(str(category), color))
+                    for category, color in color_map.items()}
+        return color_map
+
+    def share_range(self, key, target, names, values):
+        """
+        Give what is drawn on every panel under one key a common value range.
+
+        Facet panels are drawn one at a time, so a layer coloring its traces
+        by value only sees the values of one panel. The range is widened to
+        the values of each panel and set on every target drawn so far, which
+        the figure still holds until it is built.
+
+        Parameters:
+            key: What shares the range, e.g. a layer.
+            target: Trace or trace property (e.g. a marker) to set the range on.
+            names (tuple): Names of the lower and upper bound properties,
+                e.g. ('zmin', 'zmax').
+            values (ndarray): Values shown by target.
+        """
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return
+        entry = self._ranges.setdefault(key, [np.inf, -np.inf, []])
+        entry[0] = min(entry[0], float(values.min()))
+        entry[1] = max(entry[1], float(values.max()))
+        entry[2].append((target, names))
+        for shared, (low, high) in entry[2]:
+            shared[low], shared[high] = entry[0], entry[1]
+
+    def show_legend(self, legendgroup):
+        """
+        Whether a trace should show its legend entry.
+
+        In faceted plots the same category appears in several panels; only
+        the first trace of each legend group shows an entry.
+
+        Parameters:
+            legendgroup: Legend group of the trace.
+
+        Returns:
+            bool: True the first time the group is seen.
+        """
+        shown = legendgroup not in self.legend_groups
+        if self.legend_queries is not None:
+            self.legend_queries.setdefault(legendgroup, shown)
+        self.legend_groups.add(legendgroup)
+        return shown
+
+    def axis_refs(self, row, col):
+        """
+        Subplot references of a panel.
+
+        Parameters:
+            row, col (int): Panel position, or both None for no panel.
+
+        Returns:
+            dict or None: e.g. {'xaxis': 'x2', 'yaxis': 'y2'}; {} without a
+                panel and None when the figure has no such subplot.
+        """
+        if row is None and col is None:
+            return {}
+        if row is None or col is None:
+            return None
+        key = (row, col)
+        if key not in self._panels:
+            try:
+                self._panels[key] = dict(self._fig._grid_ref[row - 1][col - 1][0].trace_kwargs)
+            except (AttributeError, IndexError, TypeError):
+                self._panels[key] = None
+        return self._panels[key]
@@ -0,0 +1,289 @@
+# render_diff.py
+"""
+Partial re-rendering of changed layers.
+
+Interactive apps redraw a plot whenever a filter changes, although most
+layers usually stay the same, and send the whole figure to the browser.
+``ggplot.draw(incremental=True)`` remembers the plain trace dicts drawn by
+each layer on the figure, keyed by a fingerprint of the layer (its data,
+mapping, params, stats and theme) and of what the layers before it had drawn.
+The next incremental draw reuses the traces of every layer whose fingerprint
+has not changed and only draws the others. ``ggplot.diff(previous_figure)``
+does the same against a figure of an earlier draw and returns a
+``FigurePatch`` listing what changed, in the form of Plotly.js's
+``restyle``, ``extendTraces``, ``addTraces``, ``deleteTraces`` and
+``relayout`` calls.
+
+Layers are reused in plots without facets; the layout changes they made
+(e.g. geom_label annotations) are replayed with their traces. Scales,
+coords and themes are always applied again.
+
+Examples:
+    >>> fig = p.draw(incremental=True)
+    >>> p2 = ggplot(df2, aes('x', 'y')) + geom_point() + geom_line(data=trend)
+    >>> patch = p2.diff(fig)  # geom_line's traces reused if trend is unchanged
+    >>> patch.restyle
+    [({'x': [array([...])], 'y': [array([...])]}, [0])]
+    >>> render_diff.apply_patch(widget, patch)  # update a FigureWidget in place
+"""
+
+import copy
+from collections import namedtuple
+
+import numpy as np
+from plotly.basedatatypes import BaseFigure
+
+from . import figure_builder, render_cache, serialize
+from .render_context import RenderContext
+
+# Changes between two figures as Plotly.js calls:
+#   restyle  [(update, [index])]  Plotly.restyle(gd, update, [index])
+#   extend   [(update, [index], max_points)]
+#                                 Plotly.extendTraces(gd, update, [index], max_points)
+#   add      [trace]              Plotly.addTraces(gd, traces)
+#   delete   [index]              Plotly.deleteTraces(gd, indices)
+#   relayout {path: value}        Plotly.relayout(gd, update)
+# Values of restyle and extend updates are wrapped in a list per trace;
+# max_points is None or the number of latest points the trace keeps.
+FigurePatch = namedtuple("FigurePatch", ["figure", "restyle", "extend", "add", "delete", "relayout"])
+
+# What drawing one layer added: plain trace dicts, the answers of
+# RenderContext.show_legend, changed layout paths and items appended to the
+# layout arrays (annotations, shapes, images)
+LayerOutput = namedtuple("LayerOutput", ["traces", "legend_queries", "layout", "layout_arrays"])
+
+_ATTR = "_ggplotly_layers"
+
+
+def _copy(value):
+    """Copy of a plain trace dict; read-only arrays are shared."""
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    if isinstance(value, np.ndarray) and value.flags.writeable:
+        return value.copy()
+    return value
+
+
+class LayerCache:
+    """
+    Traces drawn by the layers of a figure, keyed by layer fingerprint.
+
+    Parameters:
+        previous (LayerCache, optional): Cache of an earlier draw whose
+            layers may be reused.
+
+    Attributes:
+        entries (dict): Layer fingerprint -> LayerOutput of this draw.
+        reused (int): Number of layers reused from the earlier draw.
+        sizes (list): Number of traces drawn by each layer, in order.
+    """
+
+    def __init__(self, previous=None):
+        self.entries = {}
+        self.reused = 0
+        self.sizes = []
+        self._previous = previous.entries if previous is not None else {}
+
+    def draw(self, geom, fig, context):
+        """
+        Draw a layer on the main panel, or reuse its output from the earlier draw.
+
+        Parameters:
+            geom (Geom): Layer to draw.
+            fig (Figure): Figure drawn inside ``figure_builder.deferred()``.
+            context (RenderContext): Render context of the draw.
+        """
+        if not figure_builder.is_deferring():
+            n_data = len(fig.data)
+            geom.draw(fig, row=1, col=1, context=context)
+            self.sizes.append(len(fig.data) - n_data)
+            return
+
+        context = RenderContext.of(fig, context)
+        # Scales are part of the key, since manual colors are drawn by layers
+        # coloring each point (see RenderContext.manual_colors)
+        key = render_cache.fingerprint(
+            (geom, frozenset(context.trace_types), context.scales, context.figure_size))
+        output = self._previous.get(key)
+        if output is not None and all(
+            (group not in context.legend_groups) == shown
+            for group, shown in output.legend_queries.items()
+        ):
+            self._replay(output, fig, context)
+            self.entries[key] = output
+            self.sizes.append(len(output.traces))
+            self.reused += 1
+            return
+
+        layout = copy.deepcopy(fig.layout._props)
+        n_data = len(fig.data)
+        n_pending = len(figure_builder.pending_traces(fig))
+        context.legend_queries = {}
+        try:
+            geom.draw(fig, row=1, col=1, context=context)
+            queries = context.legend_queries
+        finally:
+            context.legend_queries = None
+
+        changes, appended = {}, {}
+        for path, (before, after) in _changes(layout, fig.layout._props).items():
+            tail = _tail(before, after) if path in figure_builder._LAYOUT_ARRAYS else None
+            if tail is not None:
+                appended[path] = copy.deepcopy(list(tail))
+            else:
+                changes[path] = copy.deepcopy(after)
+
+        # Traces of the layer in drawing order, as figure_builder.collect orders them
+        pending = figure_builder.pending_traces(fig)[n_pending:]
+        drawn = [(position, 0, i, trace) for i, (position, trace) in enumerate(pending)]
+        drawn += [(i, 1, 0, fig.data[i]._props) for i in range(n_data, len(fig.data))]
+        traces = [_copy(trace) for *_, trace in sorted(drawn, key=lambda item: item[:3])]
+        self.entries[key] = LayerOutput(traces, queries, changes, appended)
+        self.sizes.append(len(traces))
+
+    @staticmethod
+    def _replay(output, fig, context):
+        """Add the traces, legend entries and layout changes of a drawn layer."""
+        for trace in output.traces:
+            figure_builder.add_trace_dict(fig, _copy(trace))
+        context.legend_groups.update(output.legend_queries)
+        for path, value in output.layout.items():
+            fig.layout[path] = copy.deepcopy(value)
+        for key, items in output.layout_arrays.items():
+            figure_builder.extend_layout(fig, key, copy.deepcopy(items))
+
+    def attach(self, fig):
+        """Keep this cache on the figure for the next incremental draw."""
+        setattr(fig, _ATTR, self)
+
+
+def layer_cache(fig):
+    """
+    Layer cache of a figure drawn with ``incremental=True``.
+
+    Returns:
+        LayerCache or None: None for figures drawn without it, and for
+            figures given as dicts.
+    """
+    if isinstance(fig, BaseFigure):
+        return fig.__dict__.get(_ATTR)
+    return None
+
+
+def _parts(fig):
+    """Trace dicts and layout dict of a figure or figure dict."""
+    if isinstance(fig, BaseFigure):
+        return [trace._props for trace in fig.data], fig.layout._props
+    fig = fig or {}
+    return list(fig.get("data", [])), fig.get("layout", {})
+
+
+def _is_array(value):
+    return isinstance(value, (np.ndarray, list, tuple))
+
+
+def _same(old, new):
+    """Whether two property values are equal, comparing arrays elementwise."""
+    if old is new:
+        return True
+    try:
+        if _is_array(old) and _is_array(new):
+            if len(old) != len(new):
+                return False
+            old, new = np.asarray(old), np.asarray(new)
+            if old.dtype.kind in "fc" and new.dtype.kind in "fc":
+                return bool(np.array_equal(old, new, equal_nan=True))
+            return bool(np.array_equal(old, new))
+        return bool(old == new)
+    except (TypeError, ValueError):
+        # Ragged arrays, or dicts holding arrays
+        return False
+
+
+def _changes(old, new, prefix=""):
+    """Changed properties of two nested dicts as {dotted path: (old, new)}."""
+    changes = {}
+    for key in [*old, *(key for key in new if key not in old)]:
+        path = f"{prefix}{key}"
+        # Figure dicts and JSON hold arrays as typed array specs
+        before = serialize.decode_array(old.get(key))
+        after = serialize.decode_array(new.get(key))
+        if isinstance(before, dict) and isinstance(after, dict):
+            changes.update(_changes(before, after, f"{path}."))
+        elif not _same(before, after):
+            changes[path] = (before, after)
+    return changes
+
+
+def _tail(before, after):
+    """New values of an array that only grew, or None."""
+    if not (_is_array(before) and _is_array(after)) or len(after) <= len(before):
+        return None
+    after = np.asarray(after)
+    return after[len(before):] if _same(before, after[:len(before)]) else None
+
+
+def diff(previous, fig):
+    """
+    Changes turning one figure into another.
+
+    Parameters:
+        previous (Figure or dict): Figure shown so far, e.g. the figure of an
+            earlier draw or the figure dict of a Dash component.
+        fig (Figure): New figure.
+
+    Returns:
+        FigurePatch: Plotly.js updates and the new figure. Traces that only
+            gained values at the end of their arrays are extended.
+    """
+    old_data, old_layout = _parts(previous)
+    new_data, new_layout = _parts(fig)
+
+    restyle, extend = [], []
+    for index, (old, new) in enumerate(zip(old_data, new_data)):
+        update, tails = {}, {}
+        for path, (before, after) in _changes(old, new).items():
+            tail = _tail(before, after)
+            if tail is not None:
+                tails[path] = [tail]
+            else:
+                update[path] = [after]
+        if update:
+            restyle.append((update, [index]))
+        if tails:
+            extend.append((tails, [index], None))
+
+    add = [_copy(trace) for trace in new_data[len(old_data):]]
+    delete = list(range(len(new_data), len(old_data)))
+    relayout = {path: after for path, (_, after) in _changes(old_layout, new_layout).items()}
+    return FigurePatch(fig, restyle, extend, add, delete, relayout)
+
+
+def apply_patch(fig, patch):
+    """
+    Apply a FigurePatch to a figure in place.
+
+    With a ``go.FigureWidget`` only the changes are sent to the browser.
+
+    Parameters:
+        fig (Figure): Figure the patch was computed from.
+        patch (FigurePatch): Changes from ``diff``.
+    """
+    with fig.batch_update():
+        for update, indices in patch.restyle:
+            fig.plotly_restyle(update, indices)
+        for update, (index,), max_points in patch.extend:
+            trace = fig.data[index]
+            for path, (tail,) in update.items():
+                values = np.concatenate([np.asarray(trace[path]), tail])
+                if max_points is not None:
+                    values = values[len(values) - max_points:]
+                trace[path] = values
+        if patch.relayout:
+            fig.plotly_relayout(patch.relayout)
+    if patch.delete:
+        fig.data = fig.data[:patch.delete[0]]
+    if patch.add:
+        fig.add_traces(patch.add)
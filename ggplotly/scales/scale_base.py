@@ -8,6 +8,37 @@ position, color, size, and shape. They can also modify axis appearance.
 
 import warnings
 
+import numpy as np
+
+from .. import figure_builder
+
+
+def sqrt_positions(traces, axis):
+    """
+    Square-root transform the x or y values of plain trace dicts.
+
+    Negative and missing values become gaps (NaN). Non-numeric positions
+    (categories, dates) are left unchanged.
+
+    Parameters:
+        traces (list): Plain trace dicts.
+        axis (str): 'x' or 'y'.
+    """
+    for trace in traces:
+        values = trace.get(axis)
+        if values is None or isinstance(values, (str, dict)):
+            continue
+        values = np.asarray(values)
+        if values.dtype.kind not in 'iufO':
+            continue
+        try:
+            values = values.astype(float)
+        except (TypeError, ValueError):
+            continue
+        with np.errstate(invalid='ignore'):
+            values = np.where(values >= 0, np.sqrt(values), np.nan)
+        figure_builder.update_trace(trace, **{axis: values})
+
 
 class Scale:
     """
@@ -17,7 +48,10 @@ class Scale:
     specific transformations for axes, colors, sizes, shapes, etc.
 
     All scales must implement the apply() method which takes a Plotly figure
-    and modifies it in place.
+    and modifies it in place. Scales that change trace data (sizes, colors,
+    transformed positions) do so in train() and map() instead, which work on
+    the plain trace dicts of every layer before the figure is built (see
+    ScaleRegistry.train), so apply() only styles axes and legends.
 
     Attributes:
         aesthetic (str): The aesthetic this scale affects (e.g., 'x', 'y', 'color',
@@ -32,6 +66,24 @@ class Scale:
     # The aesthetic this scale affects. Subclasses should override.
     aesthetic = None
 
+    def train(self, traces):
+        """
+        Learn ranges or levels from the traces of every layer.
+
+        Parameters:
+            traces (list): Plain trace dicts (see ``figure_builder``).
+        """
+        pass
+
+    def map(self, traces):
+        """
+        Map the trained aesthetic onto trace data, in place.
+
+        Parameters:
+            traces (list): Plain trace dicts (see ``figure_builder``).
+        """
+        pass
+
     def apply(self, fig):
         """
         Apply the scale transformation to the figure.
@@ -44,55 +96,55 @@ class Scale:
         """
         pass  # To be implemented by subclasses
 
-    def _apply_manual_color_mapping(self, fig, values, name=None, breaks=None,
-                                     labels=None, update_fill=False, guide='legend'):
+    @staticmethod
+    def _map_manual_colors(traces, values, breaks=None, labels=None, update_fill=False):
         """
-        Apply manual color mapping to figure traces.
+        Map manual colors onto plain trace dicts by trace name.
 
         Shared implementation for scale_color_manual and scale_fill_manual.
 
         Parameters:
-            fig (Figure): Plotly figure object.
+            traces (list): Plain trace dicts.
             values (dict or list): Color mapping or list of colors.
-            name (str, optional): Legend title.
             breaks (list, optional): Categories to show in legend.
             labels (list, optional): Labels for breaks.
             update_fill (bool): If True, also update fillcolor attribute.
-            guide (str): 'legend' or 'none' to control legend visibility.
         """
+        # Traces colored per point (PointColorTraceBuilder) already hold the
+        # scale's colors and are not a category of their own
+        per_point = [isinstance(trace.get('marker', {}).get('color'), (np.ndarray, list, tuple))
+                     for trace in traces]
+
         # Create a mapping of categories to colors
         if isinstance(values, dict):
             color_map = values
         else:
-            # Extract categories from trace names
-            categories = []
-            for trace in fig.data:
-                if hasattr(trace, 'name') and trace.name not in categories:
-                    categories.append(trace.name)
+            # Categories are the trace names, in order of appearance
+            categories = list(dict.fromkeys(
+                trace.get('name') for trace, skip in zip(traces, per_point) if not skip))
             color_map = dict(zip(categories, values))
 
-        # Update trace colors based on the mapping
-        for trace in fig.data:
-            if hasattr(trace, 'name') and trace.name in color_map:
-                color = color_map[trace.name]
-                if hasattr(trace, 'marker') and trace.marker is not None:
-                    trace.marker.color = color
-                if hasattr(trace, 'line') and trace.line is not None:
-                    trace.line.color = color
-                if update_fill and hasattr(trace, 'fillcolor'):
-                    trace.fillcolor = color
-
+        relabel = dict(zip(breaks, labels)) if breaks is not None and labels is not None else {}
+        for trace, skip in zip(traces, per_point):
+            name = trace.get('name')
+            if name in color_map and not skip:
+                color = color_map[name]
+                for path in ('marker', 'line'):
+                    if figure_builder.has_property(trace, path):
+                        figure_builder.update_trace(trace, **{f'{path}_color': color})
+                if update_fill and figure_builder.has_property(trace, 'fillcolor'):
+                    trace['fillcolor'] = color
+            # Update legend items if breaks and labels are provided
+            if name in relabel:
+                trace['name'] = relabel[name]
+
+    @staticmethod
+    def _apply_manual_legend(fig, name=None, guide='legend'):
+        """Legend title and visibility for scale_color_manual and scale_fill_manual."""
         # Update the legend title if provided
         if name is not None:
             fig.update_layout(legend_title_text=name)
 
-        # Update legend items if breaks and labels are provided
-        if breaks is not None and labels is not None:
-            for trace in fig.data:
-                if hasattr(trace, 'name') and trace.name in breaks:
-                    idx = breaks.index(trace.name)
-                    trace.name = labels[idx]
-
         # Hide legend if guide is 'none'
         if guide == 'none':
             fig.update_layout(showlegend=False)
@@ -171,3 +223,27 @@ class ScaleRegistry:
     def to_list(self):
         """Return scales as a list (for backward compatibility)."""
         return list(self._order)
+
+    def train(self, traces):
+        """
+        Train every scale on the traces of all layers.
+
+        Like ggplot2's scale training, each scale learns its range or levels
+        from all layers at once, before any of them is mapped.
+
+        Parameters:
+            traces (list): Plain trace dicts of the drawn figure (see
+                ``figure_builder.collect``).
+        """
+        for scale in self._order:
+            scale.train(traces)
+
+    def map(self, traces):
+        """
+        Map every trained scale onto the trace dicts, in place.
+
+        Parameters:
+            traces (list): Plain trace dicts of the drawn figure.
+        """
+        for scale in self._order:
+            scale.map(traces)
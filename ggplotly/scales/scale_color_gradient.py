@@ -1,5 +1,6 @@
 """Continuous color gradient scale for the color aesthetic."""
 
+from .. import colormap, figure_builder
 from .scale_base import Scale
 
 
@@ -59,91 +60,54 @@ class scale_color_gradient(Scale):
         self.guide = guide
         self.aesthetics = aesthetics
 
-    def apply(self, fig):
+    def map(self, traces):
         """
-        Apply the color gradient to markers and line segments in the figure.
+        Apply the color gradient to markers and line segments of the traces.
 
         Parameters:
-            fig (Figure): Plotly figure object.
+            traces (list): Plain trace dicts of every layer.
         """
         new_colorscale = [[0, self.low], [1, self.high]]
 
-        for trace in fig.data:
+        marker = {'colorscale': new_colorscale, 'showscale': self.guide != 'none'}
+        # Apply limits if specified
+        if self.limits is not None:
+            marker['cmin'], marker['cmax'] = self.limits
+        # Configure colorbar
+        if self.guide != 'none':
+            colorbar_config = {}
+            if self.name is not None:
+                colorbar_config['title'] = self.name
+            if self.breaks is not None:
+                colorbar_config['tickvals'] = self.breaks
+                if self.labels is not None:
+                    colorbar_config['ticktext'] = self.labels
+            if colorbar_config:
+                marker['colorbar'] = colorbar_config
+
+        segments = []
+        for trace in traces:
             # Handle marker-based traces (scatter points, etc.)
-            if hasattr(trace, 'marker') and trace.marker is not None:
-                trace.marker.colorscale = new_colorscale
-
-                # Apply limits if specified
-                if self.limits is not None:
-                    trace.marker.cmin = self.limits[0]
-                    trace.marker.cmax = self.limits[1]
-
-                # Configure colorbar
-                if self.guide != 'none':
-                    colorbar_config = {}
-                    if self.name is not None:
-                        colorbar_config['title'] = self.name
-                    if self.breaks is not None:
-                        colorbar_config['tickvals'] = self.breaks
-                        if self.labels is not None:
-                            colorbar_config['ticktext'] = self.labels
-                    if colorbar_config:
-                        trace.marker.colorbar = colorbar_config
-                    trace.marker.showscale = True
-                else:
-                    trace.marker.showscale = False
-
-            # Handle line gradient segments (created by ContinuousColorTraceBuilder)
-            if hasattr(trace, 'meta') and trace.meta:
-                meta = trace.meta
-                if isinstance(meta, dict) and meta.get('_ggplotly_line_gradient'):
-                    t_norm = meta.get('_color_norm', 0)
-                    new_color = self._interpolate_color(new_colorscale, t_norm)
-                    trace.line.color = new_color
-
-    @staticmethod
-    def _interpolate_color(colorscale, t):
+            if figure_builder.has_property(trace, 'marker'):
+                figure_builder.update_trace(trace, marker=marker)
+
+            # Collect line gradient segments (created by ContinuousColorTraceBuilder)
+            meta = trace.get('meta')
+            if isinstance(meta, dict) and meta.get('_ggplotly_line_gradient'):
+                segments.append(trace)
+
+        if segments:
+            # Look up every segment color in one pass
+            t = [seg['meta'].get('_color_norm', 0) for seg in segments]
+            colors = colormap.map_colors(t, new_colorscale, 0, 1)
+            for seg, color in zip(segments, colors):
+                figure_builder.update_trace(seg, line_color=color)
+
+    def apply(self, fig):
         """
-        Interpolate between colorscale endpoints.
+        Apply the color gradient to markers and line segments in the figure.
 
         Parameters:
-            colorscale: List of [position, color] pairs
-            t: Normalized value between 0 and 1
-
-        Returns:
-            str: Interpolated RGB color string
+            fig (Figure): Plotly figure object.
         """
-        t = max(0, min(1, t))  # Clamp to [0, 1]
-
-        low_color = colorscale[0][1]
-        high_color = colorscale[1][1]
-
-        # Parse color to RGB (handles hex and named colors)
-        def color_to_rgb(color):
-            if color.startswith('#'):
-                color = color.lstrip('#')
-                return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
-            elif color.startswith('rgb'):
-                # Parse rgb(r, g, b) format
-                import re
-                match = re.match(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)', color)
-                if match:
-                    return tuple(int(x) for x in match.groups())
-            # Fallback for named colors - approximate mapping
-            named_colors = {
-                'blue': (0, 0, 255), 'red': (255, 0, 0), 'green': (0, 128, 0),
-                'white': (255, 255, 255), 'black': (0, 0, 0),
-                'yellow': (255, 255, 0), 'orange': (255, 165, 0),
-                'purple': (128, 0, 128), 'cyan': (0, 255, 255),
-            }
-            return named_colors.get(color.lower(), (128, 128, 128))
-
-        low_rgb = color_to_rgb(low_color)
-        high_rgb = color_to_rgb(high_color)
-
-        # Linear interpolation
-        r = int(low_rgb[0] + t * (high_rgb[0] - low_rgb[0]))
-        g = int(low_rgb[1] + t * (high_rgb[1] - low_rgb[1]))
-        b = int(low_rgb[2] + t * (high_rgb[2] - low_rgb[2]))
-
-        return f'rgb({r}, {g}, {b})'
+        figure_builder.map_figure(fig, self)
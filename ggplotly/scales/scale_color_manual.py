@@ -1,5 +1,6 @@
 # scales/scale_color_manual.py
 
+from .. import figure_builder
 from .scale_base import Scale
 
 
@@ -21,6 +22,18 @@ class scale_color_manual(Scale):
         self.breaks = breaks
         self.labels = labels
 
+    def map(self, traces):
+        """
+        Map the manual color values onto the traces by trace name.
+
+        Parameters:
+            traces (list): Plain trace dicts of every layer.
+        """
+        self._map_manual_colors(
+            traces, self.values, breaks=self.breaks, labels=self.labels,
+            update_fill=False
+        )
+
     def apply(self, fig):
         """
         Apply the manual color scale to the figure.
@@ -28,8 +41,6 @@ class scale_color_manual(Scale):
         Parameters:
             fig (Figure): Plotly figure object.
         """
-        self._apply_manual_color_mapping(
-            fig, self.values, name=self.name,
-            breaks=self.breaks, labels=self.labels,
-            update_fill=False
-        )
+        figure_builder.map_figure(fig, self)
+
+        self._apply_manual_legend(fig, name=self.name)
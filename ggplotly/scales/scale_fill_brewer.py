@@ -1,5 +1,5 @@
 # scales/scale_fill_brewer.py
-import plotly.express as px
+import plotly.colors as pc
 
 from .scale_base import Scale
 
@@ -96,11 +96,11 @@ class scale_fill_brewer(Scale):
 
         try:
             if self.type == "qual":
-                color_palette = getattr(px.colors.qualitative, palette_name)
+                color_palette = getattr(pc.qualitative, palette_name)
             elif self.type == "seq":
-                color_palette = getattr(px.colors.sequential, palette_name)
+                color_palette = getattr(pc.sequential, palette_name)
             elif self.type == "div":
-                color_palette = getattr(px.colors.diverging, palette_name)
+                color_palette = getattr(pc.diverging, palette_name)
             else:
                 raise ValueError(f"Unsupported type '{self.type}' for ColorBrewer scale.")
         except AttributeError:
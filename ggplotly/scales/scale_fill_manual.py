@@ -1,3 +1,4 @@
+from .. import figure_builder
 from .scale_base import Scale
 
 
@@ -76,6 +77,18 @@ class scale_fill_manual(Scale):
 
         return data
 
+    def map(self, traces):
+        """
+        Map the manual fill values onto the traces by trace name.
+
+        Parameters:
+            traces (list): Plain trace dicts of every layer.
+        """
+        self._map_manual_colors(
+            traces, self.values, breaks=self.breaks, labels=self.labels,
+            update_fill=True
+        )
+
     def apply(self, fig):
         """
         Apply the manual fill scale to the figure.
@@ -83,11 +96,9 @@ class scale_fill_manual(Scale):
         Parameters:
             fig (Figure): Plotly figure object.
         """
-        self._apply_manual_color_mapping(
-            fig, self.values, name=self.name,
-            breaks=self.breaks, labels=self.labels,
-            update_fill=True, guide=self.guide
-        )
+        figure_builder.map_figure(fig, self)
+
+        self._apply_manual_legend(fig, name=self.name, guide=self.guide)
 
     def get_legend_info(self):
         """
@@ -2,6 +2,7 @@
 
 import numpy as np
 
+from .. import figure_builder
 from .scale_base import Scale
 
 
@@ -18,45 +19,61 @@ class scale_size(Scale):
         """
         self.range = range
         self.name = name
+        self._trained = None  # (min, max) of the mapped sizes, set by train()
 
-    def apply(self, fig):
+    def train(self, traces):
         """
-        Apply the size scale to the figure.
+        Learn the range of the mapped marker sizes across all layers.
 
         Parameters:
-            fig (Figure): Plotly figure object.
+            traces (list): Plain trace dicts of every layer.
+        """
+        arrays = [
+            np.asarray(trace['marker']['size'], dtype=float)
+            for trace in traces
+            if isinstance(trace.get('marker', {}).get('size'), (list, tuple, np.ndarray))
+        ]
+        if arrays:
+            values = np.concatenate(arrays)
+            self._trained = (np.nanmin(values), np.nanmax(values))
+        else:
+            self._trained = None
+
+    def map(self, traces):
         """
-        # Find the min and max values in the size data
-        size_data = []
-        for trace in fig.data:
-            if "marker" in trace and "size" in trace.marker:
-                size = trace.marker.size
-                if isinstance(size, (list, tuple, np.ndarray)):
-                    size_data.extend(size)
+        Rescale marker sizes to the size range.
 
-        if not size_data:
+        Parameters:
+            traces (list): Plain trace dicts of every layer.
+        """
+        if self._trained is None:
             return  # No size data to scale
 
-        size_min, size_max = min(size_data), max(size_data)
-        size_range = self.range
-
-        # Apply scaling to marker sizes
-        for trace in fig.data:
-            if "marker" in trace and "size" in trace.marker:
-                size = trace.marker.size
-                if isinstance(size, (list, tuple, np.ndarray)):
-                    # Normalize and scale sizes
-                    normalized_sizes = [
-                        ((s - size_min) / (size_max - size_min))
-                        * (size_range[1] - size_range[0])
-                        + size_range[0]
-                        for s in size
-                    ]
-                    trace.marker.size = normalized_sizes
-                else:
-                    # Single size value; scale directly
-                    trace.marker.size = size_range[0]
+        size_min, size_max = self._trained
+        low, high = self.range
+        span = size_max - size_min
+        for trace in traces:
+            if not figure_builder.has_property(trace, 'marker.size'):
+                continue
+            size = trace.get('marker', {}).get('size')
+            if isinstance(size, (list, tuple, np.ndarray)):
+                # Normalize and scale sizes; a constant size maps to the middle
+                size = np.asarray(size, dtype=float)
+                normalized = (size - size_min) / span if span else np.full(len(size), 0.5)
+                figure_builder.update_trace(trace, marker_size=normalized * (high - low) + low)
+            else:
+                # Single size value; scale directly
+                figure_builder.update_trace(trace, marker_size=low)
+
+    def apply(self, fig):
+        """
+        Apply the size scale to the figure.
+
+        Parameters:
+            fig (Figure): Plotly figure object.
+        """
+        figure_builder.map_figure(fig, self)
 
         # Update legend if needed
-        if self.name is not None:
+        if self.name is not None and self._trained is not None:
             fig.update_layout(legend_title_text=self.name)
@@ -1,8 +1,7 @@
 # scales/scale_x_continuous.py
 
-import numpy as np
-
-from .scale_base import Scale
+from .. import figure_builder
+from .scale_base import Scale, sqrt_positions
 
 
 class scale_x_continuous(Scale):
@@ -109,6 +108,16 @@ class scale_x_continuous(Scale):
         new_high = high + data_range * mult_high + add_high
         return [new_low, new_high]
 
+    def map(self, traces):
+        """
+        Transform the x values of the traces for trans='sqrt'.
+
+        Parameters:
+            traces (list): Plain trace dicts of every layer.
+        """
+        if self.trans == "sqrt":
+            sqrt_positions(traces, "x")
+
     def apply(self, fig):
         """
         Apply the scale transformation to the x-axis of the figure.
@@ -116,6 +125,9 @@ class scale_x_continuous(Scale):
         Parameters:
             fig (Figure): Plotly figure object.
         """
+        if self.trans == "sqrt":
+            figure_builder.map_figure(fig, self)
+
         xaxis_update = {}
 
         if self.name is not None:
@@ -149,11 +161,8 @@ class scale_x_continuous(Scale):
                 # Note: This gives log10, not log2. True log2 would need data transformation
             elif self.trans == "sqrt":
                 # Custom transformation needed as Plotly doesn't support 'sqrt' natively
+                # (the x values are transformed in map())
                 xaxis_update["type"] = "linear"
-                for trace in fig.data:
-                    if hasattr(trace, 'x') and trace.x is not None:
-                        trace.x = [np.sqrt(val) if val is not None and val >= 0 else None
-                                   for val in trace.x]
             elif self.trans == "reverse":
                 xaxis_update["autorange"] = "reversed"
             elif self.trans == "identity":
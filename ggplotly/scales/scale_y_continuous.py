@@ -1,8 +1,7 @@
 # scales/scale_y_continuous.py
 
-import numpy as np
-
-from .scale_base import Scale
+from .. import figure_builder
+from .scale_base import Scale, sqrt_positions
 
 
 class scale_y_continuous(Scale):
@@ -25,6 +24,16 @@ class scale_y_continuous(Scale):
         self.labels = labels
         self.trans = trans
 
+    def map(self, traces):
+        """
+        Transform the y values of the traces for trans='sqrt'.
+
+        Parameters:
+            traces (list): Plain trace dicts of every layer.
+        """
+        if self.trans == "sqrt":
+            sqrt_positions(traces, "y")
+
     def apply(self, fig):
         """
         Apply the scale transformation to the y-axis of the figure.
@@ -32,6 +41,9 @@ class scale_y_continuous(Scale):
         Parameters:
             fig (Figure): Plotly figure object.
         """
+        if self.trans == "sqrt":
+            figure_builder.map_figure(fig, self)
+
         yaxis_update = {}
 
         if self.name is not None:
@@ -53,7 +65,6 @@ class scale_y_continuous(Scale):
                 # Custom transformation needed as Plotly doesn't support 'sqrt' natively
                 yaxis_update["type"] = "linear"
                 yaxis_update["tickmode"] = "linear"
-                fig.data[0].y = [np.sqrt(val) for val in fig.data[0].y]
             else:
                 raise ValueError(f"Unsupported transformation: {self.trans}")
 
@@ -0,0 +1,216 @@
+# serialize.py
+"""
+Compact serialization of figures.
+
+Plotly writes NumPy-backed trace arrays as base64 typed arrays (``bdata``
+with a ``dtype``), but keeps float arrays in float64 and writes arrays held
+as Python lists as decimal text. ``figure_dict`` rewrites every numeric
+trace array as the smallest typed array that holds it exactly: integral
+floats become small integers and floats that survive a round trip through
+single precision become float32. With ``precision='float32'`` all float
+arrays are downcast, keeping about 7 significant digits for half the size.
+
+Examples:
+    >>> from ggplotly.serialize import to_json
+    >>> text = to_json(fig, precision='float32')
+"""
+
+import base64
+from copy import deepcopy
+
+import numpy as np
+import plotly.io as pio
+from _plotly_utils.basevalidators import DataArrayValidator
+
+try:
+    from _plotly_utils.utils import convert_to_base64, to_typed_array_spec
+except ImportError:
+    # Typed arrays came with plotly 6; older versions write plain lists
+    convert_to_base64 = to_typed_array_spec = None
+
+PRECISIONS = ("float64", "float32")
+
+# Typed array dtypes of plotly.js, from narrowest to widest
+_INT_TYPES = tuple(np.dtype(t) for t in ("int8", "uint8", "int16", "uint16", "int32", "uint32"))
+
+_FLOAT32_MAX = float(np.finfo(np.float32).max)
+
+
+def _check_precision(precision):
+    if precision not in PRECISIONS:
+        raise ValueError(f"precision must be one of {PRECISIONS}, got {precision!r}")
+
+
+def _narrow_int(values):
+    """Values as the narrowest plotly.js integer type, or None if none fits."""
+    low, high = values.min(), values.max()
+    for dtype in _INT_TYPES:
+        info = np.iinfo(dtype)
+        if low >= info.min and high <= info.max:
+            return values.astype(dtype)
+    return None
+
+
+def compact_array(values, precision="float64"):
+    """
+    Smallest typed array holding numeric values.
+
+    Parameters:
+        values (array-like): Trace array.
+        precision (str): 'float64' keeps float values exact; 'float32'
+            downcasts all float arrays.
+
+    Returns:
+        ndarray or None: The compact array, or None when the values are not
+            a rectangular numeric array.
+    """
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        return None
+    if array.dtype == object:
+        # Lists from the figure: only numbers and None (gaps) are numeric
+        for item in array.flat:
+            if item is not None and (not isinstance(item, (int, float, np.number))
+                                     or isinstance(item, (bool, np.bool_))):
+                return None
+        array = array.astype(float)
+    if array.size == 0 or array.dtype.kind not in "iuf":
+        return None
+
+    if array.dtype.kind in "iu":
+        narrow = _narrow_int(array)
+        return array if narrow is None else narrow
+
+    finite = np.isfinite(array)
+    if finite.all() and np.array_equal(array, np.rint(array)):
+        narrow = _narrow_int(array)
+        if narrow is not None:
+            return narrow
+    if array.dtype == np.float32:
+        return array
+
+    if finite.any() and np.abs(array[finite]).max() > _FLOAT32_MAX:
+        return array
+    single = array.astype(np.float32)
+    if precision == "float32" or np.array_equal(single, array, equal_nan=True):
+        return single
+    return array
+
+
+def decode_array(value):
+    """
+    NumPy array of a typed array spec, as found in figure dicts and JSON.
+
+    Parameters:
+        value: Property value; a dict with ``dtype``, ``bdata`` and
+            optionally ``shape`` is decoded.
+
+    Returns:
+        ndarray or the value unchanged if it is not a typed array spec.
+    """
+    if not (isinstance(value, dict) and "bdata" in value and "dtype" in value):
+        return value
+    data = value["bdata"]
+    if isinstance(data, str):
+        data = base64.b64decode(data)
+    # plotly.js typed arrays are little-endian
+    array = np.frombuffer(data, dtype=np.dtype(value["dtype"]).newbyteorder("<"))
+    shape = value.get("shape")
+    if shape:
+        if isinstance(shape, str):
+            shape = [int(size) for size in shape.split(",")]
+        array = array.reshape(shape)
+    return array
+
+
+def _copy(value):
+    """Copy the dicts of a property tree, sharing its arrays."""
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)) and value and isinstance(value[0], dict):
+        return [_copy(item) for item in value]
+    return value
+
+
+def _is_array_property(obj, key):
+    try:
+        validator = obj._get_validator(key)
+    except Exception:
+        return False
+    return isinstance(validator, DataArrayValidator) or getattr(validator, "array_ok", False)
+
+
+def _compact_props(obj, props, precision):
+    """Replace the numeric arrays of one (nested) trace dict by typed array specs."""
+    for key, value in props.items():
+        if isinstance(value, dict):
+            try:
+                child = obj[key]
+            except Exception:
+                child = None
+            if child is not None:
+                _compact_props(child, value, precision)
+        elif isinstance(value, np.ndarray) or (
+            isinstance(value, (list, tuple)) and len(value) and _is_array_property(obj, key)
+        ):
+            compact = compact_array(value, precision)
+            if compact is not None:
+                props[key] = to_typed_array_spec(compact)
+
+
+def figure_dict(fig, precision="float64"):
+    """
+    Plotly dict of a figure with compact numeric trace arrays.
+
+    Parameters:
+        fig (Figure): Plotly figure.
+        precision (str): 'float64' (default, exact) or 'float32'.
+
+    Returns:
+        dict: Figure dict with ``data`` and ``layout``. With plotly 5, which
+            has no typed arrays, the plain ``fig.to_dict()``.
+    """
+    _check_precision(precision)
+    if to_typed_array_spec is None:
+        return fig.to_dict()
+    # Like Figure.to_dict, without deep-copying trace arrays that are
+    # replaced by their compact encoding anyway
+    fig_dict = {"data": [_copy(trace._props) for trace in fig.data],
+                "layout": deepcopy(fig.layout._props)}
+    if fig.frames:
+        fig_dict["frames"] = deepcopy([frame._props for frame in fig.frames])
+    for trace, trace_dict in zip(fig.data, fig_dict["data"]):
+        _compact_props(trace, trace_dict, precision)
+    convert_to_base64(fig_dict)
+    return fig_dict
+
+
+def to_json(fig, precision="float64", pretty=False):
+    """
+    Serialize a figure to JSON with compact numeric trace arrays.
+
+    Parameters:
+        fig (Figure): Plotly figure.
+        precision (str): 'float64' (default, exact) or 'float32'.
+        pretty (bool): Indent the output. Default is False.
+
+    Returns:
+        str: Plotly JSON, readable with ``plotly.io.from_json``.
+    """
+    return pio.to_json(figure_dict(fig, precision), validate=False, pretty=pretty)
+
+
+def to_html(fig, precision="float64", **kwargs):
+    """
+    HTML for a figure with compact numeric trace arrays.
+
+    Parameters:
+        fig (Figure): Plotly figure.
+        precision (str): 'float64' (default, exact) or 'float32'.
+        **kwargs: Passed to ``plotly.io.to_html``.
+
+    Returns:
+        str: HTML document or div.
+    """
+    return pio.to_html(figure_dict(fig, precision), validate=False, **kwargs)
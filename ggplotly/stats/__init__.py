@@ -1,4 +1,8 @@
+from .stat_acf import stat_acf
 from .stat_bin import stat_bin
+from .stat_bin_2d import stat_bin_2d
+from .stat_binhex import stat_binhex
+from .stat_boxplot import stat_boxplot
 from .stat_contour import stat_contour
 from .stat_count import stat_count
 from .stat_density import stat_density
@@ -6,11 +10,13 @@ from .stat_ecdf import stat_ecdf
 from .stat_fanchart import stat_fanchart
 from .stat_function import stat_function
 from .stat_identity import stat_identity
+from .stat_pacf import stat_pacf
 from .stat_qq import stat_qq
 from .stat_qq_line import stat_qq_line
 from .stat_smooth import stat_smooth
 from .stat_stl import stat_stl
 from .stat_summary import stat_summary
+from .stat_ydensity import stat_ydensity
 
 __all__ = [
     "stat_identity",
@@ -26,4 +32,10 @@ __all__ = [
     "stat_qq",
     "stat_qq_line",
     "stat_stl",
+    "stat_acf",
+    "stat_pacf",
+    "stat_boxplot",
+    "stat_ydensity",
+    "stat_bin_2d",
+    "stat_binhex",
 ]
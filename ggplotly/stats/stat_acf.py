@@ -0,0 +1,232 @@
+# stats/stat_acf.py
+"""Autocorrelation stat backed by a batched FFT engine."""
+
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from .stat_base import Stat
+
+
+def _stack_series(series_list):
+    """
+    Stack ragged 1D series into a zero-padded (series x time) matrix.
+
+    Each series is demeaned on its own before padding, so the zero padding
+    contributes nothing to the lagged products.
+
+    Parameters:
+        series_list (list of array-like): Series to stack.
+
+    Returns:
+        tuple: (matrix, lengths) where matrix has shape (n_series, max_len)
+            and lengths holds the number of observations per series.
+    """
+    lengths = np.array([len(s) for s in series_list], dtype=np.int64)
+    max_len = int(lengths.max()) if len(lengths) else 0
+    matrix = np.zeros((len(series_list), max_len), dtype=float)
+    for i, s in enumerate(series_list):
+        values = np.asarray(s, dtype=float)
+        matrix[i, :len(values)] = values - values.mean() if len(values) else values
+    return matrix, lengths
+
+
+def acovf_batch(matrix, lengths, nlags, adjusted=False):
+    """
+    Autocovariances of many demeaned series with a single batched FFT.
+
+    Parameters:
+        matrix (ndarray): Demeaned, zero-padded (n_series, max_len) matrix.
+        lengths (ndarray): Number of observations in each row.
+        nlags (int): Largest lag to return.
+        adjusted (bool): If True, divide lag k by n - k instead of n.
+
+    Returns:
+        ndarray: Array of shape (n_series, nlags + 1).
+    """
+    from scipy.fft import irfft, next_fast_len, rfft
+
+    n_fft = next_fast_len(2 * matrix.shape[1] - 1, real=True)
+    spectrum = rfft(matrix, n=n_fft, axis=1)
+    acov = irfft(spectrum * np.conj(spectrum), n=n_fft, axis=1)[:, :nlags + 1]
+
+    lags = np.arange(nlags + 1)
+    if adjusted:
+        denom = np.maximum(lengths[:, None] - lags[None, :], 1)
+    else:
+        denom = np.broadcast_to(lengths[:, None], acov.shape)
+    return acov / denom
+
+
+def acf_batch(matrix, lengths, nlags, alpha=None, adjusted=False):
+    """
+    Autocorrelations and Bartlett confidence bands for many series at once.
+
+    Parameters:
+        matrix (ndarray): Demeaned, zero-padded (n_series, max_len) matrix.
+        lengths (ndarray): Number of observations in each row.
+        nlags (int): Largest lag to return.
+        alpha (float, optional): Significance level for confidence bands.
+        adjusted (bool): Use n - k denominators for the autocovariances.
+
+    Returns:
+        tuple: (acf, halfwidth) arrays of shape (n_series, nlags + 1).
+            halfwidth is None when alpha is None; lag 0 has zero width.
+    """
+    acov = acovf_batch(matrix, lengths, nlags, adjusted=adjusted)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        acf = acov / acov[:, [0]]
+
+    if alpha is None:
+        return acf, None
+
+    # Bartlett's formula: var(r_k) = (1 + 2 * sum_{j<k} r_j^2) / n
+    var = np.ones_like(acf) / lengths[:, None]
+    var[:, 0] = 0
+    if nlags >= 2:
+        var[:, 2:] *= 1 + 2 * np.cumsum(acf[:, 1:-1] ** 2, axis=1)
+    z = NormalDist().inv_cdf(1 - alpha / 2)
+    return acf, z * np.sqrt(var)
+
+
+def pacf_durbin_levinson(acov, nlags):
+    """
+    Partial autocorrelations via Durbin-Levinson, vectorized across series.
+
+    Parameters:
+        acov (ndarray): Autocovariances of shape (n_series, >= nlags + 1).
+        nlags (int): Largest lag to return.
+
+    Returns:
+        ndarray: Array of shape (n_series, nlags + 1) with pacf[:, 0] == 1.
+    """
+    n_series = acov.shape[0]
+    pacf = np.ones((n_series, nlags + 1))
+    phi = np.zeros((n_series, nlags + 1))
+    sigma = acov[:, 0].astype(float).copy()
+
+    for k in range(1, nlags + 1):
+        # phi[:, 1:k] holds the AR(k-1) coefficients
+        prev = phi[:, 1:k]
+        num = acov[:, k] - np.einsum('ij,ij->i', prev, acov[:, k - 1:0:-1])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            reflection = num / sigma
+        phi[:, 1:k] = prev - reflection[:, None] * prev[:, ::-1]
+        phi[:, k] = reflection
+        sigma = sigma * (1 - reflection ** 2)
+        pacf[:, k] = reflection
+
+    return pacf
+
+
+def _split_groups(data, y_col, group_col):
+    """Return (group keys, list of NA-free value arrays) for the y column."""
+    if group_col is None:
+        return [None], [data[y_col].dropna().values]
+
+    keys, series_list = [], []
+    for key, values in data.groupby(group_col, sort=False, observed=True)[y_col]:
+        keys.append(key)
+        series_list.append(values.dropna().values)
+    return keys, series_list
+
+
+class stat_acf(Stat):
+    """
+    Compute the autocorrelation function of one or many series.
+
+    All series (one per group) are demeaned, zero-padded into a single
+    (series x time) matrix and transformed with one batched FFT, so many
+    sensors cost roughly the same as one long series. Bartlett confidence
+    bands are computed in the same pass.
+
+    Parameters:
+        nlags (int): Number of lags to compute. Default is 40.
+        alpha (float): Significance level for the confidence band.
+            Default is 0.05. Use None to skip the band.
+        adjusted (bool): Use n - k denominators. Default is False,
+            matching statsmodels' acf.
+
+    Computed variables:
+        - lag: Lag (starting at 1)
+        - acf: Autocorrelation at each lag
+        - ci_lower, ci_upper: Confidence band around zero
+        - n: Number of observations in the series
+
+    Examples:
+        >>> ggplot(df, aes(y='value')) + geom_acf()
+        >>> ggplot(df, aes(y='value', group='sensor')) + geom_acf(nlags=20)
+    """
+
+    __name__ = "acf"
+
+    # Default geom for this stat (used when stat added directly to plot)
+    geom = 'col'
+
+    value_name = "acf"
+
+    def __init__(self, data=None, mapping=None, nlags=40, alpha=0.05,
+                 adjusted=False, **params):
+        super().__init__(data, mapping, **params)
+        self.nlags = nlags
+        self.alpha = alpha
+        self.adjusted = adjusted
+
+    def _group_col(self, data):
+        """Return the column that splits the data into separate series."""
+        for aesthetic in ('group', 'color', 'fill'):
+            col = self.mapping.get(aesthetic)
+            if isinstance(col, str) and col in data.columns:
+                return col
+        return None
+
+    def _compute_matrix(self, matrix, lengths, nlags):
+        """Return (values, halfwidth) arrays for the stacked series."""
+        return acf_batch(matrix, lengths, nlags, alpha=self.alpha,
+                         adjusted=self.adjusted)
+
+    def compute(self, data):
+        """
+        Compute the ACF for each series in the data.
+
+        Parameters:
+            data (DataFrame): Input data with the y column mapped.
+
+        Returns:
+            tuple: (DataFrame of lags and values, updated mapping dict)
+        """
+        y_col = self.mapping.get('y')
+        if y_col is None:
+            raise ValueError(f"stat_{self.value_name} requires 'y' aesthetic mapping")
+
+        group_col = self._group_col(data)
+        keys, series_list = _split_groups(data, y_col, group_col)
+        matrix, lengths = _stack_series(series_list)
+
+        nlags = self.nlags
+        if len(lengths) and lengths.min() > 1:
+            nlags = min(nlags, int(lengths.min()) - 1)
+
+        values, halfwidth = self._compute_matrix(matrix, lengths, nlags)
+        if halfwidth is None:
+            halfwidth = np.full_like(values, np.nan)
+
+        # Drop lag 0 (always 1.0, not informative)
+        n_series = len(keys)
+        lags = np.arange(1, nlags + 1)
+        result = pd.DataFrame({
+            'lag': np.tile(lags, n_series),
+            self.value_name: values[:, 1:].ravel(),
+            'ci_lower': -halfwidth[:, 1:].ravel(),
+            'ci_upper': halfwidth[:, 1:].ravel(),
+            'n': np.repeat(lengths, nlags),
+        })
+        if group_col is not None:
+            result[group_col] = np.repeat(np.asarray(keys, dtype=object), nlags)
+
+        new_mapping = self.mapping.copy()
+        new_mapping['x'] = 'lag'
+        new_mapping['y'] = self.value_name
+
+        return result, new_mapping
@@ -122,6 +122,275 @@ class stat_bin(Stat):
 
         return bin_edges
 
+    def _bin_index(self, x, edges):
+        """
+        Bin number of each value, or -1 for values outside the breaks.
+
+        Matches np.histogram: bins are [a, b) with the last bin also closed
+        on the right. With closed='left' the bins mirror that, (a, b] with
+        the first bin also closed on the left.
+
+        Parameters:
+            x (ndarray): Values.
+            edges (ndarray): Increasing bin edges.
+
+        Returns:
+            ndarray: int64 bin indices.
+        """
+        n_bins = len(edges) - 1
+        if self.closed == 'left':
+            idx = np.searchsorted(edges, x, side='left') - 1
+            idx[x == edges[0]] = 0
+        else:
+            idx = np.searchsorted(edges, x, side='right') - 1
+            idx[x == edges[-1]] = n_bins - 1
+        idx[(idx < 0) | (idx >= n_bins)] = -1
+        return idx
+
+    def count_groups(self, x, codes, n_groups, edges, weights=None):
+        """
+        Histogram counts for many groups in one pass.
+
+        Every value is mapped to a bin with a single searchsorted, and the
+        combined (group * n_bins + bin) index is counted with one bincount,
+        so the cost is linear in the number of rows whatever the number of
+        groups.
+
+        Parameters:
+            x (ndarray): Values.
+            codes (ndarray): Group code of each value (0..n_groups-1;
+                negative codes are skipped).
+            n_groups (int): Number of groups.
+            edges (ndarray): Shared bin edges.
+            weights (ndarray, optional): Weight of each value.
+
+        Returns:
+            tuple: (counts, totals) where counts has shape (n_groups, n_bins)
+                and totals holds each group's number (or weight) of values.
+        """
+        n_bins = len(edges) - 1
+        codes = np.asarray(codes, dtype=np.int64)
+        idx = self._bin_index(np.asarray(x, dtype=float), edges)
+        keep = (idx >= 0) & (codes >= 0)
+        flat = codes[keep] * n_bins + idx[keep]
+        kept_weights = None if weights is None else weights[keep]
+        counts = np.bincount(flat, weights=kept_weights, minlength=n_groups * n_bins)
+
+        grouped = codes >= 0
+        totals = np.bincount(codes[grouped], weights=None if weights is None else weights[grouped],
+                             minlength=n_groups)
+        return counts.reshape(n_groups, n_bins), totals
+
+    def _frame(self, edges, counts, totals):
+        """
+        Build the computed variables for every group.
+
+        Parameters:
+            edges (ndarray): Shared bin edges.
+            counts (ndarray): Counts of shape (n_groups, n_bins).
+            totals (ndarray): Number (or weight) of values in each group.
+
+        Returns:
+            DataFrame: One row per group and bin, groups in order, with a
+                'group' column holding the group code.
+        """
+        n_groups, n_bins = counts.shape
+        widths = np.diff(edges)
+        centers = (edges[:-1] + edges[1:]) / 2
+        xmin = edges[:-1]
+        xmax = edges[1:]
+
+        # Compute density (integrates to 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            density = np.where(totals[:, None] > 0, counts / (totals[:, None] * widths), 0)
+
+        # Normalized count and density (max = 1)
+        max_count = counts.max(axis=1, keepdims=True, initial=0)
+        max_density = density.max(axis=1, keepdims=True, initial=0)
+        ncount = counts / np.where(max_count > 0, max_count, 1)
+        ndensity = density / np.where(max_density > 0, max_density, 1)
+
+        # Add padding if requested
+        if self.pad:
+            # Add empty bins at start and end
+            avg_width = np.mean(widths)
+            zero = np.zeros((n_groups, 1))
+            centers = np.concatenate([[centers[0] - avg_width], centers, [centers[-1] + avg_width]])
+            counts = np.hstack([zero, counts, zero]).astype(counts.dtype)
+            density = np.hstack([zero, density, zero])
+            ncount = np.hstack([zero, ncount, zero])
+            ndensity = np.hstack([zero, ndensity, zero])
+            widths = np.concatenate([[avg_width], widths, [avg_width]])
+            xmin = np.concatenate([[xmin[0] - avg_width], xmin, [xmax[-1]]])
+            xmax = np.concatenate([[xmin[1]], xmax, [xmax[-1] + avg_width]])
+            n_bins += 2
+
+        return pd.DataFrame({
+            'x': np.tile(centers, n_groups),
+            'count': counts.ravel(),
+            'density': density.ravel(),
+            'ncount': ncount.ravel(),
+            'ndensity': ndensity.ravel(),
+            'width': np.tile(widths, n_groups),
+            'xmin': np.tile(xmin, n_groups),
+            'xmax': np.tile(xmax, n_groups),
+            'group': np.repeat(np.arange(n_groups), n_bins),
+        })
+
+    def _count_chunk(self, data, group_col, edges):
+        """
+        Count one frame of data against fixed edges.
+
+        Parameters:
+            data (DataFrame): Rows to count.
+            group_col (str, optional): Column whose values define the groups.
+            edges (ndarray): Bin edges.
+
+        Returns:
+            tuple: (groups, counts, totals) where groups holds the distinct
+                group values in order of first appearance.
+        """
+        x = data[self.mapping.get('x')].to_numpy(dtype=float)
+        if group_col is None:
+            codes, groups = np.zeros(len(x), dtype=np.int64), pd.Index([None])
+        else:
+            codes, groups = pd.factorize(data[group_col], sort=False)
+        weights = self._weights(data)
+
+        if self.na_rm:
+            keep = ~np.isnan(x)
+            x, codes = x[keep], codes[keep]
+            weights = None if weights is None else weights[keep]
+
+        counts, totals = self.count_groups(x, codes, len(groups), edges, weights)
+        return groups, counts, totals
+
+    def _empty(self, group_col=None):
+        columns = ['x', 'count', 'density', 'ncount', 'ndensity', 'width', 'xmin', 'xmax']
+        if group_col is not None:
+            columns.append(group_col)
+        return pd.DataFrame({column: [] for column in columns})
+
+    def _finish(self, edges, groups, counts, totals, group_col):
+        result = self._frame(edges, counts, totals)
+        codes = result.pop('group').to_numpy()
+        if group_col is not None:
+            result[group_col] = pd.Index(groups).take(codes)
+        self.params["stat"] = "bin"
+        return result
+
+    def compute_grouped(self, data, group_col, bins=None):
+        """
+        Compute bin counts for every group of a column with shared edges.
+
+        Parameters:
+            data (DataFrame): Data containing the variable to bin.
+            group_col (str): Column whose values define the groups.
+            bins (int, optional): Number of bins. Default is self.bins.
+
+        Returns:
+            DataFrame: The columns of compute() plus group_col, groups in
+                order of first appearance.
+        """
+        if bins is None:
+            bins = self.bins
+
+        x = data[self.mapping.get('x')].to_numpy(dtype=float)
+        finite = x[~np.isnan(x)]
+        if len(finite) == 0:
+            return self._empty(group_col)
+
+        # Shared edges from all groups so bars align for stacking
+        edges = np.asarray(self._compute_bins(finite, bins, self.binwidth, self.boundary,
+                                              self.center, self.breaks), dtype=float)
+        groups, counts, totals = self._count_chunk(data, group_col, edges)
+        return self._finish(edges, groups, counts, totals, group_col)
+
+    def compute_chunks(self, source, group_col=None, bins=None):
+        """
+        Compute bin counts over data read chunk by chunk.
+
+        Edges come from ``breaks`` when given, otherwise from a first pass
+        over the chunks that only tracks the minimum and maximum of x. A
+        second pass accumulates the counts of every chunk, so peak memory
+        is bounded by the chunk size. The result equals compute() (or
+        compute_grouped() with ``group_col``) on the concatenated data.
+
+        Parameters:
+            source: A ChunkedData, or anything it accepts (an iterable or
+                callable of DataFrames, a pyarrow Dataset, a memmap).
+            group_col (str, optional): Column whose values define the groups.
+            bins (int, optional): Number of bins. Default is self.bins.
+
+        Returns:
+            DataFrame: The columns of compute(), plus group_col if given.
+
+        Raises:
+            ValueError: If the source is a one-shot iterator and no
+                ``breaks`` were given, since edges then need a first pass.
+        """
+        from ..chunked import as_chunked
+
+        if bins is None:
+            bins = self.bins
+        source = as_chunked(source)
+        x_col = self.mapping.get('x')
+
+        if self.breaks is not None:
+            edges = np.asarray(self.breaks, dtype=float)
+        else:
+            if source.one_shot:
+                raise ValueError(
+                    "stat_bin needs two passes over a chunked source to find bin edges. "
+                    "Pass breaks=, or a list or callable of chunks instead of an iterator."
+                )
+            bounds = source.value_range(x_col)
+            if bounds is None:
+                return self._empty(group_col)
+            edges = np.asarray(self._compute_bins(np.asarray(bounds), bins, self.binwidth,
+                                                  self.boundary, self.center, None), dtype=float)
+
+        columns = [x_col]
+        for column in (group_col, self.mapping.get('weight')):
+            if isinstance(column, str) and column not in columns:
+                columns.append(column)
+
+        # Merge per-chunk counts; group codes follow first appearance
+        positions = {}
+        groups, rows, totals = [], [], []
+        for chunk_groups, counts, chunk_totals in source.map(
+            lambda chunk: self._count_chunk(chunk, group_col, edges), columns
+        ):
+            for value, row, total in zip(chunk_groups, counts, chunk_totals):
+                key = value if group_col is not None else None
+                if key not in positions:
+                    positions[key] = len(groups)
+                    groups.append(value)
+                    rows.append(row.astype(float))
+                    totals.append(float(total))
+                else:
+                    position = positions[key]
+                    rows[position] += row
+                    totals[position] += total
+
+        if not groups:
+            return self._empty(group_col)
+        counts = np.vstack(rows)
+        if self._weights_column() is None:
+            counts = counts.astype(np.int64)
+        return self._finish(edges, groups, counts, np.asarray(totals), group_col)
+
+    def _weights_column(self):
+        weight_col = self.mapping.get('weight')
+        return weight_col if isinstance(weight_col, str) else None
+
+    def _weights(self, data):
+        """Values of the mapped weight column, or None."""
+        weight_col = self._weights_column()
+        if weight_col is not None and weight_col in data.columns:
+            return data[weight_col].to_numpy(dtype=float)
+        return None
+
     def compute(self, data, bins=None):
         """
         Compute bin counts for the data.
@@ -133,7 +402,7 @@ class stat_bin(Stat):
         Returns:
             DataFrame: Data with binning information including:
                 - x: bin centers
-                - count: counts per bin
+                - count: counts per bin (summed weights if weight is mapped)
                 - density: density per bin
                 - ncount: normalized count
                 - ndensity: normalized density
@@ -149,11 +418,14 @@ class stat_bin(Stat):
             # Return unchanged if no x mapping
             return data
 
-        x = data[x_col].values.copy()
+        x = data[x_col].to_numpy(dtype=float)
+        weights = self._weights(data)
 
         # Remove NA values if requested
         if self.na_rm:
-            x = x[~np.isnan(x)]
+            keep = ~np.isnan(x)
+            x = x[keep]
+            weights = None if weights is None else weights[keep]
 
         if len(x) == 0:
             return pd.DataFrame({
@@ -162,58 +434,12 @@ class stat_bin(Stat):
             })
 
         # Compute bin edges
-        bin_edges = self._compute_bins(x, bins, self.binwidth, self.boundary,
-                                       self.center, self.breaks)
-
-        # Compute histogram
-        # Note: np.histogram has right-closed bins by default [(, ])
-        # For left-closed bins, we need to handle this differently
-        if self.closed == 'left':
-            # Reverse the data and edges, compute, then reverse back
-            counts, _ = np.histogram(-x, bins=-bin_edges[::-1])
-            counts = counts[::-1]
-        else:
-            counts, _ = np.histogram(x, bins=bin_edges)
-
-        # Compute bin properties
-        widths = np.diff(bin_edges)
-        centers = (bin_edges[:-1] + bin_edges[1:]) / 2
-        xmin = bin_edges[:-1]
-        xmax = bin_edges[1:]
-
-        # Compute density (integrates to 1)
-        total = len(x)
-        density = counts / (total * widths) if total > 0 else counts * 0
+        bin_edges = np.asarray(self._compute_bins(x, bins, self.binwidth, self.boundary,
+                                                  self.center, self.breaks), dtype=float)
 
-        # Normalized count and density (max = 1)
-        max_count = counts.max() if counts.max() > 0 else 1
-        max_density = density.max() if density.max() > 0 else 1
-        ncount = counts / max_count
-        ndensity = density / max_density
-
-        # Add padding if requested
-        if self.pad:
-            # Add empty bins at start and end
-            avg_width = np.mean(widths)
-            centers = np.concatenate([[centers[0] - avg_width], centers, [centers[-1] + avg_width]])
-            counts = np.concatenate([[0], counts, [0]])
-            density = np.concatenate([[0], density, [0]])
-            ncount = np.concatenate([[0], ncount, [0]])
-            ndensity = np.concatenate([[0], ndensity, [0]])
-            widths = np.concatenate([[avg_width], widths, [avg_width]])
-            xmin = np.concatenate([[xmin[0] - avg_width], xmin, [xmax[-1]]])
-            xmax = np.concatenate([[xmin[1]], xmax, [xmax[-1] + avg_width]])
-
-        result = pd.DataFrame({
-            'x': centers,
-            'count': counts,
-            'density': density,
-            'ncount': ncount,
-            'ndensity': ndensity,
-            'width': widths,
-            'xmin': xmin,
-            'xmax': xmax,
-        })
+        counts, totals = self.count_groups(x, np.zeros(len(x), dtype=np.int64), 1,
+                                           bin_edges, weights)
+        result = self._frame(bin_edges, counts, totals).drop(columns='group')
 
         # Store stat info
         self.params["stat"] = "bin"
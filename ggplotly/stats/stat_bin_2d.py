@@ -0,0 +1,254 @@
+# stats/stat_bin_2d.py
+"""Rectangular 2D binning stat for heatmaps of overplotted points."""
+
+import numpy as np
+import pandas as pd
+
+from .stat_base import Stat
+
+FUNS = ("count", "sum", "mean", "min", "max", "median")
+
+
+def _pair(value):
+    """Broadcast a scalar or pair to an (x, y) tuple."""
+    if value is None:
+        return None, None
+    if np.ndim(value) == 0:
+        return value, value
+    return tuple(value)
+
+
+def axis_bins(values, bins=30, binwidth=None, limits=None):
+    """
+    Origin, width and number of equal-width bins covering ``values``.
+
+    Parameters:
+        values (ndarray): Finite values.
+        bins (int): Number of bins, used when binwidth is None.
+        binwidth (float, optional): Width of each bin.
+        limits (tuple, optional): (low, high) range to cover instead of the
+            range of values.
+
+    Returns:
+        tuple: (origin, width, n_bins)
+    """
+    lo, hi = limits if limits is not None else (values.min(), values.max())
+    lo, hi = float(lo), float(hi)
+    span = hi - lo
+    if binwidth is not None:
+        width = float(binwidth)
+        return lo, width, int(np.floor(span / width)) + 1
+    if span == 0:
+        width = abs(lo) * 0.1 or 1.0
+        return lo - width / 2, width, 1
+    return lo, span / bins, int(bins)
+
+
+def axis_index(values, origin, width, n_bins):
+    """Integer bin of each value; the last bin is closed on the right."""
+    idx = np.floor((values - origin) / width).astype(np.int64)
+    return np.clip(idx, 0, n_bins - 1)
+
+
+def summarise_bins(codes, n_bins, z=None, weights=None, fun=None):
+    """
+    Count and summarise values per bin code.
+
+    Counting and the 'sum' and 'mean' summaries use np.bincount; 'min' and
+    'max' use unbuffered ufunc reductions. Other summaries (including
+    callables) fall back to a pandas groupby over the occupied bins.
+
+    Parameters:
+        codes (ndarray): Bin of each observation (0..n_bins-1).
+        n_bins (int): Number of bins.
+        z (ndarray, optional): Values to summarise. Default summarises the
+            (weighted) count.
+        weights (ndarray, optional): Observation weights for the count.
+        fun (str or callable, optional): Summary of z: one of 'count',
+            'sum', 'mean', 'min', 'max', 'median', or a callable taking an
+            array. Default is 'count' without z and 'mean' with z.
+
+    Returns:
+        tuple: (occupied bin codes, count, value) arrays.
+    """
+    rows = np.bincount(codes, minlength=n_bins)
+    occupied = np.flatnonzero(rows)
+    count = rows if weights is None else np.bincount(codes, weights=weights, minlength=n_bins)
+    count = count[occupied]
+
+    if fun is None:
+        fun = "count" if z is None else "mean"
+    if z is None or fun == "count":
+        return occupied, count, count.astype(float)
+
+    z = np.asarray(z, dtype=float)
+    if fun == "sum":
+        value = np.bincount(codes, weights=z, minlength=n_bins)[occupied]
+    elif fun == "mean":
+        value = np.bincount(codes, weights=z, minlength=n_bins)[occupied] / rows[occupied]
+    elif fun in ("min", "max"):
+        ufunc = np.minimum if fun == "min" else np.maximum
+        value = np.full(n_bins, np.inf if fun == "min" else -np.inf)
+        ufunc.at(value, codes, z)
+        value = value[occupied]
+    else:
+        value = pd.Series(z).groupby(codes, sort=True).agg(fun).to_numpy(dtype=float)
+    return occupied, count, value
+
+
+class stat_bin_2d(Stat):
+    """
+    Divide the plane into rectangles and count the points in each.
+
+    Each point's rectangle is found with integer arithmetic and counted with
+    np.bincount, so the cost is linear in the number of points and the
+    output size depends only on the number of occupied bins.
+
+    Parameters:
+        data (DataFrame, optional): Data to use for this stat.
+        mapping (dict, optional): Aesthetic mappings. x and y are required;
+            weight and z are optional.
+        bins (int or tuple): Number of bins in each direction. Default is 30.
+        binwidth (float or tuple, optional): Bin width in each direction.
+            Overrides bins.
+        fun (str or callable, optional): Summary of the z aesthetic per bin
+            ('count', 'sum', 'mean', 'min', 'max', 'median' or a callable).
+            Default is the mean when z is mapped.
+        drop (bool): If True (default), leave out empty bins.
+        limits (tuple, optional): ((xmin, xmax), (ymin, ymax)) range to bin
+            over. Default is the range of the data. geom_bin2d bins every
+            facet panel over the range of the whole layer.
+        na_rm (bool): If True, remove NA values. Default is False.
+        **params: Additional parameters for the stat.
+
+    Computed variables:
+        - x, y: Bin centers
+        - xmin, xmax, ymin, ymax: Bin edges
+        - width, height: Bin size
+        - count: Number of points in the bin (sum of weights if weight is mapped)
+        - density: Count divided by the total count
+        - value: Summary of z, or the count when z is not mapped
+
+    Examples:
+        >>> ggplot(df, aes(x='x', y='y')) + stat_bin_2d(bins=50)
+        >>> ggplot(df, aes(x='x', y='y', z='price')) + stat_bin_2d(fun='median')
+    """
+
+    __name__ = "bin_2d"
+
+    geom = "bin2d"
+
+    def __init__(self, data=None, mapping=None, bins=30, binwidth=None, fun=None,
+                 drop=True, limits=None, na_rm=False, **params):
+        """
+        Initialize the 2D binning stat.
+
+        Parameters:
+            data (DataFrame, optional): Data to use for this stat.
+            mapping (dict, optional): Aesthetic mappings.
+            bins (int or tuple): Number of bins per direction. Default is 30.
+            binwidth (float or tuple, optional): Bin width per direction.
+            fun (str or callable, optional): Summary of z per bin.
+            drop (bool): Leave out empty bins. Default is True.
+            limits (tuple, optional): ((xmin, xmax), (ymin, ymax)) range to bin over.
+            na_rm (bool): Remove NA values. Default is False.
+            **params: Additional parameters.
+        """
+        super().__init__(data, mapping, **params)
+        if isinstance(fun, str) and fun not in FUNS:
+            raise ValueError(f"fun must be a callable or one of {FUNS}, got {fun!r}")
+        self.bins = bins
+        self.binwidth = binwidth
+        self.fun = fun
+        self.drop = drop
+        self.limits = limits
+        self.na_rm = na_rm
+
+    def _arrays(self, data):
+        """Finite x, y and the optional z and weight columns of the data."""
+        x = data[self.mapping['x']].to_numpy(dtype=float)
+        y = data[self.mapping['y']].to_numpy(dtype=float)
+        extra = {}
+        for aes_name in ('z', 'weight'):
+            column = self.mapping.get(aes_name)
+            if isinstance(column, str) and column in data.columns:
+                extra[aes_name] = data[column].to_numpy(dtype=float)
+
+        keep = np.isfinite(x) & np.isfinite(y)
+        if 'z' in extra:
+            keep &= np.isfinite(extra['z'])
+        return x[keep], y[keep], {k: v[keep] for k, v in extra.items()}
+
+    def _ranges(self, x, y):
+        """(low, high) of x and y: the limits if given, else the data range."""
+        if self.limits is not None:
+            (x_lo, x_hi), (y_lo, y_hi) = self.limits
+        else:
+            x_lo, x_hi, y_lo, y_hi = x.min(), x.max(), y.min(), y.max()
+        return (float(x_lo), float(x_hi)), (float(y_lo), float(y_hi))
+
+    def _result(self, occupied, count, value, centers, sizes):
+        """Frame of computed variables for the occupied bins."""
+        x, y = centers
+        width, height = sizes
+        total = count.sum()
+        return pd.DataFrame({
+            'x': x,
+            'y': y,
+            'xmin': x - width / 2,
+            'xmax': x + width / 2,
+            'ymin': y - height / 2,
+            'ymax': y + height / 2,
+            'width': width,
+            'height': height,
+            'count': count,
+            'density': count / total if total else count * 0.0,
+            'value': value,
+        })
+
+    def _new_mapping(self):
+        new_mapping = {k: v for k, v in self.mapping.items() if k not in ('z', 'weight')}
+        new_mapping['x'] = 'x'
+        new_mapping['y'] = 'y'
+        new_mapping.setdefault('fill', 'value')
+        return new_mapping
+
+    def compute(self, data):
+        """
+        Bin the points of the data.
+
+        Parameters:
+            data (DataFrame): Input data with x and y columns.
+
+        Returns:
+            tuple: (DataFrame with one row per bin, updated mapping dict)
+        """
+        if self.mapping.get('x') is None or self.mapping.get('y') is None:
+            raise ValueError("stat_bin_2d requires 'x' and 'y' aesthetic mappings")
+
+        x, y, extra = self._arrays(data)
+        if len(x) == 0:
+            empty = self._result(np.array([], dtype=np.int64), np.array([]), np.array([]),
+                                 (np.array([]), np.array([])), (0.0, 0.0))
+            return empty, self._new_mapping()
+
+        bins_x, bins_y = _pair(self.bins)
+        width_x, width_y = _pair(self.binwidth)
+        x_range, y_range = self._ranges(x, y)
+        x0, wx, nx = axis_bins(x, bins_x, width_x, x_range)
+        y0, wy, ny = axis_bins(y, bins_y, width_y, y_range)
+
+        codes = axis_index(x, x0, wx, nx) * ny + axis_index(y, y0, wy, ny)
+        occupied, count, value = summarise_bins(codes, nx * ny, extra.get('z'),
+                                                extra.get('weight'), self.fun)
+        if not self.drop:
+            full = np.arange(nx * ny)
+            count_full = np.zeros(nx * ny, dtype=count.dtype)
+            count_full[occupied] = count
+            value_full = np.full(nx * ny, 0.0 if 'z' not in extra else np.nan)
+            value_full[occupied] = value
+            occupied, count, value = full, count_full, value_full
+
+        ix, iy = np.divmod(occupied, ny)
+        centers = (x0 + (ix + 0.5) * wx, y0 + (iy + 0.5) * wy)
+        return self._result(occupied, count, value, centers, (wx, wy)), self._new_mapping()
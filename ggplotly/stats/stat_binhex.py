@@ -0,0 +1,167 @@
+# stats/stat_binhex.py
+"""Hexagonal 2D binning stat."""
+
+import numpy as np
+
+from .stat_bin_2d import _pair, stat_bin_2d, summarise_bins
+
+SQRT3 = np.sqrt(3.0)
+
+
+def hex_centers(x, y, x0, y0, width, height):
+    """
+    Assign points to the nearest center of a pointy-top hexagonal lattice.
+
+    Rows of centers are ``height`` apart and centers within a row are
+    ``width`` apart; odd rows are shifted by half a width. A point lies
+    between two rows and its hexagon is centered in one of them, so only
+    the nearest center of each of those two rows is compared. Distances
+    are measured as if the hexagons were regular.
+
+    Parameters:
+        x, y (ndarray): Point coordinates.
+        x0, y0 (float): Center of hexagon (0, 0).
+        width (float): Distance between centers within a row.
+        height (float): Distance between rows.
+
+    Returns:
+        tuple: (column, row) integer arrays. Column indices count in half
+            widths, so odd rows have odd columns.
+    """
+    u = (x - x0) / width
+    v = (y - y0) / height
+    row_lo = np.floor(v).astype(np.int64)
+
+    best_col = best_row = best_dist = None
+    for row in (row_lo, row_lo + 1):
+        shift = (row & 1) * 0.5
+        col = np.rint(u - shift) + shift
+        dist = (u - col) ** 2 + (0.75 * (v - row) ** 2)
+        if best_dist is None:
+            best_col, best_row, best_dist = col, row, dist
+        else:
+            closer = dist < best_dist
+            best_col = np.where(closer, col, best_col)
+            best_row = np.where(closer, row, best_row)
+            best_dist = np.where(closer, dist, best_dist)
+    return np.rint(best_col * 2).astype(np.int64), best_row
+
+
+class stat_binhex(stat_bin_2d):
+    """
+    Divide the plane into hexagons and count the points in each.
+
+    Parameters:
+        data (DataFrame, optional): Data to use for this stat.
+        mapping (dict, optional): Aesthetic mappings. x and y are required;
+            weight and z are optional.
+        bins (int or tuple): Number of hexagons across the x range (and,
+            with a tuple, the number of rows across the y range). Default is 30.
+        binwidth (float or tuple, optional): Distance between hexagon
+            centers in a row (and between rows). Overrides bins.
+        aspect (float): Height over width of the panel in pixels. Rows are
+            spaced so hexagons look regular on such a panel. Default is 1.
+        fun (str or callable, optional): Summary of the z aesthetic per
+            hexagon. Default is the mean when z is mapped.
+        limits (tuple, optional): ((xmin, xmax), (ymin, ymax)) range to bin
+            over. Default is the range of the data.
+        na_rm (bool): If True, remove NA values. Default is False.
+        **params: Additional parameters for the stat.
+
+    Computed variables:
+        - x, y: Hexagon centers
+        - width: Distance between centers in a row
+        - height: Distance between rows
+        - count: Number of points in the hexagon (sum of weights if weight is mapped)
+        - density: Count divided by the total count
+        - value: Summary of z, or the count when z is not mapped
+
+    Examples:
+        >>> ggplot(df, aes(x='x', y='y')) + stat_binhex(bins=40)
+        >>> ggplot(df, aes(x='x', y='y', weight='w')) + geom_hex()
+    """
+
+    __name__ = "binhex"
+
+    geom = "hex"
+
+    def __init__(self, data=None, mapping=None, bins=30, binwidth=None, aspect=1.0,
+                 fun=None, limits=None, na_rm=False, **params):
+        """
+        Initialize the hexagonal binning stat.
+
+        Parameters:
+            data (DataFrame, optional): Data to use for this stat.
+            mapping (dict, optional): Aesthetic mappings.
+            bins (int or tuple): Hexagons across the x (and y) range. Default is 30.
+            binwidth (float or tuple, optional): Center spacing in a row (and between rows).
+            aspect (float): Panel height over width in pixels. Default is 1.
+            fun (str or callable, optional): Summary of z per hexagon.
+            limits (tuple, optional): ((xmin, xmax), (ymin, ymax)) range to bin over.
+            na_rm (bool): Remove NA values. Default is False.
+            **params: Additional parameters.
+        """
+        super().__init__(data, mapping, bins=bins, binwidth=binwidth, fun=fun,
+                         drop=True, limits=limits, na_rm=na_rm, **params)
+        self.aspect = aspect
+
+    def spacing(self, x, y):
+        """
+        Distance between centers within a row and between rows.
+
+        Parameters:
+            x, y (ndarray): Finite point coordinates; their range is binned
+                unless limits are set.
+
+        Returns:
+            tuple: (width, height)
+        """
+        (x_lo, x_hi), (y_lo, y_hi) = self._ranges(x, y)
+        x_range = x_hi - x_lo or 1.0
+        y_range = y_hi - y_lo or 1.0
+        bins_x, bins_y = _pair(self.bins)
+        width, height = _pair(self.binwidth)
+        if width is None:
+            width = x_range / bins_x
+        if height is None:
+            if self.binwidth is None and np.ndim(self.bins) > 0:
+                height = y_range / bins_y
+            else:
+                # Regular hexagons on a panel of the given pixel aspect
+                height = width * (y_range / x_range) / self.aspect * SQRT3 / 2
+        return float(width), float(height)
+
+    def compute(self, data):
+        """
+        Bin the points of the data into hexagons.
+
+        Parameters:
+            data (DataFrame): Input data with x and y columns.
+
+        Returns:
+            tuple: (DataFrame with one row per occupied hexagon, updated mapping dict)
+        """
+        if self.mapping.get('x') is None or self.mapping.get('y') is None:
+            raise ValueError("stat_binhex requires 'x' and 'y' aesthetic mappings")
+
+        x, y, extra = self._arrays(data)
+        if len(x) == 0:
+            empty = self._result(np.array([], dtype=np.int64), np.array([]), np.array([]),
+                                 (np.array([]), np.array([])), (0.0, 0.0))
+            return empty.drop(columns=['xmin', 'xmax', 'ymin', 'ymax']), self._new_mapping()
+
+        width, height = self.spacing(x, y)
+        (x0, _), (y0, _) = self._ranges(x, y)
+        cols, rows = hex_centers(x, y, x0, y0, width, height)
+
+        col_min, row_min = cols.min(), rows.min()
+        n_cols = int(cols.max() - col_min) + 1
+        n_rows = int(rows.max() - row_min) + 1
+        codes = (rows - row_min) * n_cols + (cols - col_min)
+        occupied, count, value = summarise_bins(codes, n_rows * n_cols, extra.get('z'),
+                                                extra.get('weight'), self.fun)
+
+        row, col = np.divmod(occupied, n_cols)
+        centers = (x0 + (col + col_min) * width / 2, y0 + (row + row_min) * height)
+        result = self._result(occupied, count, value, centers, (width, height))
+        return result.drop(columns=['xmin', 'xmax', 'ymin', 'ymax']), self._new_mapping()
@@ -0,0 +1,222 @@
+# stats/stat_boxplot.py
+"""Boxplot summary stat computed server-side, one vectorized pass per layer."""
+
+import numpy as np
+import pandas as pd
+
+from .stat_base import Stat
+
+# Columns produced for every box
+SUMMARY_COLUMNS = (
+    "ymin", "lower", "middle", "upper", "ymax",
+    "notchlower", "notchupper", "relvarwidth", "n",
+)
+
+
+def _sorted_quantile(values, starts, counts, prob):
+    """
+    Quantile of each contiguous sorted segment (R type 7, numpy's default).
+
+    Parameters:
+        values (ndarray): Values sorted within each segment.
+        starts (ndarray): Start offset of each segment.
+        counts (ndarray): Length of each segment (all > 0).
+        prob (float): Probability in [0, 1].
+
+    Returns:
+        ndarray: One quantile per segment.
+    """
+    h = (counts - 1) * prob
+    lo = np.floor(h).astype(np.int64)
+    hi = np.minimum(lo + 1, counts - 1)
+    below = values[starts + lo]
+    return below + (h - lo) * (values[starts + hi] - below)
+
+
+def boxplot_summary(codes, values, n_groups, coef=1.5):
+    """
+    Five-number summaries, notches and outliers for many groups at once.
+
+    Values are sorted once by (group, value); quartiles are then read off
+    each group's segment by index arithmetic and whiskers are found with a
+    segmented reduction, so there is no Python loop over rows.
+
+    Parameters:
+        codes (ndarray): Integer group code for each value (0..n_groups-1,
+            negative codes are dropped).
+        values (ndarray): Values to summarise. Non-finite values are dropped.
+        n_groups (int): Number of groups.
+        coef (float): Whisker length as a multiple of the IQR.
+
+    Returns:
+        tuple: (summary, outliers) where summary is a dict of arrays keyed by
+            SUMMARY_COLUMNS with one entry per group, and outliers is a list
+            of arrays. Groups without finite values get NaN summaries.
+    """
+    codes = np.asarray(codes, dtype=np.int64)
+    values = np.asarray(values, dtype=float)
+    keep = (codes >= 0) & np.isfinite(values)
+    codes, values = codes[keep], values[keep]
+
+    order = np.lexsort((values, codes))
+    values, codes = values[order], codes[order]
+
+    counts = np.bincount(codes, minlength=n_groups)
+    present = counts > 0
+    starts = (np.cumsum(counts) - counts)[present]
+    n = counts[present]
+
+    lower = _sorted_quantile(values, starts, n, 0.25)
+    middle = _sorted_quantile(values, starts, n, 0.5)
+    upper = _sorted_quantile(values, starts, n, 0.75)
+    iqr = upper - lower
+
+    # Map each value to its position among the non-empty groups
+    segment = (np.cumsum(present) - 1)[codes]
+    lower_fence = lower - coef * iqr
+    upper_fence = upper + coef * iqr
+    inside = (values >= lower_fence[segment]) & (values <= upper_fence[segment])
+
+    # Whiskers reach the most extreme values within the fences; with a tiny
+    # coef a group can have no such value, so fall back to the hinges
+    ymin = np.minimum.reduceat(np.where(inside, values, np.inf), starts) if len(starts) else lower
+    ymax = np.maximum.reduceat(np.where(inside, values, -np.inf), starts) if len(starts) else upper
+    ymin = np.where(np.isfinite(ymin), ymin, lower)
+    ymax = np.where(np.isfinite(ymax), ymax, upper)
+
+    notch = 1.58 * iqr / np.sqrt(n)
+
+    summary = {
+        "ymin": ymin,
+        "lower": lower,
+        "middle": middle,
+        "upper": upper,
+        "ymax": ymax,
+        "notchlower": middle - notch,
+        "notchupper": middle + notch,
+        "relvarwidth": np.sqrt(n),
+        "n": n,
+    }
+    result = {}
+    for name, column in summary.items():
+        full = np.full(n_groups, np.nan)
+        full[present] = column
+        result[name] = full
+    result["n"] = counts
+
+    out_codes = codes[~inside]
+    out_counts = np.bincount(out_codes, minlength=n_groups)
+    outliers = np.split(values[~inside], np.cumsum(out_counts)[:-1])
+
+    return result, outliers
+
+
+class stat_boxplot(Stat):
+    """
+    Compute boxplot statistics for each x position.
+
+    Quartiles use R's default (type 7) definition, matching ggplot2.
+    Whiskers extend to the most extreme observation within ``coef`` times
+    the interquartile range of the box, and observations beyond them are
+    returned as outliers. geom_boxplot uses this stat internally so only the
+    summaries and outliers, not every observation, end up in the figure.
+
+    Parameters:
+        data (DataFrame, optional): Data to use for this stat.
+        mapping (dict, optional): Aesthetic mappings.
+        coef (float): Length of the whiskers as a multiple of the IQR.
+            Default is 1.5.
+        na_rm (bool): If True, silently remove missing values. Default is False.
+        **params: Additional parameters for the stat.
+
+    Computed variables:
+        - ymin: Lower whisker end
+        - lower: First quartile
+        - middle: Median
+        - upper: Third quartile
+        - ymax: Upper whisker end
+        - outliers: Array of observations beyond the whiskers
+        - notchlower, notchupper: Median -/+ 1.58 * IQR / sqrt(n)
+        - relvarwidth: sqrt(n), for variable-width boxes
+        - n: Number of observations
+
+    Examples:
+        >>> ggplot(mpg, aes(x='class', y='hwy')) + stat_boxplot()
+        >>> ggplot(mpg, aes(x='class', y='hwy')) + stat_boxplot(coef=3)
+    """
+
+    __name__ = "boxplot"
+
+    geom = "boxplot"
+
+    def __init__(self, data=None, mapping=None, coef=1.5, na_rm=False, **params):
+        """
+        Initialize the boxplot stat.
+
+        Parameters:
+            data (DataFrame, optional): Data to use for this stat.
+            mapping (dict, optional): Aesthetic mappings.
+            coef (float): Whisker length as a multiple of the IQR. Default is 1.5.
+            na_rm (bool): Remove NA values. Default is False.
+            **params: Additional parameters.
+        """
+        super().__init__(data, mapping, **params)
+        self.coef = coef
+        self.na_rm = na_rm
+
+    def compute_array(self, x, y):
+        """
+        Compute one box per distinct x value.
+
+        Boxes are returned in order of first appearance of their x value.
+
+        Parameters:
+            x (array-like): Box positions.
+            y (array-like): Observations.
+
+        Returns:
+            DataFrame: One row per box with column x, the computed
+                variables and an object column of outlier arrays.
+        """
+        codes, uniques = pd.factorize(pd.Series(x), sort=False)
+        summary, outliers = boxplot_summary(codes, y, len(uniques), self.coef)
+
+        result = pd.DataFrame({"x": np.asarray(uniques), **summary})
+        result["outliers"] = pd.Series(outliers, index=result.index, dtype=object)
+        return result
+
+    def compute(self, data):
+        """
+        Summarise data into one row per x value and discrete group.
+
+        Parameters:
+            data (DataFrame): Input data with x and y columns.
+
+        Returns:
+            tuple: (DataFrame of box summaries, updated mapping dict)
+        """
+        x_col = self.mapping.get('x')
+        y_col = self.mapping.get('y')
+        if x_col is None or y_col is None:
+            raise ValueError("stat_boxplot requires 'x' and 'y' aesthetic mappings")
+
+        keys = [x_col]
+        for aes_name in ('group', 'fill', 'color', 'colour'):
+            column = self.mapping.get(aes_name)
+            if isinstance(column, str) and column in data.columns and column not in keys:
+                keys.append(column)
+
+        grouped = data.groupby(keys, sort=False, observed=True, dropna=True)
+        codes = grouped.ngroup().to_numpy()
+        n_groups = grouped.ngroups
+        summary, outliers = boxplot_summary(codes, data[y_col].to_numpy(), n_groups, self.coef)
+
+        result = grouped[keys].nth(0).reset_index(drop=True)
+        for name, column in summary.items():
+            result[name] = column
+        result["outliers"] = pd.Series(outliers, index=result.index, dtype=object)
+
+        new_mapping = {k: v for k, v in self.mapping.items() if k != 'y'}
+        for name in ("ymin", "lower", "middle", "upper", "ymax"):
+            new_mapping[name] = name
+        return result, new_mapping
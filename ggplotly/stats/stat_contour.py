@@ -29,8 +29,6 @@ contour lines or filled contours.
 """
 
 import numpy as np
-from scipy.interpolate import griddata
-from scipy.stats import gaussian_kde
 
 from .stat_base import Stat
 
@@ -226,6 +224,8 @@ class stat_contour(Stat):
         # Shape: (2, gridsize*gridsize)
         positions = np.vstack([X.ravel(), Y.ravel()])
 
+        from scipy.stats import gaussian_kde
+
         # Compute KDE
         try:
             # Stack x and y as 2D data for KDE
@@ -293,6 +293,8 @@ class stat_contour(Stat):
 
             # Interpolate z values to grid using scipy's griddata
             # Uses linear interpolation by default
+            from scipy.interpolate import griddata
+
             z_grid = griddata((x, y), z, (X, Y), method='linear')
 
         return x_grid, y_grid, z_grid
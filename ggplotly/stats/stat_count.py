@@ -1,20 +1,42 @@
+import numpy as np
+import pandas as pd
+
 from .stat_base import Stat
 
+# Largest key space counted with a dense bincount; sparser combinations
+# are compacted with np.unique first
+_DENSE_LIMIT = 1 << 24
+
+
+def _factorize(values):
+    """Integer codes and sorted uniques of a key column (appearance order if unsortable)."""
+    try:
+        return pd.factorize(values, sort=True)
+    except TypeError:
+        return pd.factorize(values, sort=False)
+
 
 class stat_count(Stat):
     """
     Count the number of observations in each group.
 
     This stat is used internally by geom_bar when you want to display
-    counts of categorical data.
+    counts of categorical data. Rows are grouped by every mapped column
+    except y (or x, for horizontal bars) and weight; a mapped ``weight``
+    column is summed instead of counting rows. Groups are returned in
+    sorted key order, so every facet panel lists its bars the same way.
 
     Parameters:
         data (DataFrame, optional): Data to use for this stat.
         mapping (dict, optional): Aesthetic mappings.
         **params: Additional parameters.
 
+    Computed variables:
+        - count: Number of observations (or sum of weights) in each group
+
     Examples:
         >>> ggplot(df, aes(x='category')) + geom_bar(stat='count')
+        >>> ggplot(df, aes(x='category', weight='amount')) + geom_bar()
     """
 
     __name__ = "count"
@@ -31,6 +53,83 @@ class stat_count(Stat):
         super().__init__(data, mapping, **params)
         self.aggregator = "count"
 
+    def _keys(self, columns):
+        """Mapped columns that define the groups, in mapping order."""
+        skip = {'weight', 'y'} if 'x' in self.mapping else {'weight'}
+        keys = []
+        for aes_name, column in self.mapping.items():
+            if aes_name in skip or not isinstance(column, str):
+                continue
+            if column in columns and column not in keys:
+                keys.append(column)
+        return keys
+
+    def _output_mapping(self):
+        """Mapping for the counted data; self.mapping is left untouched."""
+        mapping = dict(self.mapping)
+        mapping.pop('weight', None)
+        if 'x' in mapping:
+            mapping['y'] = self.aggregator
+        elif 'y' in mapping:
+            mapping['x'] = self.aggregator
+        return mapping
+
+    def count(self, data, keys, weights=None):
+        """
+        Count rows per combination of key columns.
+
+        Each key is factorized once to integer codes, the codes are
+        combined into one index per row and counted with np.bincount.
+        Rows with a missing key are dropped.
+
+        Parameters:
+            data (DataFrame): Input data.
+            keys (list of str): Grouping columns.
+            weights (ndarray, optional): Weight of each row.
+
+        Returns:
+            DataFrame: The observed key combinations in sorted order, with
+                a count column.
+        """
+        factorized = [_factorize(data[key]) for key in keys]
+        sizes = [max(len(uniques), 1) for _, uniques in factorized]
+        if np.prod(sizes, dtype=float) >= 2 ** 62:
+            # Combined codes would overflow int64
+            by = [data[key] for key in keys]
+            if weights is None:
+                counts = data.groupby(by, observed=True).size()
+            else:
+                counts = pd.Series(weights, index=data.index).groupby(by, observed=True).sum()
+            return counts.rename(self.aggregator).reset_index()
+
+        combined = np.zeros(len(data), dtype=np.int64)
+        valid = np.ones(len(data), dtype=bool)
+        for (codes, _), size in zip(factorized, sizes):
+            combined *= size
+            combined += codes
+            valid &= codes >= 0
+        combined = combined[valid]
+        weights = None if weights is None else np.asarray(weights, dtype=float)[valid]
+
+        space = int(np.prod(sizes, dtype=float)) if keys else 1
+        if space <= max(_DENSE_LIMIT, len(combined)):
+            counts = np.bincount(combined, minlength=space)
+            observed = np.flatnonzero(counts)
+            if weights is None:
+                counts = counts[observed]
+            else:
+                counts = np.bincount(combined, weights=weights, minlength=space)[observed]
+        else:
+            observed, inverse = np.unique(combined, return_inverse=True)
+            counts = np.bincount(inverse, weights=weights, minlength=len(observed))
+
+        columns = {}
+        positions = np.unravel_index(observed, sizes) if keys else ()
+        for key, (_, uniques), position in zip(keys, factorized, positions):
+            columns[key] = uniques.take(position)
+        columns[self.aggregator] = counts
+        return pd.DataFrame(columns)
+
     def compute(self, data):
         """
         Compute counts for each group in the data.
@@ -41,48 +140,62 @@ class stat_count(Stat):
         Returns:
             tuple: (transformed DataFrame, updated mapping dict)
         """
+        keys = self._keys(data.columns)
+        weight_col = self.mapping.get('weight')
+        weights = None
+        if isinstance(weight_col, str) and weight_col in data.columns:
+            weights = data[weight_col].to_numpy(dtype=float)
 
-        data = data.copy()
-        stat = self.aggregator
+        tf = self.count(data, keys, weights)
+        return tf, self._output_mapping()
 
-        grouping = list(set([v for k, v in self.mapping.items()]))
-        grouping = [g for g in grouping if g in data.columns]
+    def compute_chunks(self, source):
+        """
+        Count observations over data read chunk by chunk.
 
-        # Get the actual column names mapped to x and y
-        x_col = self.mapping.get('x')
-        y_col = self.mapping.get('y')
+        Each chunk is reduced to counts per combination of the mapped
+        columns, and those partial counts are summed as the chunks arrive,
+        so peak memory is bounded by the chunk size plus the number of
+        distinct combinations. A mapped ``weight`` column is summed instead
+        of counting rows.
 
-        # Use value_counts when we only have one grouping column
-        # OR when all data columns would be used for grouping (nothing left to count)
-        non_grouping_cols = [c for c in data.columns if c not in grouping]
+        Parameters:
+            source: A ChunkedData, or anything it accepts (an iterable or
+                callable of DataFrames, a pyarrow Dataset, a memmap).
 
-        if len(grouping) == 1 or len(non_grouping_cols) == 0:
-            # Use value_counts - works when grouping by all columns
-            tf = data[grouping].value_counts()
+        Returns:
+            tuple: (DataFrame with the grouping columns and a count column
+                in sorted key order, updated mapping dict)
+        """
+        from ..chunked import as_chunked
+
+        source = as_chunked(source)
+        available = source.columns
+        weight_col = self.mapping.get('weight')
+        keys = self._keys(available)
+        if not keys:
+            raise ValueError("stat_count requires a mapped column present in the chunked source")
+
+        columns = keys + ([weight_col] if weight_col in available else [])
+
+        def count_chunk(chunk):
+            weights = chunk[weight_col].to_numpy(dtype=float) if weight_col in chunk else None
+            return self.count(chunk, keys, weights).set_index(keys)[self.aggregator]
+
+        total = None
+        for counts in source.map(count_chunk, columns):
+            if total is None:
+                total = counts
+            else:
+                total = pd.concat([total, counts]).groupby(level=keys, sort=False).sum()
+
+        if total is None:
+            tf = pd.DataFrame({**{key: [] for key in keys}, self.aggregator: []})
         else:
-            # If both x and y columns are in the grouping, remove y
-            # (y will become the count result)
-            if x_col in grouping and y_col in grouping:
-                grouping.remove(y_col)
-                self.mapping.pop("y")
-
-            tf = data.groupby(grouping).agg(stat).iloc[:, [0]]
-            tf.columns = [stat]
-            tf = tf.reset_index()
-
-        tf = tf.reset_index()
-
-        if ("x" in self.mapping) & ("y" not in self.mapping):
-            dcol = "x"
-            # x = list(tf[self.mapping[dcol]])
-            # y = list(tf["count"])
-            self.mapping["x"] = self.mapping[dcol]
-            self.mapping["y"] = stat
-        elif ("y" in self.mapping) & ("x" not in self.mapping):
-            dcol = "y"
-            # y = list(tf[self.mapping[dcol]])
-            # x = list(tf["count"])
-            self.mapping["y"] = self.mapping[dcol]
-            self.mapping["x"] = stat
-
-        return tf, self.mapping
+            try:
+                total = total.sort_index()
+            except TypeError:
+                pass
+            tf = total.reset_index()
+
+        return tf, self._output_mapping()
@@ -2,11 +2,79 @@
 
 import numpy as np
 import pandas as pd
-from scipy.stats import gaussian_kde
 
 from .stat_base import Stat
 
 
+def linear_bin(values, lo, hi, n, weights=None):
+    """
+    Spread observations onto a regular grid with linear binning.
+
+    Each observation splits its weight between the two nearest grid points in
+    proportion to its distance from them. Observations outside [lo, hi] are
+    dropped.
+
+    Parameters:
+        values (array-like): Observations.
+        lo, hi (float): Grid limits.
+        n (int): Number of grid points (at least 2).
+        weights (array-like, optional): Weight of each observation.
+
+    Returns:
+        ndarray: Binned weight at each of the n grid points.
+    """
+    values = np.asarray(values, dtype=float)
+    weights = np.ones_like(values) if weights is None else np.asarray(weights, dtype=float)
+    if hi <= lo:
+        counts = np.zeros(n)
+        counts[0] = weights.sum()
+        return counts
+
+    pos = (values - lo) * ((n - 1) / (hi - lo))
+    inside = (pos >= 0) & (pos <= n - 1)
+    pos, weights = pos[inside], weights[inside]
+    left = np.minimum(pos.astype(np.int64), n - 2)
+    frac = pos - left
+    return (np.bincount(left, weights * (1 - frac), minlength=n)
+            + np.bincount(left + 1, weights * frac, minlength=n))
+
+
+def binned_kde(values, bw, lo, hi, n=512, weights=None):
+    """
+    Gaussian kernel density estimate on a regular grid.
+
+    Observations are linearly binned onto the grid and the bin weights are
+    convolved with the kernel by FFT, so the cost is O(len(values) + n log n)
+    rather than O(len(values) * n). For grids of a few hundred points the
+    result agrees with the exact estimate to well under a percent.
+
+    Parameters:
+        values (array-like): Observations.
+        bw (float): Kernel standard deviation.
+        lo, hi (float): Grid limits; should cover the observations.
+        n (int): Number of grid points. Default is 512.
+        weights (array-like, optional): Weight of each observation.
+
+    Returns:
+        tuple: (grid, density) arrays of length n.
+    """
+    grid = np.linspace(lo, hi, n)
+    counts = linear_bin(values, lo, hi, n, weights)
+    total = counts.sum()
+    if hi <= lo or total <= 0 or bw <= 0:
+        return grid, np.zeros(n)
+
+    delta = (hi - lo) / (n - 1)
+    half = min(n - 1, int(np.ceil(4 * bw / delta)))
+    offsets = np.arange(-half, half + 1) * delta
+    kernel = np.exp(-0.5 * (offsets / bw) ** 2) / (bw * np.sqrt(2 * np.pi))
+
+    size = 1 << int(np.ceil(np.log2(n + 2 * half)))
+    smoothed = np.fft.irfft(np.fft.rfft(counts, size) * np.fft.rfft(kernel, size), size)
+    density = smoothed[half:half + n] / total
+    return grid, np.maximum(density, 0)
+
+
 class stat_density(Stat):
     """
     Compute kernel density estimate for continuous data.
@@ -145,6 +213,8 @@ class stat_density(Stat):
         # Compute bandwidth
         bw = self._compute_bandwidth(x)
 
+        from scipy.stats import gaussian_kde
+
         # Create KDE
         if bw is not None:
             density = gaussian_kde(x, bw_method=bw / np.std(x, ddof=1))
@@ -208,6 +278,8 @@ class stat_density(Stat):
 
         bw = self._compute_bandwidth(x)
 
+        from scipy.stats import gaussian_kde
+
         if bw is not None:
             density = gaussian_kde(x, bw_method=bw / np.std(x, ddof=1))
         else:
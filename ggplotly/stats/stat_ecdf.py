@@ -6,6 +6,135 @@ import pandas as pd
 
 from .stat_base import Stat
 
+SPACINGS = ("probability", "x")
+
+
+def ecdf_steps(codes, x, n_groups):
+    """
+    ECDF steps of many groups at once, with ties merged into one step.
+
+    The values are ordered by a single lexsort on (group, x). Each distinct
+    value of a group becomes one step whose height is the number of values
+    of the group less than or equal to it.
+
+    Parameters:
+        codes (ndarray): Group code of each value (0..n_groups-1).
+        x (ndarray): Finite values.
+        n_groups (int): Number of groups.
+
+    Returns:
+        tuple: (step codes, step x, cumulative counts, group sizes), steps
+            ordered by group and then by x.
+    """
+    codes = np.asarray(codes, dtype=np.int64)
+    order = np.lexsort((x, codes))
+    codes, x = codes[order], x[order]
+
+    new = np.ones(len(x), dtype=bool)
+    new[1:] = (codes[1:] != codes[:-1]) | (x[1:] != x[:-1])
+    starts = np.flatnonzero(new)
+    ends = np.append(starts[1:], len(x))
+
+    sizes = np.bincount(codes, minlength=n_groups)
+    group_start = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    step_codes = codes[starts]
+    return step_codes, x[starts], ends - group_start[step_codes], sizes
+
+
+def thin_probability(codes, y, n):
+    """
+    Mask of at most n + 1 steps per group, spaced evenly in probability.
+
+    The first step reaching each multiple of 1/n is kept, along with the
+    last step of every group, so a step curve through the kept points is
+    never more than 1/n below the full ECDF.
+    """
+    bucket = np.ceil(y * n - 1e-9)
+    keep = np.ones(len(y), dtype=bool)
+    same_group = codes[1:] == codes[:-1]
+    keep[1:] = ~same_group | (bucket[1:] != bucket[:-1])
+    keep[:-1] |= ~same_group
+    keep[-1:] = True
+    return keep
+
+
+class EcdfSketch:
+    """
+    Mergeable summary of one distribution, for ECDFs of chunked data.
+
+    Each chunk is reduced to at most ``size`` ECDF breakpoints. Summaries
+    are merged like a binary counter (a summary of 2**k chunks is only
+    merged with another of the same size), so the cumulative counts are
+    within ``(log2(chunks) + 1) / size`` of the exact ECDF while memory stays
+    proportional to ``size * log2(chunks)``.
+
+    Parameters:
+        size (int): Breakpoints kept per summary. Default is 4096.
+    """
+
+    def __init__(self, size=4096):
+        self.size = size
+        self.levels = []
+        self.count = 0
+
+    def _thin(self, x, cum):
+        total = cum[-1]
+        keep = thin_probability(np.zeros(len(x), dtype=np.int64), cum / total, self.size)
+        return x[keep], cum[keep]
+
+    @staticmethod
+    def _merge(a, b):
+        x = np.union1d(a[0], b[0])
+        cum = np.zeros(len(x))
+        for points, counts in (a, b):
+            idx = np.searchsorted(points, x, side='right') - 1
+            cum += np.where(idx >= 0, counts[np.maximum(idx, 0)], 0)
+        return x, cum
+
+    def add_steps(self, x, cum):
+        """
+        Add one chunk, given as its distinct sorted values and cumulative counts.
+
+        Parameters:
+            x (ndarray): Distinct values, increasing.
+            cum (ndarray): Number of chunk values <= each value.
+        """
+        if len(x) == 0:
+            return
+        summary = self._thin(np.asarray(x, dtype=float), np.asarray(cum, dtype=float))
+        self.count += summary[1][-1]
+        for level in range(len(self.levels) + 1):
+            if level == len(self.levels):
+                self.levels.append(summary)
+                break
+            if self.levels[level] is None:
+                self.levels[level] = summary
+                break
+            summary = self._thin(*self._merge(self.levels[level], summary))
+            self.levels[level] = None
+
+    def add(self, values):
+        """Add a chunk of raw values (non-finite values are ignored)."""
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        _, x, cum, _ = ecdf_steps(np.zeros(len(values)), values, 1)
+        self.add_steps(x, cum)
+
+    def curve(self):
+        """
+        The approximate ECDF.
+
+        Returns:
+            tuple: (x, y) breakpoints with y in (0, 1].
+        """
+        summaries = [s for s in self.levels if s is not None]
+        if not summaries:
+            return np.array([]), np.array([])
+        result = summaries[0]
+        for summary in summaries[1:]:
+            result = self._merge(result, summary)
+        return result[0], result[1] / self.count
+
 
 class stat_ecdf(Stat):
     """
@@ -14,34 +143,120 @@ class stat_ecdf(Stat):
     The ECDF shows the proportion of data points less than or equal to each
     value. Useful for visualizing distributions without binning like histograms.
 
+    Tied values are merged into a single step, and a separate ECDF is
+    computed for each color, fill or group. With ``n`` each ECDF is reduced
+    to about ``n`` breakpoints, so the size of the plot no longer grows
+    with the number of observations.
+
     Parameters:
         data (DataFrame, optional): Data to use for this stat.
         mapping (dict, optional): Aesthetic mappings.
-        n (int, optional): Number of points to evaluate. Default uses all unique values.
+        n (int, optional): Number of breakpoints per ECDF (plus the final
+            step with probability spacing). Default keeps one step per
+            distinct value.
+        spacing (str): How breakpoints are chosen when ``n`` is set:
+            - 'probability' (default): evenly in cumulative probability, so the
+              drawn curve is within 1/n of the full ECDF
+            - 'x': ECDF evaluated at n evenly spaced x values, as in ggplot2
         pad (bool): If True, pad the ECDF with (min-eps, 0) and (max+eps, 1). Default False.
+        sketch_size (int): Breakpoints kept per chunk summary by
+            compute_chunks(). Default is 4096.
         **params: Additional parameters for the stat.
 
+    Computed variables:
+        - x: Breakpoint
+        - y: Proportion of observations less than or equal to x
+
     Examples:
         >>> ggplot(df, aes(x='value')) + geom_step(stat='ecdf')
         >>> ggplot(df, aes(x='value')) + geom_line(stat='ecdf')
+        >>> ggplot(df, aes(x='latency', color='region')) + geom_step(stat='ecdf', n=500)
     """
 
     __name__ = "ecdf"
 
-    def __init__(self, data=None, mapping=None, n=None, pad=False, **params):
+    def __init__(self, data=None, mapping=None, n=None, pad=False, spacing='probability',
+                 sketch_size=4096, **params):
         """
         Initialize the stat_ecdf.
 
         Parameters:
             data (DataFrame, optional): Data to use for this stat.
             mapping (dict, optional): Aesthetic mappings.
-            n (int, optional): Number of evaluation points.
+            n (int, optional): Number of breakpoints per ECDF.
             pad (bool): Whether to pad ECDF at ends. Default False.
+            spacing (str): 'probability' or 'x'. Default is 'probability'.
+            sketch_size (int): Breakpoints per chunk summary. Default is 4096.
             **params: Additional parameters.
         """
         super().__init__(data, mapping, **params)
+        if spacing not in SPACINGS:
+            raise ValueError(f"spacing must be one of {SPACINGS}, got {spacing!r}")
         self.n = n
         self.pad = pad
+        self.spacing = spacing
+        self.sketch_size = sketch_size
+
+    def _reduce(self, codes, x, y):
+        """Apply ``n`` to steps ordered by group; returns (codes, x, y)."""
+        if self.n is None:
+            return codes, x, y
+        if self.spacing == 'probability':
+            keep = thin_probability(codes, y, self.n)
+            return codes[keep], x[keep], y[keep]
+
+        # Evaluate each group's ECDF on n evenly spaced values
+        bounds = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1], True])
+        parts = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            gx, gy = x[start:stop], y[start:stop]
+            grid = np.linspace(gx[0], gx[-1], self.n) if stop - start > 1 else gx
+            idx = np.searchsorted(gx, grid, side='right') - 1
+            parts.append((np.full(len(grid), codes[start]), grid, gy[idx]))
+        if not parts:
+            return codes, x, y
+        return tuple(np.concatenate(arrays) for arrays in zip(*parts))
+
+    def _pad(self, codes, x, y):
+        """Add (min - eps, 0) and (max + eps, 1) to every group."""
+        if len(x) == 0:
+            return codes, x, y
+        firsts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        lasts = np.append(firsts[1:], len(x)) - 1
+        spread = x[lasts] - x[firsts]
+        eps = np.where(spread > 0, spread * 0.01, 0.1)
+
+        # Insert each group's closing point before the next group's opening one
+        positions = np.concatenate([lasts + 1, firsts])
+        codes = np.insert(codes, positions, np.concatenate([codes[lasts], codes[firsts]]))
+        x = np.insert(x, positions, np.concatenate([x[lasts] + eps, x[firsts] - eps]))
+        y = np.insert(y, positions, np.concatenate([np.ones(len(lasts)), np.zeros(len(firsts))]))
+        return codes, x, y
+
+    def _curves(self, codes, x, n_groups):
+        """Steps of every group after ``n`` and ``pad``; returns (codes, x, y)."""
+        x = np.asarray(x, dtype=float)
+        keep = (codes >= 0) & np.isfinite(x)
+        step_codes, steps, cum, sizes = ecdf_steps(codes[keep], x[keep], n_groups)
+        y = cum / sizes[step_codes]
+        step_codes, steps, y = self._reduce(step_codes, steps, y)
+        if self.pad:
+            step_codes, steps, y = self._pad(step_codes, steps, y)
+        return step_codes, steps, y
+
+    def _group_keys(self, columns):
+        keys = []
+        for aes_name in ('group', 'fill', 'color', 'colour'):
+            column = self.mapping.get(aes_name)
+            if isinstance(column, str) and column in columns and column not in keys:
+                keys.append(column)
+        return keys
+
+    def _new_mapping(self):
+        new_mapping = self.mapping.copy()
+        new_mapping['x'] = 'x'
+        new_mapping['y'] = 'y'
+        return new_mapping
 
     def compute(self, data):
         """
@@ -49,38 +264,97 @@ class stat_ecdf(Stat):
 
         Parameters:
             data (DataFrame or array-like): The input data. If DataFrame,
-                uses the column specified in mapping['x'].
+                uses the column specified in mapping['x'] and computes one
+                ECDF per color, fill or group.
 
         Returns:
             tuple: (DataFrame with 'x' and 'y' columns, updated mapping dict)
         """
         # Handle both DataFrame and array input for backward compatibility
-        if isinstance(data, pd.DataFrame):
-            x_col = self.mapping.get('x')
-            if x_col is None:
-                raise ValueError("stat_ecdf requires 'x' aesthetic mapping")
-            x = data[x_col].values
-        else:
-            x = np.asarray(data)
-
-        # Sort and compute ECDF
-        x_sorted = np.sort(x)
-        y = np.arange(1, len(x_sorted) + 1) / len(x_sorted)
-
-        # Optionally pad the ECDF
-        if self.pad:
-            eps = (x_sorted[-1] - x_sorted[0]) * 0.01 if len(x_sorted) > 1 else 0.1
-            x_sorted = np.concatenate([[x_sorted[0] - eps], x_sorted, [x_sorted[-1] + eps]])
-            y = np.concatenate([[0], y, [1]])
+        if not isinstance(data, pd.DataFrame):
+            _, x, y = self._curves(np.zeros(len(np.asarray(data)), dtype=np.int64), data, 1)
+            return pd.DataFrame({"x": x, "y": y}), self._new_mapping()
 
-        result = pd.DataFrame({"x": x_sorted, "y": y})
+        x_col = self.mapping.get('x')
+        if x_col is None:
+            raise ValueError("stat_ecdf requires 'x' aesthetic mapping")
 
-        # Update mapping to reflect computed columns
-        new_mapping = self.mapping.copy()
-        new_mapping['x'] = 'x'
-        new_mapping['y'] = 'y'
+        keys = self._group_keys(data.columns)
+        if not keys:
+            _, x, y = self._curves(np.zeros(len(data), dtype=np.int64), data[x_col].to_numpy(), 1)
+            return pd.DataFrame({"x": x, "y": y}), self._new_mapping()
+
+        grouped = data.groupby(keys, sort=False, observed=True, dropna=True)
+        codes, x, y = self._curves(grouped.ngroup().to_numpy(), data[x_col].to_numpy(),
+                                   grouped.ngroups)
+
+        group_keys = grouped[keys].nth(0).reset_index(drop=True)
+        result = group_keys.iloc[codes].reset_index(drop=True)
+        result["x"] = x
+        result["y"] = y
+        return result, self._new_mapping()
+
+    def compute_chunks(self, source, group_col=None):
+        """
+        Compute ECDFs over data read chunk by chunk.
+
+        Each chunk is sorted once (a lexsort over group and x), reduced to
+        ``sketch_size`` breakpoints per group and merged into an EcdfSketch,
+        so memory is bounded by the chunk size and the sketch size. The
+        curves are then reduced to ``n`` breakpoints as in compute().
+
+        Parameters:
+            source: A ChunkedData, or anything it accepts (an iterable or
+                callable of DataFrames, a pyarrow Dataset, a memmap).
+            group_col (str, optional): Column whose values define the groups.
+
+        Returns:
+            DataFrame: Columns x and y, plus group_col if given, groups in
+                order of first appearance.
+        """
+        from ..chunked import as_chunked
+
+        source = as_chunked(source)
+        x_col = self.mapping.get('x')
+        columns = [x_col] if group_col is None else [x_col, group_col]
+
+        def summarize(chunk):
+            if group_col is None:
+                codes, groups = np.zeros(len(chunk), dtype=np.int64), [None]
+            else:
+                codes, groups = pd.factorize(chunk[group_col], sort=False)
+            x = chunk[x_col].to_numpy(dtype=float)
+            keep = (codes >= 0) & np.isfinite(x)
+            step_codes, steps, cum, _ = ecdf_steps(codes[keep], x[keep], len(groups))
+            bounds = np.searchsorted(step_codes, np.arange(len(groups) + 1))
+            return [(groups[code], steps[bounds[code]:bounds[code + 1]],
+                     cum[bounds[code]:bounds[code + 1]]) for code in range(len(groups))]
+
+        sketches = {}
+        for parts in source.map(summarize, columns):
+            for group, steps, cum in parts:
+                sketch = sketches.setdefault(group, EcdfSketch(self.sketch_size))
+                sketch.add_steps(steps, cum)
+
+        curves = [(code, *sketch.curve()) for code, sketch in enumerate(sketches.values())]
+        curves = [curve for curve in curves if len(curve[1])]
+        if not curves:
+            result = pd.DataFrame({"x": [], "y": []})
+            if group_col is not None:
+                result[group_col] = []
+            return result
+
+        codes = np.concatenate([np.full(len(x), code) for code, x, _ in curves])
+        x = np.concatenate([x for _, x, _ in curves])
+        y = np.concatenate([y for _, _, y in curves])
+        codes, x, y = self._reduce(codes, x, y)
+        if self.pad:
+            codes, x, y = self._pad(codes, x, y)
 
-        return result, new_mapping
+        result = pd.DataFrame({"x": x, "y": y})
+        if group_col is not None:
+            result[group_col] = pd.Index(list(sketches)).take(codes)
+        return result
 
     def compute_array(self, x):
         """
@@ -92,8 +366,9 @@ class stat_ecdf(Stat):
             x (array-like): The input data values.
 
         Returns:
-            tuple: (x_sorted, y_values) arrays
+            tuple: (x, y) arrays with one step per distinct value (or at
+                most ``n`` breakpoints)
         """
-        x_sorted = np.sort(x)
-        y_values = np.arange(1, len(x_sorted) + 1) / len(x_sorted)
-        return x_sorted, y_values
+        x = np.asarray(x)
+        _, x_steps, y_values = self._curves(np.zeros(len(x), dtype=np.int64), x, 1)
+        return x_steps, y_values
@@ -9,7 +9,6 @@ from typing import Optional
 
 import numpy as np
 import pandas as pd
-from scipy import sparse
 
 # Module-level cache for bundling results (survives deepcopy of stat objects)
 _bundling_cache: dict[int, pd.DataFrame] = {}
@@ -310,6 +309,8 @@ def _compute_compatibility_matrix(edges, compatibility_threshold=0.6, verbose=Tr
     # Zero out diagonal
     np.fill_diagonal(compatibility, 0)
 
+    from scipy import sparse
+
     return sparse.csr_matrix(compatibility)
 
 
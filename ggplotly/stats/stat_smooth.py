@@ -1,9 +1,6 @@
 # stats/stat_smooth.py
 
 import numpy as np
-from scipy import stats as scipy_stats
-from sklearn.linear_model import LinearRegression
-from statsmodels.nonparametric.smoothers_lowess import lowess
 
 from .stat_base import Stat
 
@@ -73,6 +70,8 @@ class stat_smooth(Stat):
         """
         if self.method == "lm":
             # Linear regression using scikit-learn
+            from sklearn.linear_model import LinearRegression
+
             model = LinearRegression()
             x_reshaped = np.array(x).reshape(-1, 1)  # Reshaping x for sklearn
             model.fit(x_reshaped, y)
@@ -81,6 +80,8 @@ class stat_smooth(Stat):
         elif self.method == "lowess":
             # LOWESS smoothing using statsmodels' lowess (degree-1)
             # Match R's loess defaults: iter=3, delta=0.01*range
+            from statsmodels.nonparametric.smoothers_lowess import lowess
+
             x_array = np.array(x)
             y_array = np.array(y)
 
@@ -303,6 +304,8 @@ class stat_smooth(Stat):
         Returns:
             tuple: (ymin, ymax) arrays for confidence interval bounds.
         """
+        from scipy import stats as scipy_stats
+
         # Calculate residuals
         residuals = y - smoothed_y
 
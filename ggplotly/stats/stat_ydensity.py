@@ -0,0 +1,325 @@
+# stats/stat_ydensity.py
+"""Violin density stat: one binned KDE profile per x position."""
+
+import numpy as np
+import pandas as pd
+
+from .stat_density import binned_kde, linear_bin, stat_density
+
+SCALES = ("area", "count", "width")
+
+
+def density_quantiles(y, density, probs):
+    """
+    Quantiles of a density profile, read off its cumulative integral.
+
+    This matches how ggplot2 places ``draw_quantiles`` lines on violins.
+
+    Parameters:
+        y (ndarray): Increasing evaluation grid.
+        density (ndarray): Density at each grid point.
+        probs (array-like): Probabilities in [0, 1].
+
+    Returns:
+        ndarray: Value of y at each probability.
+    """
+    steps = np.diff(y) * (density[1:] + density[:-1]) / 2
+    cdf = np.concatenate(([0.0], np.cumsum(steps)))
+    if cdf[-1] <= 0:
+        return np.full(len(probs), np.nan)
+    return np.interp(probs, cdf / cdf[-1], y)
+
+
+def _smooth(weight, sigma):
+    """
+    Gaussian smoothing of grid weights, dropping what falls off the grid.
+
+    Parameters:
+        weight (ndarray): Weight at each grid point.
+        sigma (float): Kernel standard deviation, in grid steps.
+
+    Returns:
+        ndarray: Smoothed weights.
+    """
+    n = len(weight)
+    half = min(n - 1, int(np.ceil(4 * sigma)))
+    kernel = np.exp(-0.5 * (np.arange(-half, half + 1) / sigma) ** 2)
+    size = 1 << int(np.ceil(np.log2(n + 2 * half)))
+    smoothed = np.fft.irfft(np.fft.rfft(weight, size) * np.fft.rfft(kernel / kernel.sum(), size), size)
+    return smoothed[half:half + n]
+
+
+def _sharpen(target, sigma, iterations=10):
+    """
+    Grid weights whose Gaussian smoothing matches ``target``.
+
+    Uses Richardson-Lucy iterations, which keep the weights non-negative
+    and on the grid.
+
+    Parameters:
+        target (ndarray): Wanted smoothed weights.
+        sigma (float): Kernel standard deviation, in grid steps.
+        iterations (int): Number of iterations. Default is 10.
+
+    Returns:
+        ndarray: Weights with about the same total as ``target``.
+    """
+    weight = target.copy()
+    norm = _smooth(np.ones_like(target), sigma)
+    for _ in range(iterations):
+        weight *= _smooth(target / np.maximum(_smooth(weight, sigma), 1e-12), sigma) / norm
+    return weight
+
+
+class stat_ydensity(stat_density):
+    """
+    Compute a density profile of y for each x position, for violin plots.
+
+    Each group is estimated with a binned Gaussian KDE on a fixed grid of
+    ``n`` points, so the result has ``n`` rows per group no matter how many
+    observations the group holds.
+
+    Parameters:
+        data (DataFrame, optional): Data to use for this stat.
+        mapping (dict, optional): Aesthetic mappings.
+        bw (str or float): Bandwidth method ('nrd0', 'nrd', 'scott',
+            'silverman') or value. Default is 'nrd0'.
+        adjust (float): Bandwidth adjustment multiplier. Default is 1.
+        kernel (str): Kernel function. Only 'gaussian' is supported.
+        n (int): Number of grid points per group. Default is 512.
+        trim (bool): If True (default), the grid spans the range of the data.
+            Otherwise it extends three bandwidths beyond it.
+        scale (str): How violin widths relate across groups:
+            - 'area' (default): every violin has the same area
+            - 'count': areas are proportional to the number of observations
+            - 'width': every violin has the same maximum width
+        draw_quantiles (list of float, optional): Quantiles for geom_violin
+            to draw as horizontal lines.
+        na_rm (bool): If True, remove NA values. Default is False.
+        **params: Additional parameters for the stat.
+
+    Computed variables:
+        - y: Grid points
+        - density: Density estimate
+        - scaled: Density scaled to a maximum of 1 within the group
+        - ndensity: Alias for scaled
+        - count: Density * number of observations
+        - n: Number of observations in the group
+        - violinwidth: Density scaled according to ``scale``, at most 1
+
+    Examples:
+        >>> ggplot(mpg, aes(x='class', y='hwy')) + stat_ydensity()
+        >>> stat_ydensity(scale='count', trim=False)
+    """
+
+    __name__ = "ydensity"
+
+    geom = "violin"
+
+    def __init__(self, data=None, mapping=None, bw='nrd0', adjust=1, kernel='gaussian',
+                 n=512, trim=True, scale='area', draw_quantiles=None, na_rm=False, **params):
+        """
+        Initialize the violin density stat.
+
+        Parameters:
+            data (DataFrame, optional): Data to use for this stat.
+            mapping (dict, optional): Aesthetic mappings.
+            bw (str or float): Bandwidth method or value. Default is 'nrd0'.
+            adjust (float): Bandwidth adjustment multiplier. Default is 1.
+            kernel (str): Kernel function. Default is 'gaussian'.
+            n (int): Number of grid points per group. Default is 512.
+            trim (bool): Trim to data range. Default is True.
+            scale (str): 'area', 'count' or 'width'. Default is 'area'.
+            draw_quantiles (list of float, optional): Quantile lines to draw.
+            na_rm (bool): Remove NA values. Default is False.
+            **params: Additional parameters.
+        """
+        super().__init__(data, mapping, bw=bw, adjust=adjust, kernel=kernel,
+                         n=n, trim=trim, na_rm=na_rm, **params)
+        if scale not in SCALES:
+            raise ValueError(f"scale must be one of {SCALES}, got {scale!r}")
+        self.scale = scale
+        self.draw_quantiles = None if draw_quantiles is None else sorted(draw_quantiles)
+
+    def bandwidth(self, values):
+        """
+        Bandwidth for one group, never zero.
+
+        Falls back to R's nrd0 rule for bandwidth names without a closed
+        form here, and to the standard deviation (or 1) when the IQR is zero.
+
+        Parameters:
+            values (ndarray): Finite observations (at least two).
+
+        Returns:
+            float: Kernel standard deviation.
+        """
+        bw = self._compute_bandwidth(values)
+        if bw is not None and bw > 0:
+            return bw
+        spread = np.std(values, ddof=1)
+        if not spread > 0:
+            spread = abs(values[0]) or 1.0
+        return 0.9 * spread * len(values) ** (-0.2) * self.adjust
+
+    def limits(self, values, bw):
+        """Grid limits for one group: the data range, or three bandwidths beyond it."""
+        lo, hi = float(values.min()), float(values.max())
+        if not self.trim:
+            lo, hi = lo - 3 * bw, hi + 3 * bw
+        return lo, hi
+
+    def profile(self, values):
+        """
+        Density profile of one group.
+
+        Parameters:
+            values (ndarray): Finite observations (at least two).
+
+        Returns:
+            tuple: (grid, density, bw)
+        """
+        bw = self.bandwidth(values)
+        lo, hi = self.limits(values, bw)
+        grid, density = binned_kde(values, bw, lo, hi, self.n)
+        return grid, density, bw
+
+    def sketch(self, values, size, bw=None):
+        """
+        Compress a group to about ``size`` points with the same binned KDE.
+
+        The observations are linearly binned onto the profile grid and each
+        grid point is repeated in proportion to its bin weight. Smoothing
+        these points with the group's bandwidth gives back the binned
+        estimate, so a renderer that runs its own KDE (such as Plotly's
+        violin) draws the profile computed here.
+
+        A renderer that smooths several groups with one bandwidth passes it
+        as ``bw``. The weights are then fitted so that smoothing them with
+        ``bw`` gives back the group's profile, including its trimmed ends.
+
+        Parameters:
+            values (ndarray): Finite observations.
+            size (int): Approximate number of points to return.
+            bw (float, optional): Bandwidth the points will be smoothed with,
+                at most the group's own. Default is the group's own.
+
+        Returns:
+            ndarray: Grid values, repeated.
+        """
+        own = self.bandwidth(values)
+        lo, hi = self.limits(values, own)
+        grid = np.linspace(lo, hi, self.n)
+        weight = linear_bin(values, lo, hi, self.n) * (size / len(values))
+        if bw is not None and bw < own and hi > lo:
+            _, density = binned_kde(values, own, lo, hi, self.n)
+            if density.sum() > 0:
+                weight = _sharpen(density, bw / (grid[1] - grid[0]))
+                weight *= size / weight.sum()
+        # Round the running total so rounding errors cannot pile up locally
+        counts = np.diff(np.rint(np.cumsum(weight)), prepend=0).astype(np.int64)
+        return np.repeat(grid, counts)
+
+    def _scale_widths(self, frame):
+        """Add the violinwidth column according to ``scale``."""
+        if self.scale == "area":
+            peak = frame["density"].max()
+            frame["violinwidth"] = frame["density"] / peak if peak > 0 else 0.0
+        elif self.scale == "count":
+            peak = frame["density"].max()
+            n_max = frame["n"].max()
+            frame["violinwidth"] = (
+                frame["density"] / peak * frame["n"] / n_max if peak > 0 else 0.0
+            )
+        else:
+            frame["violinwidth"] = frame["scaled"]
+        return frame
+
+    def _profiles(self, codes, values, n_groups):
+        """
+        Profiles for every group code, concatenated.
+
+        Groups with fewer than two finite observations are dropped, as in
+        ggplot2.
+
+        Returns:
+            DataFrame: Columns code, y, density, scaled, ndensity, count, n.
+        """
+        values = np.asarray(values, dtype=float)
+        keep = (codes >= 0) & np.isfinite(values)
+        codes, values = codes[keep], values[keep]
+        order = np.argsort(codes, kind="stable")
+        codes, values = codes[order], values[order]
+        bounds = np.searchsorted(codes, np.arange(n_groups + 1))
+
+        frames = []
+        for code in range(n_groups):
+            group = values[bounds[code]:bounds[code + 1]]
+            if len(group) < 2:
+                continue
+            grid, density, _ = self.profile(group)
+            peak = density.max()
+            scaled = density / peak if peak > 0 else density
+            frames.append(pd.DataFrame({
+                "code": code,
+                "y": grid,
+                "density": density,
+                "scaled": scaled,
+                "ndensity": scaled,
+                "count": density * len(group),
+                "n": len(group),
+            }))
+
+        if not frames:
+            return pd.DataFrame(columns=["code", "y", "density", "scaled",
+                                         "ndensity", "count", "n", "violinwidth"])
+        return self._scale_widths(pd.concat(frames, ignore_index=True))
+
+    def compute_array(self, x, y):
+        """
+        Compute one profile per distinct x value.
+
+        Parameters:
+            x (array-like): Violin positions.
+            y (array-like): Observations.
+
+        Returns:
+            DataFrame: ``n`` rows per violin with column x and the computed
+                variables.
+        """
+        codes, uniques = pd.factorize(pd.Series(x), sort=False)
+        result = self._profiles(codes, y, len(uniques))
+        result.insert(0, "x", np.asarray(uniques)[result.pop("code").to_numpy(dtype=np.int64)])
+        return result
+
+    def compute(self, data):
+        """
+        Compute profiles for each x value and discrete group.
+
+        Parameters:
+            data (DataFrame): Input data with x and y columns.
+
+        Returns:
+            tuple: (DataFrame of profiles, updated mapping dict)
+        """
+        x_col = self.mapping.get('x')
+        y_col = self.mapping.get('y')
+        if x_col is None or y_col is None:
+            raise ValueError("stat_ydensity requires 'x' and 'y' aesthetic mappings")
+
+        keys = [x_col]
+        for aes_name in ('group', 'fill', 'color', 'colour'):
+            column = self.mapping.get(aes_name)
+            if isinstance(column, str) and column in data.columns and column not in keys:
+                keys.append(column)
+
+        grouped = data.groupby(keys, sort=False, observed=True, dropna=True)
+        codes = grouped.ngroup().to_numpy()
+        result = self._profiles(codes, data[y_col].to_numpy(), grouped.ngroups)
+
+        group_keys = grouped[keys].nth(0).reset_index(drop=True)
+        result = group_keys.iloc[result.pop("code").to_numpy(dtype=np.int64)].reset_index(drop=True).join(result)
+
+        new_mapping = self.mapping.copy()
+        new_mapping['y'] = 'y'
+        return result, new_mapping
@@ -0,0 +1,281 @@
+# streaming.py
+"""
+Appending rows to live plots.
+
+Monitoring dashboards redraw the same plot whenever new rows arrive,
+recomputing every layer and sending every trace again.
+``ggplot.append(rows, max_points=...)`` adds the rows to the plot data,
+keeps only the latest ``max_points`` rows, and returns a
+``render_diff.FigurePatch`` turning the figure shown so far into the new
+one: ``Plotly.extendTraces`` calls for a browser, or a patch to apply to a
+``go.FigureWidget`` with ``render_diff.apply_patch``.
+
+Layers drawing one mark per row (geom_point, geom_path and geom_line; see
+``Geom.streamable``) only draw the rows that arrive and the rows that leave
+the window. The new rows go through the layer with the color and shape maps
+of the rows drawn so far, and each trace is extended with its new points,
+keeping its latest ones. Other layers, such as layers with stats, are drawn
+again from the rows in the window. Categories keep their colors as rows
+arrive and leave.
+
+Examples:
+    >>> p = ggplot(df, aes('time', 'value', color='sensor')) + geom_line()
+    >>> widget = go.FigureWidget(p.draw(incremental=True))
+    >>> patch = p.append(new_rows, max_points=10_000)
+    >>> render_diff.apply_patch(widget, patch)
+    >>> patch.extend  # or send these as Plotly.extendTraces calls
+    [({'x': [array([...])], 'y': [array([...])]}, [0], 10000), ...]
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.subplots as sp
+
+from . import figure_builder, render_diff
+from .aesthetic_mapper import AestheticMapper
+from .constants import SHAPE_PALETTE
+from .data_utils import INDEX_COLUMN, normalize_data
+from .render_context import RenderContext
+from .scales.scale_base import Scale
+
+
+def _rows(plot, rows):
+    """New rows as a DataFrame shaped like the plot data."""
+    if isinstance(rows, pd.Series):
+        rows, _, _ = normalize_data(rows, {})
+    elif not isinstance(rows, pd.DataFrame):
+        rows = pd.DataFrame(rows)
+    if INDEX_COLUMN in plot.data.columns and INDEX_COLUMN not in rows.columns:
+        rows = rows.assign(**{INDEX_COLUMN: rows.index.values})
+    return rows
+
+
+def _window(data, rows, max_points):
+    """
+    Data with rows appended, keeping the latest max_points rows.
+
+    Returns:
+        tuple: (data, old rows leaving the window, new rows kept in it).
+    """
+    n_old = len(data)
+    data = pd.concat([data, rows], ignore_index=True)
+    drop = max(len(data) - max_points, 0) if max_points is not None else 0
+    return data.iloc[drop:].reset_index(drop=True), data.iloc[:min(drop, n_old)], rows.iloc[max(drop - n_old, 0):]
+
+
+def _keep_maps(geom, data, rows):
+    """
+    Fix the color and shape maps of a layer to the categories seen so far.
+
+    Categories already drawn keep their color and shape, whether or not they
+    are still in the window; new categories take the next palette entries.
+    """
+    mapper = AestheticMapper(data, geom.mapping, geom.params, geom.theme, validate=False)
+    columns = {geom.mapping.get(aesthetic) for aesthetic in ("color", "fill")} - {None}
+    column = columns.pop() if len(columns) == 1 else None
+    if isinstance(column, str) and column in data.columns:
+        color_map = geom._global_color_map
+        if color_map is None:
+            color_map = mapper._create_color_map(data[column])
+        if color_map is not None:
+            palette = mapper.get_color_palette()
+            color_map = dict(color_map)
+            for value in rows[column].dropna().unique():
+                color_map.setdefault(value, palette[len(color_map) % len(palette)])
+            geom._global_color_map = color_map
+
+    column = geom.mapping.get("shape")
+    if isinstance(column, str) and column in data.columns:
+        shape_map = dict(geom._global_shape_map or mapper._create_shape_map(data[column]))
+        for value in rows[column].dropna().unique():
+            shape_map.setdefault(value, SHAPE_PALETTE[len(shape_map) % len(SHAPE_PALETTE)])
+        geom._global_shape_map = shape_map
+
+
+def _streams(geom, data):
+    """Whether a layer can draw appended rows on their own."""
+    order = geom.streamable
+    if not order or geom.stats or geom.params.get("raster"):
+        return False
+    if isinstance(order, str):
+        column = geom.mapping.get(order)
+        return column in data.columns and data[column].is_monotonic_increasing
+    return True
+
+
+def _draw_rows(plot, geom, data):
+    """Plain trace dicts of a layer drawn from some rows only."""
+    fig = sp.make_subplots(rows=1, cols=1)
+    with figure_builder.deferred():
+        geom.draw(fig, data=data, row=1, col=1, context=RenderContext(plot.coords, plot.scales, plot._figure_size()))
+    traces = figure_builder.collect(fig)
+    plot._scale_registry.map(traces)
+    for coord in plot.coords:
+        coord.map(traces)
+    return traces
+
+
+def _trace_key(trace):
+    return trace.get("type", "scatter"), trace.get("name"), trace.get("legendgroup")
+
+
+def _length(trace):
+    values = trace.get("x", trace.get("y"))
+    return 0 if values is None else len(values)
+
+
+def _is_proxy(trace):
+    """Legend entries drawn as a trace with a single missing point."""
+    x = trace.get("x")
+    return x is not None and len(x) == 1 and x[0] is None
+
+
+def _point_paths(trace, n, prefix=""):
+    """Dotted paths of the properties of a trace holding one value per point."""
+    paths = []
+    for key, value in trace.items():
+        if isinstance(value, dict):
+            paths += _point_paths(value, n, f"{prefix}{key}.")
+        elif isinstance(value, (np.ndarray, list, tuple)) and n and len(value) == n:
+            paths.append(f"{prefix}{key}")
+    return paths
+
+
+def _get(trace, path):
+    for part in path.split("."):
+        trace = trace[part]
+    return trace
+
+
+def _extend_layer(traces, offset, added, removed):
+    """
+    extendTraces updates turning the traces of a layer into its new traces.
+
+    Parameters:
+        traces (list): Trace dicts of the layer in the figure.
+        offset (int): Index of the first trace of the layer in the figure.
+        added (list): Trace dicts drawn from the appended rows.
+        removed (list): Trace dicts drawn from the rows leaving the window.
+
+    Returns:
+        list or None: Updates, or None when the layer must be drawn again
+            (e.g. a new category needs a trace of its own).
+    """
+    current = {}
+    for index, trace in enumerate(traces, offset):
+        key = _trace_key(trace)
+        if key in current:
+            return None
+        current[key] = (index, trace)
+
+    dropped = {}
+    for trace in removed:
+        key = _trace_key(trace)
+        if key not in current:
+            return None
+        if not _is_proxy(trace):
+            dropped[key] = dropped.get(key, 0) + _length(trace)
+
+    new = {}
+    for trace in added:
+        key = _trace_key(trace)
+        if key not in current or key in new:
+            return None
+        new[key] = trace
+
+    updates = []
+    for key, (index, trace) in current.items():
+        if _is_proxy(trace):
+            continue
+        n_old, n_drop = _length(trace), dropped.get(key, 0)
+        paths = _point_paths(trace, n_old)
+        if key in new and not _is_proxy(new[key]):
+            tail = new[key]
+            tail_paths = _point_paths(tail, _length(tail))
+            if set(tail_paths) != set(paths):
+                return None
+            for path, (_, after) in render_diff._changes(trace, tail).items():
+                # Properties set after the figure was built are not drawn again
+                if path not in tail_paths and after is not None and path != "showlegend":
+                    return None
+            update = {path: [np.asarray(_get(tail, path))] for path in paths}
+            n_new = _length(tail)
+        elif n_drop:
+            update = {path: [np.asarray(_get(trace, path))[:0]] for path in paths}
+            n_new = 0
+        else:
+            continue
+        kept = n_old - n_drop + n_new
+        if kept <= 0:
+            # The trace would be empty; a full draw removes it
+            return None
+        updates.append((update, [index], kept if n_drop else None))
+    return updates
+
+
+def _extend(plot, previous, windows):
+    """FigurePatch extending the traces of previous, or None to draw again."""
+    cache = render_diff.layer_cache(previous)
+    if plot.facets or cache is None or len(cache.sizes) != len(plot.layers):
+        return None
+    if sum(cache.sizes) != len(previous.data):
+        return None
+    if any(type(scale).train is not Scale.train for scale in plot.scales):
+        # Trained scales (e.g. scale_size) depend on every row
+        return None
+
+    extend = []
+    offset = 0
+    for geom, size in zip(plot.layers, cache.sizes):
+        traces = [trace._props for trace in previous.data[offset:offset + size]]
+        if id(geom) in windows:
+            data, dropped, rows = windows[id(geom)]
+            if not _streams(geom, data):
+                return None
+            removed = _draw_rows(plot, geom, dropped) if len(dropped) else []
+            added = _draw_rows(plot, geom, rows) if len(rows) else []
+            updates = _extend_layer(traces, offset, added, removed)
+            if updates is None:
+                return None
+            extend += updates
+        offset += size
+    return render_diff.FigurePatch(previous, [], extend, [], [], {})
+
+
+def append(plot, rows, max_points=None):
+    """
+    Append rows to the data of a plot and patch its figure.
+
+    Parameters:
+        plot (ggplot): Plot drawn so far.
+        rows (DataFrame, Series or dict): New rows, with the columns of the
+            plot data.
+        max_points (int, optional): Number of latest rows to keep; older
+            rows leave the plot. Default keeps every row.
+
+    Returns:
+        FigurePatch: Changes from the figure shown so far to the new one.
+            ``patch.figure`` is the new figure, also kept as ``plot.fig``.
+
+    Raises:
+        ValueError: If the plot has no data of its own to append to.
+    """
+    if plot.data is None:
+        raise ValueError("append() needs a plot with data; layers with their own data do not stream.")
+    previous = plot.fig
+    rows = _rows(plot, rows)
+
+    windows = {}
+    for geom in plot.layers:
+        if not geom._has_explicit_data and geom.data is not None:
+            _keep_maps(geom, geom.data, rows)
+            geom.data, dropped, kept = _window(geom.data, rows, max_points)
+            windows[id(geom)] = (geom.data, dropped, kept)
+    plot.data = _window(plot.data, rows, max_points)[0]
+    plot._render_key = None
+
+    patch = _extend(plot, previous, windows)
+    if patch is None:
+        return plot.diff(previous)
+    render_diff.apply_patch(previous, patch)
+    return patch
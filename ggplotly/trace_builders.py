@@ -12,6 +12,7 @@ Strategy Pattern Overview:
 - TraceBuilder (ABC): Base class defining the interface
 - GroupedTraceBuilder: For explicit 'group' aesthetic
 - ColorOnlyTraceBuilder: For color/fill mapped to categorical column
+- PointColorTraceBuilder: For markers colored by a high-cardinality column
 - ShapeOnlyTraceBuilder: For shape mapped to categorical column
 - ColorAndShapeTraceBuilder: For both color and shape mapped
 - ContinuousColorTraceBuilder: For numeric color mapping (colorscale)
@@ -38,6 +39,21 @@ based on grouping scenarios. This refactoring:
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+import pandas as pd
+
+from . import colormap
+from .figure_builder import add_trace
+from .render_context import RenderContext
+
+# A categorical color with more categories than this is drawn as one trace
+# with a color per point instead of one trace per category (marker-only
+# traces; see PointColorTraceBuilder)
+max_category_traces = 500
+
+# Legend entries shown for the most frequent categories in that case
+legend_categories = 20
+
 
 class TraceBuilder(ABC):
     """
@@ -49,6 +65,7 @@ class TraceBuilder(ABC):
 
     Attributes:
         fig: The Plotly figure to add traces to
+        context: RenderContext of the figure (shown legend groups)
         plot: The Plotly graph object class (e.g., go.Scatter, go.Bar)
         data: DataFrame containing the data to plot
         mapping: Dict of aesthetic mappings (e.g., {'x': 'col_a', 'y': 'col_b'})
@@ -103,15 +120,10 @@ class TraceBuilder(ABC):
         self.x = data[mapping["x"]] if "x" in mapping else None
         self.y = data[mapping["y"]] if "y" in mapping else None
 
-        # Initialize legend tracking on the figure if not present.
-        # This set tracks which legend groups have been shown to prevent
-        # duplicate legend entries in faceted plots.
-        # Note: We use a namespaced attribute to avoid conflicts with Plotly internals.
-        # This is stored on the figure because legend state must persist across
-        # multiple geom draws in the same plot.
-        self._legendgroups_attr = '_ggplotly_shown_legendgroups'
-        if not hasattr(fig, self._legendgroups_attr):
-            setattr(fig, self._legendgroups_attr, set())
+        # Legend groups already shown are tracked by the figure's render
+        # context, since legend state must persist across every geom and
+        # panel drawn in the same plot.
+        self.context = RenderContext.of(fig)
 
         # Respect the showlegend parameter from geom params
         self.base_showlegend = params.get("showlegend", True)
@@ -133,14 +145,29 @@ class TraceBuilder(ABC):
         # If showlegend=False was set on the geom, never show legend
         if not self.base_showlegend:
             return False
-        # Get the shown groups set from the figure
-        shown_groups = getattr(self.fig, self._legendgroups_attr)
-        # If we've already shown this group, don't show again
-        if legendgroup in shown_groups:
-            return False
-        # Mark this group as shown and return True
-        shown_groups.add(legendgroup)
-        return True
+        return self.context.show_legend(legendgroup)
+
+    @staticmethod
+    def category_masks(values, categories):
+        """
+        Boolean row mask for each category of a column.
+
+        The column is encoded once, instead of compared with every category.
+
+        Parameters:
+            values: Series holding the categorical column
+            categories: Category values, in trace order
+
+        Returns:
+            dict: Category -> boolean NumPy array
+        """
+        categories = list(categories)
+        try:
+            codes = pd.Categorical(values, categories=categories).codes
+        except (TypeError, ValueError):
+            # Categories that cannot be encoded (e.g. NaN); compare one by one
+            return {value: (values == value).to_numpy() for value in categories}
+        return {value: codes == i for i, value in enumerate(categories)}
 
     @abstractmethod
     def build(self, apply_color_targets_fn):
@@ -201,19 +228,16 @@ class GroupedTraceBuilder(TraceBuilder):
             )
 
             legend_name = str(group)
-            self.fig.add_trace(
-                self.plot(
-                    x=self.x[group_mask],
-                    y=self.y[group_mask],
-                    showlegend=self.should_show_legend(legend_name),
-                    legendgroup=legend_name,  # Links traces across facets
-                    opacity=self.alpha,
-                    name=legend_name,
-                    **self.payload,
-                    **trace_props,
-                ),
-                row=self.row,
-                col=self.col,
+            add_trace(
+                self.fig, self.plot, row=self.row, col=self.col,
+                x=self.x[group_mask],
+                y=self.y[group_mask],
+                showlegend=self.should_show_legend(legend_name),
+                legendgroup=legend_name,  # Links traces across facets
+                opacity=self.alpha,
+                name=legend_name,
+                **self.payload,
+                **trace_props,
             )
 
 
@@ -253,11 +277,14 @@ class ColorAndShapeTraceBuilder(TraceBuilder):
         color_values = list(cat_map.keys())
         shape_values = list(shape_map.keys())
 
+        color_masks = self.category_masks(self.data[cat_col], color_values)
+        shape_masks = self.category_masks(self.data[shape_col], shape_values)
+
         # Create traces for each combination
         for color_val in color_values:
             for shape_val in shape_values:
                 # Filter data for this specific combination
-                combo_mask = (self.data[cat_col] == color_val) & (self.data[shape_col] == shape_val)
+                combo_mask = color_masks[color_val] & shape_masks[shape_val]
 
                 # Skip if no data points match this combination
                 # (common when categories don't fully cross)
@@ -279,19 +306,16 @@ class ColorAndShapeTraceBuilder(TraceBuilder):
                 else:
                     legend_name = f"{color_val}, {shape_val}"
 
-                self.fig.add_trace(
-                    self.plot(
-                        x=x_subset,
-                        y=y_subset,
-                        opacity=self.alpha,
-                        name=legend_name,
-                        showlegend=self.should_show_legend(legend_name),
-                        legendgroup=legend_name,
-                        **self.payload,
-                        **trace_props,
-                    ),
-                    row=self.row,
-                    col=self.col,
+                add_trace(
+                    self.fig, self.plot, row=self.row, col=self.col,
+                    x=x_subset,
+                    y=y_subset,
+                    opacity=self.alpha,
+                    name=legend_name,
+                    showlegend=self.should_show_legend(legend_name),
+                    legendgroup=legend_name,
+                    **self.payload,
+                    **trace_props,
                 )
 
 
@@ -319,10 +343,9 @@ class ColorOnlyTraceBuilder(TraceBuilder):
             cat_col = style_props['fill']
             cat_map = style_props['fill_map']
 
-        # Create a trace for each category value
-        for cat_value in cat_map.keys():
-            # Boolean mask for rows matching this category
-            cat_mask = self.data[cat_col] == cat_value
+        # Create a trace for each category value, with a boolean mask for
+        # the rows matching it
+        for cat_value, cat_mask in self.category_masks(self.data[cat_col], cat_map).items():
 
             # Skip if no data for this category
             # (can happen in faceted plots where not all categories appear)
@@ -339,21 +362,114 @@ class ColorOnlyTraceBuilder(TraceBuilder):
             )
 
             legend_name = str(cat_value)
-            self.fig.add_trace(
-                self.plot(
-                    x=x_subset,
-                    y=y_subset,
-                    opacity=self.alpha,
-                    name=legend_name,
-                    showlegend=self.should_show_legend(legend_name),
-                    legendgroup=legend_name,
-                    **self.payload,
-                    **trace_props,
-                ),
-                row=self.row,
-                col=self.col,
+            add_trace(
+                self.fig, self.plot, row=self.row, col=self.col,
+                x=x_subset,
+                y=y_subset,
+                opacity=self.alpha,
+                name=legend_name,
+                showlegend=self.should_show_legend(legend_name),
+                legendgroup=legend_name,
+                **self.payload,
+                **trace_props,
+            )
+
+
+class PointColorTraceBuilder(TraceBuilder):
+    """
+    Builds a single trace with one color per point for a categorical color.
+
+    With thousands of categories (user IDs, SKUs), one trace per category
+    means thousands of traces and legend entries. Here each point's color is
+    looked up from its category code in the palette, so the number of traces
+    does not depend on the number of categories. Legend entries are empty
+    proxy traces for the most frequent categories only. Colors of manual
+    scales (scale_color_manual) are looked up before the points are colored.
+
+    Used for marker-only traces when the geom sets ``legend`` (the number of
+    legend entries, or 'none'), or when the color has more categories than
+    ``max_category_traces``.
+
+    Example:
+        ggplot(df, aes(x='x', y='y', color='user_id')) + geom_point(legend=10)
+        # One trace; legend entries for the 10 most frequent users
+    """
+
+    def build(self, apply_color_targets_fn):
+        """Build one trace colored per point, plus legend proxies."""
+        style_props = self.style_props
+        if style_props['color_series'] is not None:
+            cat_col = style_props['color']
+            cat_map = self.context.manual_colors('color', style_props['color_map'])
+        else:
+            cat_col = style_props['fill']
+            cat_map = self.context.manual_colors('fill', style_props['fill_map'])
+
+        categories = list(cat_map)
+        codes = self.category_codes(self.data[cat_col], categories)
+        # Points outside the color map (e.g. missing values) get the default color
+        palette = np.array([*cat_map.values(), style_props['default_color']], dtype=object)
+        point_colors = palette[codes]
+
+        trace_props = apply_color_targets_fn(
+            self.color_targets, style_props, value_key=None, data_mask=None, shape_key=None
+        )
+        for aesthetic, trace_prop in self.color_targets.items():
+            if aesthetic in ('color', 'fill'):
+                trace_props[trace_prop] = point_colors
+
+        add_trace(
+            self.fig, self.plot, row=self.row, col=self.col,
+            x=self.x,
+            y=self.y,
+            opacity=self.alpha,
+            name=str(cat_col),
+            showlegend=False,
+            **self.payload,
+            **trace_props,
+        )
+
+        # Legend proxies for the most frequent categories, in category order
+        legend = self.params.get('legend')
+        if legend is None:
+            legend = legend_categories
+        if legend == 'none' or not self.base_showlegend:
+            return
+        counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+        top = np.argsort(-counts, kind='stable')[:legend]
+        for i in np.sort(top[counts[top] > 0]).tolist():
+            legend_name = str(categories[i])
+            add_trace(
+                self.fig, self.plot, row=self.row, col=self.col,
+                x=[None],
+                y=[None],
+                mode='markers',
+                marker_color=cat_map[categories[i]],
+                opacity=self.alpha,
+                name=legend_name,
+                showlegend=self.should_show_legend(legend_name),
+                legendgroup=legend_name,
             )
 
+    @staticmethod
+    def category_codes(values, categories):
+        """
+        Position of each value in categories, or -1 for other values.
+
+        Parameters:
+            values: Series holding the categorical column
+            categories: Category values, in palette order
+
+        Returns:
+            ndarray: Integer code per row
+        """
+        try:
+            return pd.Categorical(values, categories=categories).codes.astype(np.intp)
+        except (TypeError, ValueError):
+            # Categories that cannot be encoded (e.g. NaN); look them up one by one
+            lookup = {value: i for i, value in enumerate(categories)}
+            return np.array([lookup.get(value, -1) for value in values], dtype=np.intp)
+
 
 class ShapeOnlyTraceBuilder(TraceBuilder):
     """
@@ -391,19 +507,16 @@ class ShapeOnlyTraceBuilder(TraceBuilder):
             )
 
             legend_name = str(shape_val)
-            self.fig.add_trace(
-                self.plot(
-                    x=x_subset,
-                    y=y_subset,
-                    opacity=self.alpha,
-                    name=legend_name,
-                    showlegend=self.should_show_legend(legend_name),
-                    legendgroup=legend_name,
-                    **self.payload,
-                    **trace_props,
-                ),
-                row=self.row,
-                col=self.col,
+            add_trace(
+                self.fig, self.plot, row=self.row, col=self.col,
+                x=x_subset,
+                y=y_subset,
+                opacity=self.alpha,
+                name=legend_name,
+                showlegend=self.should_show_legend(legend_name),
+                legendgroup=legend_name,
+                **self.payload,
+                **trace_props,
             )
 
 
@@ -467,17 +580,14 @@ class ContinuousColorTraceBuilder(TraceBuilder):
             marker_dict['symbol'] = shape_val if shape_val else 'circle'
 
         # Create single trace - colorbar serves as legend
-        self.fig.add_trace(
-            self.plot(
-                x=self.x,
-                y=self.y,
-                opacity=self.alpha,
-                showlegend=False,  # Colorbar replaces discrete legend
-                marker=marker_dict,
-                **self.payload,
-            ),
-            row=self.row,
-            col=self.col,
+        add_trace(
+            self.fig, self.plot, row=self.row, col=self.col,
+            x=self.x,
+            y=self.y,
+            opacity=self.alpha,
+            showlegend=False,  # Colorbar replaces discrete legend
+            marker=marker_dict,
+            **self.payload,
         )
 
     def _build_line_gradient(self):
@@ -506,84 +616,48 @@ class ContinuousColorTraceBuilder(TraceBuilder):
         # Extract arrays
         x_vals = self.x.values if hasattr(self.x, 'values') else list(self.x)
         y_vals = self.y.values if hasattr(self.y, 'values') else list(self.y)
-        c_vals = color_values.values if hasattr(color_values, 'values') else list(color_values)
+        c_vals = np.asarray(color_values, dtype=float)
 
-        vmin, vmax = min(c_vals), max(c_vals)
+        vmin, vmax = np.nanmin(c_vals), np.nanmax(c_vals)
         colorscale = self.DEFAULT_COLORSCALE
 
-        # Draw each segment with interpolated color
+        # Normalize color values at the midpoint of each segment and look
+        # up all segment colors at once
+        midpoints = (c_vals[:-1] + c_vals[1:]) / 2
+        t_norm = (midpoints - vmin) / (vmax - vmin) if vmax != vmin else np.zeros(len(midpoints))
+        colors = colormap.map_colors(t_norm, colorscale, 0, 1)
+
+        # Draw each segment with its color
         for i in range(len(x_vals) - 1):
-            # Normalize color value at midpoint of segment
-            t_norm = ((c_vals[i] + c_vals[i + 1]) / 2 - vmin) / (vmax - vmin) if vmax != vmin else 0
-            color = self._interpolate_color(colorscale, t_norm)
-
-            self.fig.add_trace(
-                go.Scattergl(  # WebGL for performance with many traces
-                    x=[x_vals[i], x_vals[i + 1]],
-                    y=[y_vals[i], y_vals[i + 1]],
-                    mode='lines',
-                    line=dict(color=color, width=line_width),
-                    opacity=self.alpha,
-                    showlegend=False,
-                    hoverinfo='skip',
-                    # Tag for scale_color_gradient to update colors
-                    meta={'_ggplotly_line_gradient': True, '_color_norm': t_norm}
-                ),
-                row=self.row,
-                col=self.col,
+            add_trace(
+                self.fig, go.Scattergl, row=self.row, col=self.col,  # WebGL for many traces
+                x=[x_vals[i], x_vals[i + 1]],
+                y=[y_vals[i], y_vals[i + 1]],
+                mode='lines',
+                line=dict(color=colors[i], width=line_width),
+                opacity=self.alpha,
+                showlegend=False,
+                hoverinfo='skip',
+                # Tag for scale_color_gradient to update colors
+                meta={'_ggplotly_line_gradient': True, '_color_norm': float(t_norm[i])}
             )
 
         # Add invisible trace for colorbar
-        self.fig.add_trace(
-            go.Scatter(
-                x=[None],
-                y=[None],
-                mode='markers',
-                marker=dict(
-                    color=[vmin, vmax],
-                    colorscale=colorscale,
-                    showscale=True,
-                    colorbar=dict(title=self.mapping.get('color', ''))
-                ),
-                showlegend=False,
-                hoverinfo='skip'
+        add_trace(
+            self.fig, go.Scatter, row=self.row, col=self.col,
+            x=[None],
+            y=[None],
+            mode='markers',
+            marker=dict(
+                color=[vmin, vmax],
+                colorscale=colorscale,
+                showscale=True,
+                colorbar=dict(title=self.mapping.get('color', ''))
             ),
-            row=self.row,
-            col=self.col,
+            showlegend=False,
+            hoverinfo='skip'
         )
 
-    @staticmethod
-    def _interpolate_color(colorscale, t):
-        """
-        Interpolate between colorscale endpoints.
-
-        Parameters:
-            colorscale: List of [position, color] pairs (e.g., [[0, '#440154'], [1, '#fde725']])
-            t: Normalized value between 0 and 1
-
-        Returns:
-            str: Interpolated RGB color string
-        """
-        t = max(0, min(1, t))  # Clamp to [0, 1]
-
-        low_color = colorscale[0][1]
-        high_color = colorscale[1][1]
-
-        # Parse hex colors to RGB
-        def hex_to_rgb(hex_color):
-            hex_color = hex_color.lstrip('#')
-            return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
-
-        low_rgb = hex_to_rgb(low_color)
-        high_rgb = hex_to_rgb(high_color)
-
-        # Linear interpolation
-        r = int(low_rgb[0] + t * (high_rgb[0] - low_rgb[0]))
-        g = int(low_rgb[1] + t * (high_rgb[1] - low_rgb[1]))
-        b = int(low_rgb[2] + t * (high_rgb[2] - low_rgb[2]))
-
-        return f'rgb({r}, {g}, {b})'
-
 
 class SingleTraceBuilder(TraceBuilder):
     """
@@ -618,18 +692,15 @@ class SingleTraceBuilder(TraceBuilder):
         # Use name from payload or default to 'trace'
         trace_name = self.original_payload.get('name', 'trace')
 
-        self.fig.add_trace(
-            self.plot(
-                x=self.x,
-                y=self.y,
-                opacity=self.alpha,
-                showlegend=self.should_show_legend(trace_name),
-                legendgroup=trace_name,
-                **self.original_payload,  # Includes 'name'
-                **trace_props,
-            ),
-            row=self.row,
-            col=self.col,
+        add_trace(
+            self.fig, self.plot, row=self.row, col=self.col,
+            x=self.x,
+            y=self.y,
+            opacity=self.alpha,
+            showlegend=self.should_show_legend(trace_name),
+            legendgroup=trace_name,
+            **self.original_payload,  # Includes 'name'
+            **trace_props,
         )
 
 
@@ -645,7 +716,9 @@ def get_trace_builder(fig, plot, data, mapping, style_props, color_targets,
     Decision tree:
     1. If group_series exists -> GroupedTraceBuilder
     2. If color AND shape grouped -> ColorAndShapeTraceBuilder
-    3. If only color grouped -> ColorOnlyTraceBuilder
+    3. If only color grouped -> ColorOnlyTraceBuilder, or
+       PointColorTraceBuilder for markers with many categories or a
+       ``legend`` parameter
     4. If only shape grouped -> ShapeOnlyTraceBuilder
     5. If continuous color -> ContinuousColorTraceBuilder
     6. Otherwise -> SingleTraceBuilder
@@ -699,8 +772,11 @@ def get_trace_builder(fig, plot, data, mapping, style_props, color_targets,
     if has_color_grouping and has_shape_grouping:
         return ColorAndShapeTraceBuilder(*args)
 
-    # Case 3: Only color/fill is mapped (categorical)
+    # Case 3: Only color/fill is mapped (categorical). Markers can take one
+    # color per point, so many categories are drawn as a single trace
     if has_color_grouping:
+        if _colors_per_point(style_props, color_targets, payload, params):
+            return PointColorTraceBuilder(*args)
         return ColorOnlyTraceBuilder(*args)
 
     # Case 4: Only shape is mapped
@@ -713,3 +789,17 @@ def get_trace_builder(fig, plot, data, mapping, style_props, color_targets,
 
     # Case 6: No grouping - single trace with all data
     return SingleTraceBuilder(*args)
+
+
+def _colors_per_point(style_props, color_targets, payload, params):
+    """Whether a categorical color is drawn as one trace with per-point colors."""
+    # Only markers take a color per point; lines and bars are split by category
+    if payload.get('mode') != 'markers' or color_targets.get('color') != 'marker_color':
+        return False
+    if params.get('legend') is not None:
+        return True
+    if style_props['color_series'] is not None:
+        cat_map = style_props['color_map']
+    else:
+        cat_map = style_props['fill_map']
+    return len(cat_map) > max_category_traces
@@ -44,20 +44,23 @@ class ggsize:
 
 class ggsave(Utils):
     """
-    A class to save ggplot figures as either HTML or PNG.
+    A class to save ggplot figures as HTML, PNG or JSON.
 
     Parameters:
         filename (str): The name of the file to save the figure (including extension).
         width (int, optional): The width of the image in pixels (for PNG). If None, the current figure width is used.
         height (int, optional): The height of the image in pixels (for PNG). If None, the current figure height is used.
         scale (float, optional): Scale the image by this factor (for PNG).
+        precision (str, optional): Precision of float arrays in HTML and JSON files:
+            'float64' (default, exact) or 'float32'.
     """
 
-    def __init__(self, filename, width=None, height=None, scale=1.0):
+    def __init__(self, filename, width=None, height=None, scale=1.0, precision="float64"):
         self.filename = filename
         self.width = width
         self.height = height
         self.scale = scale
+        self.precision = precision
 
     def apply(self, plot):
         """
@@ -76,20 +79,29 @@ class ggsave(Utils):
             self.save_html(plot)
         elif self.filename.endswith(".png"):
             self.save_png(plot, width, height)
+        elif self.filename.endswith(".json"):
+            self.save_json(plot)
         else:
-            raise ValueError("Unsupported file format. Use either .html or .png.")
+            raise ValueError("Unsupported file format. Use .html, .png or .json.")
 
     def save_html(self, plot):
         """
         Save the plot as an HTML file.
 
-        Uses CDN references for Plotly.js and MathJax, resulting in small file
-        sizes (~8KB) but requiring internet for viewing.
-        MathJax CDN enables LaTeX rendering (e.g., geom_text with parse=True).
+        Uses CDN references for Plotly.js, resulting in small file sizes
+        (~8KB) but requiring internet for viewing. MathJax is loaded from its
+        CDN only when LaTeX is rendered (e.g., geom_text with parse=True).
         """
-        plot.fig.write_html(self.filename, include_plotlyjs='cdn', include_mathjax='cdn')
+        plot.save(self.filename, format="html", precision=self.precision)
         print(f"Plot saved as HTML: {self.filename}")
 
+    def save_json(self, plot):
+        """
+        Save the plot as Plotly JSON with compact base64 typed arrays.
+        """
+        plot.save(self.filename, format="json", precision=self.precision)
+        print(f"Plot saved as JSON: {self.filename}")
+
     def save_png(self, plot, width, height):
         """
         Save the plot as a PNG file. Requires the `kaleido` package to be installed.
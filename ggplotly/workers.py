@@ -0,0 +1,48 @@
+# workers.py
+"""
+Sending plots to worker processes.
+
+``export_html``, ``ggsave_many`` and the async renderers run plots in a
+``ProcessPoolExecutor``. Their arguments are pickled up front with ``pack``
+rather than in the pool's feeder thread, which tells a plot that cannot be
+sent (e.g. one holding a lambda) apart from an error raised while rendering
+it, so the caller can render that plot itself. ``call_packed`` runs in the
+worker and unpickles them.
+
+Examples:
+    >>> payload = pack((plot,))
+    >>> if payload is not None:
+    ...     future = pool.submit(call_packed, draw, payload)
+"""
+
+import pickle
+
+
+def pack(args):
+    """
+    Pickled args for a worker process, or None if they cannot be sent.
+
+    Parameters:
+        args (tuple): Positional arguments of the call.
+
+    Returns:
+        bytes or None: The payload for ``call_packed``.
+    """
+    try:
+        return pickle.dumps(args, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+
+
+def call_packed(func, payload):
+    """
+    Call func with the args of a payload from ``pack``, in a worker.
+
+    Parameters:
+        func (callable): Module-level function to call.
+        payload (bytes): Arguments pickled by ``pack``.
+
+    Returns:
+        The result of ``func(*args)``.
+    """
+    return func(*pickle.loads(payload))
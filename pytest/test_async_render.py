@@ -0,0 +1,121 @@
+# pytest/test_async_render.py
+"""Tests for drawing and saving plots from an asyncio event loop."""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import pytest
+from ggplotly import RenderQueue, aes, async_render, geom_point, ggplot
+from ggplotly.exceptions import ColumnNotFoundError
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(2)
+    return pd.DataFrame({'x': rng.normal(size=50), 'y': rng.normal(size=50)})
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool recording the most calls running at once."""
+
+    def __init__(self):
+        super().__init__(max_workers=8)
+        self.running = self.most = 0
+        self._guard = threading.Lock()
+
+    def submit(self, fn, *args):
+        def call():
+            with self._guard:
+                self.running += 1
+                self.most = max(self.most, self.running)
+            try:
+                return fn(*args)
+            finally:
+                with self._guard:
+                    self.running -= 1
+        return super().submit(call)
+
+
+class TestDrawAsync:
+    def test_draw_matches_draw(self, df):
+        p = ggplot(df, aes('x', 'y')) + geom_point()
+        fig = asyncio.run(p.draw_async())
+        assert fig is p.fig
+        assert fig.to_dict() == (ggplot(df, aes('x', 'y')) + geom_point()).draw().to_dict()
+
+    def test_process_pool(self, df):
+        p = ggplot(df, aes('x', 'y')) + geom_point()
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            fig = asyncio.run(p.draw_async(executor=pool))
+        assert fig is p.fig and fig.data[0].type == 'scatter'
+
+    def test_process_pool_errors_are_not_retried(self, df, monkeypatch):
+        drawn = []
+        monkeypatch.setattr(async_render, '_draw', drawn.append)
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            # Timed out, then failed while drawing; neither is drawn in a thread
+            pool.submit(time.sleep, 0.5)
+            with pytest.raises(asyncio.TimeoutError):
+                asyncio.run((ggplot(df, aes('x', 'y')) + geom_point()).draw_async(
+                    timeout=0.05, executor=pool))
+            broken = ggplot(df, aes('x', 'missing')) + geom_point()
+            with pytest.raises(ColumnNotFoundError):
+                asyncio.run(broken.draw_async(executor=pool))
+            assert drawn == []
+
+            # A plot that cannot be pickled is drawn in a thread instead
+            unpicklable = ggplot(df, aes('x', 'y')) + geom_point()
+            unpicklable.hook = lambda: None
+            asyncio.run(unpicklable.draw_async(executor=pool))
+            assert drawn == [unpicklable]
+
+    def test_timeout_cancels_waiting_draw(self, df):
+        p = ggplot(df, aes('x', 'y')) + geom_point()
+        before = p.fig
+        release = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pool.submit(release.wait)
+            with pytest.raises(asyncio.TimeoutError):
+                asyncio.run(p.draw_async(timeout=0.05, executor=pool))
+            release.set()
+        # The draw never started
+        assert p.fig is before
+
+    def test_save_async(self, df, tmp_path):
+        p = ggplot(df, aes('x', 'y')) + geom_point()
+        path = str(tmp_path / 'plot.json')
+        assert asyncio.run(p.save_async(path, precision='float32')) == path
+        with open(path) as f:
+            assert json.load(f)['data'][0]['type'] == 'scatter'
+
+
+class TestRenderQueue:
+    def test_bounded_concurrency(self, df):
+        pool = CountingExecutor()
+        queue = RenderQueue(max_concurrency=2, executor=pool)
+        plots = [ggplot(df.iloc[:10 * i + 10], aes('x', 'y')) + geom_point() for i in range(6)]
+        figures = asyncio.run(queue.draw_all(plots))
+        pool.shutdown()
+
+        assert [len(fig.data[0].x) for fig in figures] == [10, 20, 30, 40, 50, 50]
+        assert pool.most <= 2
+
+    def test_save(self, df, tmp_path):
+        queue = RenderQueue(max_concurrency=1)
+        path = str(tmp_path / 'plot.html')
+
+        async def save_both():
+            return await asyncio.gather(
+                queue.save(ggplot(df, aes('x', 'y')) + geom_point(), path),
+                queue.draw(ggplot(df, aes('x', 'y')) + geom_point()),
+            )
+
+        saved, fig = asyncio.run(save_both())
+        assert saved == path and (tmp_path / 'plot.html').exists()
+        assert len(fig.data) == 1
@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+
+import pytest
+from ggplotly import (
+    ChunkedData,
+    aes,
+    geom_bar,
+    geom_histogram,
+    ggplot,
+    stat_bin,
+    stat_count,
+)
+
+
+@pytest.fixture
+def events():
+    rng = np.random.default_rng(11)
+    df = pd.DataFrame({
+        'latency': rng.gamma(2.0, 10.0, 50_000),
+        'region': rng.choice(['eu', 'us', 'ap'], 50_000),
+        'w': rng.random(50_000),
+    })
+    df.loc[::101, 'latency'] = np.nan
+    return df
+
+
+def _chunks(df, size=6000):
+    return [df.iloc[start:start + size] for start in range(0, len(df), size)]
+
+
+class TestChunkedData:
+    def test_array_source_in_bounded_chunks(self):
+        source = ChunkedData(np.arange(10.0), chunk_size=4)
+        chunks = list(source.chunks())
+
+        assert [len(c) for c in chunks] == [4, 4, 2]
+        assert source.columns == ['value']
+
+    def test_memmap_source(self, tmp_path):
+        path = tmp_path / 'x.npy'
+        np.save(path, np.linspace(0, 1, 1000))
+        source = ChunkedData(np.load(path, mmap_mode='r'), chunk_size=300)
+
+        assert source.value_range('value') == (0.0, 1.0)
+
+    def test_iterator_read_once(self, events):
+        source = ChunkedData(iter(_chunks(events)))
+
+        assert source.columns == ['latency', 'region', 'w']
+        assert sum(len(c) for c in source.chunks()) == len(events)
+        with pytest.raises(ValueError, match="already been read"):
+            list(source.chunks())
+
+    def test_thread_pool_keeps_chunk_order(self, events):
+        source = ChunkedData(events, chunk_size=1000, n_jobs=4)
+
+        assert list(source.map(len)) == [1000] * 50
+
+
+class TestStatBinChunks:
+    @pytest.mark.parametrize('params', [
+        {}, {'binwidth': 5, 'boundary': 0}, {'closed': 'left', 'pad': True}, {'na_rm': True},
+    ])
+    def test_matches_in_memory(self, events, params):
+        expected = stat_bin(mapping={'x': 'latency'}, **params).compute(events)
+        result = stat_bin(mapping={'x': 'latency'}, **params).compute_chunks(_chunks(events))
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_grouped_weighted_in_threads(self, events):
+        mapping = {'x': 'latency', 'weight': 'w'}
+        expected = stat_bin(mapping=mapping).compute_grouped(events, 'region')
+        source = ChunkedData(events, chunk_size=4000, n_jobs=4)
+        result = stat_bin(mapping=mapping).compute_chunks(source, 'region')
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_iterator_needs_breaks(self, events):
+        with pytest.raises(ValueError, match="breaks"):
+            stat_bin(mapping={'x': 'latency'}).compute_chunks(iter(_chunks(events)))
+
+        result = stat_bin(mapping={'x': 'latency'}, breaks=[0, 20, 40, 1000]).compute_chunks(
+            iter(_chunks(events))
+        )
+        assert result['count'].sum() == events['latency'].notna().sum()
+
+
+class TestStatCountChunks:
+    def test_counts_and_weights(self, events):
+        tf, mapping = stat_count(mapping={'x': 'region'}).compute_chunks(_chunks(events))
+        counts = tf.set_index('region')['count']
+
+        assert counts.to_dict() == events['region'].value_counts().to_dict()
+        assert mapping == {'x': 'region', 'y': 'count'}
+
+        tf, _ = stat_count(mapping={'x': 'region', 'weight': 'w'}).compute_chunks(_chunks(events))
+        assert tf['count'].sum() == pytest.approx(events['w'].sum())
+
+
+class TestGeomHistogramChunks:
+    def test_grouped_histogram_from_callable(self, events):
+        chunks = _chunks(events)
+        streamed = (ggplot(mapping=aes(x='latency', fill='region'))
+                    + geom_histogram(data=lambda: iter(chunks), bins=20)).draw()
+        in_memory = (ggplot(events, aes(x='latency', fill='region'))
+                     + geom_histogram(bins=20)).draw()
+
+        assert [t.name for t in streamed.data] == [t.name for t in in_memory.data]
+        for a, b in zip(streamed.data, in_memory.data):
+            np.testing.assert_array_equal(a.y, b.y)
+
+    def test_memmap_with_breaks(self, tmp_path):
+        path = tmp_path / 'x.npy'
+        np.save(path, np.random.default_rng(0).normal(size=20_000))
+        values = np.load(path, mmap_mode='r')
+        fig = (ggplot(mapping=aes(x='value'))
+               + geom_histogram(data=ChunkedData(values, chunk_size=5000),
+                                breaks=np.linspace(-5, 5, 11))).draw()
+
+        assert sum(fig.data[0].y) == 20_000
+        assert len(fig.data[0].x) == 10
+
+
+class TestGeomBarChunks:
+    def test_grouped_bars_from_chunks(self, events):
+        chunks = _chunks(events)
+        streamed = (ggplot(mapping=aes(x='region', fill='region'))
+                    + geom_bar(data=ChunkedData(iter(chunks)))).draw()
+        in_memory = (ggplot(events, aes(x='region', fill='region')) + geom_bar()).draw()
+
+        assert [t.name for t in streamed.data] == [t.name for t in in_memory.data]
+        for a, b in zip(streamed.data, in_memory.data):
+            np.testing.assert_array_equal(a.x, b.x)
+            np.testing.assert_array_equal(a.y, b.y)
+
+    def test_identity_stat_is_rejected(self, events):
+        p = ggplot(mapping=aes(x='region')) + geom_bar(data=_chunks(events), stat='identity')
+        with pytest.raises(ValueError, match='stat_count'):
+            p.draw()
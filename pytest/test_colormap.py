@@ -0,0 +1,66 @@
+# pytest/test_colormap.py
+"""Tests for the colormap lookup tables behind continuous colors."""
+
+import numpy as np
+import pandas as pd
+
+from ggplotly import aes, colormap, geom_line, ggplot, scale_color_gradient
+from ggplotly.aesthetic_mapper import AestheticMapper
+from ggplotly.trace_builders import ContinuousColorTraceBuilder
+
+
+class TestLookupTable:
+    def test_endpoints_are_exact(self):
+        table = colormap.lut('Viridis')
+        assert table.shape == (colormap.lut_size, 4)
+        assert table.dtype == np.uint8 and not table.flags.writeable
+        assert table[0].tolist() == [0x44, 0x01, 0x54, 255]
+        assert table[-1].tolist() == [0xfd, 0xe7, 0x25, 255]
+
+    def test_colorscale_forms_share_a_table(self):
+        pairs = colormap.lut([[0, 'white'], [1, 'red']], n=1024)
+        assert pairs.shape == (1024, 4)
+        assert colormap.lut(['white', 'red'], n=1024) is pairs
+        assert colormap.lut(((0, 'white'), (1, 'red')), n=1024) is pairs
+
+    def test_to_rgba_keeps_alpha(self):
+        assert colormap.to_rgba('rgba(10, 20, 30, 0.5)') == (10, 20, 30, 0.5)
+        assert colormap.to_rgba('steelblue') == (70, 130, 180, 1)
+        rgba = colormap.to_rgba_array(['red', None, 'red'])
+        np.testing.assert_array_equal(rgba[:, 3], [1, 0, 1])
+
+
+class TestMapValues:
+    def test_gather_with_clamping_and_missing_values(self):
+        values = np.array([-1.0, 0.0, 0.5, 1.0, 2.0, np.nan])
+        rgba = colormap.map_values(values, [[0, 'black'], [1, 'white']], 0, 1)
+        np.testing.assert_array_equal(rgba[:, 0], [0, 0, 128, 255, 255, 0])
+        np.testing.assert_array_equal(rgba[:, 3], [255, 255, 255, 255, 255, 0])
+
+    def test_default_range_and_constant_values(self):
+        colors = colormap.map_colors(pd.Series([5, 10]), ['red', 'blue'])
+        assert colors.tolist() == ['rgb(255, 0, 0)', 'rgb(0, 0, 255)']
+        colors = colormap.map_colors([3, 3], ['red', 'blue'])
+        assert colors.tolist() == ['rgb(255, 0, 0)'] * 2
+
+
+class TestContinuousColors:
+    def test_float_integers_are_categorical(self):
+        df = pd.DataFrame({'v': [1.0, 2.0, 1.0, 2.0, np.nan, 1.0]})
+        mapper = AestheticMapper(df, {'color': 'v'}, {})
+        assert not mapper._is_continuous(df['v'])
+        df['v'] = [1.5, 2.0, 1.0, 2.0, np.nan, 1.0]
+        assert mapper._is_continuous(df['v'])
+
+    def test_line_gradient_and_scale_use_the_table(self):
+        df = pd.DataFrame({'x': range(30), 'y': range(30), 'v': np.linspace(0, 1, 30)})
+        p = ggplot(df, aes(x='x', y='y', color='v')) + geom_line()
+        segments = p.draw().data[:-1]
+        assert len(segments) == 29
+        expected = colormap.map_colors([segments[0].meta['_color_norm']],
+                                       ContinuousColorTraceBuilder.DEFAULT_COLORSCALE, 0, 1)
+        assert segments[0].line.color == expected[0]
+
+        fig = (p + scale_color_gradient(low='black', high='white')).draw()
+        assert fig.data[0].line.color == 'rgb(4, 4, 4)'
+        assert fig.data[-2].line.color == 'rgb(251, 251, 251)'
@@ -135,3 +135,65 @@ class TestUSFlightsDatasets:
     def test_us_flights_in_list(self):
         available = data()
         assert "us_flights" in available
+
+
+class TestDatasetCache:
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        from ggplotly import datasets
+
+        monkeypatch.setenv("GGPLOTLY_CACHE_DIR", str(tmp_path))
+        datasets.clear_cache()
+        yield tmp_path / "datasets"
+        datasets.clear_cache()
+
+    def test_binary_cache_matches_csv(self, cache_dir):
+        from ggplotly import datasets
+
+        expected = pd.read_csv(datasets._DATA_DIR / "mpg.csv")
+        pd.testing.assert_frame_equal(data("mpg"), expected)
+        assert (cache_dir / "mpg" / "header.json").exists()
+
+        # Second load comes from the binary cache, not the CSV
+        datasets.clear_cache()
+        pd.testing.assert_frame_equal(data("mpg"), expected)
+
+    def test_missing_categories_survive_cache(self, cache_dir):
+        from ggplotly import datasets
+
+        expected = pd.read_csv(datasets._DATA_DIR / "msleep.csv")
+        assert expected["vore"].isna().any()
+        data("msleep")
+        datasets.clear_cache()
+        pd.testing.assert_frame_equal(data("msleep"), expected)
+
+    def test_returned_frames_are_independent(self):
+        df = data("diamonds")
+        df.loc[0, "price"] = -1
+        df["carat"] = 0
+
+        fresh = data("diamonds")
+        assert fresh.loc[0, "price"] != -1
+        assert fresh["carat"].max() > 0
+
+    def test_stale_cache_is_rebuilt(self, cache_dir):
+        import json
+
+        from ggplotly import datasets
+
+        data("iris")
+        header_path = cache_dir / "iris" / "header.json"
+        header = json.loads(header_path.read_text())
+        header["size"] = -1
+        header_path.write_text(json.dumps(header))
+
+        datasets.clear_cache()
+        assert data("iris").shape == (150, 5)
+        assert json.loads(header_path.read_text())["size"] != -1
+
+    def test_clear_cache_disk(self, cache_dir):
+        from ggplotly import datasets
+
+        data("mtcars")
+        datasets.clear_cache(disk=True)
+        assert not cache_dir.exists()
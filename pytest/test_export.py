@@ -0,0 +1,184 @@
+import importlib.util
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+
+import pytest
+from ggplotly import (
+    aes,
+    export_html,
+    geom_point,
+    geom_text,
+    ggplot,
+    ggsave_many,
+    stat_function,
+)
+from ggplotly.export import plotlyjs_filename
+
+
+@pytest.fixture
+def plots():
+    rng = np.random.default_rng(4)
+    df = pd.DataFrame({'x': rng.normal(size=50), 'y': rng.normal(size=50),
+                       'label': ['a'] * 50})
+    return {
+        'scatter': ggplot(df, aes(x='x', y='y')) + geom_point(),
+        'latex': ggplot(df, aes(x='x', y='y', label='label')) + geom_text(parse=True),
+    }
+
+
+class TestExportHtml:
+    """Tests for export_html."""
+
+    def test_directory_export_shares_plotlyjs(self, plots, tmp_path):
+        report = export_html(plots, str(tmp_path), n_jobs=1)
+
+        assert sorted(os.listdir(tmp_path)) == sorted(['latex.html', 'scatter.html',
+                                                       plotlyjs_filename()])
+        assert report.plotlyjs == str(tmp_path / plotlyjs_filename())
+        for path, size in report.files:
+            html = open(path).read()
+            assert f'src="{plotlyjs_filename()}"' in html
+            assert 'cdn.plot.ly' not in html
+            assert size == os.path.getsize(path)
+        assert report.total_bytes == (sum(size for _, size in report.files)
+                                      + os.path.getsize(report.plotlyjs))
+
+    def test_mathjax_only_when_needed(self, plots, tmp_path):
+        export_html(plots, str(tmp_path), mathjax='mathjax/tex-svg.js', n_jobs=1)
+        assert 'mathjax/tex-svg.js' in (tmp_path / 'latex.html').read_text()
+        assert 'tex-svg' not in (tmp_path / 'scatter.html').read_text()
+
+    def test_single_page(self, plots, tmp_path):
+        path = tmp_path / 'report.html'
+        report = export_html(list(plots.values()), str(path), names=['one', 'two'], n_jobs=1)
+
+        html = path.read_text()
+        assert html.count(f'src="{plotlyjs_filename()}"') == 1
+        assert 'id="one"' in html and 'id="two"' in html
+        assert html.count('tex-svg') == 1
+        assert report.files == [(str(path), os.path.getsize(path))]
+
+    def test_worker_processes(self, plots, tmp_path):
+        # A lambda cannot be sent to a worker, so that plot renders locally
+        plots['function'] = ggplot() + stat_function(fun=lambda x: x ** 2, xlim=(0, 1))
+        report = export_html(plots, str(tmp_path), n_jobs=2)
+        assert [os.path.basename(path) for path, _ in report.files] == [
+            'scatter.html', 'latex.html', 'function.html']
+
+    def test_render_errors_are_not_retried(self, plots, tmp_path, monkeypatch):
+        drawn = []
+        draw = ggplot.draw
+
+        def counting_draw(self, *args, **kwargs):
+            drawn.append(self)
+            return draw(self, *args, **kwargs)
+
+        monkeypatch.setattr(ggplot, 'draw', counting_draw)
+        plots['broken'] = ggplot(plots['scatter'].data, aes(x='x', y='missing')) + geom_point()
+        with pytest.raises(Exception, match='missing'):
+            export_html(plots, str(tmp_path), n_jobs=2)
+        # Workers drew every plot; none was drawn again in this process
+        assert drawn == []
+
+    def test_names_must_match_plots(self, plots, tmp_path):
+        with pytest.raises(ValueError, match='names'):
+            export_html(list(plots.values()), str(tmp_path), names=['one'])
+
+    @pytest.mark.parametrize('name', ['a/b', '../x', '..', ''])
+    def test_names_must_be_file_names(self, plots, tmp_path, name):
+        with pytest.raises(ValueError, match='plain file name'):
+            export_html({name: plots['scatter']}, str(tmp_path / 'out'), n_jobs=1)
+        assert not (tmp_path / 'x.html').exists()
+
+    def test_save_with_local_plotlyjs(self, plots, tmp_path):
+        plot = plots['scatter']
+        plot.draw()
+        plot.save(str(tmp_path / 'plot.html'), include_plotlyjs='directory')
+        html = (tmp_path / 'plot.html').read_text()
+        assert f'src="{plotlyjs_filename()}"' in html
+        assert 'tex-svg' not in html
+        assert (tmp_path / plotlyjs_filename()).exists()
+
+
+class TestGgsaveMany:
+    """Tests for ggsave_many."""
+
+    def test_html_and_json(self, plots, tmp_path):
+        paths = [str(tmp_path / 'scatter.html'), str(tmp_path / 'latex.json')]
+        report = ggsave_many(plots.values(), paths, workers=1, precision='float32')
+
+        assert [saved.path for saved in report.files] == paths
+        assert [saved.format for saved in report.files] == ['html', 'json']
+        assert 'cdn.plot.ly' in (tmp_path / 'scatter.html').read_text()
+        assert json.loads((tmp_path / 'latex.json').read_text())['data']
+        for saved in report.files:
+            assert saved.bytes == os.path.getsize(saved.path)
+            assert saved.draw_seconds > 0 and saved.write_seconds > 0
+        assert report.total_bytes == sum(saved.bytes for saved in report.files)
+
+    def test_batches_in_worker_processes(self, plots, tmp_path):
+        # A lambda cannot be sent to a worker, so its batch renders locally
+        items = [*plots.values(), ggplot() + stat_function(fun=lambda x: x ** 2, xlim=(0, 1))] * 2
+        paths = [str(tmp_path / f'{i}.json') for i in range(len(items))]
+        report = ggsave_many(items, paths, workers=2, batch_size=2)
+
+        assert [saved.path for saved in report.files] == paths
+        assert all(os.path.exists(path) for path in paths)
+
+    def test_unsupported_format(self, plots, tmp_path):
+        with pytest.raises(ValueError, match='tiff'):
+            ggsave_many(plots.values(), ['a.png', 'b.tiff'])
+        with pytest.raises(ValueError, match='paths'):
+            ggsave_many(plots.values(), ['a.png'])
+
+    @pytest.fixture
+    def kaleido(self, monkeypatch):
+        """Calls of a stand-in plotly.io.write_images writing every file."""
+        find_spec = importlib.util.find_spec
+        monkeypatch.setattr(importlib.util, 'find_spec',
+                            lambda name, *args: name == 'kaleido' or find_spec(name, *args))
+        calls = []
+
+        def write_images(figs, paths, format, width, height, scale):
+            calls.append((len(figs), paths, format, width, scale))
+            time.sleep(0.02)
+            for path in paths:
+                with open(path, 'wb') as f:
+                    f.write(b'image')
+
+        monkeypatch.setattr(pio, 'write_images', write_images, raising=False)
+        return calls
+
+    def test_images_are_written_per_batch(self, plots, tmp_path, kaleido):
+        items = [*plots.values()] * 3
+        paths = [str(tmp_path / name) for name in
+                 ['a.png', 'b.svg', 'c.json', 'd.pdf', 'e.PNG', 'f.html']]
+        report = ggsave_many(items, paths, workers=1, batch_size=3, width=400, scale=2)
+
+        assert kaleido == [
+            (2, paths[:2], ['png', 'svg'], 400, 2),
+            (2, paths[3:5], ['pdf', 'png'], 400, 2),
+        ]
+        assert [saved.format for saved in report.files] == ['png', 'svg', 'json', 'pdf', 'png', 'html']
+        # Images of one Kaleido call share its time
+        images = [saved for saved in report.files if saved.format != 'json' and saved.format != 'html']
+        assert images[0].write_seconds == images[1].write_seconds >= 0.01
+        assert images[2].write_seconds == images[3].write_seconds >= 0.01
+        assert all(saved.bytes == 5 for saved in images)
+
+    def test_images_need_batch_export(self, plots, tmp_path, kaleido, monkeypatch):
+        # plotly.io loads its functions lazily, so hide it rather than delete it
+        monkeypatch.setattr(pio, 'write_images', None)
+        with pytest.raises(ImportError, match='plotly 6.1'):
+            ggsave_many(plots.values(), [str(tmp_path / 'a.png'), str(tmp_path / 'b.json')])
+
+    @pytest.mark.skipif(importlib.util.find_spec('kaleido') is not None,
+                        reason='kaleido is installed')
+    def test_images_need_kaleido(self, plots, tmp_path):
+        with pytest.raises(ImportError, match='pip install kaleido'):
+            ggsave_many(plots.values(), [str(tmp_path / 'a.png'), str(tmp_path / 'b.svg')])
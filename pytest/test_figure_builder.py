@@ -0,0 +1,127 @@
+# pytest/test_figure_builder.py
+"""Tests for the deferred, validation-free trace assembly behind ggplot.draw()."""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+import pytest
+from ggplotly import (
+    aes,
+    facet_grid,
+    facet_wrap,
+    figure_builder,
+    geom_abline,
+    geom_hline,
+    geom_line,
+    geom_point,
+    ggplot,
+    render_cache,
+)
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(4)
+    n = 200
+    return pd.DataFrame({
+        'x': rng.normal(size=n),
+        'y': rng.normal(size=n),
+        'v': rng.random(n),
+        'g': rng.choice(['a', 'b', 'c'], n),
+        's': rng.choice(['p', 'q'], n),
+        'f': rng.choice(['u', 'v'], n),
+    })
+
+
+@pytest.fixture(autouse=True)
+def no_cache():
+    render_cache.enabled = False
+    yield
+    render_cache.enabled = True
+    figure_builder.strict_validation = False
+
+
+def _strict_and_deferred(plot):
+    figure_builder.strict_validation = True
+    strict = plot.draw()
+    figure_builder.strict_validation = False
+    return strict, plot.draw()
+
+
+class TestTraceDict:
+    def test_magic_underscores_expand(self):
+        trace = figure_builder.trace_dict(go.Scatter, {
+            'x': pd.Series([1.0, 2.0]), 'marker_color': 'red', 'marker_line_width': 2,
+            'marker_line': {}, 'error_x': {'array': [1, 2]}, 'name': None,
+        })
+        assert trace['type'] == 'scatter'
+        assert trace['marker'] == {'color': 'red', 'line': {'width': 2}}
+        assert trace['error_x'] == {'array': [1, 2]}
+        assert 'name' not in trace
+        assert not trace['x'].flags.writeable
+
+    def test_coerces_like_validators(self):
+        trace = figure_builder.trace_dict(go.Scatter, {
+            'marker': {'colorscale': 'Viridis', 'colorbar': {'title': 'v'}},
+            'meta': {'_tag': True},
+        })
+        assert trace['marker']['colorbar']['title'] == {'text': 'v'}
+        assert trace['marker']['colorscale'][0] == [0.0, '#440154']
+        assert trace['meta'] == {'_tag': True}
+
+    def test_invalid_property(self):
+        with pytest.raises(ValueError, match='nonsense'):
+            figure_builder.trace_dict(go.Scatter, {'nonsense_value': 1})
+
+
+class TestAddTrace:
+    def test_outside_draw_adds_immediately(self):
+        fig = make_subplots(rows=1, cols=2)
+        figure_builder.add_trace(fig, go.Scatter, row=1, col=2, x=[1, 2], y=[3, 4])
+        assert fig.data[0].xaxis == 'x2'
+
+    def test_deferred_keeps_drawing_order(self):
+        fig = make_subplots(rows=1, cols=2)
+        with figure_builder.deferred():
+            figure_builder.add_trace(fig, go.Scatter, row=1, col=2, name='first')
+            fig.add_trace(go.Bar(name='second'), row=1, col=1)
+            figure_builder.add_trace(fig, go.Scatter, row=1, col=1, name='third')
+        assert [t.name for t in fig.data] == ['second']
+
+        built = figure_builder.build(fig)
+        assert [t.name for t in built.data] == ['first', 'second', 'third']
+        assert [t.xaxis for t in built.data] == ['x2', 'x', 'x']
+        # The subplot grid survives, and later changes are validated again
+        built.add_annotation(text='note', row=1, col=2)
+        with pytest.raises(ValueError):
+            built.update_traces(nonsense=1)
+
+    def test_build_without_pending_traces(self):
+        fig = make_subplots(rows=1, cols=1)
+        assert figure_builder.build(fig) is fig
+
+
+class TestDraw:
+    @pytest.mark.parametrize('make_plot', [
+        lambda df: ggplot(df, aes('x', 'y', color='g')) + geom_point() + facet_wrap('f'),
+        lambda df: ggplot(df, aes('x', 'y', color='g', shape='s')) + geom_point()
+        + geom_abline(slope=1, intercept=0) + geom_point(aes(color='s')),
+        lambda df: ggplot(df, aes('x', 'y', color='v')) + geom_point(),
+        lambda df: ggplot(df, aes('x', 'y', color='v')) + geom_line(),
+        lambda df: ggplot(df, aes('x', 'y', group='g')) + geom_line() + facet_grid(rows='f', cols='s'),
+    ])
+    def test_matches_strict_validation(self, df, make_plot):
+        strict, deferred = _strict_and_deferred(make_plot(df))
+        assert deferred.to_dict() == strict.to_dict()
+
+    def test_reference_lines_on_deferred_panels(self, df):
+        fig = (ggplot(df, aes('x', 'y')) + geom_point() + geom_hline(yintercept=0)
+               + facet_wrap('f')).draw()
+        assert len(fig.layout.shapes) == 2
+
+    def test_faceted_legend_entries_once(self, df):
+        fig = (ggplot(df, aes('x', 'y', color='g')) + geom_point() + facet_wrap('f')).draw()
+        assert sorted(t.name for t in fig.data if t.showlegend) == ['a', 'b', 'c']
+        assert {t.xaxis for t in fig.data} == {'x', 'x2'}
@@ -98,3 +98,51 @@ class TestGeomAcf:
 
         bar_trace = [t for t in fig.data if t.type == 'bar'][0]
         assert bar_trace.width == 0.5
+
+    def test_grouped_series_batched(self):
+        """Test that a group aesthetic draws one bar trace per series."""
+        np.random.seed(42)
+        df = pd.DataFrame({
+            'value': np.random.randn(300).cumsum(),
+            'sensor': np.repeat(['a', 'b', 'c'], 100),
+        })
+
+        plot = ggplot(df, aes(y='value', group='sensor')) + geom_acf(nlags=10)
+        fig = plot.draw()
+
+        bar_traces = [t for t in fig.data if t.type == 'bar']
+        assert [t.name for t in bar_traces] == ['a', 'b', 'c']
+        assert all(len(t.x) == 10 for t in bar_traces)
+
+
+class TestStatAcf:
+    """Tests for the batched FFT engine behind geom_acf."""
+
+    def test_matches_statsmodels(self):
+        """Test ACF values and confidence bands against statsmodels."""
+        from statsmodels.tsa.stattools import acf
+
+        from ggplotly import stat_acf
+
+        np.random.seed(0)
+        y = np.random.randn(150).cumsum()
+        expected, confint = acf(y, nlags=20, alpha=0.05)
+
+        result, mapping = stat_acf(mapping={'y': 'y'}, nlags=20).compute(pd.DataFrame({'y': y}))
+
+        assert mapping['x'] == 'lag' and mapping['y'] == 'acf'
+        np.testing.assert_allclose(result['acf'], expected[1:], atol=1e-10)
+        np.testing.assert_allclose(result['ci_upper'], confint[1:, 1] - expected[1:], atol=1e-10)
+
+    def test_ragged_groups_match_individual(self):
+        """Test that batching series of different lengths matches one-at-a-time."""
+        from ggplotly import stat_acf
+
+        np.random.seed(1)
+        series = {'a': np.random.randn(80), 'b': np.random.randn(200)}
+        df = pd.concat([pd.DataFrame({'y': v, 'g': k}) for k, v in series.items()])
+
+        batched, _ = stat_acf(mapping={'y': 'y', 'group': 'g'}, nlags=15).compute(df)
+        for key, values in series.items():
+            single, _ = stat_acf(mapping={'y': 'y'}, nlags=15).compute(pd.DataFrame({'y': values}))
+            np.testing.assert_allclose(batched.loc[batched['g'] == key, 'acf'], single['acf'])
@@ -628,6 +628,100 @@ class TestGeomMapGeoJSON:
             assert fig.layout.mapbox.center.lon is not None
 
 
+class TestGeomMapSimplify:
+    """Tests for ragged GeoJSON arrays and geometry simplification."""
+
+    @pytest.fixture
+    def circle_geojson(self):
+        """Two dense circular polygons."""
+        theta = np.linspace(0, 2 * np.pi, 500)
+        features = []
+        for i, cx in enumerate([-100.0, -90.0]):
+            ring = np.c_[cx + 2 * np.cos(theta), 40 + 2 * np.sin(theta)]
+            ring[-1] = ring[0]
+            features.append({
+                'type': 'Feature',
+                'id': f'c{i}',
+                'properties': {'name': f'c{i}'},
+                'geometry': {'type': 'Polygon', 'coordinates': [ring.tolist()]},
+            })
+        return {'type': 'FeatureCollection', 'features': features}
+
+    def test_geometry_arrays_bounds(self, simple_polygon_geojson, circle_geojson):
+        """Test bounds computed from the flattened coordinates."""
+        from ggplotly.geo_utils import GeometryArrays
+
+        arrays = GeometryArrays.from_geojson(circle_geojson)
+        minx, miny, maxx, maxy = arrays.bounds()
+        assert minx == pytest.approx(-102) and maxx == pytest.approx(-88)
+        assert miny == pytest.approx(38) and maxy == pytest.approx(42)
+        assert arrays.feature_bounds().shape == (2, 4)
+        assert len(GeometryArrays.from_geojson(simple_polygon_geojson).geom_types) == 2
+
+    def test_line_coords_break_between_lines(self, line_geojson):
+        """Test that line coordinates have a NaN break after each line."""
+        from ggplotly.geo_utils import GeometryArrays
+
+        lons, lats = GeometryArrays.from_geojson(line_geojson).line_coords()
+        n_lines = len(line_geojson['features'])
+        assert np.isnan(lons).sum() == n_lines
+        assert np.isnan(lons[-1]) and np.isnan(lats[-1])
+
+    @pytest.mark.parametrize('method', ['dp', 'vw'])
+    def test_simplify_reduces_coordinates(self, circle_geojson, method):
+        """Test that simplification drops points but keeps rings closed."""
+        from ggplotly.geo_utils import simplify_geojson
+
+        result = simplify_geojson(circle_geojson, 0.05, method)
+        for original, simplified in zip(circle_geojson['features'], result['features']):
+            ring = simplified['geometry']['coordinates'][0]
+            assert 4 <= len(ring) < len(original['geometry']['coordinates'][0])
+            assert ring[0] == ring[-1]
+            assert simplified['properties'] == original['properties']
+
+    def test_simplify_small_ring_keeps_triangle(self, circle_geojson):
+        """Test that rings smaller than the tolerance collapse to a valid triangle."""
+        from ggplotly.geo_utils import simplify_geojson
+
+        result = simplify_geojson(circle_geojson, 10.0)
+        ring = result['features'][0]['geometry']['coordinates'][0]
+        assert len(ring) == 4
+        assert ring[0] == ring[-1]
+
+    def test_simplify_is_cached(self, circle_geojson):
+        """Test that the same geometry and tolerance reuse the cached result."""
+        from ggplotly.geo_utils import simplify_geometry
+
+        geometry = circle_geojson['features'][0]['geometry']
+        first = simplify_geometry(geometry, 0.05)
+        assert simplify_geometry(geometry, 0.05) is first
+        assert simplify_geometry(geometry, 0.1) is not first
+
+    def test_simplify_unknown_method_raises(self, circle_geojson):
+        """Test that an unknown simplification method raises ValueError."""
+        from ggplotly.geo_utils import simplify_geojson
+
+        with pytest.raises(ValueError, match="Unknown simplify method"):
+            simplify_geojson(circle_geojson, 0.05, method='bogus')
+
+    def test_geom_map_simplify_true(self, circle_geojson):
+        """Test that simplify=True shrinks the GeoJSON written to the figure."""
+        data = pd.DataFrame({'id': ['c0', 'c1'], 'value': [1, 2]})
+        full = (
+            ggplot(data, aes(map_id='id', fill='value'))
+            + geom_map(geojson=circle_geojson, featureidkey='id')
+        ).draw()
+        small = (
+            ggplot(data, aes(map_id='id', fill='value'))
+            + geom_map(geojson=circle_geojson, featureidkey='id', simplify=True)
+        ).draw()
+
+        def n_coords(fig):
+            return sum(len(f['geometry']['coordinates'][0]) for f in fig.data[0].geojson['features'])
+
+        assert n_coords(small) < n_coords(full)
+
+
 # =============================================================================
 # GeoDataFrame tests
 # =============================================================================
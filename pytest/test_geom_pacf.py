@@ -98,3 +98,36 @@ class TestGeomPacf:
         fig = plot.draw()
 
         assert len(fig.data) == 3
+
+    @pytest.mark.parametrize('method', ['ywm', 'yw', 'ld', 'ldb'])
+    def test_native_methods_match_statsmodels(self, method):
+        """Test Durbin-Levinson PACF against statsmodels for each native method."""
+        from statsmodels.tsa.stattools import pacf
+
+        from ggplotly import stat_pacf
+
+        np.random.seed(0)
+        y = np.random.randn(150).cumsum()
+        expected = pacf(y, nlags=20, method=method)
+
+        result, _ = stat_pacf(mapping={'y': 'y'}, nlags=20, method=method).compute(pd.DataFrame({'y': y}))
+
+        np.testing.assert_allclose(result['pacf'], expected[1:], atol=1e-8)
+
+    def test_too_many_lags_raises(self):
+        """Test that nlags above half the sample size raises."""
+        df = pd.DataFrame({'value': np.random.randn(30)})
+
+        plot = ggplot(df, aes(y='value')) + geom_pacf(nlags=20)
+        with pytest.raises(ValueError, match="50% of the sample size"):
+            plot.draw()
+
+    def test_lags_just_below_half_the_sample(self):
+        """Test that nlags must stay strictly below half the sample size."""
+        df = pd.DataFrame({'value': np.random.randn(30)})
+
+        fig = (ggplot(df, aes(y='value')) + geom_pacf(nlags=14)).draw()
+        bar_trace = [t for t in fig.data if t.type == 'bar'][0]
+        assert bar_trace.x[-1] == 14
+        with pytest.raises(ValueError, match="must be < 15"):
+            (ggplot(df, aes(y='value')) + geom_pacf(nlags=15)).draw()
@@ -11,7 +11,7 @@ import pytest
 
 sys.path.insert(0, '/Users/ben/Projects/ggplotly')
 
-from ggplotly import aes, geom_range, ggplot, labs
+from ggplotly import aes, coord_flip, geom_range, ggplot, labs
 
 
 @pytest.fixture
@@ -103,6 +103,19 @@ class TestGeomRangeBasic:
         assert isinstance(fig, Figure)
 
 
+class TestGeomRangeCoordFlip:
+    """geom_range under coord_flip."""
+
+    def test_hover_data_keeps_its_shape(self, weekly_data):
+        p = ggplot(weekly_data, aes(x='date', y='value')) + geom_range()
+        traces = p.draw().data
+        flipped = (p + coord_flip()).draw()
+        for trace, flipped_trace in zip(traces, flipped.data):
+            if trace.customdata is not None:
+                assert np.shape(flipped_trace.customdata) == np.shape(trace.customdata)
+                assert np.shape(trace.customdata)[1] == 1
+
+
 class TestGeomRangeFrequency:
     """Tests for frequency handling."""
 
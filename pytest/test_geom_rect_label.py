@@ -8,9 +8,10 @@ Covers all four test categories:
 4. Visual regression tests
 """
 
+import numpy as np
 import pandas as pd
-import pytest
 
+import pytest
 from ggplotly import (
     aes,
     facet_grid,
@@ -22,7 +23,7 @@ from ggplotly import (
     geom_text,
     ggplot,
 )
-
+from ggplotly.label_layout import select_labels, text_extents
 
 # =============================================================================
 # GEOM_RECT TESTS
@@ -552,6 +553,66 @@ class TestGeomLabelIntegration:
         assert label_fig.layout.annotations[0].bgcolor is not None
 
 
+class TestLabelOverlap:
+    """Tests for check_overlap, priority and max_labels on geom_label and geom_text."""
+
+    @pytest.fixture
+    def dense(self):
+        rng = np.random.default_rng(5)
+        n = 2000
+        return pd.DataFrame({
+            "x": rng.normal(size=n), "y": rng.normal(size=n),
+            "name": [f"point {i}" for i in range(n)], "rank": rng.random(n),
+        })
+
+    def test_select_labels_skips_overlapping_boxes(self):
+        left = np.array([0.0, 5.0, 30.0, np.nan])
+        keep = select_labels(left, np.zeros(4), 20.0, 10.0)
+        assert keep.tolist() == [True, False, True, False]
+
+    def test_select_labels_priority_and_budget(self):
+        left = np.array([0.0, 5.0, 30.0, 60.0])
+        keep = select_labels(left, np.zeros(4), 20.0, 10.0, priority=[1, 2, 0, 3])
+        assert keep.tolist() == [False, True, True, True]
+        keep = select_labels(left, np.zeros(4), 20.0, 10.0, priority=[1, 2, 0, 3], max_labels=2)
+        assert keep.tolist() == [False, True, False, True]
+
+    def test_text_extents(self):
+        widths, heights = text_extents(pd.Series(["ab", "abcd<br>a"]), 10)
+        assert widths[1] == 2 * widths[0]
+        assert heights[1] == 2 * heights[0]
+
+    def test_label_check_overlap_thins_dense_labels(self, dense):
+        fig = (ggplot(dense, aes(x="x", y="y", label="name"))
+               + geom_label(check_overlap=True)).draw()
+        assert 0 < len(fig.layout.annotations) < len(dense) / 10
+
+    def test_label_priority_first(self, dense):
+        fig = (ggplot(dense, aes(x="x", y="y", label="name"))
+               + geom_label(check_overlap=True, priority="rank")).draw()
+        top = dense.loc[dense["rank"].idxmax(), "name"]
+        assert top in {a.text for a in fig.layout.annotations}
+
+    def test_label_max_labels(self, dense):
+        fig = (ggplot(dense, aes(x="x", y="y", label="name"))
+               + geom_label(max_labels=10, priority="rank")).draw()
+        expected = dense.nlargest(10, "rank")["name"]
+        assert sorted(a.text for a in fig.layout.annotations) == sorted(expected)
+
+    def test_text_check_overlap(self, dense):
+        fig = (ggplot(dense, aes(x="x", y="y", label="name"))
+               + geom_text(check_overlap=True)).draw()
+        assert 0 < len(fig.data[0].x) < len(dense) / 10
+
+    def test_label_keeps_earlier_annotations(self):
+        df = pd.DataFrame({"x": [1, 2], "y": [1, 2], "label": ["a", "b"], "f": ["u", "v"]})
+        fig = (ggplot(df, aes(x="x", y="y", label="label")) + geom_label()
+               + facet_wrap("f")).draw()
+        texts = [a.text for a in fig.layout.annotations]
+        assert "a" in texts and "b" in texts
+        assert {a.xref for a in fig.layout.annotations if a.text in ("a", "b")} == {"x", "x2"}
+
+
 # =============================================================================
 # VISUAL REGRESSION TESTS
 # =============================================================================
@@ -0,0 +1,96 @@
+# pytest/test_import_time.py
+"""
+Import-time benchmarks for ggplotly.
+
+Each check runs in a fresh interpreter so modules imported by other tests
+do not hide regressions.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("scipy", "sklearn", "statsmodels", "plotly.express")
+
+# Generous budget for the bare import, which should only build the lazy table
+IMPORT_BUDGET_SECONDS = 0.5
+
+
+def _run(code):
+    """Run code in a fresh interpreter and return its stdout."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def _loaded_heavy_modules(code):
+    """Return the heavy modules loaded after running code."""
+    out = _run(
+        "import sys\n"
+        f"{code}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    return [m for m in out.split(",") if m]
+
+
+class TestImportTime:
+    def test_bare_import_is_fast(self):
+        elapsed = float(_run(
+            "import time\n"
+            "start = time.perf_counter()\n"
+            "import ggplotly\n"
+            "print(time.perf_counter() - start)"
+        ))
+        assert elapsed < IMPORT_BUDGET_SECONDS
+
+    def test_bare_import_loads_no_submodules(self):
+        out = _run(
+            "import sys\n"
+            "import ggplotly\n"
+            "print(sorted(m for m in sys.modules if m.startswith('ggplotly.')))"
+        )
+        assert out == "[]"
+
+    def test_simple_plot_skips_heavy_dependencies(self):
+        code = (
+            "import pandas as pd\n"
+            "from ggplotly import aes, geom_bar, geom_point, ggplot\n"
+            "df = pd.DataFrame({'x': list('abca'), 'y': [1, 2, 3, 4]})\n"
+            "(ggplot(df, aes('x')) + geom_bar()).draw()\n"
+            "(ggplot(df, aes('x', 'y')) + geom_point()).draw()"
+        )
+        assert _loaded_heavy_modules(code) == []
+
+    @pytest.mark.parametrize("name, module", [
+        ("geom_smooth", "statsmodels"),
+        ("geom_contour", "scipy"),
+        ("geom_density", "scipy"),
+        ("stat_smooth", "sklearn"),
+    ])
+    def test_heavy_dependency_deferred_to_first_use(self, name, module):
+        assert module not in _loaded_heavy_modules(f"from ggplotly import {name}")
+
+
+class TestLazyExports:
+    def test_all_names_resolve(self):
+        import ggplotly
+
+        for name in ggplotly.__all__:
+            assert getattr(ggplotly, name) is not None
+
+    def test_names_not_shadowed_by_submodules(self):
+        import ggplotly
+        import ggplotly.aes
+        import ggplotly.layer  # noqa: F401
+
+        assert isinstance(ggplotly.ggplot, type)
+        assert isinstance(ggplotly.aes, type)
+        assert not isinstance(ggplotly.layer, type(sys))
+
+    def test_unknown_name_raises(self):
+        import ggplotly
+
+        with pytest.raises(AttributeError):
+            ggplotly.not_a_real_name  # noqa: B018
@@ -429,6 +429,60 @@ class TestStatBin:
         # Should only count 4 values
         assert result['count'].sum() == 4
 
+    def test_stat_bin_weight(self):
+        """Test that a mapped weight sums weights instead of counting rows."""
+        from ggplotly.stats.stat_bin import stat_bin
+        stat = stat_bin(mapping={'x': 'value', 'weight': 'w'}, breaks=[0, 5, 10])
+        data = pd.DataFrame({'value': [1, 2, 6, 10], 'w': [0.5, 1.5, 2.0, 4.0]})
+        result = stat.compute(data)
+        assert list(result['count']) == [2.0, 6.0]
+        assert np.isclose((result['density'] * result['width']).sum(), 1.0)
+
+
+class TestStatBinGrouped:
+    """Test the one-pass grouped binning used by geom_histogram."""
+
+    @pytest.fixture
+    def grouped_data(self):
+        rng = np.random.default_rng(3)
+        return pd.DataFrame({
+            'value': rng.normal(size=2000),
+            'g': rng.choice(['a', 'b', 'c'], 2000),
+            'w': rng.random(2000),
+        })
+
+    @pytest.mark.parametrize('closed', ['right', 'left'])
+    def test_matches_per_group_compute(self, grouped_data, closed):
+        """Each group's rows equal stat_bin.compute on that group with shared breaks."""
+        from ggplotly.stats.stat_bin import stat_bin
+        stat = stat_bin(mapping={'x': 'value'}, bins=12, closed=closed)
+        result = stat.compute_grouped(grouped_data, 'g')
+
+        breaks = np.r_[result.loc[result.g == 'a', 'xmin'], result['xmax'].iloc[-1]]
+        assert list(result['g'].unique()) == list(grouped_data['g'].unique())
+        for group, rows in result.groupby('g', sort=False):
+            subset = grouped_data[grouped_data.g == group]
+            expected = stat_bin(mapping={'x': 'value'}, breaks=breaks, closed=closed).compute(subset)
+            pd.testing.assert_frame_equal(
+                rows.drop(columns='g').reset_index(drop=True), expected, check_dtype=False
+            )
+
+    def test_weights(self, grouped_data):
+        from ggplotly.stats.stat_bin import stat_bin
+        stat = stat_bin(mapping={'x': 'value', 'weight': 'w'})
+        result = stat.compute_grouped(grouped_data, 'g')
+
+        totals = result.groupby('g')['count'].sum()
+        expected = grouped_data.groupby('g')['w'].sum()
+        assert np.allclose(totals.sort_index(), expected.sort_index())
+
+    def test_geom_histogram_weight_aesthetic(self, grouped_data):
+        from ggplotly import aes, geom_histogram, ggplot
+        fig = (ggplot(grouped_data, aes(x='value', fill='g', weight='w'))
+               + geom_histogram(bins=10)).draw()
+
+        assert np.isclose(sum(sum(trace.y) for trace in fig.data), grouped_data['w'].sum())
+
 
 # =============================================================================
 # Integration Tests
@@ -0,0 +1,144 @@
+import base64
+import struct
+import zlib
+
+import numpy as np
+import pandas as pd
+
+import pytest
+from ggplotly import (
+    aes,
+    facet_wrap,
+    geom_point,
+    geom_raster_points,
+    ggplot,
+    ggsize,
+    rasterize,
+)
+from ggplotly.rasterize import aggregate, blend_categories, panel_pixels, png_data_uri
+
+
+@pytest.fixture
+def cloud():
+    rng = np.random.default_rng(8)
+    n = 20000
+    return pd.DataFrame({
+        'x': rng.normal(size=n),
+        'y': rng.normal(size=n),
+        'v': rng.random(n),
+        'species': rng.choice(['a', 'b', 'c'], n),
+    })
+
+
+def _decode_png(uri):
+    png = base64.b64decode(uri.split(',', 1)[1])
+    width, height = struct.unpack('>II', png[16:24])
+    idat = png[png.index(b'IDAT') + 4:png.index(b'IEND') - 8]
+    raw = np.frombuffer(zlib.decompress(idat), dtype=np.uint8).reshape(height, -1)
+    return raw[:, 1:].reshape(height, width, 4)
+
+
+class TestAggregate:
+    """Tests for the pixel reductions."""
+
+    def test_count_matches_histogram2d(self, cloud):
+        x, y = cloud['x'].to_numpy(), cloud['y'].to_numpy()
+        extent = (x.min(), x.max(), y.min(), y.max())
+        grid = aggregate(x, y, extent, (40, 30))
+
+        expected, _, _ = np.histogram2d(y, x, bins=(30, 40), range=[extent[2:], extent[:2]])
+        np.testing.assert_array_equal(np.nan_to_num(grid), expected)
+        assert np.isnan(grid[expected == 0]).all()
+
+    @pytest.mark.parametrize('how', ['sum', 'mean', 'min', 'max'])
+    def test_value_reductions(self, how):
+        x = np.array([0.0, 0.1, 0.9, 1.0])
+        y = np.array([0.0, 0.1, 0.9, 1.0])
+        v = np.array([1.0, 3.0, 5.0, 7.0])
+        grid = aggregate(x, y, (0, 1, 0, 1), (2, 2), v, how)
+
+        expected = {'sum': (4, 12), 'mean': (2, 6), 'min': (1, 5), 'max': (3, 7)}[how]
+        assert grid[0, 0] == expected[0]
+        assert grid[1, 1] == expected[1]
+        assert np.isnan(grid[0, 1]) and np.isnan(grid[1, 0])
+
+    def test_any(self):
+        grid = aggregate(np.array([0.0, 0.2]), np.array([0.0, 0.2]), (0, 1, 0, 1), (2, 2), how='any')
+        assert grid[0, 0] == 1
+        assert np.isnan(grid).sum() == 3
+
+    def test_errors(self):
+        x = np.zeros(3)
+        with pytest.raises(ValueError, match='reduce'):
+            aggregate(x, x, (0, 1, 0, 1), (2, 2), how='median')
+        with pytest.raises(ValueError, match='numeric color'):
+            aggregate(x, x, (0, 1, 0, 1), (2, 2), how='mean')
+        with pytest.raises(ValueError, match='engine'):
+            aggregate(x, x, (0, 1, 0, 1), (2, 2), engine='cuda')
+
+    def test_blend_categories(self):
+        x = np.array([0.1, 0.1, 0.1, 0.9])
+        y = np.array([0.1, 0.1, 0.1, 0.9])
+        colors = np.array([[255, 0, 0], [0, 0, 255]])
+        image = blend_categories(x, y, np.array([0, 0, 1, 1]), colors, (0, 1, 0, 1), (2, 2))
+
+        np.testing.assert_array_equal(image[0, 0, :3], [170, 0, 85])
+        np.testing.assert_array_equal(image[1, 1, :3], [0, 0, 255])
+        assert image[0, 0, 3] == 255
+        assert image[1, 1, 3] < image[0, 0, 3]
+        assert image[0, 1, 3] == 0
+
+    def test_png_round_trip(self):
+        image = np.random.default_rng(1).integers(0, 256, (5, 7, 4), dtype=np.uint8)
+        np.testing.assert_array_equal(_decode_png(png_data_uri(image)), image)
+
+
+class TestRasterPoints:
+    """Tests for geom_point(raster=True) and geom_raster_points."""
+
+    def test_grid_sized_from_ggsize(self, cloud):
+        fig = (ggplot(cloud, aes(x='x', y='y')) + geom_point(raster=True) + ggsize(600, 400)).draw()
+        assert [trace.type for trace in fig.data] == ['heatmap']
+        z = np.asarray(fig.data[0].z, dtype=float)
+        width, height = panel_pixels(fig, 1, 1, (600, 400))
+        assert z.shape == (round(height), round(width))
+        assert np.nansum(z) == len(cloud)
+
+    def test_numeric_color_is_reduced(self, cloud):
+        fig = (ggplot(cloud, aes(x='x', y='y', color='v'))
+               + geom_raster_points(reduce='max', pixels=(20, 10))).draw()
+        z = np.asarray(fig.data[0].z, dtype=float)
+        assert z.shape == (10, 20)
+        assert np.nanmax(z) == cloud['v'].max()
+
+    def test_categorical_color_blends_into_image(self, cloud):
+        fig = (ggplot(cloud, aes(x='x', y='y', color='species'))
+               + geom_raster_points(pixels=(50, 40))).draw()
+        assert [trace.type for trace in fig.data] == ['image', 'scatter', 'scatter', 'scatter']
+        image = _decode_png(fig.data[0].source)
+        assert image.shape == (40, 50, 4)
+        assert fig.layout.yaxis.autorange is True
+        assert sorted(trace.name for trace in fig.data[1:]) == ['a', 'b', 'c']
+
+    def test_facets_show_each_legend_entry_once(self, cloud):
+        fig = (ggplot(cloud, aes(x='x', y='y', color='species')) + geom_raster_points()
+               + facet_wrap('species')).draw()
+        legend = [trace.name for trace in fig.data if trace.type == 'scatter' and trace.showlegend]
+        assert sorted(legend) == ['a', 'b', 'c']
+
+    def test_facets_reduce_numeric_color(self, cloud):
+        fig = (ggplot(cloud, aes(x='x', y='y', color='v'))
+               + geom_raster_points(reduce='max', pixels=(20, 10)) + facet_wrap('species')).draw()
+        assert [trace.type for trace in fig.data] == ['heatmap'] * 3
+        assert max(np.nanmax(np.asarray(trace.z, dtype=float)) for trace in fig.data) == cloud['v'].max()
+
+    def test_too_many_categories(self, cloud, monkeypatch):
+        monkeypatch.setattr(rasterize, 'max_categories', 2)
+        with pytest.raises(ValueError, match='at most 2 color categories'):
+            (ggplot(cloud, aes(x='x', y='y', color='species')) + geom_raster_points()).draw()
+
+    def test_datetime_axis(self):
+        df = pd.DataFrame({'t': pd.date_range('2024-01-01', periods=500, freq='h'),
+                           'y': np.arange(500.0)})
+        fig = (ggplot(df, aes(x='t', y='y')) + geom_raster_points(pixels=(10, 10))).draw()
+        assert pd.Timestamp(fig.data[0].x[0]) > pd.Timestamp('2024-01-01')
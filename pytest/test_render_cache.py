@@ -0,0 +1,106 @@
+# pytest/test_render_cache.py
+"""Tests for the per-plot render cache behind ggplot.draw()."""
+
+import numpy as np
+import pandas as pd
+
+import pytest
+from ggplotly import (
+    aes,
+    facet_wrap,
+    geom_point,
+    ggplot,
+    labs,
+    render_cache,
+    theme_minimal,
+)
+
+
+@pytest.fixture
+def df():
+    np.random.seed(0)
+    return pd.DataFrame({
+        'x': np.random.randn(50),
+        'y': np.random.randn(50),
+        'g': np.random.choice(['a', 'b'], 50),
+    })
+
+
+@pytest.fixture(autouse=True)
+def fresh_counters():
+    render_cache.reset_counters()
+    yield
+    render_cache.enabled = True
+
+
+class TestRenderCache:
+    def test_second_draw_is_hit(self, df):
+        p = ggplot(df, aes('x', 'y')) + geom_point()
+        fig = p.draw()
+
+        assert p.draw() is fig
+        assert render_cache.cache_info() == (1, 1, True)
+
+    def test_repr_methods_share_one_draw(self, df):
+        p = ggplot(df, aes('x', 'y', color='g')) + geom_point() + facet_wrap('g')
+        p._repr_html_()
+        p._repr_mimebundle_()
+
+        assert render_cache.cache_info().misses == 1
+        assert render_cache.cache_info().hits == 1
+
+    def test_add_invalidates(self, df):
+        p = ggplot(df, aes('x', 'y')) + geom_point()
+        fig = p.draw()
+
+        q = p + labs(title='Title')
+        assert q.draw() is not fig
+        assert q.draw().layout.title.text == 'Title'
+
+    def test_param_change_invalidates(self, df):
+        p = ggplot(df, aes('x', 'y')) + geom_point()
+        fig = p.draw()
+
+        p.layers[0].params['size'] = 12
+        assert p.draw() is not fig
+
+    def test_in_place_data_change_invalidates(self, df):
+        p = ggplot(df, aes('x', 'y')) + geom_point()
+        p.draw()
+
+        p.layers[0].data.loc[0, 'y'] = 100.0
+        assert p.draw().data[0].y[0] == 100.0
+
+    def test_theme_change_invalidates(self, df):
+        p = ggplot(df, aes('x', 'y')) + geom_point()
+        fig = p.draw()
+
+        p.theme = theme_minimal()
+        assert p.draw() is not fig
+
+    def test_disabled_always_rebuilds(self, df):
+        render_cache.enabled = False
+        p = ggplot(df, aes('x', 'y')) + geom_point()
+        fig = p.draw()
+
+        assert p.draw() is not fig
+        assert render_cache.cache_info() == (0, 0, False)
+
+
+class TestFingerprint:
+    def test_equal_frames_match(self, df):
+        assert render_cache.fingerprint(df) == render_cache.fingerprint(df.copy())
+
+    def test_dtype_change_differs(self, df):
+        changed = df.astype({'x': 'float32'})
+        assert render_cache.fingerprint(df) != render_cache.fingerprint(changed)
+
+    def test_distinct_functions_differ(self):
+        assert render_cache.fingerprint({'f': lambda x: x}) != render_cache.fingerprint({'f': lambda x: x})
+
+    def test_derived_color_maps_are_skipped(self, df):
+        point = geom_point()
+        key = render_cache.fingerprint(point)
+        point._global_color_map = {value: 'red' for value in df['x']}
+        point._global_shape_map = {'a': 'circle'}
+        assert render_cache.fingerprint(point) == key
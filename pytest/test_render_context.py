@@ -0,0 +1,89 @@
+# pytest/test_render_context.py
+"""Tests for the render context shared by the geoms, facets and coords of a draw."""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from ggplotly import (
+    aes,
+    coord_flip,
+    facet_wrap,
+    figure_builder,
+    geom_histogram,
+    geom_point,
+    ggplot,
+)
+from ggplotly.render_context import RenderContext
+
+
+class TestRenderContext:
+    def test_of_attaches_one_context(self):
+        fig = go.Figure()
+        context = RenderContext.of(fig)
+        assert RenderContext.of(fig) is context
+
+        other = RenderContext()
+        assert RenderContext.of(fig, other) is other
+        assert RenderContext.of(fig) is other
+
+    def test_reads_traces_added_since_last_query(self):
+        fig = go.Figure()
+        context = RenderContext.of(fig)
+        assert not context.is_geo
+
+        fig.add_trace(go.Bar(x=[1], y=[1]))
+        assert context.trace_types == {'bar'}
+        fig.add_trace(go.Scattergeo(lon=[0], lat=[0]))
+        assert context.is_geo and not context.is_map
+
+        # Replaced traces are read again
+        fig.data = []
+        fig.add_trace(go.Scattermap(lon=[0], lat=[0]))
+        assert context.trace_types == {'scattermap'}
+        assert context.is_map
+
+    def test_deferred_traces_are_recorded(self):
+        fig = make_subplots(rows=1, cols=2)
+        with figure_builder.deferred():
+            figure_builder.add_trace(fig, go.Scattergeo, lon=[0], lat=[0])
+        assert not fig.data
+        assert RenderContext.of(fig).is_geo
+
+    def test_new_figure_is_read_from_scratch(self):
+        context = RenderContext()
+        first = go.Figure(go.Bar(x=[1], y=[1]))
+        assert RenderContext.of(first, context).trace_types == {'bar'}
+        second = go.Figure(go.Scatter(x=[1], y=[1]))
+        assert RenderContext.of(second, context).trace_types == {'scatter'}
+
+    def test_show_legend_once(self):
+        context = RenderContext()
+        assert context.show_legend('a')
+        assert not context.show_legend('a')
+        assert context.show_legend('b')
+
+    def test_axis_refs(self):
+        context = RenderContext.of(make_subplots(rows=2, cols=2))
+        assert context.axis_refs(2, 1) == {'xaxis': 'x3', 'yaxis': 'y3'}
+        assert context.axis_refs(None, None) == {}
+        assert context.axis_refs(3, 1) is None
+
+
+class TestDraw:
+    def test_context_records_the_plot(self):
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [3, 1, 2]})
+        p = ggplot(df, aes('x', 'y')) + geom_point() + coord_flip()
+        context = RenderContext.of(p.draw())
+        assert context.has_coord(coord_flip)
+        assert context.trace_types == {'scatter'}
+
+    def test_legend_entries_once_across_layers_and_panels(self):
+        rng = np.random.default_rng(3)
+        df = pd.DataFrame({'x': rng.normal(size=60), 'g': rng.choice(['a', 'b'], 60),
+                           'f': rng.choice(['u', 'v'], 60)})
+        fig = (ggplot(df, aes(x='x', fill='g')) + geom_histogram(bins=5)
+               + facet_wrap('f')).draw()
+        shown = sorted(t.name for t in fig.data if t.showlegend)
+        assert shown == ['a', 'b']
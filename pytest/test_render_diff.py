@@ -0,0 +1,127 @@
+# pytest/test_render_diff.py
+"""Tests for incremental draws and figure patches."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+import pytest
+from ggplotly import (
+    aes,
+    geom_hline,
+    geom_line,
+    geom_point,
+    ggplot,
+    render_cache,
+    render_diff,
+    serialize,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_cache():
+    render_cache.enabled = False
+    yield
+    render_cache.enabled = True
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(5)
+    return pd.DataFrame({
+        'x': rng.normal(size=100),
+        'y': rng.normal(size=100),
+        'g': rng.choice(['a', 'b', 'c'], 100),
+    })
+
+
+@pytest.fixture
+def trend():
+    return pd.DataFrame({'x': [-2.0, 2.0], 'y': [-1.0, 1.0]})
+
+
+def _plot(data, trend):
+    return (ggplot(data, aes('x', 'y', color='g')) + geom_point()
+            + geom_line(data=trend, mapping=aes('x', 'y'), color='red')
+            + geom_hline(yintercept=0))
+
+
+class TestIncrementalDraw:
+    def test_unchanged_layers_are_reused(self, df, trend):
+        p = _plot(df, trend)
+        first = p.draw(incremental=True)
+        assert render_diff.layer_cache(first).reused == 0
+
+        second = p.draw(incremental=True)
+        assert render_diff.layer_cache(second).reused == 3
+        assert second.to_dict() == first.to_dict()
+        # Reused traces are copies; changing the new figure keeps the cache intact
+        second.data[0].marker.color = 'black'
+        assert p.draw(incremental=True).to_dict() == first.to_dict()
+
+    def test_only_changed_layers_are_drawn(self, df, trend):
+        fig = _plot(df, trend).draw(incremental=True)
+        p = _plot(df[df['g'] != 'a'], trend)
+        fig = p.diff(fig).figure
+
+        # The points changed, as did the plot data geom_hline inherits; the
+        # trend line is reused
+        assert render_diff.layer_cache(fig).reused == 1
+        assert fig.to_dict() == _plot(df[df['g'] != 'a'], trend).draw().to_dict()
+
+    def test_figures_drawn_without_cache_draw_every_layer(self, df, trend):
+        fig = _plot(df, trend).draw()
+        assert render_diff.layer_cache(fig) is None
+        patch = _plot(df, trend).diff(fig)
+        assert render_diff.layer_cache(patch.figure).reused == 0
+
+
+class TestDiff:
+    def test_unchanged_plot_has_empty_patch(self, df, trend):
+        fig = _plot(df, trend).draw(incremental=True)
+        patch = _plot(df, trend).diff(fig)
+        assert patch.restyle == patch.extend == patch.add == patch.delete == []
+        assert patch.relayout == {}
+
+    def test_restyle_add_and_delete(self, df, trend):
+        fig = _plot(df, trend).draw(incremental=True)
+        patch = _plot(df[df['g'] != 'a'], trend).diff(fig)
+        # Traces b, c, a, Line become b, c, Line
+        assert patch.delete == [3]
+        assert patch.add == []
+        (update, indices), = patch.restyle
+        assert indices == [2]
+        assert update['name'] == ['Line']
+        np.testing.assert_array_equal(update['x'][0], trend['x'])
+
+        widget = go.Figure(fig)
+        render_diff.apply_patch(widget, patch)
+        assert widget.to_dict() == patch.figure.to_dict()
+
+    def test_appended_rows_extend_traces(self):
+        rows = pd.DataFrame({'t': np.arange(10.0), 'v': np.arange(10.0) ** 2})
+        fig = (ggplot(rows.iloc[:6], aes('t', 'v')) + geom_line()).draw()
+        patch = (ggplot(rows, aes('t', 'v')) + geom_line()).diff(fig)
+
+        assert patch.restyle == []
+        (update, indices, max_points), = patch.extend
+        assert indices == [0] and max_points is None
+        np.testing.assert_array_equal(update['x'][0], [6, 7, 8, 9])
+        np.testing.assert_array_equal(update['y'][0], [36, 49, 64, 81])
+
+        render_diff.apply_patch(fig, patch)
+        np.testing.assert_array_equal(fig.data[0].y, rows['v'])
+
+    def test_figure_dict_and_relayout(self, df, trend):
+        previous = _plot(df, trend).draw().to_dict()
+        patch = (_plot(df, trend) + geom_hline(yintercept=1)).diff(previous)
+        assert list(patch.relayout) == ['shapes']
+        assert len(patch.relayout['shapes']) == 2
+
+        # Arrays of figure dicts and JSON are typed array specs
+        fig = _plot(df, trend).draw()
+        for previous in (json.loads(fig.to_json()), serialize.figure_dict(fig)):
+            patch = _plot(df, trend).diff(previous)
+            assert patch.restyle == [] and patch.extend == [] and patch.relayout == {}
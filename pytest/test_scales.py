@@ -571,3 +571,58 @@ class TestContinuousColorMapping:
         # Should be 1 trace with colorscale (continuous)
         assert len(fig.data) == 1, f"Expected 1 trace for continuous, got {len(fig.data)}"
         assert fig.data[0].marker.colorscale is not None
+
+
+class TestScaleTraining:
+    """Tests for training scales on every layer before the figure is built."""
+
+    def test_size_range_trained_across_layers(self):
+        """Sizes of all layers are rescaled with one shared range."""
+        low = pd.DataFrame({'x': [1, 2], 'y': [1, 2], 'w': [0.0, 1.0]})
+        high = pd.DataFrame({'x': [1, 2], 'y': [1, 2], 'w': [9.0, 10.0]})
+        p = (ggplot(low, aes(x='x', y='y', size='w')) + geom_point()
+             + geom_point(data=high) + scale_size(range=(2, 12)))
+        fig = p.draw()
+
+        np.testing.assert_allclose(fig.data[0].marker.size, [2, 3])
+        np.testing.assert_allclose(fig.data[1].marker.size, [11, 12])
+
+    def test_sqrt_transforms_every_trace(self):
+        """trans='sqrt' transforms all traces, with negative values as gaps."""
+        df = pd.DataFrame({'x': [0, 1, 2, 3], 'y': [4.0, 9.0, -1.0, 16.0],
+                           'g': ['a', 'a', 'b', 'b']})
+        fig = (ggplot(df, aes(x='x', y='y', color='g')) + geom_point()
+               + scale_y_continuous(trans='sqrt')).draw()
+
+        np.testing.assert_allclose(fig.data[0].y, [2, 3])
+        assert np.isnan(fig.data[1].y[0]) and fig.data[1].y[1] == 4
+
+    def test_registry_trains_before_mapping(self):
+        """Every scale is trained before any is mapped."""
+        calls = []
+
+        class Recorder(scale_size):
+            def train(self, traces):
+                calls.append(('train', len(traces)))
+
+            def map(self, traces):
+                calls.append(('map', len(traces)))
+
+        df = pd.DataFrame({'x': [1, 2], 'y': [1, 2], 'g': ['a', 'b']})
+        (ggplot(df, aes(x='x', y='y', color='g')) + geom_point() + Recorder()).draw()
+        assert calls == [('train', 2), ('map', 2)]
+
+    def test_apply_maps_a_figure_not_drawn_by_the_plot(self):
+        """scale.apply() still maps traces of any figure."""
+        fig = Figure()
+        fig.add_scatter(x=[1], y=[1], name='a')
+        fig.add_scatter(x=[2], y=[2], name='b')
+        scale_color_manual({'a': 'red', 'b': 'blue'}).apply(fig)
+        assert [t.marker.color for t in fig.data] == ['red', 'blue']
+
+    def test_drawn_figure_is_not_mapped_twice(self):
+        """Scales mapped during draw() are skipped when the figure is styled."""
+        df = pd.DataFrame({'x': [1, 4], 'y': [1, 2]})
+        fig = (ggplot(df, aes(x='x', y='y')) + geom_point()
+               + scale_x_continuous(trans='sqrt')).draw()
+        np.testing.assert_allclose(fig.data[0].x, [1, 2])
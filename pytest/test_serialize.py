@@ -0,0 +1,174 @@
+import base64
+import json
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+import pytest
+from ggplotly import aes, geom_bin2d, geom_point, geom_text, ggplot, ggsave, serialize
+from ggplotly.serialize import compact_array, figure_dict, to_json
+
+
+def _decode(spec):
+    dtypes = {'f8': 'float64', 'f4': 'float32', 'i1': 'int8', 'u1': 'uint8',
+              'i2': 'int16', 'u2': 'uint16', 'i4': 'int32', 'u4': 'uint32'}
+    return np.frombuffer(base64.b64decode(spec['bdata']), dtype=dtypes[spec['dtype']])
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(2)
+    return pd.DataFrame({'x': rng.normal(size=500), 'y': rng.normal(size=500),
+                         'n': rng.integers(0, 1000, 500)})
+
+
+class TestCompactArray:
+    """Tests for compact_array."""
+
+    def test_integral_floats_become_small_ints(self):
+        assert compact_array(np.array([1.0, 2.0, 300.0])).dtype == np.int16
+        assert compact_array([0, 255]).dtype == np.uint8
+
+    def test_exact_float32(self):
+        assert compact_array(np.array([0.5, np.nan, 1.25])).dtype == np.float32
+        assert compact_array(np.array([0.1, 0.2])).dtype == np.float64
+
+    def test_float32_precision(self):
+        compact = compact_array(np.array([0.1, 0.2]), precision='float32')
+        assert compact.dtype == np.float32
+        np.testing.assert_allclose(compact, [0.1, 0.2], rtol=1e-7)
+        assert compact_array(np.array([1e300, 0.1]), precision='float32').dtype == np.float64
+
+    def test_non_numeric(self):
+        assert compact_array(['1', '2']) is None
+        assert compact_array([True, False]) is None
+        assert compact_array([1, 'a']) is None
+        assert compact_array([]) is None
+
+    def test_lists_with_gaps(self):
+        compact = compact_array([1.5, None, 2.5])
+        assert compact.dtype == np.float32
+        assert np.isnan(compact[1])
+
+
+class TestFigureSerialization:
+    """Tests for compact figure JSON."""
+
+    def test_round_trip(self, points):
+        fig = (ggplot(points, aes(x='x', y='y', size='n')) + geom_point()).draw()
+        restored = pio.from_json(to_json(fig))
+        trace = restored.to_dict()['data'][0]
+        np.testing.assert_array_equal(_decode(trace['x']), points['x'])
+        assert trace['marker']['size']['dtype'] in ('i2', 'u2')
+
+    def test_list_arrays_are_encoded(self):
+        fig = go.Figure(go.Scatter(x=[1, 2, 3], y=[1.5, None, 2.5], text=['a', 'b', 'c'],
+                                   marker=dict(color=['red', 'blue', 'red'])))
+        trace = figure_dict(fig)['data'][0]
+        assert trace['x']['dtype'] == 'i1'
+        assert trace['y']['dtype'] == 'f4'
+        assert trace['text'] == ['a', 'b', 'c']
+        assert trace['marker']['color'] == ['red', 'blue', 'red']
+
+    def test_heatmap_keeps_shape(self, points):
+        fig = (ggplot(points, aes(x='x', y='y')) + geom_bin2d(bins=(6, 4))).draw()
+        z = figure_dict(fig)['data'][0]['z']
+        assert z['shape'] == '4, 6'
+        assert z['dtype'] == 'f4'
+        np.testing.assert_array_equal(serialize.decode_array(z), np.asarray(fig.data[0].z))
+
+    def test_float32_halves_float_arrays(self, points):
+        fig = (ggplot(points, aes(x='x', y='y')) + geom_point()).draw()
+        trace = figure_dict(fig, precision='float32')['data'][0]
+        assert trace['x']['dtype'] == 'f4'
+        assert len(to_json(fig, precision='float32')) < len(to_json(fig))
+
+    def test_invalid_precision(self, points):
+        fig = (ggplot(points, aes(x='x', y='y')) + geom_point()).draw()
+        with pytest.raises(ValueError, match='precision'):
+            to_json(fig, precision='float16')
+
+    def test_does_not_modify_figure(self, points):
+        fig = (ggplot(points, aes(x='x', y='y')) + geom_point()).draw()
+        to_json(fig, precision='float32')
+        assert fig.data[0].x.dtype == np.float64
+
+    def test_plain_dict_without_typed_arrays(self, points, monkeypatch):
+        # plotly 5 has no typed array helpers
+        monkeypatch.setattr(serialize, 'to_typed_array_spec', None)
+        fig = (ggplot(points, aes(x='x', y='y')) + geom_point()).draw()
+        assert figure_dict(fig) == fig.to_dict()
+        assert pio.from_json(to_json(fig)).data[0].type == 'scatter'
+
+
+class TestSave:
+    """Tests for saving compact HTML and JSON files."""
+
+    def test_save_json(self, points, tmp_path):
+        plot = ggplot(points, aes(x='x', y='y')) + geom_point()
+        plot.draw()
+        path = tmp_path / 'plot.txt'
+        plot.save(str(path), format='json', precision='float32')
+        data = json.loads(path.read_text())
+        assert data['data'][0]['x']['dtype'] == 'f4'
+
+    def test_save_html(self, points, tmp_path):
+        plot = ggplot(points, aes(x='x', y='y')) + geom_point()
+        plot.draw()
+        path = tmp_path / 'plot.html'
+        plot.save(str(path))
+        assert '"bdata"' in path.read_text()
+
+    def test_to_json_and_ggsave(self, points, tmp_path):
+        plot = ggplot(points, aes(x='x', y='y')) + geom_point()
+        assert json.loads(plot.to_json())['data'][0]['type'] == 'scatter'
+        path = tmp_path / 'plot.json'
+        ggsave(str(path)).apply(plot)
+        assert json.loads(path.read_text())['data'][0]['x']['dtype'] == 'f8'
+
+    def test_unsupported_format(self, points, tmp_path):
+        plot = ggplot(points, aes(x='x', y='y')) + geom_point()
+        plot.draw()
+        with pytest.raises(ValueError, match='Unsupported'):
+            plot.save(str(tmp_path / 'plot.svgz'))
+
+
+class TestNotebookDisplay:
+    """Tests for _repr_html_ and _repr_mimebundle_."""
+
+    @pytest.fixture
+    def renderer(self, monkeypatch):
+        """Sets the default Plotly renderer for one test."""
+        def set_default(name):
+            monkeypatch.setattr(pio.renderers, 'default', name)
+        return set_default
+
+    def test_bundle_holds_compact_arrays(self, points, renderer):
+        renderer('plotly_mimetype+notebook_connected')
+        plot = ggplot(points, aes(x='x', y='y')) + geom_point()
+        bundle = plot._repr_mimebundle_()
+        trace = bundle['application/vnd.plotly.v1+json']['data'][0]
+        assert trace['x'] == figure_dict(plot.draw())['data'][0]['x']
+        assert '"x":{"dtype":"f8","bdata":' in bundle['text/html']
+        assert '"x":{"dtype":"f8","bdata":' in plot._repr_html_()
+
+    def test_configured_renderer(self, points, renderer):
+        plot = ggplot(points, aes(x='x', y='y')) + geom_point()
+        renderer('notebook')
+        bundle = plot._repr_mimebundle_()
+        assert list(bundle) == ['text/html']
+        # The renderer loads Plotly.js into offline kernels itself
+        assert 'cdn.plot.ly' not in bundle['text/html']
+        assert '"x":{"dtype":"f8","bdata":' in bundle['text/html']
+
+        renderer('json')
+        bundle = plot._repr_mimebundle_()
+        assert bundle['application/json']['data'][0]['x'] == figure_dict(plot.draw())['data'][0]['x']
+
+    def test_latex_is_html_only(self, points):
+        plot = ggplot(points.assign(label='$x$'), aes(x='x', y='y', label='label')) + geom_text(parse=True)
+        bundle = plot._repr_mimebundle_()
+        assert list(bundle) == ['text/html']
+        assert 'mathjax' in bundle['text/html'].lower()
@@ -0,0 +1,189 @@
+import numpy as np
+import pandas as pd
+
+import pytest
+from ggplotly import (
+    aes,
+    coord_flip,
+    facet_wrap,
+    geom_bin2d,
+    geom_hex,
+    geom_smooth,
+    ggplot,
+    ggsize,
+    scale_fill_gradient,
+    stat_bin_2d,
+    stat_binhex,
+)
+from ggplotly.stats.stat_binhex import SQRT3, hex_centers
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(11)
+    n = 5000
+    return pd.DataFrame({
+        'x': rng.normal(size=n),
+        'y': rng.normal(size=n),
+        'z': rng.random(n),
+        'w': rng.integers(1, 4, n).astype(float),
+        'panel': rng.choice(['a', 'b'], n),
+    })
+
+
+class TestStatBin2d:
+    """Tests for stat_bin_2d."""
+
+    def test_counts_match_histogram2d(self, points):
+        tf, mapping = stat_bin_2d(mapping={'x': 'x', 'y': 'y'}, bins=20, drop=False).compute(points)
+
+        expected, _, _ = np.histogram2d(points['x'], points['y'], bins=20)
+        np.testing.assert_array_equal(tf['count'].to_numpy(), expected.ravel())
+        assert mapping['fill'] == 'value'
+        assert tf['count'].sum() == len(points)
+
+    def test_drop_keeps_occupied_bins(self, points):
+        tf, _ = stat_bin_2d(mapping={'x': 'x', 'y': 'y'}, bins=20).compute(points)
+        assert (tf['count'] > 0).all()
+        assert tf['count'].sum() == len(points)
+
+    def test_weights(self, points):
+        tf, _ = stat_bin_2d(mapping={'x': 'x', 'y': 'y', 'weight': 'w'}, bins=10,
+                            drop=False).compute(points)
+
+        expected, _, _ = np.histogram2d(points['x'], points['y'], bins=10, weights=points['w'])
+        np.testing.assert_allclose(tf['count'].to_numpy(), expected.ravel())
+
+    @pytest.mark.parametrize('fun', ['sum', 'mean', 'min', 'max', 'median'])
+    def test_summaries_match_groupby(self, points, fun):
+        stat = stat_bin_2d(mapping={'x': 'x', 'y': 'y', 'z': 'z'}, bins=8, fun=fun)
+        tf, mapping = stat.compute(points)
+
+        x_bin = np.clip(np.floor((points['x'] - points['x'].min()) / tf['width'].iloc[0]), 0, 7)
+        y_bin = np.clip(np.floor((points['y'] - points['y'].min()) / tf['height'].iloc[0]), 0, 7)
+        expected = points['z'].groupby([x_bin, y_bin]).agg(fun)
+        np.testing.assert_allclose(tf['value'].to_numpy(), expected.to_numpy())
+        assert 'z' not in mapping
+
+    def test_invalid_fun(self):
+        with pytest.raises(ValueError, match='fun'):
+            stat_bin_2d(fun='mode')
+
+    def test_binwidth(self, points):
+        tf, _ = stat_bin_2d(mapping={'x': 'x', 'y': 'y'}, binwidth=(0.5, 0.25)).compute(points)
+        assert (tf['width'] == 0.5).all()
+        assert (tf['height'] == 0.25).all()
+
+
+    def test_limits(self, points):
+        tf, _ = stat_bin_2d(mapping={'x': 'x', 'y': 'y'}, bins=10,
+                            limits=((-10, 10), (-5, 5))).compute(points)
+        assert (tf['width'] == 2).all() and (tf['height'] == 1).all()
+        assert np.allclose((tf['xmin'] + 10) / 2, np.rint((tf['xmin'] + 10) / 2))
+
+
+class TestStatBinhex:
+    """Tests for stat_binhex."""
+
+    def test_hex_centers_are_nearest(self):
+        rng = np.random.default_rng(3)
+        x, y = rng.uniform(-5, 5, 2000), rng.uniform(-5, 5, 2000)
+        width, height = 0.7, 0.7 * SQRT3 / 2
+        cols, rows = hex_centers(x, y, 0.0, 0.0, width, height)
+
+        # Brute force over a neighbourhood of lattice centers
+        grid_rows = np.arange(-12, 13)
+        centers = [(c * width / 2, r * height) for r in grid_rows
+                   for c in range(-20, 21) if (c - r) % 2 == 0]
+        cx, cy = np.array(centers).T
+        nearest = np.argmin((x[:, None] - cx) ** 2 + (y[:, None] - cy) ** 2, axis=1)
+        np.testing.assert_allclose(cols * width / 2, cx[nearest])
+        np.testing.assert_allclose(rows * height, cy[nearest])
+
+    def test_counts_all_points(self, points):
+        tf, mapping = stat_binhex(mapping={'x': 'x', 'y': 'y'}, bins=15).compute(points)
+        assert tf['count'].sum() == len(points)
+        assert not {'xmin', 'xmax', 'ymin', 'ymax'} & set(tf.columns)
+        assert mapping['fill'] == 'value'
+
+
+class TestGeomBin2dHex:
+    """Tests for geom_bin2d and geom_hex."""
+
+    def test_bin2d_single_heatmap(self, points):
+        fig = (ggplot(points, aes(x='x', y='y')) + geom_bin2d(bins=25)).draw()
+        assert [trace.type for trace in fig.data] == ['heatmap']
+        z = np.asarray(fig.data[0].z, dtype=float)
+        assert z.shape == (25, 25)
+        assert np.nansum(z) == len(points)
+
+    def test_hex_single_trace(self, points):
+        fig = (ggplot(points, aes(x='x', y='y')) + geom_hex(bins=20)).draw()
+        assert len(fig.data) == 1
+        trace = fig.data[0]
+        assert trace.marker.symbol == 'hexagon'
+        assert sum(trace.marker.color) == len(points)
+
+    def test_stat_layers(self, points):
+        fig = (ggplot(points, aes(x='x', y='y')) + stat_binhex(bins=20)).draw()
+        assert [trace.type for trace in fig.data] == ['scatter']
+        fig = (ggplot(points, aes(x='x', y='y')) + stat_bin_2d(bins=20)).draw()
+        assert [trace.type for trace in fig.data] == ['heatmap']
+
+    def test_hex_size_follows_figure_size(self, points):
+        hexes = geom_hex(bins=20)
+        plot = ggplot(points, aes(x='x', y='y')) + hexes
+        small = (plot + ggsize(400, 400)).draw().data[0].marker.size
+        large = (plot + ggsize(1600, 1600)).draw().data[0].marker.size
+        assert large > 3 * small
+        assert not any(key.startswith('_') for key in hexes.params)
+
+    def test_fill_scale(self, points):
+        fig = (ggplot(points, aes(x='x', y='y')) + geom_hex()
+               + scale_fill_gradient(low='white', high='red')).draw()
+        assert fig.data[0].marker.colorscale[-1][1] == 'red'
+
+    def test_facets(self, points):
+        fig = (ggplot(points, aes(x='x', y='y')) + geom_bin2d(bins=10)
+               + facet_wrap('panel')).draw()
+        assert len(fig.data) == 2
+        assert sum(np.nansum(np.asarray(t.z, dtype=float)) for t in fig.data) == len(points)
+
+    def test_facets_share_bins_and_colors(self, points):
+        # One panel only spans part of the x range
+        points = points[(points['panel'] == 'a') | (points['x'] > 0)]
+        fig = (ggplot(points, aes(x='x', y='y')) + geom_bin2d(bins=10)
+               + facet_wrap('panel')).draw()
+        x_lo, width = points['x'].min(), np.ptp(points['x']) / 10
+        for trace in fig.data:
+            # Bin centers of every panel lie on the bins of the whole layer
+            offsets = (np.asarray(trace.x) - x_lo) / width - 0.5
+            np.testing.assert_allclose(offsets, np.rint(offsets), atol=1e-9)
+        counts = [np.nanmax(np.asarray(trace.z, dtype=float)) for trace in fig.data]
+        assert {(trace.zmin, trace.zmax) for trace in fig.data} == {(1, max(counts))}
+
+    def test_hex_facets_share_colors(self, points):
+        fig = (ggplot(points, aes(x='x', y='y')) + geom_hex(bins=10)
+               + facet_wrap('panel')).draw()
+        counts = np.concatenate([trace.marker.color for trace in fig.data])
+        assert {(trace.marker.cmin, trace.marker.cmax) for trace in fig.data} == {
+            (counts.min(), counts.max())}
+
+    def test_coord_flip_transposes_grid(self, points):
+        plot = ggplot(points, aes(x='x', y='y')) + geom_bin2d(bins=(20, 10))
+        trace = plot.draw().data[0]
+        flipped = (plot + coord_flip()).draw().data[0]
+        z = np.asarray(trace.z, dtype=float)
+        assert z.shape == (10, 20)
+        np.testing.assert_array_equal(np.asarray(flipped.x), np.asarray(trace.y))
+        np.testing.assert_array_equal(np.asarray(flipped.y), np.asarray(trace.x))
+        np.testing.assert_array_equal(np.asarray(flipped.z, dtype=float), z.T)
+
+    def test_coord_flip_leaves_other_traces(self, points):
+        plot = (ggplot(points, aes(x='x', y='y')) + geom_bin2d(bins=10)
+                + geom_smooth(method='lm'))
+        traces = plot.draw().data
+        flipped = (plot + coord_flip()).draw()
+        for trace, flipped_trace in zip(traces[1:], flipped.data[1:]):
+            np.testing.assert_array_equal(np.asarray(flipped_trace.x), np.asarray(trace.y))
+            np.testing.assert_array_equal(np.asarray(flipped_trace.y), np.asarray(trace.x))
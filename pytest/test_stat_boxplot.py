@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+
+import pytest
+from ggplotly import aes, coord_flip, facet_wrap, geom_boxplot, ggplot, stat_boxplot
+
+
+@pytest.fixture
+def box_data():
+    rng = np.random.default_rng(42)
+    return pd.DataFrame({
+        'g': rng.choice(['a', 'b', 'c'], 600),
+        'f': rng.choice(['u', 'v'], 600),
+        'y': rng.standard_t(3, 600),
+    })
+
+
+def _reference(values, coef=1.5):
+    """Per-group boxplot statistics computed the slow way."""
+    q1, q2, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - coef * iqr) & (values <= q3 + coef * iqr)]
+    outliers = values[(values < q1 - coef * iqr) | (values > q3 + coef * iqr)]
+    return q1, q2, q3, inside.min(), inside.max(), np.sort(outliers)
+
+
+class TestStatBoxplot:
+    """Tests for stat_boxplot."""
+
+    @pytest.mark.parametrize('coef', [0.5, 1.5, 3.0])
+    def test_matches_reference(self, box_data, coef):
+        stat = stat_boxplot(mapping={'x': 'g', 'y': 'y', 'fill': 'f'}, coef=coef)
+        result, mapping = stat.compute(box_data)
+
+        assert len(result) == 6
+        assert mapping['middle'] == 'middle'
+        for _, row in result.iterrows():
+            values = box_data.loc[(box_data.g == row.g) & (box_data.f == row.f), 'y'].to_numpy()
+            q1, q2, q3, lo, hi, outliers = _reference(values, coef)
+            np.testing.assert_allclose(
+                [row.lower, row.middle, row.upper, row.ymin, row.ymax], [q1, q2, q3, lo, hi]
+            )
+            np.testing.assert_allclose(np.sort(row.outliers), outliers)
+            assert row.n == len(values)
+
+    def test_notch_bounds(self):
+        result = stat_boxplot().compute_array(np.zeros(16), np.arange(16.0))
+        iqr = result.upper[0] - result.lower[0]
+
+        assert result.notchupper[0] - result.middle[0] == pytest.approx(1.58 * iqr / 4)
+
+    def test_missing_values_dropped(self):
+        result = stat_boxplot().compute_array([1, 1, 1, 2], [1.0, np.nan, 3.0, np.nan])
+
+        assert list(result.n) == [2, 0]
+        assert result.middle[0] == 2.0
+        assert np.isnan(result.middle[1])
+
+    def test_stat_layer_draws_box(self, box_data):
+        fig = (ggplot(box_data, aes('g', 'y')) + stat_boxplot(coef=0.5)).draw()
+
+        assert fig.data[0].type == 'box'
+        assert sum(len(points) for points in fig.data[0].y) > 0
+
+
+class TestGeomBoxplotPrecomputed:
+    """geom_boxplot ships summaries instead of raw observations."""
+
+    def test_trace_has_summaries_not_samples(self, box_data):
+        fig = (ggplot(box_data, aes('g', 'y')) + geom_boxplot()).draw()
+        trace = fig.data[0]
+        values = box_data.loc[box_data.g == trace.x[0], 'y'].to_numpy()
+        q1, q2, q3, lo, hi, outliers = _reference(values)
+
+        assert len(trace.x) == 3
+        assert trace.q1[0] == pytest.approx(q1)
+        assert trace.median[0] == pytest.approx(q2)
+        assert trace.upperfence[0] == pytest.approx(hi)
+        np.testing.assert_allclose(np.sort(trace.y[0]), outliers)
+        assert sum(len(points) for points in trace.y) < len(box_data)
+
+    def test_coef_changes_whiskers(self, box_data):
+        narrow = (ggplot(box_data, aes('g', 'y')) + geom_boxplot(coef=0.5)).draw().data[0]
+        wide = (ggplot(box_data, aes('g', 'y')) + geom_boxplot(coef=3)).draw().data[0]
+
+        assert all(n <= w for n, w in zip(narrow.upperfence, wide.upperfence))
+        assert sum(map(len, narrow.y)) > sum(map(len, wide.y))
+
+    def test_notch_span(self, box_data):
+        trace = (ggplot(box_data, aes('g', 'y')) + geom_boxplot(notch=True)).draw().data[0]
+
+        assert trace.notched
+        assert len(trace.notchspan) == 3
+
+    def test_fill_groups_and_facets(self, box_data):
+        fig = (ggplot(box_data, aes('g', 'y', fill='f')) + geom_boxplot() + facet_wrap('f')).draw()
+
+        assert all(trace.type == 'box' for trace in fig.data)
+        assert sum(len(trace.x) for trace in fig.data) == 6
+
+    def test_coord_flip(self, box_data):
+        trace = (ggplot(box_data, aes('g', 'y')) + geom_boxplot() + coord_flip()).draw().data[0]
+
+        assert trace.orientation == 'h'
+        assert len(trace.y) == 3
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+import pytest
+from ggplotly import aes, facet_wrap, geom_bar, ggplot, stat_count
+
+
+@pytest.fixture
+def orders():
+    rng = np.random.default_rng(5)
+    return pd.DataFrame({
+        'product': rng.choice(['tea', 'coffee', 'cocoa'], 3000),
+        'size': pd.Categorical(rng.choice(['S', 'M', 'L'], 3000), categories=['S', 'M', 'L']),
+        'store': rng.choice(['north', 'south'], 3000),
+        'amount': rng.random(3000),
+    })
+
+
+class TestStatCount:
+    """Tests for stat_count."""
+
+    def test_matches_groupby(self, orders):
+        stat = stat_count(mapping={'x': 'product', 'fill': 'size', 'group': 'store'})
+        tf, mapping = stat.compute(orders)
+
+        expected = orders.groupby(['product', 'size', 'store'], observed=True).size()
+        assert list(tf.columns) == ['product', 'size', 'store', 'count']
+        np.testing.assert_array_equal(tf['count'], expected.to_numpy())
+        assert mapping['y'] == 'count'
+
+    def test_sorted_keys_keep_category_order(self, orders):
+        tf, _ = stat_count(mapping={'x': 'size'}).compute(orders)
+
+        assert list(tf['size']) == ['S', 'M', 'L']
+        assert isinstance(tf['size'].dtype, pd.CategoricalDtype)
+
+    def test_weight_is_summed(self, orders):
+        tf, mapping = stat_count(mapping={'x': 'product', 'weight': 'amount'}).compute(orders)
+
+        expected = orders.groupby('product')['amount'].sum()
+        np.testing.assert_allclose(tf.set_index('product')['count'], expected)
+        assert 'weight' not in mapping
+
+    def test_horizontal_counts_y(self, orders):
+        tf, mapping = stat_count(mapping={'y': 'store'}).compute(orders)
+
+        assert mapping == {'y': 'store', 'x': 'count'}
+        assert tf['count'].sum() == len(orders)
+
+    def test_missing_keys_dropped_and_mapping_untouched(self):
+        stat = stat_count(mapping={'x': 'c'})
+        tf, _ = stat.compute(pd.DataFrame({'c': ['a', None, 'b', 'a']}))
+
+        assert tf.to_dict('list') == {'c': ['a', 'b'], 'count': [2, 1]}
+        assert stat.mapping == {'x': 'c'}
+
+    def test_facet_panels_share_bar_order(self, orders):
+        fig = (ggplot(orders, aes(x='product')) + geom_bar() + facet_wrap('store')).draw()
+
+        assert [list(t.x) for t in fig.data] == [['cocoa', 'coffee', 'tea']] * 2
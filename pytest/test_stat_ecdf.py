@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+
+import pytest
+from ggplotly import ChunkedData, aes, geom_step, ggplot, stat_ecdf
+from ggplotly.stats.stat_ecdf import EcdfSketch
+
+
+@pytest.fixture
+def latencies():
+    rng = np.random.default_rng(21)
+    return pd.DataFrame({
+        'ms': np.round(rng.gamma(2.0, 10.0, 40_000), 1),
+        'region': rng.choice(['eu', 'us'], 40_000),
+    })
+
+
+def _max_error(values, x, y):
+    """Largest gap between the exact ECDF and a step curve through (x, y)."""
+    values = np.sort(values)
+    grid = np.quantile(values, np.linspace(0, 1, 5001))
+    drawn = y[np.maximum(np.searchsorted(x, grid, side='right') - 1, 0)]
+    exact = np.searchsorted(values, grid, side='right') / len(values)
+    return np.abs(drawn - exact).max()
+
+
+class TestStatEcdf:
+    """Tests for stat_ecdf."""
+
+    def test_ties_merged_into_steps(self):
+        result, _ = stat_ecdf(mapping={'x': 'v'}).compute(pd.DataFrame({'v': [3, 1, 3, 2, np.nan]}))
+
+        assert result.to_dict('list') == {'x': [1.0, 2.0, 3.0], 'y': [0.25, 0.5, 1.0]}
+
+    def test_groups_sorted_once(self, latencies):
+        result, mapping = stat_ecdf(mapping={'x': 'ms', 'color': 'region'}).compute(latencies)
+
+        assert list(result['region'].unique()) == list(latencies['region'].unique())
+        for region, curve in result.groupby('region'):
+            values = latencies.loc[latencies.region == region, 'ms']
+            assert len(curve) == values.nunique()
+            assert _max_error(values, curve.x.to_numpy(), curve.y.to_numpy()) == 0
+        assert mapping['color'] == 'region'
+
+    def test_n_probability_spacing(self, latencies):
+        result, _ = stat_ecdf(mapping={'x': 'ms'}, n=100).compute(latencies)
+
+        assert len(result) <= 101
+        assert result['y'].iloc[-1] == 1.0
+        assert _max_error(latencies.ms, result.x.to_numpy(), result.y.to_numpy()) <= 0.01
+
+    def test_n_x_spacing(self, latencies):
+        result, _ = stat_ecdf(mapping={'x': 'ms'}, n=50, spacing='x').compute(latencies)
+
+        np.testing.assert_allclose(np.diff(result.x), np.diff(result.x)[0])
+        assert len(result) == 50
+
+    def test_pad_each_group(self, latencies):
+        result, _ = stat_ecdf(mapping={'x': 'ms', 'color': 'region'}, n=10, pad=True).compute(latencies)
+
+        for _, curve in result.groupby('region', sort=False):
+            assert curve.y.iloc[0] == 0 and curve.y.iloc[-1] == 1
+            assert curve.x.is_monotonic_increasing
+
+    def test_invalid_spacing(self):
+        with pytest.raises(ValueError, match="spacing"):
+            stat_ecdf(spacing='log')
+
+    def test_geom_step_passes_n(self, latencies):
+        fig = (ggplot(latencies, aes(x='ms', color='region')) + geom_step(stat='ecdf', n=200)).draw()
+
+        assert len(fig.data) == 2
+        assert all(len(trace.x) <= 201 for trace in fig.data)
+
+
+class TestEcdfChunks:
+    def test_sketch_error_bound(self):
+        values = np.random.default_rng(3).lognormal(size=200_000)
+        sketch = EcdfSketch(size=512)
+        for chunk in np.array_split(values, 64):
+            sketch.add(chunk)
+        x, y = sketch.curve()
+
+        # log2(64) + 1 merge levels, each within 1/size
+        assert _max_error(values, x, y) <= 7 / 512
+        assert y[-1] == pytest.approx(1.0)
+
+    def test_compute_chunks_grouped(self, latencies):
+        source = ChunkedData(latencies, chunk_size=5000, n_jobs=2)
+        result = stat_ecdf(mapping={'x': 'ms'}, n=200).compute_chunks(source, 'region')
+
+        assert list(result['region'].unique()) == list(latencies['region'].unique())
+        for region, curve in result.groupby('region'):
+            values = latencies.loc[latencies.region == region, 'ms']
+            assert len(curve) <= 201
+            assert _max_error(values, curve.x.to_numpy(), curve.y.to_numpy()) <= 0.01
+
+    def test_geom_step_draws_chunks(self, latencies):
+        source = ChunkedData(latencies, chunk_size=5000)
+        fig = (ggplot(mapping=aes(x='ms', color='region'))
+               + geom_step(data=source, stat='ecdf', n=200)).draw()
+
+        assert sorted(trace.name for trace in fig.data) == ['eu', 'us']
+        for trace in fig.data:
+            values = latencies.loc[latencies.region == trace.name, 'ms']
+            assert _max_error(values, np.asarray(trace.x), np.asarray(trace.y)) <= 0.01
+
+    def test_geom_step_chunks_need_ecdf(self, latencies):
+        plot = ggplot(mapping=aes(x='ms', y='ms')) + geom_step(data=ChunkedData(latencies))
+
+        with pytest.raises(ValueError, match="stat='ecdf'"):
+            plot.draw()
@@ -0,0 +1,196 @@
+import numpy as np
+import pandas as pd
+
+import pytest
+from ggplotly import aes, coord_flip, geom_boxplot, geom_violin, ggplot, stat_ydensity
+from ggplotly.stats.stat_density import binned_kde
+from ggplotly.stats.stat_ydensity import density_quantiles
+
+
+@pytest.fixture
+def violin_data():
+    rng = np.random.default_rng(7)
+    return pd.DataFrame({
+        'g': np.repeat(['a', 'b', 'c'], [400, 800, 1600]),
+        'f': rng.choice(['u', 'v'], 2800),
+        'y': rng.normal(size=2800),
+    })
+
+
+def _gaussian_kde(values, bw, grid):
+    z = (grid[:, None] - values[None, :]) / bw
+    return np.exp(-0.5 * z ** 2).sum(axis=1) / (len(values) * bw * np.sqrt(2 * np.pi))
+
+
+class TestBinnedKde:
+    def test_matches_exact_kde(self):
+        values = np.random.default_rng(0).normal(size=3000)
+        grid, density = binned_kde(values, 0.2, values.min() - 1, values.max() + 1, 512)
+
+        exact = _gaussian_kde(values, 0.2, grid)
+        assert np.abs(density - exact).max() < 1e-3 * exact.max()
+
+    def test_density_quantiles(self):
+        grid = np.linspace(-6, 6, 2001)
+        density = np.exp(-0.5 * grid ** 2)
+
+        q = density_quantiles(grid, density, [0.25, 0.5, 0.75])
+        np.testing.assert_allclose(q, [-0.6745, 0, 0.6745], atol=1e-3)
+
+
+class TestStatYdensity:
+    """Tests for stat_ydensity."""
+
+    def test_fixed_length_profiles(self, violin_data):
+        stat = stat_ydensity(mapping={'x': 'g', 'y': 'y'}, n=128)
+        result, mapping = stat.compute(violin_data)
+
+        assert len(result) == 3 * 128
+        assert mapping['y'] == 'y'
+        assert list(result.groupby('g', sort=False)['n'].first()) == [400, 800, 1600]
+
+    def test_trim_limits_grid_to_data(self, violin_data):
+        trimmed = stat_ydensity().compute_array(violin_data.g, violin_data.y)
+        untrimmed = stat_ydensity(trim=False).compute_array(violin_data.g, violin_data.y)
+
+        a = violin_data.y[violin_data.g == 'a']
+        assert trimmed[trimmed.x == 'a'].y.min() == pytest.approx(a.min())
+        assert untrimmed[untrimmed.x == 'a'].y.min() < a.min()
+
+    @pytest.mark.parametrize('scale, expected', [
+        ('width', [1.0, 1.0, 1.0]),
+        ('count', [0.25, 0.5, 1.0]),
+    ])
+    def test_scale(self, violin_data, scale, expected):
+        result = stat_ydensity(scale=scale).compute_array(violin_data.g, violin_data.y)
+        peaks = result.groupby('x', sort=False).violinwidth.max()
+
+        np.testing.assert_allclose(peaks, expected, rtol=0.15)
+
+    def test_area_scale_shares_peak(self, violin_data):
+        result = stat_ydensity().compute_array(violin_data.g, violin_data.y)
+
+        assert result.violinwidth.max() == pytest.approx(1.0)
+        np.testing.assert_allclose(result.violinwidth, result.density / result.density.max())
+
+    def test_invalid_scale(self):
+        with pytest.raises(ValueError, match="scale"):
+            stat_ydensity(scale='volume')
+
+    def test_small_groups_dropped(self):
+        result = stat_ydensity().compute_array(['a', 'a', 'b'], [1.0, 2.0, 3.0])
+
+        assert set(result.x) == {'a'}
+
+    def test_sketch_reproduces_profile(self):
+        values = np.random.default_rng(1).normal(size=200_000)
+        stat = stat_ydensity()
+        grid, density, bw = stat.profile(values)
+        points = stat.sketch(values, 1024)
+
+        assert len(points) == 1024
+        redrawn = _gaussian_kde(points, bw, grid)
+        assert np.abs(redrawn - density).max() < 0.03 * density.max()
+
+    @pytest.mark.parametrize('trim', [True, False])
+    def test_sketch_for_smaller_bandwidth(self, trim):
+        values = np.random.default_rng(1).exponential(size=200_000)
+        stat = stat_ydensity(trim=trim)
+        grid, density, bw = stat.profile(values)
+        points = stat.sketch(values, 1024, bw / 2)
+
+        assert len(points) == 1024
+        assert grid[0] <= points.min() and points.max() <= grid[-1]
+        redrawn = _gaussian_kde(points, bw / 2, grid)
+        assert np.abs(redrawn - density).max() < 0.05 * density.max()
+
+
+class TestGeomViolinPrecomputed:
+    """geom_violin ships a compressed sample instead of raw observations."""
+
+    def test_large_group_is_compressed(self):
+        df = pd.DataFrame({'g': 'a', 'y': np.random.default_rng(2).normal(size=100_000)})
+        trace = (ggplot(df, aes('g', 'y')) + geom_violin()).draw().data[0]
+
+        assert trace.type == 'violin'
+        assert len(trace.y) <= 1024
+        assert trace.bandwidth > 0
+        assert trace.spanmode == 'hard'
+
+    def test_one_trace_per_group(self, violin_data):
+        fig = (ggplot(violin_data, aes('g', 'y')) + geom_violin()).draw()
+
+        assert len(fig.data) == 1
+        x = pd.Series(fig.data[0].x)
+        assert list(x.unique()) == ['a', 'b', 'c']
+        assert list(x.value_counts(sort=False)) == [1024] * 3
+        stat = stat_ydensity()
+        bandwidths = [stat.bandwidth(g.to_numpy()) for _, g in violin_data.groupby('g')['y']]
+        assert fig.data[0].bandwidth == pytest.approx(min(bandwidths))
+
+    def test_scale_groups(self, violin_data):
+        area = (ggplot(violin_data, aes('g', 'y')) + geom_violin()).draw()
+        width = (ggplot(violin_data, aes('g', 'y')) + geom_violin(scale='width')).draw()
+        count = (ggplot(violin_data, aes('g', 'y')) + geom_violin(scale='count', max_points=800)).draw()
+
+        assert len(area.data) == 1
+        # Plotly scales the widths of a trace together
+        assert len({t.scalegroup for t in width.data}) == 3
+        assert [t.scalemode for t in count.data] == ['count']
+        # Point counts stay proportional to group sizes
+        assert list(pd.Series(count.data[0].x).value_counts(sort=False)) == [200, 400, 800]
+
+    @pytest.mark.parametrize('scale', ['area', 'count', 'width'])
+    def test_draw_quantiles_lines(self, violin_data, scale):
+        fig = (ggplot(violin_data, aes('g', 'y', fill='f'))
+               + geom_violin(draw_quantiles=[0.25, 0.5, 0.75], scale=scale)).draw()
+        violins = [t for t in fig.data if t.type == 'violin']
+        lines = [t for t in fig.data if t.type == 'bar']
+
+        assert len(violins) == len(lines) == (6 if scale == 'width' else 2)
+        assert not any(t.box.visible for t in violins)
+        assert sum(t.showlegend for t in fig.data) == 2
+        assert [t.legendgroup for t in lines] == [t.legendgroup for t in violins]
+
+        # Each line sits at the quantile, as wide as Plotly draws the violin
+        groups = {}
+        for violin in violins:
+            x, y = np.asarray(violin.x), np.asarray(violin.y, dtype=float)
+            for position in dict.fromkeys(x):
+                points = y[x == position]
+                grid = np.linspace(points.min(), points.max(), 200)
+                peak = _gaussian_kde(points, violin.bandwidth, grid).max()
+                groups[violin.name, position] = (violin, points, peak)
+        for line in lines:
+            for i in range(0, len(line.x), 3):
+                position = line.x[i]
+                values = violin_data.y[(violin_data.g == position) & (violin_data.f == line.name)]
+                grid, density, _ = stat_ydensity().profile(values.to_numpy())
+                quantiles = density_quantiles(grid, density, [0.25, 0.5, 0.75])
+                assert line.base[i:i + 3] == pytest.approx(quantiles)
+
+            for position, base, width in zip(line.x, line.base, line.width):
+                violin, points, _ = groups[line.name, position]
+                shared = [g for g in groups.values() if g[0].scalegroup == violin.scalegroup]
+                scale_by = max(g[2] for g in shared) / (violin.width / 2)
+                if scale == 'count':
+                    scale_by *= max(len(g[1]) for g in shared) / len(points)
+                drawn = _gaussian_kde(points, violin.bandwidth, np.array([base]))[0] / scale_by
+                assert width / 2 == pytest.approx(drawn, abs=0.02 * violin.width)
+
+    def test_fill_colors_consistent_across_positions(self, violin_data):
+        fig = (ggplot(violin_data, aes('g', 'y', fill='f')) + geom_violin()).draw()
+        colors = {}
+        for trace in fig.data:
+            colors.setdefault(trace.name, set()).add(trace.fillcolor)
+
+        assert all(len(c) == 1 for c in colors.values())
+        assert sum(t.showlegend for t in fig.data) == 2
+
+    def test_stat_layer_and_combinations(self, violin_data):
+        fig = (ggplot(violin_data, aes('g', 'y')) + stat_ydensity(scale='width')
+               + geom_boxplot(width=0.1) + coord_flip()).draw()
+
+        violins = [t for t in fig.data if t.type == 'violin']
+        assert len({t.scalegroup for t in violins}) == 3
+        assert set(violins[0].y) == {'a'} and violins[0].orientation == 'h'
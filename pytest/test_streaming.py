@@ -0,0 +1,97 @@
+# pytest/test_streaming.py
+"""Tests for appending rows to drawn plots."""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+import pytest
+from ggplotly import (
+    aes,
+    geom_line,
+    geom_point,
+    geom_smooth,
+    ggplot,
+    render_cache,
+    render_diff,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_cache():
+    render_cache.enabled = False
+    yield
+    render_cache.enabled = True
+
+
+def _rows(start, stop):
+    t = np.arange(start, stop, dtype=float)
+    return pd.DataFrame({'t': t, 'v': np.sin(t), 'g': np.where(t % 2 == 0, 'a', 'b')})
+
+
+class TestAppend:
+    @pytest.mark.parametrize('geom', [geom_line, geom_point])
+    def test_traces_are_extended(self, geom):
+        p = ggplot(_rows(0, 50), aes('t', 'v', color='g')) + geom()
+        fig = p.draw(incremental=True)
+        shown = go.Figure(fig)
+        patch = p.append(_rows(50, 60))
+
+        assert patch.restyle == patch.add == patch.delete == []
+        assert [indices for _, indices, _ in patch.extend] == [[0], [1]]
+        update, _, max_points = patch.extend[0]
+        np.testing.assert_array_equal(update['x'][0], [50, 52, 54, 56, 58])
+        assert max_points is None
+
+        full = (ggplot(_rows(0, 60), aes('t', 'v', color='g')) + geom()).draw()
+        assert patch.figure is fig and fig.to_dict() == full.to_dict()
+        render_diff.apply_patch(shown, patch)
+        assert shown.to_dict() == full.to_dict()
+
+    def test_max_points_keeps_latest_rows(self):
+        p = ggplot(_rows(0, 50), aes('t', 'v', color='g')) + geom_line()
+        p.draw(incremental=True)
+        patch = p.append(_rows(50, 60), max_points=40)
+
+        assert len(p.data) == 40 and p.data['t'].iloc[0] == 20
+        assert [max_points for *_, max_points in patch.extend] == [20, 20]
+        full = (ggplot(_rows(20, 60), aes('t', 'v', color='g')) + geom_line()).draw()
+        assert patch.figure.to_dict() == full.to_dict()
+
+    def test_categories_keep_their_colors(self):
+        p = ggplot(_rows(0, 10), aes('t', 'v', color='g')) + geom_point()
+        fig = p.draw(incremental=True)
+        colors = {trace.name: trace.marker.color for trace in fig.data}
+
+        # 'a' leaves the window, then a new category arrives
+        new = pd.DataFrame({'t': [10.0, 11.0], 'v': [0.0, 1.0], 'g': ['b', 'c']})
+        patch = p.append(new, max_points=2)
+        drawn = {trace.name: trace.marker.color for trace in patch.figure.data}
+        assert drawn['b'] == colors['b']
+        assert drawn['c'] not in colors.values()
+
+
+class TestFallback:
+    def test_stat_layers_are_drawn_again(self):
+        p = ggplot(_rows(0, 50), aes('t', 'v')) + geom_point() + geom_smooth(method='lm')
+        fig = p.draw(incremental=True)
+        patch = p.append(_rows(50, 60), max_points=50)
+
+        assert patch.extend == [] and patch.restyle
+        full = (ggplot(_rows(10, 60), aes('t', 'v')) + geom_point()
+                + geom_smooth(method='lm')).draw()
+        assert patch.figure.to_dict() == full.to_dict()
+        render_diff.apply_patch(fig, patch)
+        assert fig.to_dict() == full.to_dict()
+
+    def test_unsorted_lines_are_drawn_again(self):
+        p = ggplot(_rows(10, 20), aes('t', 'v')) + geom_line()
+        p.draw(incremental=True)
+        patch = p.append(_rows(0, 5))
+        np.testing.assert_array_equal(patch.figure.data[0].x, np.arange(20.0)[np.r_[0:5, 10:20]])
+
+    def test_plot_without_data_raises(self):
+        p = ggplot() + geom_point(data=_rows(0, 5), mapping=aes('t', 'v'))
+        p.draw()
+        with pytest.raises(ValueError, match='append'):
+            p.append(_rows(5, 10))
@@ -4,10 +4,18 @@ Tests for trace_builders module.
 These tests verify that the trace builder strategies produce correct Plotly traces
 with the expected data, groupings, colors, shapes, and legend behavior.
 """
+import numpy as np
 import pandas as pd
 
 import pytest
-from ggplotly import aes, geom_line, geom_point, ggplot
+from ggplotly import (
+    aes,
+    geom_line,
+    geom_point,
+    ggplot,
+    scale_color_manual,
+    trace_builders,
+)
 
 
 @pytest.fixture
@@ -140,6 +148,71 @@ class TestColorOnlyTraceBuilder:
             assert trace.legendgroup == trace.name
 
 
+class TestPointColorTraceBuilder:
+    """Tests for PointColorTraceBuilder (one trace, one color per point)."""
+
+    @pytest.fixture
+    def many_users(self):
+        rng = np.random.default_rng(6)
+        n = 3000
+        users = rng.integers(0, 800, n)
+        return pd.DataFrame({'x': rng.normal(size=n), 'y': rng.normal(size=n),
+                             'user': [f'u{u}' for u in users]})
+
+    def test_legend_parameter_gives_one_data_trace(self, grouped_data):
+        p = ggplot(grouped_data, aes(x='x', y='y', color='group')) + geom_point(legend=1)
+        fig = p.draw()
+
+        assert len(fig.data[0].x) == 6
+        colors = list(fig.data[0].marker.color)
+        assert colors[0] == colors[1] == colors[2] != colors[3]
+        # Legend proxy for the most frequent category (ties in category order)
+        assert [(t.name, t.showlegend) for t in fig.data[1:]] == [('A', True)]
+        assert fig.data[1].marker.color == colors[0]
+
+    def test_legend_none(self, grouped_data):
+        p = ggplot(grouped_data, aes(x='x', y='y', color='group')) + geom_point(legend='none')
+        assert len(p.draw().data) == 1
+
+    def test_high_cardinality_switches_automatically(self, many_users):
+        fig = (ggplot(many_users, aes(x='x', y='y', color='user')) + geom_point()).draw()
+        assert len(fig.data) == 1 + trace_builders.legend_categories
+        assert len(fig.data[0].marker.color) == len(many_users)
+        top = many_users['user'].value_counts()
+        shown = {t.name for t in fig.data[1:]}
+        assert shown >= set(top.index[top > top.iloc[trace_builders.legend_categories]])
+
+    def test_lines_keep_one_trace_per_category(self, many_users):
+        fig = (ggplot(many_users.head(300), aes(x='x', y='y', color='user')) + geom_line(legend=5)).draw()
+        assert len(fig.data) == many_users.head(300)['user'].nunique()
+
+    def test_manual_scale_colors_points_and_legend(self, grouped_data):
+        values = {'A': 'red', 'B': 'blue', 'C': 'green'}
+        p = (ggplot(grouped_data, aes(x='x', y='y', color='group')) + geom_point(legend=2)
+             + scale_color_manual(values=values))
+        fig = p.draw()
+        expected = [values[g] for g in grouped_data['group']]
+        assert list(fig.data[0].marker.color) == expected
+        assert {t.name: t.marker.color for t in fig.data[1:]} == {'A': 'red', 'B': 'blue'}
+
+        # Colors given as a list follow category order, above the trace limit too
+        p = (ggplot(grouped_data, aes(x='x', y='y', color='group')) + geom_point()
+             + scale_color_manual(values=['red', 'blue', 'green']))
+        trace_builders.max_category_traces, limit = 1, trace_builders.max_category_traces
+        try:
+            fig = p.draw()
+        finally:
+            trace_builders.max_category_traces = limit
+        assert list(fig.data[0].marker.color) == expected
+        assert {t.name: t.marker.color for t in fig.data[1:]} == {'A': 'red', 'B': 'blue'}
+
+    def test_missing_categories_get_default_color(self):
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [1, 2, 3], 'g': ['a', None, 'b']})
+        fig = (ggplot(df, aes(x='x', y='y', color='g')) + geom_point(legend=2)).draw()
+        colors = list(fig.data[0].marker.color)
+        assert len(colors) == 3 and all(isinstance(c, str) for c in colors)
+
+
 class TestShapeOnlyTraceBuilder:
     """Tests for ShapeOnlyTraceBuilder - shape mapped to column."""
 